@@ -0,0 +1,129 @@
+package main
+
+import (
+	"fmt"
+	"os"
+	"path/filepath"
+	"time"
+
+	"github.com/dcos/dcos-cli/pkg/cli"
+	"github.com/dcos/dcos-cli/pkg/cli/version"
+	"github.com/dcos/dcos-cli/pkg/daemon"
+	"github.com/sirupsen/logrus"
+	"github.com/spf13/afero"
+	"golang.org/x/crypto/ssh/terminal"
+)
+
+// daemonLogFile is the log file of the daemon in the DC/OS directory.
+const daemonLogFile = "daemon.log"
+
+// forwardToDaemon runs the invocation through the daemon of the DC/OS directory, as opted-in through
+// DCOS_CLI_DAEMON. The boolean is false when the invocation must run in this process, the daemon is
+// then started in the background if it isn't running yet.
+//
+// Interactive invocations (when stdin is a terminal) always run in this process, as the daemon
+// has no controlling terminal. So do help and profiled invocations.
+func forwardToDaemon(env *cli.Environment) (int, bool) {
+	if val, _ := env.EnvLookup(cli.EnvDaemon); val != "1" {
+		return 0, false
+	}
+	for i, arg := range env.Args[1:] {
+		// Help functions of plugin commands exit the process with the plugin exit code.
+		if (i == 0 && arg == "help") || arg == "--help" || arg == "-h" {
+			return 0, false
+		}
+	}
+	for _, key := range []string{cli.EnvCPUProfile, cli.EnvMemProfile, cli.EnvTrace} {
+		if val, ok := env.EnvLookup(key); ok && val != "" {
+			return 0, false
+		}
+	}
+	if terminal.IsTerminal(int(os.Stdin.Fd())) {
+		return 0, false
+	}
+
+	dcosDir, err := cli.NewContext(env).DCOSDir()
+	if err != nil {
+		return 0, false
+	}
+	if exists, _ := afero.DirExists(env.Fs, dcosDir); !exists {
+		return 0, false
+	}
+	workDir, err := os.Getwd()
+	if err != nil {
+		return 0, false
+	}
+
+	req := &daemon.Request{
+		Version: version.Version(),
+		Args:    env.Args,
+		Env:     os.Environ(),
+		Dir:     workDir,
+	}
+	code, err := daemon.Forward(dcosDir, req, os.Stdin, os.Stdout, os.Stderr)
+	switch err {
+	case nil:
+		return code, true
+	case daemon.ErrConnectionLost:
+		fmt.Fprintf(env.ErrOut, "Error: %s\n", err)
+		return 1, true
+	case daemon.ErrNotRunning:
+		if executable, err := os.Executable(); err == nil {
+			daemon.Start(executable, dcosDir)
+		}
+	}
+	return 0, false
+}
+
+// serveDaemon runs the daemon of the DC/OS directory, in a process started by forwardToDaemon.
+func serveDaemon() {
+	dcosDir := os.Getenv(cli.EnvDCOSDir)
+
+	logger := &logrus.Logger{
+		Out:       os.Stderr,
+		Formatter: new(logrus.TextFormatter),
+		Hooks:     make(logrus.LevelHooks),
+		Level:     logrus.InfoLevel,
+	}
+	logFile, err := os.OpenFile(filepath.Join(dcosDir, daemonLogFile), os.O_WRONLY|os.O_CREATE|os.O_APPEND, 0600)
+	if err == nil {
+		defer logFile.Close()
+		logger.Out = logFile
+	}
+
+	idleTimeout := daemon.DefaultIdleTimeout
+	if val, ok := os.LookupEnv(cli.EnvDaemonIdleTimeout); ok {
+		if idleTimeout, err = time.ParseDuration(val); err != nil {
+			logger.Warnf("Invalid %s value: %s", cli.EnvDaemonIdleTimeout, err)
+			idleTimeout = daemon.DefaultIdleTimeout
+		}
+	}
+
+	err = daemon.Serve(daemon.ServeOpts{
+		Dir:         dcosDir,
+		Version:     version.Version(),
+		IdleTimeout: idleTimeout,
+		Logger:      logger,
+		Run: func(args []string, stdin, stdout, stderr *os.File) int {
+			env := &cli.Environment{
+				Args:   args,
+				Input:  stdin,
+				Out:    stdout,
+				ErrOut: stderr,
+				EnvLookup: func(key string) (string, bool) {
+					// Plugins must run as child processes, the daemon process can't be replaced.
+					if key == cli.EnvPluginExec {
+						return "", false
+					}
+					return os.LookupEnv(key)
+				},
+				Fs: afero.NewOsFs(),
+			}
+			return exitCode(env, run(env))
+		},
+	})
+	if err != nil {
+		logger.Error(err)
+		os.Exit(1)
+	}
+}
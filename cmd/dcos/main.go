@@ -1,9 +1,12 @@
 package main
 
 import (
+	"context"
 	"fmt"
 	"io"
 	"os"
+	"os/exec"
+	"runtime/trace"
 	"strconv"
 	"strings"
 	"time"
@@ -13,32 +16,58 @@ import (
 	"github.com/dcos/dcos-cli/pkg/cli/version"
 	"github.com/dcos/dcos-cli/pkg/cmd"
 	"github.com/dcos/dcos-cli/pkg/config"
+	"github.com/dcos/dcos-cli/pkg/daemon"
 	"github.com/dcos/dcos-cli/pkg/dcos"
 	"github.com/dcos/dcos-cli/pkg/httpclient"
 	"github.com/sirupsen/logrus"
 )
 
 func main() {
+	if os.Getenv(daemon.EnvServe) == "1" {
+		serveDaemon()
+		return
+	}
 	env := cli.NewOsEnvironment()
-	err := run(env)
-	if err != nil {
-		if _, ok := err.(*config.SSLError); ok {
-			msg := "Error: An SSL error occurred. To configure your SSL settings, please " +
-				"run: 'dcos config set core.ssl_verify <value>'\n" +
-				"<value>: Whether to verify SSL certs for HTTPS or path to certs. " +
-				"Valid values are a path to a CA_BUNDLE, " +
-				"True (will then use system CA certificates), " +
-				"or False (will then send insecure requests).\n"
-			fmt.Fprint(env.ErrOut, msg)
-		}
-		os.Exit(1)
+	if code, ok := forwardToDaemon(env); ok {
+		os.Exit(code)
+	}
+	if code := exitCode(env, run(env)); code != 0 {
+		os.Exit(code)
+	}
+}
+
+// exitCode returns the exit code for the error returned by run, it prints a hint for SSL errors.
+func exitCode(env *cli.Environment, err error) int {
+	if err == nil {
+		return 0
+	}
+	// Exit with the same code as the plugin binary when it fails.
+	//
+	// See https://jira.mesosphere.com/browse/DCOS_OSS-4399
+	if exitErr, ok := err.(*exec.ExitError); ok && exitErr.ExitCode() > 0 {
+		return exitErr.ExitCode()
+	}
+	if _, ok := err.(*config.SSLError); ok {
+		msg := "Error: An SSL error occurred. To configure your SSL settings, please " +
+			"run: 'dcos config set core.ssl_verify <value>'\n" +
+			"<value>: Whether to verify SSL certs for HTTPS or path to certs. " +
+			"Valid values are a path to a CA_BUNDLE, " +
+			"True (will then use system CA certificates), " +
+			"or False (will then send insecure requests).\n"
+		fmt.Fprint(env.ErrOut, msg)
 	}
+	return 1
 }
 
 // run launches the DC/OS CLI with a given environment.
 func run(env *cli.Environment) error {
+	stopProfiling := startProfiling(env)
+	defer stopProfiling()
+
 	globalFlags := &cli.GlobalFlags{}
+	region := trace.StartRegion(context.Background(), "global-flags")
 	env.Args = append(env.Args[:1], globalFlags.Parse(env.Args[1:])...)
+	region.End()
 
 	if globalFlags.Verbosity == 0 {
 		if envVerbosity, ok := env.EnvLookup("DCOS_VERBOSITY"); ok {
@@ -57,9 +86,41 @@ func run(env *cli.Environment) error {
 		printVersion(ctx)
 		return nil
 	}
+	if tracePath, ok := env.EnvLookup(cli.EnvHTTPTrace); ok && tracePath != "" {
+		traceFile, err := env.Fs.OpenFile(tracePath, os.O_WRONLY|os.O_CREATE|os.O_APPEND, 0600)
+		if err != nil {
+			ctx.Logger().Warnf("Couldn't open HTTP trace file: %s", err)
+		} else {
+			defer traceFile.Close()
+			httpclient.SetTraceOutput(traceFile)
+			defer httpclient.SetTraceOutput(nil)
+		}
+	}
+
+	if envBodyLimit, ok := env.EnvLookup(cli.EnvHTTPDebugBodyLimit); ok {
+		bodyLimit, err := strconv.ParseInt(envBodyLimit, 10, 64)
+		if err != nil {
+			ctx.Logger().Warnf("Invalid %s value: %s", cli.EnvHTTPDebugBodyLimit, err)
+		} else {
+			httpclient.SetDebugBodyLimit(bodyLimit)
+			defer httpclient.SetDebugBodyLimit(httpclient.DefaultDebugBodyLimit)
+		}
+	}
+
 	dcosCmd := cmd.NewDCOSCommand(ctx)
 	dcosCmd.SetArgs(env.Args[1:])
-	return dcosCmd.Execute()
+	region = trace.StartRegion(context.Background(), "execute")
+	err := dcosCmd.Execute()
+	region.End()
+
+	if ctx.Logger().Level >= logrus.DebugLevel {
+		stats := httpclient.Stats()
+		ctx.Logger().Debugf(
+			"HTTP connections: %d dialed, %d open, %d idle, %d active (%d transports)",
+			stats.Dials, stats.Open, stats.Idle, stats.Active, stats.Transports,
+		)
+	}
+	return err
 }
 
 // logrusLevel returns the log level for the CLI based on the verbosity. The default verbosity is 0.
@@ -0,0 +1,82 @@
+package main
+
+import (
+	"fmt"
+	"os"
+	"runtime"
+	"runtime/pprof"
+	"runtime/trace"
+
+	"github.com/dcos/dcos-cli/pkg/cli"
+	"github.com/spf13/afero"
+)
+
+// startProfiling starts the profilers enabled through the environment:
+//
+//   - DCOS_CLI_CPUPROFILE writes a pprof CPU profile for the whole run.
+//   - DCOS_CLI_MEMPROFILE writes a pprof heap profile at the end of the run.
+//   - DCOS_CLI_TRACE writes a runtime execution trace, which includes the regions of the main CLI phases.
+//
+// It returns a function stopping the profilers, which must be called before the process exits.
+func startProfiling(env *cli.Environment) (stop func()) {
+	var stops []func()
+	stop = func() {
+		for i := len(stops) - 1; i >= 0; i-- {
+			stops[i]()
+		}
+	}
+
+	if path, ok := env.EnvLookup(cli.EnvCPUProfile); ok && path != "" {
+		if f, err := createProfile(env, path); err == nil {
+			if err := pprof.StartCPUProfile(f); err != nil {
+				fmt.Fprintf(env.ErrOut, "Couldn't start CPU profile: %s\n", err)
+				f.Close()
+			} else {
+				stops = append(stops, func() {
+					pprof.StopCPUProfile()
+					f.Close()
+				})
+			}
+		}
+	}
+
+	if path, ok := env.EnvLookup(cli.EnvTrace); ok && path != "" {
+		if f, err := createProfile(env, path); err == nil {
+			if err := trace.Start(f); err != nil {
+				fmt.Fprintf(env.ErrOut, "Couldn't start execution trace: %s\n", err)
+				f.Close()
+			} else {
+				stops = append(stops, func() {
+					trace.Stop()
+					f.Close()
+				})
+			}
+		}
+	}
+
+	if path, ok := env.EnvLookup(cli.EnvMemProfile); ok && path != "" {
+		stops = append(stops, func() {
+			f, err := createProfile(env, path)
+			if err != nil {
+				return
+			}
+			defer f.Close()
+
+			// Get up-to-date statistics about live objects.
+			runtime.GC()
+			if err := pprof.WriteHeapProfile(f); err != nil {
+				fmt.Fprintf(env.ErrOut, "Couldn't write heap profile: %s\n", err)
+			}
+		})
+	}
+	return stop
+}
+
+// createProfile creates a profile output file.
+func createProfile(env *cli.Environment, path string) (afero.File, error) {
+	f, err := env.Fs.OpenFile(path, os.O_WRONLY|os.O_CREATE|os.O_TRUNC, 0600)
+	if err != nil {
+		fmt.Fprintf(env.ErrOut, "Couldn't create profile: %s\n", err)
+	}
+	return f, err
+}
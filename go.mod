@@ -22,6 +22,6 @@ require (
 	github.com/stretchr/testify v1.6.1
 	github.com/vbauerster/mpb v3.4.0+incompatible
 	golang.org/x/crypto v0.0.0-20200728195943-123391ffb6de
-	golang.org/x/sys v0.0.0-20200817085935-3ff754bf58a9 // indirect
+	golang.org/x/sys v0.0.0-20200817085935-3ff754bf58a9
 	gopkg.in/square/go-jose.v2 v2.5.1 // indirect
 )
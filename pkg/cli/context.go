@@ -1,12 +1,14 @@
 package cli
 
 import (
+	"context"
 	"crypto/tls"
 	"errors"
 	"fmt"
 	"io"
 	"os"
 	"path/filepath"
+	"runtime/trace"
 	"strings"
 	"sync"
 
@@ -84,6 +86,9 @@ func (ctx *Context) Logger() *logrus.Logger {
 // PluginManager returns a plugin manager.
 func (ctx *Context) PluginManager(cluster *config.Cluster) *plugin.Manager {
 	pluginManager := plugin.NewManager(ctx.Fs(), ctx.Logger())
+	if dcosDir, err := ctx.DCOSDir(); err == nil {
+		pluginManager.SetStoreDir(filepath.Join(dcosDir, "store"))
+	}
 	if cluster != nil {
 		pluginManager.SetCluster(cluster)
 	}
@@ -133,7 +138,9 @@ func (ctx *Context) Cluster() (*config.Cluster, error) {
 	if err != nil {
 		return nil, err
 	}
+	region := trace.StartRegion(context.Background(), "current-config")
 	conf, err := configManager.Current()
+	region.End()
 	if err != nil {
 		return nil, err
 	}
@@ -169,6 +176,7 @@ func (ctx *Context) HTTPClient(c *config.Cluster, opts ...httpclient.Option) (*h
 	tlsOpt := httpclient.TLS(&tls.Config{
 		InsecureSkipVerify: clusterTLS.Insecure, // nolint: gosec
 		RootCAs:            clusterTLS.RootCAs,
+		ClientSessionCache: httpclient.SessionCache(c.Dir()),
 	})
 
 	baseOpts = append(baseOpts, tlsOpt, httpclient.Logger(ctx.Logger()))
@@ -17,6 +17,32 @@ const (
 
 	// EnvDCOSDir can be used to specify a custom directory for the DC/OS CLI data, which defaults to "~/.dcos".
 	EnvDCOSDir = "DCOS_DIR"
+
+	// EnvHTTPTrace can be set to the path of a file where HTTP request traces get appended, as newline-delimited JSON.
+	EnvHTTPTrace = "DCOS_CLI_HTTP_TRACE"
+
+	// EnvHTTPDebugBodyLimit is the number of bytes of HTTP bodies logged at the debug level, 0 disables body logging.
+	EnvHTTPDebugBodyLimit = "DCOS_CLI_HTTP_DEBUG_BODY_LIMIT"
+
+	// EnvCPUProfile can be set to the path of a file where a CPU profile of the CLI run gets written.
+	EnvCPUProfile = "DCOS_CLI_CPUPROFILE"
+
+	// EnvMemProfile can be set to the path of a file where a heap profile gets written at the end of the CLI run.
+	EnvMemProfile = "DCOS_CLI_MEMPROFILE"
+
+	// EnvTrace can be set to the path of a file where a runtime execution trace of the CLI run gets written.
+	EnvTrace = "DCOS_CLI_TRACE"
+
+	// EnvPluginExec can be set to 1 to replace the CLI process with the plugin process when invoking a
+	// plugin command, instead of running it as a child process. This is only supported on Linux and macOS.
+	EnvPluginExec = "DCOS_CLI_PLUGIN_EXEC"
+
+	// EnvDaemon can be set to 1 to run non-interactive invocations through a resident CLI process, started
+	// on demand for the DC/OS directory. This is only supported on Linux and macOS.
+	EnvDaemon = "DCOS_CLI_DAEMON"
+
+	// EnvDaemonIdleTimeout is the duration after which the resident CLI process exits when it isn't used, eg. "5m".
+	EnvDaemonIdleTimeout = "DCOS_CLI_DAEMON_IDLE_TIMEOUT"
 )
 
 // Environment represents the CLI environment. It contains writers for stdout/stderr,
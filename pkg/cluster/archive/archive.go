@@ -0,0 +1,297 @@
+package archive
+
+import (
+	"archive/zip"
+	"bytes"
+	"errors"
+	"fmt"
+	"io"
+	"os"
+	"path"
+	"path/filepath"
+	"strings"
+	"time"
+
+	"github.com/dcos/dcos-cli/pkg/config"
+	"github.com/dcos/dcos-cli/pkg/fsutil"
+	"github.com/pelletier/go-toml"
+	"github.com/spf13/afero"
+)
+
+// TOML keys rewritten when exporting and importing a cluster.
+const (
+	keyACSToken = "core.dcos_acs_token" // nolint: gosec
+	keyTLS      = "core.ssl_verify"
+)
+
+// Files of a cluster directory which are part of an archive. Other files (eg. the `attached` file,
+// the plugin index or temporary files) are either specific to a DCOS_DIR or get rebuilt on demand.
+const (
+	configFile   = "dcos.toml"
+	caBundleFile = "dcos_ca.crt"
+	pluginsDir   = "subcommands"
+	pluginFile   = "plugin.toml"
+
+	// storeDigestFile refers to the plugin store of the DCOS_DIR the plugin was installed into.
+	storeDigestFile = "store.digest"
+)
+
+// ErrClusterExists indicates that an imported cluster is already configured.
+var ErrClusterExists = errors.New("cluster is already configured")
+
+// ExportOpts are options for an export.
+type ExportOpts struct {
+	// IncludeToken indicates whether the ACS token is part of the archive.
+	IncludeToken bool
+}
+
+// Export writes a configured cluster to w as a ZIP archive.
+//
+// The archive holds the cluster config, its CA bundle and its plugins under a directory
+// named after the cluster ID. Absolute paths to the cluster directory are made relative,
+// they are resolved again on import.
+func Export(cluster *config.Cluster, w io.Writer, opts ExportOpts) error {
+	fs := cluster.Config().Fs()
+	clusterDir := cluster.Dir()
+
+	zw := zip.NewWriter(w)
+	root := filepath.Base(clusterDir)
+	if err := writeDir(zw, root, 0755); err != nil {
+		return err
+	}
+
+	data, err := afero.ReadFile(fs, cluster.Config().Path())
+	if err != nil {
+		return err
+	}
+	data, err = exportConfig(data, clusterDir, opts)
+	if err != nil {
+		return err
+	}
+	if err := writeFile(zw, path.Join(root, configFile), data, 0600); err != nil {
+		return err
+	}
+
+	caBundlePath := filepath.Join(clusterDir, caBundleFile)
+	if data, err := afero.ReadFile(fs, caBundlePath); err == nil {
+		if err := writeFile(zw, path.Join(root, caBundleFile), data, 0644); err != nil {
+			return err
+		}
+	}
+
+	err = afero.Walk(fs, filepath.Join(clusterDir, pluginsDir), func(p string, info os.FileInfo, err error) error {
+		if err != nil {
+			if os.IsNotExist(err) {
+				return nil
+			}
+			return err
+		}
+		relPath, err := filepath.Rel(clusterDir, p)
+		if err != nil {
+			return err
+		}
+		name := path.Join(root, filepath.ToSlash(relPath))
+
+		switch {
+		case info.IsDir():
+			return writeDir(zw, name, info.Mode())
+		case info.Name() == storeDigestFile:
+			return nil
+		}
+
+		data, err := afero.ReadFile(fs, p)
+		if err != nil {
+			return err
+		}
+		if info.Name() == pluginFile {
+			if data, err = exportPlugin(data, filepath.Dir(p)); err != nil {
+				return fmt.Errorf("couldn't export %s: %s", p, err)
+			}
+		}
+		return writeFile(zw, name, data, info.Mode())
+	})
+	if err != nil {
+		return err
+	}
+	return zw.Close()
+}
+
+// Import extracts a cluster archive into the clusters directory of a config manager.
+//
+// The archive is extracted into a temporary directory, its paths are then rewritten
+// for the cluster directory before it gets moved there. Thus, the cluster either gets
+// fully imported or not at all.
+func Import(manager *config.Manager, archivePath string) (*config.Config, error) {
+	fs := manager.Fs()
+
+	tmpRoot := filepath.Join(manager.Dir(), "tmp")
+	if err := fs.MkdirAll(tmpRoot, 0700); err != nil {
+		return nil, err
+	}
+	tmpDir, err := afero.TempDir(fs, tmpRoot, "import")
+	if err != nil {
+		return nil, err
+	}
+	defer fs.RemoveAll(tmpDir)
+
+	if err := fsutil.Unzip(fs, archivePath, tmpDir); err != nil {
+		return nil, err
+	}
+
+	entries, err := afero.ReadDir(fs, tmpDir)
+	if err != nil {
+		return nil, err
+	}
+	if len(entries) != 1 || !entries[0].IsDir() {
+		return nil, fmt.Errorf("%s is not a cluster archive", archivePath)
+	}
+	id := entries[0].Name()
+	srcDir := filepath.Join(tmpDir, id)
+	clusterDir := filepath.Join(manager.Dir(), "clusters", id)
+
+	if exists, _ := afero.Exists(fs, filepath.Join(srcDir, configFile)); !exists {
+		return nil, fmt.Errorf("%s is not a cluster archive", archivePath)
+	}
+	if exists, _ := afero.Exists(fs, clusterDir); exists {
+		return nil, ErrClusterExists
+	}
+
+	if err := rewriteFile(fs, filepath.Join(srcDir, configFile), func(data []byte) ([]byte, error) {
+		return importConfig(data, clusterDir)
+	}); err != nil {
+		return nil, err
+	}
+
+	plugins, _ := afero.ReadDir(fs, filepath.Join(srcDir, pluginsDir))
+	for _, plugin := range plugins {
+		envDir := filepath.Join(pluginsDir, plugin.Name(), "env")
+		pluginFilePath := filepath.Join(srcDir, envDir, pluginFile)
+		if exists, _ := afero.Exists(fs, pluginFilePath); !exists {
+			continue
+		}
+		if err := rewriteFile(fs, pluginFilePath, func(data []byte) ([]byte, error) {
+			return importPlugin(data, filepath.Join(clusterDir, envDir))
+		}); err != nil {
+			return nil, err
+		}
+	}
+
+	if err := fs.MkdirAll(filepath.Dir(clusterDir), 0755); err != nil {
+		return nil, err
+	}
+	if err := fs.Rename(srcDir, clusterDir); err != nil {
+		return nil, err
+	}
+	return manager.Find(id, true)
+}
+
+// exportConfig removes the ACS token from a cluster config, unless it should be included,
+// and makes the path to the cluster CA bundle relative to the cluster directory.
+func exportConfig(data []byte, clusterDir string, opts ExportOpts) ([]byte, error) {
+	tree, err := toml.LoadBytes(data)
+	if err != nil {
+		return nil, err
+	}
+	if !opts.IncludeToken && tree.Has(keyACSToken) {
+		if err := tree.Delete(keyACSToken); err != nil {
+			return nil, err
+		}
+	}
+	if tls, ok := tree.Get(keyTLS).(string); ok && tls == filepath.Join(clusterDir, caBundleFile) {
+		tree.Set(keyTLS, caBundleFile)
+	}
+	return treeBytes(tree)
+}
+
+// importConfig makes a relative path to the cluster CA bundle absolute.
+func importConfig(data []byte, clusterDir string) ([]byte, error) {
+	tree, err := toml.LoadBytes(data)
+	if err != nil {
+		return nil, err
+	}
+	if tls, ok := tree.Get(keyTLS).(string); ok && tls == caBundleFile {
+		tree.Set(keyTLS, filepath.Join(clusterDir, caBundleFile))
+	}
+	return treeBytes(tree)
+}
+
+// exportPlugin makes the command paths of a plugin.toml file relative to the plugin env directory.
+func exportPlugin(data []byte, envDir string) ([]byte, error) {
+	return rewritePluginPaths(data, func(cmdPath string) string {
+		if relPath, err := filepath.Rel(envDir, cmdPath); err == nil && !strings.HasPrefix(relPath, "..") {
+			return filepath.ToSlash(relPath)
+		}
+		return cmdPath
+	})
+}
+
+// importPlugin makes the command paths of a plugin.toml file absolute, for a given plugin env directory.
+func importPlugin(data []byte, envDir string) ([]byte, error) {
+	return rewritePluginPaths(data, func(cmdPath string) string {
+		if filepath.IsAbs(cmdPath) {
+			return cmdPath
+		}
+		return filepath.Join(envDir, filepath.FromSlash(cmdPath))
+	})
+}
+
+// rewritePluginPaths rewrites the command paths of a plugin.toml file.
+func rewritePluginPaths(data []byte, rewrite func(cmdPath string) string) ([]byte, error) {
+	tree, err := toml.LoadBytes(data)
+	if err != nil {
+		return nil, err
+	}
+	commands, _ := tree.Get("commands").([]*toml.Tree)
+	for _, command := range commands {
+		if cmdPath, ok := command.Get("path").(string); ok && cmdPath != "" {
+			command.Set("path", rewrite(cmdPath))
+		}
+	}
+	return treeBytes(tree)
+}
+
+// rewriteFile rewrites a file in place, keeping its permissions.
+func rewriteFile(fs afero.Fs, filePath string, rewrite func(data []byte) ([]byte, error)) error {
+	info, err := fs.Stat(filePath)
+	if err != nil {
+		return err
+	}
+	data, err := afero.ReadFile(fs, filePath)
+	if err != nil {
+		return err
+	}
+	data, err = rewrite(data)
+	if err != nil {
+		return fmt.Errorf("couldn't import %s: %s", filepath.Base(filePath), err)
+	}
+	return afero.WriteFile(fs, filePath, data, info.Mode())
+}
+
+// treeBytes returns the TOML representation of a tree.
+func treeBytes(tree *toml.Tree) ([]byte, error) {
+	var buf bytes.Buffer
+	if _, err := tree.WriteTo(&buf); err != nil {
+		return nil, err
+	}
+	return buf.Bytes(), nil
+}
+
+// writeDir adds a directory entry to a ZIP archive.
+func writeDir(zw *zip.Writer, name string, mode os.FileMode) error {
+	header := &zip.FileHeader{Name: name + "/", Method: zip.Store, Modified: time.Now()}
+	header.SetMode(mode | os.ModeDir)
+	_, err := zw.CreateHeader(header)
+	return err
+}
+
+// writeFile adds a file to a ZIP archive.
+func writeFile(zw *zip.Writer, name string, data []byte, mode os.FileMode) error {
+	header := &zip.FileHeader{Name: name, Method: zip.Deflate, Modified: time.Now()}
+	header.SetMode(mode)
+	f, err := zw.CreateHeader(header)
+	if err != nil {
+		return err
+	}
+	_, err = f.Write(data)
+	return err
+}
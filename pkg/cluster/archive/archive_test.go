@@ -0,0 +1,117 @@
+package archive
+
+import (
+	"bytes"
+	"io/ioutil"
+	"os"
+	"path/filepath"
+	"testing"
+
+	"github.com/dcos/dcos-cli/pkg/config"
+	"github.com/pelletier/go-toml"
+	"github.com/spf13/afero"
+	"github.com/stretchr/testify/require"
+)
+
+const clusterID = "79893ca2-f7f1-2295-2514-a6b3918043b6"
+
+func TestExportImport(t *testing.T) {
+	for _, includeToken := range []bool{false, true} {
+		src, removeSrc := newManager(t)
+		defer removeSrc()
+
+		conf := config.New(config.Opts{Fs: src.Fs()})
+		conf.Set("cluster.name", "mr-cluster")
+		conf.Set("core.dcos_url", "https://dcos.example.com")
+		conf.Set("core.dcos_acs_token", "token")
+		require.NoError(t, src.Save(conf, clusterID, []byte("ca bundle")))
+		require.NoError(t, src.Attach(conf))
+
+		srcEnvDir := filepath.Join(src.Dir(), "clusters", clusterID, "subcommands", "dcos-core-cli", "env")
+		createFile(t, filepath.Join(srcEnvDir, "bin", "dcos-core"), "binary", 0755)
+		createFile(t, filepath.Join(srcEnvDir, "plugin.toml"), `name = "dcos-core-cli"
+
+[[commands]]
+  name = "core"
+  path = '`+filepath.Join(srcEnvDir, "bin", "dcos-core")+`'
+`, 0644)
+		createFile(t, filepath.Join(srcEnvDir, "..", "store.digest"), "digest", 0644)
+
+		var buf bytes.Buffer
+		require.NoError(t, Export(config.NewCluster(conf), &buf, ExportOpts{IncludeToken: includeToken}))
+
+		archivePath := filepath.Join(src.Dir(), "cluster.zip")
+		require.NoError(t, ioutil.WriteFile(archivePath, buf.Bytes(), 0600))
+
+		dest, removeDest := newManager(t)
+		defer removeDest()
+
+		importedConf, err := Import(dest, archivePath)
+		require.NoError(t, err)
+
+		cluster := config.NewCluster(importedConf)
+		require.Equal(t, clusterID, cluster.ID())
+		require.Equal(t, "mr-cluster", cluster.Name())
+		require.Equal(t, "https://dcos.example.com", cluster.URL())
+		if includeToken {
+			require.Equal(t, "token", cluster.ACSToken())
+		} else {
+			require.Empty(t, cluster.ACSToken())
+		}
+
+		clusterDir := filepath.Join(dest.Dir(), "clusters", clusterID)
+		require.Equal(t, filepath.Join(clusterDir, "dcos_ca.crt"), importedConf.Get("core.ssl_verify"))
+
+		envDir := filepath.Join(clusterDir, "subcommands", "dcos-core-cli", "env")
+		pluginTree, err := toml.LoadFile(filepath.Join(envDir, "plugin.toml"))
+		require.NoError(t, err)
+		commands := pluginTree.Get("commands").([]*toml.Tree)
+		require.Len(t, commands, 1)
+		require.Equal(t, filepath.Join(envDir, "bin", "dcos-core"), commands[0].Get("path"))
+
+		info, err := os.Stat(filepath.Join(envDir, "bin", "dcos-core"))
+		require.NoError(t, err)
+		if os.PathSeparator == '/' {
+			require.Equal(t, os.FileMode(0755), info.Mode().Perm())
+		}
+
+		for _, file := range []string{"attached", filepath.Join("subcommands", "dcos-core-cli", "store.digest")} {
+			_, err := os.Stat(filepath.Join(clusterDir, file))
+			require.True(t, os.IsNotExist(err), file)
+		}
+
+		_, err = Import(dest, archivePath)
+		require.Equal(t, ErrClusterExists, err)
+	}
+}
+
+func TestImportInvalidArchive(t *testing.T) {
+	manager, remove := newManager(t)
+	defer remove()
+
+	archivePath := filepath.Join(manager.Dir(), "cluster.zip")
+	require.NoError(t, ioutil.WriteFile(archivePath, []byte("not a zip"), 0600))
+
+	_, err := Import(manager, archivePath)
+	require.Error(t, err)
+
+	clusters, _ := ioutil.ReadDir(filepath.Join(manager.Dir(), "clusters"))
+	require.Empty(t, clusters)
+}
+
+// newManager returns a config manager in a temporary directory, as directories can't be renamed on a MemMapFs.
+func newManager(t *testing.T) (*config.Manager, func()) {
+	dir, err := ioutil.TempDir("", "dcos-cli")
+	require.NoError(t, err)
+
+	manager := config.NewManager(config.ManagerOpts{
+		Dir: dir,
+		Fs:  afero.NewOsFs(),
+	})
+	return manager, func() { os.RemoveAll(dir) }
+}
+
+func createFile(t *testing.T, path, content string, perm os.FileMode) {
+	require.NoError(t, os.MkdirAll(filepath.Dir(path), 0755))
+	require.NoError(t, ioutil.WriteFile(path, []byte(content), perm))
+}
@@ -1,10 +1,14 @@
 package lister
 
+import "time"
+
 // Filters are filtering conditions for cluster lists.
 type Filters struct {
 	AttachedOnly bool
 	Status       string
 	Linked       bool
+	StatusTTL    time.Duration
+	UpdateCache  bool
 }
 
 // Filter is a functional option for list filters.
@@ -30,3 +34,18 @@ func Linked() Filter {
 		filters.Linked = true
 	}
 }
+
+// CachedStatus indicates that cluster statuses can be read from the status cache.
+// Statuses older than the given TTL are returned as well, but their items are marked as stale.
+func CachedStatus(ttl time.Duration) Filter {
+	return func(filters *Filters) {
+		filters.StatusTTL = ttl
+	}
+}
+
+// UpdateStatusCache indicates that the statuses of the probed clusters should be written to the status cache.
+func UpdateStatusCache() Filter {
+	return func(filters *Filters) {
+		filters.UpdateCache = true
+	}
+}
@@ -32,6 +32,7 @@ type Item struct {
 	URL      string `json:"url"`
 	Version  string `json:"version"`
 	cluster  *config.Cluster
+	stale    bool
 }
 
 // Cluster returns the cluster associated to the item.
@@ -39,12 +40,20 @@ func (i *Item) Cluster() *config.Cluster {
 	return i.cluster
 }
 
+// Stale indicates whether the item status comes from the status cache and is older than the cache TTL.
+func (i *Item) Stale() bool {
+	return i.stale
+}
+
 // Lister is able to retrieve locally configured clusters as well as linked clusters.
 type Lister struct {
 	configManager  *config.Manager
 	linker         *linker.Linker
 	currentCluster *config.Cluster
 	logger         *logrus.Logger
+	cache          *statusCache
+	cacheUpdated   bool
+	cacheMu        sync.Mutex
 }
 
 // New creates a new cluster lister.
@@ -120,11 +129,24 @@ func (l *Lister) List(filters ...Filter) []*Item {
 				return
 			}
 
-			httpClient := l.httpClient(cluster)
-			version, err := dcos.NewClient(httpClient).Version()
-			if err == nil {
-				item.Status = StatusAvailable
-				item.Version = version.Version
+			if entry, ok := l.cachedStatus(item.ID, listFilters.StatusTTL); ok {
+				item.Status = entry.Status
+				item.Version = entry.Version
+				item.stale = time.Since(entry.ProbedAt) > listFilters.StatusTTL
+			} else {
+				httpClient := l.httpClient(cluster)
+				version, err := dcos.NewClient(httpClient).Version()
+				if err == nil {
+					item.Status = StatusAvailable
+					item.Version = version.Version
+				}
+				if listFilters.UpdateCache {
+					l.cacheStatus(item.ID, statusCacheEntry{
+						Status:   item.Status,
+						Version:  item.Version,
+						ProbedAt: time.Now(),
+					})
+				}
 			}
 
 			if cluster.Config().Path() == "" {
@@ -149,6 +171,13 @@ func (l *Lister) List(filters ...Filter) []*Item {
 		}(cluster)
 	}
 	wg.Wait()
+
+	l.cacheMu.Lock()
+	if l.cacheUpdated {
+		l.persistStatusCache()
+		l.cacheUpdated = false
+	}
+	l.cacheMu.Unlock()
 	return items
 }
 
@@ -170,6 +199,7 @@ func (l *Lister) httpClient(cluster *config.Cluster) *httpclient.Client {
 		httpclient.TLS(&tls.Config{
 			InsecureSkipVerify: clusterTLS.Insecure, // nolint: gosec
 			RootCAs:            clusterTLS.RootCAs,
+			ClientSessionCache: httpclient.SessionCache(cluster.Dir()),
 		}),
 	)
 }
@@ -2,9 +2,12 @@ package lister
 
 import (
 	"bytes"
+	"fmt"
+	"net/http"
 	"net/http/httptest"
 	"path/filepath"
 	"testing"
+	"time"
 
 	"github.com/sirupsen/logrus/hooks/test"
 
@@ -119,3 +122,98 @@ func TestListIgnoresLegacyConfig(t *testing.T) {
 	require.Len(t, lister.List(AttachedOnly()), 0)
 	require.Len(t, lister.List(), 0)
 }
+
+func TestListCachedStatus(t *testing.T) {
+	env := mock.NewEnvironment()
+
+	ts := mock.NewTestServer(mock.Cluster{Version: "1.12"})
+	conf := config.New(config.Opts{Fs: env.Fs})
+	conf.Set("core.dcos_url", ts.URL)
+	conf.Set("cluster.name", "cached-cluster")
+	conf.SetPath(filepath.Join("clusters", "1234-56789-01234", "dcos.toml"))
+	require.NoError(t, conf.Persist())
+
+	newLister := func() *Lister {
+		logger, _ := test.NewNullLogger()
+		return New(config.NewManager(config.ManagerOpts{
+			Fs:        env.Fs,
+			EnvLookup: env.EnvLookup,
+		}), logger)
+	}
+
+	// The first list probes the cluster and populates the status cache.
+	items := newLister().List(CachedStatus(time.Minute), UpdateStatusCache())
+	require.Len(t, items, 1)
+	require.Equal(t, StatusAvailable, items[0].Status)
+	require.Equal(t, "1.12", items[0].Version)
+	require.False(t, items[0].Stale())
+
+	// Once the cluster is down, its status is still read from the cache.
+	ts.Close()
+	items = newLister().List(CachedStatus(time.Minute))
+	require.Len(t, items, 1)
+	require.Equal(t, StatusAvailable, items[0].Status)
+	require.Equal(t, "1.12", items[0].Version)
+	require.False(t, items[0].Stale())
+
+	// Statuses older than the TTL are marked as stale and trigger a single revalidation.
+	lister := newLister()
+	items = lister.List(CachedStatus(time.Nanosecond))
+	require.Len(t, items, 1)
+	require.Equal(t, StatusAvailable, items[0].Status)
+	require.True(t, items[0].Stale())
+	require.True(t, lister.Revalidate(items))
+	require.False(t, newLister().Revalidate(items))
+
+	// Without the cached status filter, the cluster is probed.
+	items = newLister().List()
+	require.Len(t, items, 1)
+	require.Equal(t, StatusUnavailable, items[0].Status)
+	require.False(t, items[0].Stale())
+
+	// The status cache is only updated when requested.
+	items = newLister().List(CachedStatus(time.Minute))
+	require.Len(t, items, 1)
+	require.Equal(t, StatusAvailable, items[0].Status)
+
+	items = newLister().List(UpdateStatusCache())
+	require.Equal(t, StatusUnavailable, items[0].Status)
+	items = newLister().List(CachedStatus(time.Minute))
+	require.Equal(t, StatusUnavailable, items[0].Status)
+}
+
+func BenchmarkList(b *testing.B) {
+	// Clusters take 50ms to respond, which is typical of remote clusters.
+	ts := httptest.NewServer(http.HandlerFunc(func(w http.ResponseWriter, r *http.Request) {
+		time.Sleep(50 * time.Millisecond)
+		w.Write([]byte(`{"version": "2.1"}`))
+	}))
+	defer ts.Close()
+
+	for _, n := range []int{1, 10, 50} {
+		b.Run(fmt.Sprintf("clusters=%d", n), func(b *testing.B) {
+			env := mock.NewEnvironment()
+			for i := 0; i < n; i++ {
+				conf := config.New(config.Opts{Fs: env.Fs})
+				conf.Set("core.dcos_url", ts.URL)
+				conf.Set("cluster.name", fmt.Sprintf("cluster-%d", i))
+				conf.SetPath(filepath.Join("clusters", fmt.Sprintf("%d-56789-01234", i), "dcos.toml"))
+				require.NoError(b, conf.Persist())
+			}
+
+			logger, _ := test.NewNullLogger()
+			lister := New(config.NewManager(config.ManagerOpts{
+				Fs:        env.Fs,
+				EnvLookup: env.EnvLookup,
+			}), logger)
+
+			b.ReportAllocs()
+			b.ResetTimer()
+			for i := 0; i < b.N; i++ {
+				if items := lister.List(); len(items) != n {
+					b.Fatalf("expected %d clusters, got %d", n, len(items))
+				}
+			}
+		})
+	}
+}
@@ -0,0 +1,116 @@
+package lister
+
+import (
+	"encoding/json"
+	"path/filepath"
+	"time"
+
+	"github.com/spf13/afero"
+)
+
+// revalidationInterval is the minimum interval between two status revalidations.
+// It prevents concurrent lists from triggering a revalidation each.
+const revalidationInterval = 10 * time.Second
+
+// statusCacheEntry is the last known status of a cluster.
+type statusCacheEntry struct {
+	Status   string    `json:"status"`
+	Version  string    `json:"version"`
+	ProbedAt time.Time `json:"probed_at"`
+}
+
+// statusCache holds the last known status of clusters, indexed by cluster ID.
+type statusCache struct {
+	Clusters      map[string]statusCacheEntry `json:"clusters"`
+	RevalidatedAt time.Time                   `json:"revalidated_at"`
+}
+
+// cachedStatus returns the cached status of a cluster. The cache isn't read when the TTL isn't positive.
+func (l *Lister) cachedStatus(id string, ttl time.Duration) (statusCacheEntry, bool) {
+	if ttl <= 0 {
+		return statusCacheEntry{}, false
+	}
+	l.cacheMu.Lock()
+	defer l.cacheMu.Unlock()
+
+	l.loadStatusCache()
+	entry, ok := l.cache.Clusters[id]
+	return entry, ok
+}
+
+// cacheStatus stores the status of a cluster in the cache.
+func (l *Lister) cacheStatus(id string, entry statusCacheEntry) {
+	l.cacheMu.Lock()
+	defer l.cacheMu.Unlock()
+
+	l.loadStatusCache()
+	l.cache.Clusters[id] = entry
+	l.cacheUpdated = true
+}
+
+// Revalidate indicates whether stale statuses in a list should be revalidated.
+//
+// It returns false when there is no stale status, or when a revalidation has recently been started.
+func (l *Lister) Revalidate(items []*Item) bool {
+	var stale bool
+	for _, item := range items {
+		stale = stale || item.stale
+	}
+	if !stale {
+		return false
+	}
+
+	l.cacheMu.Lock()
+	defer l.cacheMu.Unlock()
+
+	l.loadStatusCache()
+	if time.Since(l.cache.RevalidatedAt) < revalidationInterval {
+		return false
+	}
+	l.cache.RevalidatedAt = time.Now()
+	l.persistStatusCache()
+	return true
+}
+
+// loadStatusCache reads the status cache from the filesystem, unless it is already loaded.
+func (l *Lister) loadStatusCache() {
+	if l.cache != nil {
+		return
+	}
+	l.cache = &statusCache{}
+
+	data, err := afero.ReadFile(l.configManager.Fs(), l.statusCachePath())
+	if err == nil {
+		if err := json.Unmarshal(data, l.cache); err != nil {
+			l.logger.Debugf("Couldn't decode cluster status cache: %s", err)
+		}
+	}
+	if l.cache.Clusters == nil {
+		l.cache.Clusters = make(map[string]statusCacheEntry)
+	}
+}
+
+// persistStatusCache atomically writes the status cache to the filesystem.
+func (l *Lister) persistStatusCache() {
+	fs := l.configManager.Fs()
+	f, err := afero.TempFile(fs, l.configManager.Dir(), "clusters.status")
+	if err != nil {
+		l.logger.Debugf("Couldn't write cluster status cache: %s", err)
+		return
+	}
+	defer fs.Remove(f.Name())
+
+	err = json.NewEncoder(f).Encode(l.cache)
+	f.Close()
+	if err == nil {
+		err = fs.Rename(f.Name(), l.statusCachePath())
+	}
+	if err != nil {
+		l.logger.Debugf("Couldn't write cluster status cache: %s", err)
+	}
+}
+
+// statusCachePath returns the path to the cluster status cache.
+func (l *Lister) statusCachePath() string {
+	return filepath.Join(l.configManager.Dir(), "clusters.status")
+}
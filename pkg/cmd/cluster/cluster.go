@@ -22,6 +22,8 @@ func NewCommand(ctx api.Context) *cobra.Command {
 	}
 	cmd.AddCommand(
 		newCmdClusterAttach(ctx),
+		newCmdClusterExport(ctx),
+		newCmdClusterImport(ctx),
 		newCmdClusterLink(ctx),
 		newCmdClusterList(ctx),
 		newCmdClusterOpen(ctx),
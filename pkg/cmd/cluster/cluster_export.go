@@ -0,0 +1,50 @@
+package cluster
+
+import (
+	"os"
+
+	"github.com/dcos/dcos-cli/api"
+	"github.com/dcos/dcos-cli/pkg/cluster/archive"
+	"github.com/dcos/dcos-cli/pkg/config"
+	"github.com/spf13/cobra"
+)
+
+// newCmdClusterExport exports a cluster to an archive.
+func newCmdClusterExport(ctx api.Context) *cobra.Command {
+	var opts archive.ExportOpts
+
+	cmd := &cobra.Command{
+		Use:   "export <cluster> <file>",
+		Short: "Export a configured cluster and its plugins to an archive",
+		Args:  cobra.ExactArgs(2),
+		RunE: func(cmd *cobra.Command, args []string) error {
+			manager, err := ctx.ConfigManager()
+			if err != nil {
+				return err
+			}
+			conf, err := manager.Find(args[0], false)
+			if err != nil {
+				return err
+			}
+
+			fs := ctx.Fs()
+			f, err := fs.OpenFile(args[1], os.O_WRONLY|os.O_CREATE|os.O_TRUNC, 0600)
+			if err != nil {
+				return err
+			}
+			if err := archive.Export(config.NewCluster(conf), f, opts); err != nil {
+				f.Close()
+				fs.Remove(args[1])
+				return err
+			}
+			if err := f.Close(); err != nil {
+				return err
+			}
+			ctx.Logger().Infof("Exported %s to %s", args[0], args[1])
+			return nil
+		},
+	}
+	cmd.Flags().BoolVar(&opts.IncludeToken, "include-token", false,
+		"Include the authentication token, the cluster is then usable without logging in again")
+	return cmd
+}
@@ -0,0 +1,44 @@
+package cluster
+
+import (
+	"fmt"
+
+	"github.com/dcos/dcos-cli/api"
+	"github.com/dcos/dcos-cli/pkg/cluster/archive"
+	"github.com/dcos/dcos-cli/pkg/config"
+	"github.com/spf13/cobra"
+)
+
+// newCmdClusterImport imports a cluster from an archive.
+func newCmdClusterImport(ctx api.Context) *cobra.Command {
+	var attach bool
+
+	cmd := &cobra.Command{
+		Use:   "import <file>",
+		Short: "Import a cluster exported with `dcos cluster export`",
+		Args:  cobra.ExactArgs(1),
+		RunE: func(cmd *cobra.Command, args []string) error {
+			manager, err := ctx.ConfigManager()
+			if err != nil {
+				return err
+			}
+			conf, err := archive.Import(manager, args[0])
+			if err == archive.ErrClusterExists {
+				return fmt.Errorf("the cluster from %s is already configured", args[0])
+			}
+			if err != nil {
+				return err
+			}
+			cluster := config.NewCluster(conf)
+			if attach {
+				if err := manager.Attach(conf); err != nil {
+					return err
+				}
+			}
+			ctx.Logger().Infof("Imported cluster %s (%s)", cluster.Name(), cluster.ID())
+			return nil
+		},
+	}
+	cmd.Flags().BoolVar(&attach, "attach", false, "Attach the imported cluster")
+	return cmd
+}
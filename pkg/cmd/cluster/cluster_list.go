@@ -4,6 +4,10 @@ import (
 	"encoding/json"
 	"errors"
 	"fmt"
+	"os"
+	"os/exec"
+	"strconv"
+	"time"
 
 	"github.com/dcos/dcos-cli/api"
 	"github.com/dcos/dcos-cli/pkg/cli"
@@ -11,11 +15,19 @@ import (
 	"github.com/spf13/cobra"
 )
 
+// envStatusTTL is the environment variable to configure the cluster status cache TTL, in seconds.
+// Setting it to 0 disables the status cache.
+const envStatusTTL = "DCOS_CLUSTER_LIST_STATUS_TTL"
+
+// defaultStatusTTL is the default TTL of the cluster status cache.
+const defaultStatusTTL = time.Minute
+
 // newCmdClusterList lists the clusters.
 func newCmdClusterList(ctx api.Context) *cobra.Command {
 	var attachedOnly bool
 	var jsonOutput bool
 	var names bool
+	var refresh bool
 	cmd := &cobra.Command{
 		Use:   "list",
 		Short: "List the clusters configured and the ones linked to the current cluster",
@@ -40,16 +52,39 @@ func newCmdClusterList(ctx api.Context) *cobra.Command {
 				filters = append(filters, lister.Linked())
 			}
 
+			statusTTL := defaultStatusTTL
+			if val, ok := ctx.EnvLookup(envStatusTTL); ok {
+				ttl, err := strconv.Atoi(val)
+				if err != nil {
+					return fmt.Errorf("invalid %s value: %s", envStatusTTL, val)
+				}
+				statusTTL = time.Duration(ttl) * time.Second
+			}
+			if !refresh && statusTTL > 0 {
+				filters = append(filters, lister.CachedStatus(statusTTL))
+			}
+			if refresh || statusTTL > 0 {
+				filters = append(filters, lister.UpdateStatusCache())
+			}
+
 			configManager, err := ctx.ConfigManager()
 			if err != nil {
 				return err
 			}
 
-			items := lister.New(configManager, ctx.Logger()).List(filters...)
+			clusterLister := lister.New(configManager, ctx.Logger())
+			items := clusterLister.List(filters...)
 			if attachedOnly && len(items) == 0 {
 				return errors.New("no cluster is attached. Please run `dcos cluster attach <cluster-name>`")
 			}
 
+			// Stale statuses are refreshed by a background process, the list is returned right away.
+			if clusterLister.Revalidate(items) {
+				if err := revalidateClusterStatuses(attachedOnly); err != nil {
+					ctx.Logger().Debugf("Couldn't refresh cluster statuses: %s", err)
+				}
+			}
+
 			if jsonOutput {
 				enc := json.NewEncoder(ctx.Out())
 				enc.SetIndent("", "    ")
@@ -71,7 +106,32 @@ func newCmdClusterList(ctx api.Context) *cobra.Command {
 	}
 	cmd.Flags().BoolVar(&attachedOnly, "attached", false, "returns attached cluster only")
 	cmd.Flags().BoolVar(&jsonOutput, "json", false, "returns clusters in json format")
+	cmd.Flags().BoolVar(&refresh, "refresh", false, "refresh cluster statuses instead of using cached ones")
 	cmd.Flags().BoolVar(&names, "names", false, "print out a list of cluster names and IDs")
 	cmd.Flags().MarkHidden("names")
 	return cmd
 }
+
+// revalidateClusterStatuses starts a detached `dcos cluster list --refresh` process,
+// which updates the cluster status cache in the background.
+//
+// The process gets its own session, so that it isn't killed along with the process group of the
+// command (eg. by the daemon when the front-end goes away). It is reaped in the background, which
+// matters for long-running processes such as the daemon.
+func revalidateClusterStatuses(attachedOnly bool) error {
+	executablePath, err := os.Executable()
+	if err != nil {
+		return err
+	}
+	args := []string{"cluster", "list", "--refresh", "--json"}
+	if attachedOnly {
+		args = append(args, "--attached")
+	}
+	cmd := exec.Command(executablePath, args...) // nolint: gosec
+	detachProcess(cmd)
+	if err := cmd.Start(); err != nil {
+		return err
+	}
+	go cmd.Wait()
+	return nil
+}
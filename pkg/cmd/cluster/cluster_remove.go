@@ -2,7 +2,6 @@ package cluster
 
 import (
 	"errors"
-	"path/filepath"
 
 	"github.com/dcos/dcos-cli/api"
 	"github.com/dcos/dcos-cli/pkg/cluster/lister"
@@ -39,7 +38,7 @@ func newCmdClusterRemove(ctx api.Context) *cobra.Command {
 				if err != nil {
 					return err
 				}
-				err = ctx.Fs().RemoveAll(filepath.Dir(conf.Path()))
+				err = configManager.Remove(conf)
 				if err != nil {
 					return err
 				}
@@ -56,7 +55,7 @@ func newCmdClusterRemove(ctx api.Context) *cobra.Command {
 			items := lister.New(configManager, ctx.Logger()).List(filters...)
 
 			for _, item := range items {
-				if err := ctx.Fs().RemoveAll(item.Cluster().Dir()); err != nil {
+				if err := configManager.Remove(item.Cluster().Config()); err != nil {
 					return err
 				}
 				ctx.Logger().Infof("Removed cluster %s ...", item.ID)
@@ -2,6 +2,7 @@ package cluster
 
 import (
 	"github.com/dcos/dcos-cli/api"
+	"github.com/dcos/dcos-cli/pkg/config"
 	"github.com/spf13/cobra"
 )
 
@@ -21,7 +22,7 @@ func newCmdClusterRename(ctx api.Context) *cobra.Command {
 				return err
 			}
 			conf.Set("cluster.name", args[1])
-			err = conf.Persist()
+			err = manager.Save(conf, config.NewCluster(conf).ID(), nil)
 			if err != nil {
 				return err
 			}
@@ -3,20 +3,42 @@ package cluster
 import (
 	"errors"
 	"fmt"
+	"io/ioutil"
+	"strings"
+	"time"
 
 	"github.com/dcos/dcos-cli/api"
+	"github.com/dcos/dcos-cli/pkg/cli"
+	"github.com/dcos/dcos-cli/pkg/login"
+	"github.com/dcos/dcos-cli/pkg/prompt"
 	"github.com/dcos/dcos-cli/pkg/setup"
 
 	"github.com/spf13/cobra"
+	"github.com/spf13/pflag"
 )
 
 // newCmdClusterSetup configures the CLI with a given DC/OS cluster.
 func newCmdClusterSetup(ctx api.Context) *cobra.Command {
+	var manifestPath string
+	var workers int
+	var singleClusterFlags []string
 	setupFlags := setup.NewFlags(ctx.Fs(), ctx.EnvLookup, ctx.Logger())
 	cmd := &cobra.Command{
 		Use:   "setup <url>",
 		Short: "Set up the CLI to communicate with a cluster",
 		Args: func(cmd *cobra.Command, args []string) error {
+			if manifestPath != "" {
+				if len(args) > 0 {
+					return errors.New("cluster URLs can't be passed along with --manifest")
+				}
+				// Setup flags are set per cluster in the manifest.
+				for _, name := range singleClusterFlags {
+					if cmd.Flags().Changed(name) {
+						return fmt.Errorf("--%s can't be passed along with --manifest", name)
+					}
+				}
+				return nil
+			}
 			if len(args) == 0 {
 				return errors.New("missing cluster URL")
 			}
@@ -26,11 +48,78 @@ func newCmdClusterSetup(ctx api.Context) *cobra.Command {
 			return nil
 		},
 		RunE: func(cmd *cobra.Command, args []string) error {
+			if manifestPath != "" {
+				return setupManifest(ctx, manifestPath, workers)
+			}
 			clusterURL := args[0]
 			_, err := ctx.Setup(setupFlags, clusterURL, true)
 			return err
 		},
 	}
 	setupFlags.Register(cmd.Flags())
+	cmd.Flags().VisitAll(func(flag *pflag.Flag) {
+		singleClusterFlags = append(singleClusterFlags, flag.Name)
+	})
+	cmd.Flags().StringVar(&manifestPath, "manifest", "",
+		"Set up the clusters listed in a TOML manifest file, instead of a single cluster.")
+	cmd.Flags().IntVar(&workers, "workers", setup.DefaultBulkWorkers,
+		"Maximum number of clusters being set up concurrently, when using --manifest.")
 	return cmd
 }
+
+// setupManifest sets up the clusters listed in a manifest and prints a summary of the results.
+//
+// Setups are non-interactive, as concurrent prompts can't be answered. Their progress output is
+// discarded for the same reason, the summary is printed once all clusters are set up.
+func setupManifest(ctx api.Context, manifestPath string, workers int) error {
+	manifest, err := setup.ReadManifest(ctx.Fs(), manifestPath)
+	if err != nil {
+		return err
+	}
+	configManager, err := ctx.ConfigManager()
+	if err != nil {
+		return err
+	}
+
+	newSetup := func() *setup.Setup {
+		noInput := prompt.New(strings.NewReader(""), ioutil.Discard)
+		return setup.New(setup.Opts{
+			Fs:        ctx.Fs(),
+			Errout:    ioutil.Discard,
+			EnvLookup: ctx.EnvLookup,
+			Prompt:    noInput,
+			Logger:    ctx.Logger(),
+			LoginFlow: login.NewFlow(login.FlowOpts{
+				Errout: ioutil.Discard,
+				Prompt: noInput,
+				Logger: ctx.Logger(),
+				Opener: ctx.Opener(),
+			}),
+			ConfigManager: configManager,
+			PluginManager: ctx.PluginManager(nil),
+			Deprecated:    ctx.Deprecated,
+		})
+	}
+	results := manifest.ConfigureAll(newSetup, workers)
+
+	var failures int
+	table := cli.NewTable(ctx.Out(), []string{"NAME", "ID", "STATUS", "DURATION", "URL"})
+	for _, result := range results {
+		var name, id string
+		status := "OK"
+		if result.Err != nil {
+			failures++
+			status = result.Err.Error()
+		} else {
+			name = result.Cluster.Name()
+			id = result.Cluster.ID()
+		}
+		table.Append([]string{name, id, status, result.Duration.Round(time.Millisecond).String(), result.URL})
+	}
+	table.Render()
+
+	if failures > 0 {
+		return fmt.Errorf("%d out of %d clusters couldn't be set up", failures, len(results))
+	}
+	return nil
+}
@@ -0,0 +1,27 @@
+package cluster
+
+import (
+	"testing"
+
+	"github.com/dcos/dcos-cli/pkg/mock"
+	"github.com/stretchr/testify/require"
+)
+
+func TestClusterSetupManifestRejectsSetupFlags(t *testing.T) {
+	ctx := mock.NewContext(mock.NewEnvironment())
+
+	for _, args := range [][]string{
+		{"--manifest", "clusters.toml", "https://dcos.example.com"},
+		{"--manifest", "clusters.toml", "--username", "bootstrapuser"},
+		{"--manifest", "clusters.toml", "--insecure"},
+		{"--manifest", "clusters.toml", "--ca-certs", "dcos-ca.crt"},
+	} {
+		cmd := newCmdClusterSetup(ctx)
+		cmd.SetArgs(args)
+		cmd.SilenceUsage = true
+		cmd.SilenceErrors = true
+		err := cmd.Execute()
+		require.Error(t, err, args)
+		require.Contains(t, err.Error(), "can't be passed along with --manifest")
+	}
+}
@@ -0,0 +1,9 @@
+//go:build !linux && !darwin
+// +build !linux,!darwin
+
+package cluster
+
+import "os/exec"
+
+// detachProcess is a no-op on this platform.
+func detachProcess(cmd *exec.Cmd) {}
@@ -0,0 +1,14 @@
+//go:build linux || darwin
+// +build linux darwin
+
+package cluster
+
+import (
+	"os/exec"
+	"syscall"
+)
+
+// detachProcess makes a command start in its own session, out of the process group of the CLI.
+func detachProcess(cmd *exec.Cmd) {
+	cmd.SysProcAttr = &syscall.SysProcAttr{Setsid: true}
+}
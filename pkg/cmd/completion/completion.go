@@ -21,6 +21,7 @@ func NewCommand(ctx api.Context) *cobra.Command {
 			shell := args[0]
 			switch shell {
 			case "bash", "zsh":
+				updateCompletionIndexes(ctx)
 				return genBashCompletion(ctx)
 			default:
 				return fmt.Errorf("invalid shell '%s' given", shell)
@@ -40,3 +41,23 @@ func genBashCompletion(ctx api.Context) error {
 	fmt.Fprint(ctx.Out(), string(data))
 	return nil
 }
+
+// updateCompletionIndexes makes sure the completion indexes read by the completion script exist.
+// They are otherwise only written when clusters or plugins change, the script falls back to
+// calling the CLI when they are missing.
+func updateCompletionIndexes(ctx api.Context) {
+	manager, err := ctx.ConfigManager()
+	if err != nil {
+		return
+	}
+	if err := manager.UpdateCompletionIndex(); err != nil {
+		ctx.Logger().Debugf("Couldn't write completion index: %s", err)
+	}
+	cluster, err := ctx.Cluster()
+	if err != nil {
+		return
+	}
+	if err := ctx.PluginManager(cluster).UpdateCompletionIndex(); err != nil {
+		ctx.Logger().Debugf("Couldn't write completion index: %s", err)
+	}
+}
@@ -136,6 +136,73 @@ __dcos_handle_subcommand() {
 }
 
 
+# Reads the completion indexes written by the CLI, which are tab-separated records (see `config.CompletionIndexFile`).
+# This sets __dcos_index to 1 when the indexes could be read, completion functions then use the __dcos_index_*
+# arrays instead of calling the CLI. The index of the current cluster is found through DCOS_CLUSTER, if set,
+# or through the attached cluster.
+__dcos_read_completion_index() {
+    __dcos_index=0
+    __dcos_index_clusters=()
+    __dcos_index_keys=()
+    __dcos_index_plugins=()
+    __dcos_index_commands=()
+    __dcos_index_scripts=()
+
+    local dcos_dir="${DCOS_DIR:-$HOME/.dcos}"
+    local kind value name cluster
+
+    if [[ ! -f "$dcos_dir/completion.index" ]]; then
+        __dcos_debug "no completion index in $dcos_dir"
+        return
+    fi
+
+    while IFS=$'\t' read -r kind value name; do
+        case "$kind" in
+            attached)
+                if [[ -z $DCOS_CLUSTER ]]; then
+                    cluster="$value"
+                fi
+                ;;
+            cluster)
+                if [[ -n $name ]]; then
+                    __dcos_index_clusters+=("$name")
+                fi
+                __dcos_index_clusters+=("$value")
+                if [[ -n $DCOS_CLUSTER && ( $DCOS_CLUSTER == "$value" || $DCOS_CLUSTER == "$name" ) ]]; then
+                    cluster="$value"
+                fi
+                ;;
+            key)
+                __dcos_index_keys+=("$value")
+                ;;
+        esac
+    done < "$dcos_dir/completion.index"
+
+    if [[ -n $cluster ]]; then
+        if [[ ! -f "$dcos_dir/clusters/$cluster/completion.index" ]]; then
+            __dcos_debug "no completion index for cluster $cluster"
+            return
+        fi
+
+        while IFS=$'\t' read -r kind value; do
+            case "$kind" in
+                plugin)
+                    __dcos_index_plugins+=("$value")
+                    ;;
+                command)
+                    __dcos_index_commands+=("$value")
+                    ;;
+                script)
+                    __dcos_index_scripts+=("$value")
+                    ;;
+            esac
+        done < "$dcos_dir/clusters/$cluster/completion.index"
+    fi
+
+    __dcos_index=1
+}
+
+
 __dcos_source_plugin_completions() {
     for dir in "$@"; do
         # skip if plugin doesn't have a completion directory
@@ -264,7 +331,7 @@ _dcos_cluster() {
         return
     fi
 
-    local commands=("attach" "help" "list" "open" "remove" "rename" "setup")
+    local commands=("attach" "export" "help" "import" "list" "open" "remove" "rename" "setup")
     local flags=("--help")
 
     if [ -z "$command" ]; then
@@ -284,6 +351,11 @@ _dcos_cluster() {
 
 __dcos_complete_cluster_names() {
     local names=()
+    if [[ $__dcos_index == 1 ]]; then
+        __dcos_debug "Found cluster names and IDs in the completion index" "${__dcos_index_clusters[@]}"
+        __dcos_handle_compreply "${__dcos_index_clusters[@]}"
+        return
+    fi
     while IFS=$'\n' read -r line; do cluster_names+=("$line"); done < <(dcos cluster list --names 2> /dev/null)
     names+=("${cluster_names[@]}")
     __dcos_debug "Found cluster names and IDs" "${cluster_names[@]}"
@@ -316,6 +388,48 @@ _dcos_cluster_attach() {
     fi
 }
 
+_dcos_cluster_export() {
+    local i command
+
+    if ! __dcos_default_command_parse; then
+        return
+    fi
+
+    local flags=("--help" "--include-token")
+
+    if [ -z "$command" ]; then
+        case "$cur" in
+            --*)
+                __dcos_handle_compreply "${flags[@]}"
+                ;;
+            *)
+                __dcos_complete_cluster_names
+                ;;
+        esac
+        return
+    fi
+}
+
+_dcos_cluster_import() {
+    local i command
+
+    if ! __dcos_default_command_parse; then
+        return
+    fi
+
+    local flags=("--help" "--attach")
+
+    if [ -z "$command" ]; then
+        case "$cur" in
+            --*)
+                __dcos_handle_compreply "${flags[@]}"
+                ;;
+            *) ;;
+        esac
+        return
+    fi
+}
+
 _dcos_cluster_list() {
     local i command
 
@@ -445,14 +559,6 @@ _dcos_cluster_setup() {
     fi
 }
 
-__dcos_complete_config_keys() {
-    local keys=()
-    while IFS=$'\n' read -r line; do config_keys+=("$line"); done < <(dcos config keys --quiet 2> /dev/null)
-    keys+=("${config_keys[@]}")
-    __dcos_debug "Found config keys" "${config_keys[@]}"
-    __dcos_handle_compreply "${keys[@]}"
-}
-
 _dcos_config() {
     local i command
 
@@ -479,6 +585,11 @@ _dcos_config() {
 }
 
 __dcos_complete_config_keys() {
+    if [[ $__dcos_index == 1 ]]; then
+        __dcos_handle_compreply "${__dcos_index_keys[@]}"
+        return
+    fi
+
     local keys=(
     "core.dcos_acs_token"
     "core.dcos_url"
@@ -646,8 +757,12 @@ _dcos_plugin_remove() {
                 ;;
             *)
                 local plugins=()
-                while IFS=$'\n' read -r line; do plugin_ids+=("$line"); done < <(dcos plugin list --quiet 2> /dev/null)
-                plugins+=("${plugin_ids[@]}")
+                if [[ $__dcos_index == 1 ]]; then
+                    plugins=("${__dcos_index_plugins[@]}")
+                else
+                    while IFS=$'\n' read -r line; do plugin_ids+=("$line"); done < <(dcos plugin list --quiet 2> /dev/null)
+                    plugins+=("${plugin_ids[@]}")
+                fi
                 __dcos_handle_compreply "${plugins[@]}"
                 ;;
         esac
@@ -668,13 +783,25 @@ _dcos() {
     local plugin_commands=()
     local completion_dirs=()
 
-    while IFS=$'\n' read -r line; do plugin_commands+=("$line"); done < <(dcos plugin list --commands 2> /dev/null)
-    commands+=("${plugin_commands[@]}")
-    __dcos_debug "Found plugin commands" "${plugin_commands[@]}"
+    if [[ $__dcos_index == 1 ]]; then
+        commands+=("${__dcos_index_commands[@]}")
+        __dcos_debug "Found plugin commands in the completion index" "${__dcos_index_commands[@]}"
 
-    while IFS=$'\n' read -r line; do completion_dirs+=("$line"); done < <(dcos plugin list --completion-dirs 2> /dev/null)
-    __dcos_debug "Plugin completion directories" "${completion_dirs[@]}"
-    __dcos_source_plugin_completions "${completion_dirs[@]}"
+        for file in "${__dcos_index_scripts[@]}"; do
+            __dcos_debug "sourcing completions from $file"
+            # shellcheck disable=SC1090
+            # disables shellcheck warning that it can't follow this source
+            . "$file"
+        done
+    else
+        while IFS=$'\n' read -r line; do plugin_commands+=("$line"); done < <(dcos plugin list --commands 2> /dev/null)
+        commands+=("${plugin_commands[@]}")
+        __dcos_debug "Found plugin commands" "${plugin_commands[@]}"
+
+        while IFS=$'\n' read -r line; do completion_dirs+=("$line"); done < <(dcos plugin list --completion-dirs 2> /dev/null)
+        __dcos_debug "Plugin completion directories" "${completion_dirs[@]}"
+        __dcos_source_plugin_completions "${completion_dirs[@]}"
+    fi
 
     # no subcommand given, complete either flags or subcommands
     if [ -z "$command" ]; then
@@ -722,6 +849,8 @@ __dcos_main() {
 
     __dcos_debug "Starting completion on '$cur' from ${words[*]}"
 
+    __dcos_read_completion_index
+
     _dcos
 }
 
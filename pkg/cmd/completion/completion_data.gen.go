@@ -66,7 +66,7 @@ func (fi bindataFileInfo) Sys() interface{} {
 	return nil
 }
 
-var _completionSh = []byte("\x1f\x8b\x08\x00\x00\x00\x00\x00\x00\xff\xec\x1c\x6b\x73\x1b\xb7\xf1\x3b\x7f\xc5\xe6\xc8\x89\x24\x5b\x27\x4b\x69\xbe\x54\x36\x35\x49\xfc\x68\x3d\x4d\xe2\x8c\xd5\xb4\xd3\xaa\x9a\x1b\xf0\x6e\x8f\x87\x08\x04\xae\x00\x8e\x34\xa3\xea\xbf\x77\x16\xb8\x37\x8f\xb2\x94\x38\xa6\x9b\x8a\x33\x99\x50\x78\x2c\x16\xfb\xde\x25\xd6\xe3\xcf\x9e\xcc\xb8\x7c\x32\x63\x26\x1b\x8d\xc6\x10\x45\x49\xac\x4c\xf4\x2c\x43\x91\xa3\x86\xb4\x90\xf1\x19\x0d\xfb\xd1\x58\x70\x30\xc5\x2c\x56\x8b\x05\x93\xc9\xd9\x68\x54\x2e\x4f\x70\x56\xcc\xf7\x0f\xe0\x7a\x04\x00\xc0\x53\xb8\xb8\x80\x50\xc2\xe4\xfa\xc5\xf3\x37\xe7\xd1\xf3\x37\xdf\xfd\x10\xbd\x78\xf9\xcd\x8f\x7f\x8a\x5e\xbd\xfe\xf6\xe5\x0d\x5c\x5e\x3e\x05\x9b\xa1\x74\xab\xe9\x83\x71\xa6\x20\x98\x5c\xbf\xfa\xf1\xfb\xe7\xdf\x7f\xfd\xdd\xcb\x8b\x93\xcb\x9b\x53\x98\x3c\x0a\xe0\xec\x8c\xc6\x07\xc1\x04\x6e\x7b\xca\x47\x37\x23\xc2\xfc\x79\x86\xf1\x95\xa1\xc3\x99\x04\xa6\x35\x5b\x83\x4a\x5b\xd8\x1a\x88\x95\xb4\x8c\x4b\x03\xac\x35\x7c\x34\x1a\x83\x61\x73\x3c\xad\xae\x5e\xad\x8a\x9a\x35\xf0\x2c\x5e\x24\x67\xf0\xcc\x41\x35\x91\x4a\x5b\x73\xe6\x6c\x74\xcb\xc6\x9a\x26\x42\xc5\x4c\x80\x41\xbc\xe2\x72\x3e\x9d\x9c\x3c\x05\x93\xf1\xd4\xb6\xe6\x34\x9a\xe9\x89\xbf\x92\xd2\x10\x2f\x92\xa7\x90\xa8\x9a\x42\x9e\xa6\x93\x78\x91\xc0\x74\x0a\xc1\xa4\x84\x14\x6c\xd2\x92\x3e\x04\xeb\xb8\x33\x32\xd3\xc8\xae\xea\x91\x94\xbb\xaf\x89\x92\x38\xf2\xeb\x6d\xa1\x25\x4c\x34\x9a\x92\x9a\xe7\x5c\xc6\x08\xd1\x1c\x6d\x14\xab\x45\x1e\xad\x94\x4e\x4c\x34\x5b\x47\x1a\x53\xe0\x06\xa4\xb2\xc0\x96\x8c\x0b\x36\x13\x08\x5c\xc2\xcf\x26\x1b\x8d\x61\x85\x20\x11\x13\x60\x90\x2b\x6d\x31\x81\x25\x6a\xc3\x95\x04\x9b\x31\x0b\x31\x93\x30\x43\x30\xaa\xd0\x31\x26\xb0\xca\x50\x42\x61\xb8\x9c\xd3\xee\xa3\x51\x4b\x6e\xfe\x79\xfe\xe7\xe8\x6f\x2f\xdf\x9e\xbf\x7e\xf3\xfd\xe9\x63\x83\x96\x64\x06\x3e\xff\x1c\x3e\x03\xbb\xce\xb7\xe2\x75\xf6\x24\xc1\xe5\x13\x59\x08\x01\x5f\x9c\x7d\x7e\x52\x12\x66\xcb\xe2\x9a\x35\xf4\x59\x65\x5c\x20\x5c\xc0\x64\x0c\xe1\xdc\xc2\x31\x5c\x76\xa8\x5f\x7d\x62\x66\x10\x82\xc9\x49\x00\x5c\x6e\x4e\x16\xfa\x60\x63\xb0\x35\x39\x9d\x5c\x3b\x11\xfe\xfb\x9b\xb7\x2f\xce\x2f\xdc\xd7\xe7\xf4\xfd\xf2\x66\xeb\xae\xa7\x4f\x37\xa6\x72\x8d\xcb\xed\xc7\xd0\xec\xb6\x73\xc2\x93\xfb\x9d\xe4\xa8\xb5\xfd\x28\x37\x3d\xdd\x0f\x3a\xa7\x7d\x75\x79\x13\x6c\xdf\x32\x70\x48\x4c\x60\x6e\x21\x1b\x4d\x4f\x27\xcd\x25\xee\x03\x3b\x94\xdb\x01\x8f\x81\x19\x53\x2c\x10\x6a\xe4\xbf\x79\xfb\xf2\xeb\xbf\x9c\x93\x6c\x33\xa1\x91\x25\x6b\x30\x68\xc1\x30\x89\x62\xbd\x15\x4c\xa3\xc4\x77\xc4\x09\x0d\x8b\x37\x06\xbb\x50\x9c\x56\xde\x8c\x52\xee\x14\xf1\x05\xa6\xac\x10\x16\x66\x98\xb1\x25\x57\x1a\xac\x82\x39\x5a\x12\x6d\x90\xf8\xce\x42\x65\x6a\x52\xad\x16\x6e\x34\x2e\xb4\x46\x59\x4f\x1c\xc1\x6b\xe9\xc7\x49\x78\x55\x0a\x61\x48\xc6\x1d\x68\xcf\x82\xad\x67\x08\xca\x66\xa8\xc1\x70\x5b\x30\xcb\x95\x34\xa3\x31\x29\x34\x6d\x49\x0b\x5b\x68\xf4\xca\x6b\x32\x55\x88\x04\x50\x26\x04\x39\x17\x48\x6b\x0f\xc1\x66\xdc\x94\xf6\xc3\xc0\xc9\xa1\x07\xb6\xe2\x06\xe1\x78\x34\x1e\x8d\xe1\x6b\x47\x66\xb2\xb9\x93\x0a\xd3\x25\xd3\xdc\x99\x0d\x7c\xc7\x8d\x35\xd5\x61\x31\x13\x82\x6c\x01\xd9\x51\xba\x98\x3b\x75\xc5\x85\xa8\x0c\xb7\x47\x49\x15\x32\x69\xd9\xef\xde\x11\xf7\x02\xce\x4d\x9b\x60\x64\xbe\x94\x4e\x60\x86\xb4\x10\x97\x4c\x14\x8c\x4c\x58\x4d\x58\x2e\xf3\xc2\x82\xb1\x9a\xe6\xf7\xdd\xc5\xb9\x81\x04\x53\x2e\x31\xa1\x83\x4a\x47\xb0\x20\x5c\x8d\x2a\x29\x26\xf7\x88\x79\x64\x11\xb5\x9a\x09\x5c\x1c\x34\x4e\xd3\x71\x36\x2a\x2f\x12\xe5\x4c\x1b\xac\xad\x52\x65\x91\x82\x49\x1c\x40\x28\x2c\x7d\x21\xf4\x82\x9e\x69\xe2\xd3\x60\x72\xed\x74\xf1\x22\xbe\x2c\x7d\x22\x34\xa6\x8a\x6f\x98\x2a\xcf\xfe\xff\x84\xd9\xa6\x72\x8c\xc9\xcd\x38\xe1\x20\x2d\x80\x54\xb0\xf9\x21\xc4\x6a\xa6\x19\x18\xab\x72\x03\x84\x22\x5d\x9e\x2f\x16\x98\x70\x66\x51\xac\xe9\xa2\x2b\xac\x3c\x48\x86\x1a\x37\xc0\x96\x73\x27\x1b\x13\x3d\xfd\x08\x1f\x1d\xf4\x87\x1e\x6d\x22\x59\x92\x6b\x4a\x77\xdb\xd4\xaf\x31\xc9\x00\x37\x80\x69\x8a\xb1\xe5\x4b\xc2\x70\x2e\xd4\x8c\x9c\xaf\x2a\x45\x8a\xad\x81\x7b\x67\x14\x6b\xb6\x12\x60\x33\xad\x8a\x79\xe6\x78\xcc\xf4\xbc\x58\xa0\xb4\x06\x98\x17\x8e\x5c\xab\xb9\x66\x8b\x81\x83\x24\x5b\xf2\x39\xb3\x68\x4a\x55\x91\xb1\x75\x9e\x4e\x23\x3a\xe5\x32\x8a\x70\x71\x02\xcc\xc4\x8a\xad\x0d\x89\x41\xad\xb6\x85\x24\x23\xe3\x24\x6e\x00\x36\x4b\x2d\x45\x5f\x5c\x26\x44\xee\xbe\xae\x1f\x12\xc5\xb9\x8c\x35\x12\xaa\x74\xca\x0c\x53\xa5\xd1\x7b\x79\xda\xa1\x0a\x4b\xaa\x4e\x1b\x85\x52\xf9\xc6\x09\xfb\xfb\xf1\xe3\xc7\x07\x9b\xc4\xed\x86\x09\x03\x7c\xea\xd8\xaf\x36\x94\x7e\x2c\x71\x4c\x81\x44\x29\xe9\x19\x93\x89\x40\xe7\x83\x35\xe6\x62\x5d\x0b\x79\x3b\x7c\x84\xa0\x31\x2b\xc6\x05\x7f\xa3\x56\x74\xc4\xa7\xc7\xa3\x26\x38\xaa\x17\x92\xd6\x05\x93\xaf\x82\x8e\x4a\x8c\x21\xe5\x82\xe8\x47\x54\x68\x01\x25\x9d\x8a\x33\xc2\x74\xcf\xc2\x82\xd9\x38\xeb\xd8\xcb\x0e\x2b\xaa\x78\xab\x39\xc9\x85\x5d\x71\xa1\x83\x47\xc3\x31\xd7\x18\x62\x8a\x40\x69\xa7\x83\xda\xec\x54\x69\x8a\x9a\x2c\x44\xa5\x54\x5e\x0e\x59\x1c\x63\x4e\x82\x26\x6b\xa9\x2b\x31\xe4\x06\x16\x4c\x5f\x61\x02\xb3\x35\x4d\x4f\x7b\x07\xf1\x14\x8c\x3a\xa4\x30\x36\x67\x31\x56\xe1\xd8\x82\xc9\x82\x09\xb1\x06\x96\x24\x98\x80\x71\x11\x1c\xa1\x52\x18\xd4\x4e\x27\xde\xe5\x18\x93\x45\xb3\x8a\xd6\x40\x5a\x68\x67\xf9\x9d\x5d\xeb\x1c\x51\x1a\x8f\xe6\x0e\x83\x01\x4f\x18\x3e\x9a\x0e\x28\x28\x7d\xc8\xab\xbe\x7d\xf9\xc3\xb7\xff\xb8\xe0\x8f\x1f\x5f\x4e\x3b\xa0\x06\x37\x0c\xb8\xca\xfb\x83\x86\x3b\xc1\xee\x88\x70\x3b\x12\xbe\x71\x69\x04\x13\xc2\x78\x6d\x6b\xc5\xf1\xb3\x35\xa8\x42\xb7\xbd\xc8\x12\xa5\x13\x2a\xca\x1f\xfe\xfa\xe6\xc5\x9b\xd3\x86\x89\x4e\xdc\xdd\x32\x26\x9d\xd5\x67\x33\xb1\x26\xe5\xa7\x53\x60\x41\x8a\x8a\xef\x72\xc1\x63\x6e\xc5\x9a\xb6\x93\x27\x61\xa5\x13\xf3\x3e\x4e\x08\xb5\x22\x08\x95\x37\x33\xde\x9d\xf5\xbd\x99\x89\x55\xee\x8d\x0d\xd3\x24\x72\x5a\x63\x6c\x4f\x47\xe3\xca\x50\x98\xd3\xe1\x4c\xc8\xf9\xae\xda\x62\x65\x4a\x24\xa6\xd9\x74\x5a\xc9\xaf\xbb\xb9\x55\xee\x34\xe0\xd2\xaa\x9e\x3e\x37\x10\x9d\x42\x8f\x6a\xe1\x64\xf5\xee\x15\x33\x30\xe7\x4b\x94\x87\xa5\x76\x78\xbf\xeb\x5c\x2f\xc9\x7d\x6c\x0b\x26\xea\xd5\xf4\x9f\x3b\xcc\x59\x62\x63\x54\xcc\xbd\x07\x2e\x31\x6d\x67\x47\x5e\xf3\xaf\xab\x2b\xb9\xc8\xf3\xd6\x8c\xa9\x5c\xb9\x25\x63\xea\x5a\xa2\x7e\x90\x71\xea\xe0\x94\x06\xa9\xfa\x94\x29\x5d\x23\x24\x24\x34\x95\x37\xef\x69\xac\x59\xb1\x1c\x42\xc2\xb9\xe6\x81\x64\xc4\x6e\xba\x4d\xd4\x59\xdc\x00\x9c\xd6\xd7\x7b\xf2\x24\x7c\x12\xdd\x8c\x6e\xc1\xb8\x92\x08\x62\x53\xc3\xd9\xc9\xb5\x60\xa6\xc6\xe9\x26\x9a\x5c\x37\xd0\x6f\xba\xca\xd2\x46\x7e\x7a\xeb\xbe\x2e\x11\x5a\xeb\xa6\x93\x0e\x05\x3a\xeb\x78\x0a\x09\xc6\x82\xc4\x34\x4c\x21\xe8\xac\x0c\xe0\x0c\xea\xcc\x6d\x80\x37\xf4\x99\x6c\x25\x2e\x0a\xb3\x19\x72\x74\x89\x33\xb9\x6e\xef\xbe\x81\x44\xa1\x37\x99\x4e\xa9\xba\x74\x28\x0d\x42\xf5\xf1\xde\x6c\x9b\xb9\xa8\x14\xc2\x67\xb4\x51\x2e\x8a\x39\x97\x51\xcb\xe5\xd4\x9e\x8e\xf8\x9c\x70\xbd\xc5\x5f\x99\x2b\x9e\x13\x89\x3c\x00\x87\x1f\xf9\xa8\x8c\x2d\xd1\x2b\x53\x65\xe0\x12\x4e\x1a\xae\xf4\xba\x27\xe6\x61\x02\x13\x02\xbf\xc5\x33\x99\x0c\x85\xf0\x0a\x98\x70\x43\x06\x65\x7a\xfe\xfc\x8b\xe3\x2f\xbf\xec\xad\x2b\x27\x0d\xac\x98\x96\x24\x4e\x6c\x46\x3e\xd4\xe7\xe8\x14\x8d\x10\xfe\x74\x15\x0a\x2a\x4c\x97\x6e\x8a\xe2\x15\x5f\x0b\x98\xec\xbb\xb5\x01\xa1\xe4\x2a\x4b\x01\x84\x2e\x6f\x4f\x21\xe4\x24\xf7\x10\x3c\x3a\x32\x59\x70\x30\x98\x64\x77\x79\xe7\x48\xeb\x6d\x6e\xe3\xc8\x5d\x48\x3e\xa1\xe3\x36\x2d\xfe\x96\xdb\x9e\x1c\xff\xf1\x78\x60\x6d\x7d\xe3\xd6\xa6\xea\xf2\x95\xad\x8a\x19\x31\xc3\x1b\x65\x6f\x3a\x3d\xbf\x37\xc0\x1d\x41\x30\x80\x54\x1d\x19\x0d\x0a\x90\xbb\x2b\x2b\x6c\xd6\x2b\x15\x71\xe8\xe8\x11\x4f\xe1\x33\xb8\x2d\x71\xe8\xf1\xbd\x25\xb7\x94\x48\x36\x70\x2b\xfb\x33\xdd\x0f\x04\x37\x36\xcc\xb5\x5a\xf2\x04\xb5\x09\x20\x10\x6a\xce\xa5\xff\xbf\x2a\x6c\x99\xc8\xfb\x6d\x14\xb6\xd0\x1e\x9f\x3d\x04\x07\x35\x56\x17\x10\xfe\xdc\xb1\xae\x3d\x44\xaa\x50\xa2\xd0\x03\x99\xc8\x80\x8b\xdf\x12\x32\x92\x12\x3b\x1c\x9c\xa1\x7f\x5f\x26\x71\x3f\xb8\x1d\x1f\x72\xe7\xe0\x77\x80\xc2\xdb\xdc\xa3\x0b\x85\x6b\x46\x47\x8e\xcc\x1f\x89\xdd\x25\xdf\xa0\x62\x9c\x9b\x0a\xc2\x30\x67\xc6\xb8\xda\xca\xc6\x48\x48\x12\xdc\x1a\xd6\x7c\xc9\x2c\x86\x57\xb8\x6e\x0f\x7a\xa1\x69\x46\x28\xc6\x24\xcd\x2e\x47\x3e\x94\x7c\x0c\xc5\x97\xe3\x32\x82\x37\x45\x9e\x2b\x6d\x7d\x44\x5d\x07\x5f\x2d\x63\xb9\xc6\xcd\xd2\x4c\xcf\x9e\x6f\x91\x9f\xdf\x52\x32\xef\x2a\x50\x3d\x99\xe1\xc6\x46\xb5\xae\x7e\x5c\xe1\xa9\x64\x87\xf8\xfc\x93\x51\xf2\x83\x69\xff\xff\x2f\x77\x37\x0c\x82\x2a\xec\x6e\x98\xfa\xc0\xcb\x0f\xc6\xcb\x58\x14\xc6\xa2\xfe\xf8\x8e\x9c\x59\xcb\xe2\x2c\x80\xa0\x54\x53\x32\x16\x01\x04\x2a\x47\xf2\xe6\x1a\x17\x6a\x89\xee\x0b\x59\xe8\x00\x02\x83\xb6\xc8\x1f\xdc\x7b\x1f\xf4\xaf\x72\xef\xd5\x6f\x80\x4e\xa6\xb1\x92\x85\xc8\x65\x79\x3d\x89\x70\x63\xd3\x7d\x7f\x09\x5f\xe7\x7d\xfd\xea\x7c\x3a\xd9\xfb\x97\xdc\x03\x57\x15\x0c\x35\x08\x2e\x91\xc2\x63\xe8\x40\x7a\x3c\xdd\x0f\x26\x34\xe5\x63\x67\x89\xf0\x0c\x9e\xed\xd3\xd1\xd5\x3a\x20\xe6\x43\x18\xfa\xf4\xf2\x8b\x56\x66\xe5\xcf\x6b\xc0\x5c\x77\x20\xb7\x7e\xba\xe9\x06\xe0\xaf\x5c\x2e\x5c\x41\xf7\x60\x29\xdb\x7d\xfd\x82\x42\xc6\x21\x28\x03\xc4\xea\x30\xa4\xb5\xb2\xaf\x3b\x91\x17\xe5\x07\x53\xd8\xf9\xec\xde\x14\x6e\x83\x3b\x2c\xef\xbf\x50\xc9\x36\x84\x81\x44\x79\x77\xa1\x8e\x17\x45\x4c\x1e\xe2\x9e\xdf\xce\x57\x46\xe4\xa3\xfe\xb7\xb5\xfd\x77\xa6\x73\x3e\x5a\xd8\xa1\xd6\x09\xe1\xfe\x5f\xc8\xfa\x79\xc9\x83\xde\x6d\x83\xbc\x3b\x21\x21\x70\x0f\x7a\xfb\x09\xb1\xc4\xc5\xf4\xbb\xe1\x88\x9b\x09\xc2\x30\x66\x61\x8c\xda\x9a\xa6\x2a\xc4\xa5\xc1\xb8\xd0\x58\x0f\xb4\x4a\x44\xf4\x97\x0a\x5d\xc5\xb5\x3d\xe0\x4b\xe0\x0f\x75\xaa\x9d\x5b\x96\xbb\xcb\x61\x5f\xbc\x95\x4c\xf9\x3c\xba\xc2\x75\x3f\xf1\xa1\xa1\xbb\xe7\x3d\x0d\x98\xdb\xb2\x1e\xb7\xca\x41\x86\x30\xfc\x77\xc1\xd1\x0e\x24\x3d\x35\x90\xeb\x16\xd4\xf7\x65\x3c\x0d\x64\x9f\xe7\xf4\x76\xbe\x2f\xcb\x69\x16\x36\xba\xea\x40\x7c\xfc\xfa\x80\x41\x4b\x59\x7f\xa6\x56\x01\x04\x85\xa4\x3f\x7f\x8f\xc9\xff\x90\x04\xfe\x42\xf3\x3a\xc0\xdc\xf7\xe4\xfb\xef\x11\x7a\x6f\x7f\x62\xa5\xf1\xc8\xd7\xfd\x62\x13\x59\x75\x85\x95\xa5\x6b\x66\x0a\x2d\xda\x63\x0b\x34\xee\x49\x99\x33\xf2\xbd\xb9\x9c\xcd\xb9\x64\xcd\xa3\x0a\x3f\x6a\x8c\x88\x96\xa8\x79\xba\x6e\x8f\x5a\xbe\x40\x55\xd8\xee\xc2\x2c\x22\x7b\xd8\x1f\xcb\xb5\x7a\xb7\x8e\x78\xde\x1e\xd7\x48\x36\x8c\xcb\x79\xe7\x7c\xad\x16\xb9\xf5\xbf\x67\x54\xe3\xde\x1d\x1d\xb9\x4a\x93\x1f\xfa\x49\xcd\x8e\x1a\xc4\xe9\x2f\x83\x7a\xc9\x63\x8c\x5a\x8b\x16\x4c\x33\x9b\x29\xd9\x5a\x99\xb3\xf8\x8a\xcd\xf1\x28\x56\x66\xd1\xa6\xcb\xc1\x2f\xd6\x3c\x72\x92\x0f\x41\xcb\xae\x74\x6a\x83\x19\x99\x5a\x3d\x70\xe3\x53\xe1\x86\x73\x0b\x0f\xec\xd8\x39\x3b\x7c\xfc\xbb\x83\xdf\x10\x92\xa4\xf9\xe5\xa0\xfc\xc9\xe0\xf7\x18\x24\xec\xf8\x01\x40\xf9\x44\x88\x25\xc9\xee\x4a\x2c\x45\x9e\x30\xfb\xe1\xaa\x2a\x9f\x4c\x4d\xb1\xa4\xed\x6e\xab\xc6\x1f\xb4\x50\xfc\xa9\x91\x76\x97\xc5\xc1\x4f\x9e\xa6\x1b\x2b\xfc\x35\x3c\xe9\xea\xbc\xb7\xfd\x79\x6f\x0e\x5c\x92\x9d\x27\xb7\xa5\xc0\xe5\xa3\xc1\xf2\x77\xbf\x6d\x29\x70\xfb\x53\xa2\xe4\x33\xe2\xe6\x8c\x2d\xdd\x5b\xb7\x90\xa7\x04\xf4\x6b\xec\x66\x25\x62\x9b\x42\x35\x3d\xf9\x08\x5e\xaf\xb0\x59\x50\x67\x2d\xf4\xcd\x79\xf2\xe6\xa7\xf4\xb2\x1c\x75\x8b\x27\x24\xa5\x2f\xbb\x1c\x2b\x19\x6d\x33\x3e\x6a\x4e\x3b\xe8\xe2\x50\x96\x7f\xa2\x84\x6b\x37\x39\xba\x8f\x48\x54\x50\xef\x2c\x17\xf5\xbb\xe3\x4d\xd1\xe8\xc0\xba\xee\x1d\xf0\x9e\x2a\x49\x79\x48\xb5\x3a\x80\x2d\x10\xee\x78\xbb\x1e\x59\xee\x73\xbb\x72\x5f\x48\xfb\x06\x2e\xd9\x45\xfe\x87\x1a\xed\xfe\xcb\x5a\x8e\x55\xb9\xa7\x83\xc9\x46\xc9\x67\xeb\x93\xdf\xad\x9b\xdd\xee\x31\x48\xd5\x7e\x33\x5e\x3d\x8e\x2f\x23\x49\x40\xee\x5a\x32\x9c\x8c\x81\xd2\xed\x57\xfb\x1f\xc6\xfc\x0d\x57\x2a\x7d\x07\xc3\x40\xbd\xb2\x45\x21\xcd\xe7\x99\x05\xa9\x56\x03\xfb\xdd\xab\x58\xf7\xac\x5a\x20\x5b\xa2\xeb\xbc\x71\xdd\x53\xca\xa2\xb4\x9c\xb4\x46\x69\x48\xd0\x62\x6c\xdd\x5b\x62\x77\x3f\xf7\xc0\xd6\xb2\x2b\x84\x25\x13\x05\x1a\x98\x15\xd6\x75\x32\x18\xcc\x99\x76\x4f\xff\x05\xbf\xda\x7c\x67\x3b\x86\x30\x74\xd8\xb9\x6d\xc0\xa5\xb1\x24\x48\xae\xb7\x91\xc6\xa7\x6e\x7c\x60\xdb\x0a\xf7\x34\xba\x97\xdf\x2b\xa5\xf5\xba\x79\xe1\x5c\xd5\x66\x7b\x65\x59\xb0\x99\xeb\x0c\x33\x0a\xb8\xdd\x33\x60\x58\x8a\x60\x15\xf0\xb9\x54\x65\x5f\xe4\xc6\x29\x77\xab\xdc\x92\xe9\xd8\x64\xc4\xee\xab\xbe\x03\x44\x93\x6a\xb3\x9d\x83\x28\xe2\x54\x8f\x88\x97\x2b\x63\xf8\x4c\xe0\x86\xb0\x76\xe1\x70\x49\xfa\x2e\xa0\x30\x6c\x8e\x87\x4d\x3b\x68\xd9\x21\x67\x94\xeb\x2d\x2d\xf2\xb2\x01\xb3\xdd\x8d\x57\x1e\x6a\x55\xbb\x35\xe5\xd0\x31\xd2\x14\x1a\x07\x2b\xe8\x63\xc8\xd4\x0a\x56\x08\x2b\x26\x2d\x6d\xf5\xa4\x19\x66\xda\xce\x93\x83\xa6\x73\x74\x4b\x73\xdc\xe4\xab\xda\x82\x6c\x79\xcd\xff\x87\x2f\xcb\xf9\x72\x10\x0a\x59\x18\x6c\xb5\xdb\x96\xef\xda\x0f\x5d\x97\x38\x70\x53\x2d\xa8\x9b\x36\x4b\xd7\x54\x68\xbf\xc2\x75\x95\xfa\x16\xec\x4e\x9f\x47\x79\x0c\xf1\xa4\x33\xee\x98\xa3\x95\xb2\xb4\x3d\xe5\xef\x3c\xcc\x76\x83\x48\xe0\xae\x54\x5e\xa4\x6e\xe4\xaa\x9d\xdf\xb8\xd7\x98\xd4\x6d\xe1\x9d\x31\x93\xb5\x0c\x3d\x94\xf5\xc1\xb2\x67\xee\x35\xcc\x50\x70\x5c\x22\x2c\x0a\x63\x4b\x70\x33\x6f\x1c\x98\x10\x98\xd4\x46\x45\xac\x7d\xff\x80\xfb\x27\x2f\x1c\xa1\x87\xff\x81\x80\x50\x42\x30\x3d\x0d\x06\xe9\x31\x1a\xe0\xd0\xb9\x65\xae\x42\xda\x69\xfd\x93\xb0\x47\x96\x78\xaf\x6c\x59\x28\x3b\x75\x1f\xd5\xfe\xc0\x41\x20\x09\xa8\x3d\x40\xa8\x1c\x66\x65\x84\x43\x7f\xb6\xbe\x4a\xe5\x5b\xfe\xc2\x57\x9d\x66\x63\x07\xe4\xbf\x01\x00\x00\xff\xff\x26\x66\x63\x8b\xca\x43\x00\x00")
+var _completionSh = []byte("\x1f\x8b\x08\x00\x00\x00\x00\x00\x00\xff\xec\x3c\x6b\x73\x1b\x37\x92\xdf\xf9\x2b\x3a\x43\x96\x2d\xd9\x1a\xc9\xca\xe5\xcb\xc9\xa6\x2b\x59\x3f\x6e\x55\x97\xc4\x29\x2b\xb9\xab\x3b\x9f\x8b\x0b\xce\xf4\x70\xb0\x1a\x02\x73\x00\x86\x34\x57\xd1\x7f\xbf\x6a\x00\xf3\x1e\xd2\x54\xe2\x98\xbe\xac\x58\x95\x8a\x8c\x47\xa3\xd1\xef\xee\x01\x30\xfe\xea\x6c\xce\xc5\xd9\x9c\xe9\x74\x34\x1a\xc3\x6c\x16\x47\x52\xcf\x9e\xa5\x98\xe5\xa8\x20\x29\x44\xf4\x9c\x9a\x5d\x6b\x94\x71\xd0\xc5\x3c\x92\xcb\x25\x13\xf1\xf3\xd1\xc8\x0f\x8f\x71\x5e\x2c\x8e\x8e\xe1\x66\x04\x00\xc0\x13\x78\xf7\x0e\x42\x01\x93\x9b\x97\x2f\xde\x5c\xcd\x5e\xbc\xf9\xe1\xa7\xd9\xcb\x57\x7f\xf9\xe5\xdf\x66\xaf\x2f\xbf\x7f\x75\x0b\xef\xdf\x3f\x05\x93\xa2\xb0\xa3\xe9\x87\x51\x2a\x21\x98\xdc\xbc\xfe\xe5\xc7\x17\x3f\x7e\xf7\xc3\xab\x77\xe7\xef\x6f\x2f\x60\xf2\x28\x80\xe7\xcf\xa9\x7d\x10\x4c\x60\xa7\x27\x7c\x74\x3b\x22\xcc\x5f\xa4\x18\x5d\x6b\x5a\x9c\x09\x60\x4a\xb1\x0d\xc8\xa4\x81\xad\x86\x48\x0a\xc3\xb8\xd0\xc0\x1a\xcd\xa7\xa3\x31\x68\xb6\xc0\x8b\x72\xeb\xe5\xa8\x59\x3d\x06\x9e\x45\xcb\xf8\x39\x3c\xb3\x50\xf5\x4c\x26\x8d\x3e\xfd\x7c\xb4\x63\x62\x45\x93\x4c\x46\x2c\x03\x8d\x78\xcd\xc5\x62\x3a\x39\x7f\x0a\x3a\xe5\x89\x69\xf4\x29\xd4\xd3\x73\xb7\x25\xa9\x20\x5a\xc6\x4f\x21\x96\x15\x85\x1c\x4d\x27\xd1\x32\x86\xe9\x14\x82\x89\x87\x14\xf4\x69\x49\x3f\x82\xf5\xa4\xd5\x32\x57\xc8\xae\xab\x96\x84\xdb\x3f\x63\x29\x70\xe4\xc6\x9b\x42\x09\x98\x28\xd4\x9e\x9a\x57\x5c\x44\x08\xb3\x05\x9a\x59\x24\x97\xf9\x6c\x2d\x55\xac\x67\xf3\xcd\x4c\x61\x02\x5c\x83\x90\x06\xd8\x8a\xf1\x8c\xcd\x33\x04\x2e\xe0\x1f\x3a\x1d\x8d\x61\x8d\x20\x10\x63\x60\x90\x4b\x65\x30\x86\x15\x2a\xcd\xa5\x00\x93\x32\x03\x11\x13\x30\x47\xd0\xb2\x50\x11\xc6\xb0\x4e\x51\x40\xa1\xb9\x58\xd0\xec\xd3\x51\x43\x6e\xfe\xfb\xea\xaf\xb3\xff\x78\xf5\xf6\xea\xf2\xcd\x8f\x17\x8f\x35\x1a\x92\x19\x78\xf0\x00\xbe\x02\xb3\xc9\xb7\xe2\xf5\xfc\x2c\xc6\xd5\x99\x28\xb2\x0c\xbe\x7e\xfe\xe0\xdc\x13\x66\xcb\xe0\x8a\x35\xf4\x5b\xa7\x3c\x43\x78\x07\x93\x31\x84\x0b\x03\x4f\xe0\x7d\x8b\xfa\xe5\x2f\x62\x1a\x21\x98\x9c\x07\xc0\x45\xbf\xb3\x50\xc7\xbd\xc6\x46\xe7\x74\x72\x63\x45\xf8\x3f\xdf\xbc\x7d\x79\xf5\xce\xfe\xf9\x82\xfe\x7e\x7f\xbb\x75\xd6\xd3\xa7\xbd\xae\x5c\xe1\x6a\xfb\x32\xd4\xbb\x6d\x9d\xf0\xfc\x6e\x2b\x59\x6a\x6d\x5f\xca\x76\x4f\x8f\x82\xd6\x6a\xdf\xbe\xbf\x0d\xb6\x4f\x19\x58\x24\x22\x30\x3b\xc8\x46\xdd\xd3\x49\xbd\x89\xbb\xc0\x0e\xc5\x76\xc0\x63\x60\x5a\x17\x4b\x84\x0a\xf9\xbf\xbc\x7d\xf5\xdd\xbf\x5f\x91\x6c\xb3\x4c\x21\x8b\x37\xa0\xd1\x80\x66\x02\xb3\xcd\x56\x30\xb5\x12\xef\x89\x13\x6a\x16\xf5\x1a\xdb\x50\xac\x56\xde\x8e\x12\x6e\x15\xf1\x25\x26\xac\xc8\x0c\xcc\x31\x65\x2b\x2e\x15\x18\x09\x0b\x34\x24\xda\x20\xf0\x83\x81\xd2\xd4\x24\x4a\x2e\x6d\x6b\x54\x28\x85\xa2\xea\x38\x85\x4b\xe1\xda\x49\x78\x65\x02\x61\x48\xc6\x1d\x68\xce\x92\x6d\xe6\x08\xd2\xa4\xa8\x40\x73\x53\x30\xc3\xa5\xd0\xa3\x31\x29\x34\x4d\x49\x0a\x53\x28\x74\xca\xab\x53\x59\x64\x31\xa0\x88\x09\x72\x9e\x21\x8d\x3d\x01\x93\x72\xed\xed\x87\x86\xf3\x13\x07\x6c\xcd\x35\xc2\x93\xd1\x78\x34\x86\xef\x2c\x99\xc9\xe6\x4e\x4a\x4c\x57\x4c\x71\x6b\x36\xf0\x03\xd7\x46\x97\x8b\x45\x2c\xcb\xc8\x16\x90\x1d\xa5\x8d\xd9\x55\xd7\x3c\xcb\x4a\xc3\xed\x50\x92\x85\x88\x1b\xf6\xbb\xb3\xc4\x9d\x80\x73\xdd\x24\x18\x99\x2f\xa9\x62\x98\x23\x0d\xc4\x15\xcb\x0a\x46\x26\xac\x22\x2c\x17\x79\x61\x40\x1b\x45\xfd\x47\x76\xe3\x5c\x43\x8c\x09\x17\x18\xd3\x42\xde\x11\x2c\x09\x57\x2d\x3d\xc5\xc4\x43\x62\x1e\x59\x44\x25\xe7\x19\x2e\x8f\x6b\xa7\x69\x39\x3b\xf3\x1b\x99\xe5\x4c\x69\xac\xac\x52\x69\x91\x82\x49\x14\x40\x98\x19\xfa\x83\xd0\x0b\x3a\xa6\x89\x4f\x83\xc9\x8d\xd5\xc5\x77\xd1\x7b\xef\x13\xa1\x36\x55\xbc\x67\xaa\x1c\xfb\x7f\x0d\xd3\xbe\x72\x8c\xc9\xcd\x58\xe1\x20\x2d\x80\x24\x63\x8b\x13\x88\xe4\x5c\x31\xd0\x46\xe6\x1a\x08\x45\xda\x3c\x5f\x2e\x31\xe6\xcc\x60\xb6\xa1\x8d\xae\xb1\xf4\x20\x29\x2a\xec\x81\xf5\x7d\xe7\xbd\x8e\x8e\x7e\x84\x8f\x8e\xbb\x4d\x8f\xfa\x48\x7a\x72\x4d\x69\x6f\x7d\xfd\x1a\x93\x0c\x70\x0d\x98\x24\x18\x19\xbe\x22\x0c\x17\x99\x9c\x93\xf3\x95\x5e\xa4\xd8\x06\xb8\x73\x46\x91\x62\xeb\x0c\x4c\xaa\x64\xb1\x48\x2d\x8f\x99\x5a\x14\x4b\x14\x46\x03\x73\xc2\x91\x2b\xb9\x50\x6c\x39\xb0\x90\x60\x2b\xbe\x60\x06\xb5\x57\x15\x11\x19\xeb\xe9\x14\xa2\x55\x2e\x2d\x09\x17\x2b\xc0\x2c\x5b\xb3\x8d\x26\x31\xa8\xd4\xb6\x10\x64\x64\xac\xc4\x0d\xc0\x66\x89\xa1\xe8\x8b\x8b\x98\xc8\xdd\xd5\xf5\x13\xa2\x38\x17\x91\x42\x42\x95\x56\x99\x63\x22\x15\x3a\x2f\x4f\x33\x64\x61\x48\xd5\x69\x62\x26\x65\xde\x5b\xe1\xe8\x28\x7a\xfc\xf8\xb8\x4f\xdc\x76\x98\x30\xc0\xa7\x96\xfd\x6a\x42\xe9\xc6\x12\x4f\x28\x90\xf0\x92\x9e\x32\x11\x67\x68\x7d\xb0\xc2\x3c\xdb\x54\x42\xde\x0c\x1f\x21\xa8\xcd\x8a\xb6\xc1\xdf\xa8\x11\x1d\xf1\xe9\x93\x51\x1d\x1c\x55\x03\x49\xeb\x82\xc9\xb7\x41\x4b\x25\xc6\x90\xf0\x8c\xe8\x47\x54\x68\x00\x25\x9d\x8a\x52\xc2\xf4\xa1\x81\x25\x33\x51\xda\xb2\x97\x2d\x56\x94\xf1\x56\xbd\x92\x0d\xbb\xa2\x42\x05\x8f\x86\x63\xae\x31\x44\x14\x81\xd2\x4c\x0b\xb5\x9e\x29\x93\x04\x15\x59\x88\x52\xa9\x9c\x1c\xb2\x28\xc2\x9c\x04\x4d\x54\x52\xe7\x31\xe4\x1a\x96\x4c\x5d\x63\x0c\xf3\x0d\x75\x4f\x3b\x0b\xf1\x04\xb4\x3c\xa1\x30\x36\x67\x11\x96\xe1\xd8\x92\x89\x82\x65\xd9\x06\x58\x1c\x63\x0c\xda\x46\x70\x84\x4a\xa1\x51\x59\x9d\xf8\x90\x63\x44\x16\xcd\x48\x1a\x03\x49\xa1\xac\xe5\xb7\x76\xad\xb5\x84\x37\x1e\xf5\x1e\x06\x03\x9e\x30\x7c\x34\x1d\x50\x50\xfa\x91\x57\x7d\xfb\xea\xa7\xef\xff\xeb\x1d\x7f\xfc\xf8\xfd\xb4\x05\x6a\x70\xc2\x80\xab\xbc\x3b\x68\xd8\x0b\x76\x4b\x84\x9b\x91\xf0\xad\x4d\x23\x58\x96\x69\xa7\x6d\x8d\x38\x7e\xbe\x01\x59\xa8\xa6\x17\x59\xa1\xb0\x42\x45\xf9\xc3\xcf\x6f\x5e\xbe\xb9\xa8\x99\x68\xc5\xdd\x0e\x63\xc2\x5a\x7d\x36\xcf\x36\xa4\xfc\xb4\x0a\x2c\x49\x51\xf1\x43\x9e\xf1\x88\x9b\x6c\x43\xd3\xc9\x93\x30\xef\xc4\x9c\x8f\xcb\x32\xb9\x26\x08\xa5\x37\xd3\xce\x9d\x75\xbd\x99\x8e\x64\xee\x8c\x0d\x53\x24\x72\x4a\x61\x64\x2e\x46\xe3\xd2\x50\xe8\x8b\xe1\x4c\xc8\xfa\xae\xca\x62\xa5\x32\x8b\x75\x3d\xe9\xa2\x94\x5f\xbb\x73\x23\xed\x6a\xc0\x85\x91\x1d\x7d\xae\x21\x5a\x85\x1e\x55\xc2\xc9\xaa\xd9\x6b\xa6\x61\xc1\x57\x28\x4e\xbc\x76\x38\xbf\x6b\x5d\x2f\xc9\x7d\x64\x0a\x96\x55\xa3\xe9\x3f\xbb\x98\xb5\xc4\x5a\xcb\x88\x3b\x0f\xec\x31\x6d\x66\x47\x4e\xf3\x6f\xca\x2d\xd9\xc8\x73\x67\xc6\xe4\x47\x6e\xc9\x98\xda\x96\xa8\x1b\x64\x5c\x58\x38\xde\x20\x95\x3f\x9f\xd2\xd5\x42\x42\x42\x53\x7a\xf3\x8e\xc6\xea\x35\xcb\x21\x24\x9c\x2b\x1e\x08\x46\xec\xa6\xdd\xcc\x5a\x83\x6b\x80\xd3\x6a\x7b\x67\x67\xe1\xd9\xec\x76\xb4\x03\xe3\x52\x22\x88\x4d\x35\x67\x27\x37\x19\xd3\x15\x4e\xb7\xb3\xc9\x4d\x0d\xfd\xb6\xad\x2c\x4d\xe4\xa7\x3b\xe7\xb5\x89\xd0\x18\x37\x9d\xb4\x28\xd0\x1a\xc7\x13\x88\x31\xca\x48\x4c\xc3\x04\x82\xd6\xc8\x00\x9e\x43\x95\xb9\x0d\xf0\x86\x7e\x93\xad\xc4\xc5\x4c\xf7\x43\x8e\x36\x71\x26\x37\xcd\xd9\xb7\x10\x4b\x74\x26\xd3\x2a\x55\x9b\x0e\xde\x20\x94\x3f\xe7\xcd\xb6\x99\x8b\xd1\x18\xde\x22\x8b\x75\xd7\xe2\x73\x11\xe3\x07\xd4\xb0\x56\xdc\x18\x14\x64\x3e\x68\xc4\x8b\xef\x2f\x4f\xbc\x89\x27\x42\x18\x36\x0f\x35\xe6\x4c\x59\x21\x57\x18\x51\x14\x07\x47\x1a\x11\xfe\x16\x49\x91\xf0\xc5\xe9\x8b\x0a\xe6\x25\x81\x7c\xcd\x33\xfc\xdb\xf1\x69\x69\x33\x34\x1a\x5d\x6e\xd5\x2e\x49\xda\x7a\xee\xf2\x6a\x17\xb0\x3a\x34\x22\x1b\xb9\xcf\x29\x4a\x63\xf1\x49\x13\xd1\x52\x52\xec\x0e\x28\x19\x77\x1e\xa3\x09\x73\xf6\x68\x34\x76\x56\x84\x82\x69\x6d\x28\x6a\x91\x49\x65\x82\xfc\xbe\x4e\xe1\xe7\x72\xc1\x32\xf0\xa8\xf2\x90\xac\xd0\xc6\x79\x20\xa7\x57\x65\xbc\xe5\xaa\x3a\xdf\xff\x72\xf5\xf3\xab\xb7\x27\xd6\xa9\xa1\x39\x19\x8d\x81\x92\x9c\x66\x48\x66\x0c\x8b\x52\x8c\x4b\x40\xa7\xa5\x19\xa2\xdd\xcc\xea\xcd\x38\x74\xbb\xb1\x85\x6d\xf4\xc5\x90\xd6\xb6\x3c\x34\x3d\x3d\x3a\xee\x77\x5e\xe3\x66\xb8\x23\xcf\x8a\x05\x17\xc3\x7d\xa5\x6a\x0f\x76\xea\x48\xf1\xdc\xd8\xbe\x46\x58\xe3\xa4\x94\xab\x69\x59\xe4\x7a\x79\xf9\xf6\x22\x9c\xfc\xf5\xcd\x0f\xaf\xce\x4e\xa9\xd3\x6b\xa9\x1b\x7d\xcd\x6d\xf6\x94\x15\x68\xad\x47\x49\x90\x51\xa3\xea\xf6\x95\x53\xaf\x12\xee\x59\x4d\x9e\x53\x8b\xc7\x80\xf9\x6b\xeb\x8a\x90\x3d\x41\x26\xb3\x55\x41\xac\xb5\xa5\xa1\x1a\x94\xab\x42\x95\xb4\x5c\xbe\xbe\x9a\x4e\x1e\xfe\x8f\x79\x68\xe5\x0d\x42\xd5\x45\xbc\x65\xa7\x7d\xac\x41\x43\x7a\x51\x46\xc9\xfa\x7e\x24\xe0\x6b\x45\xff\x80\x49\x53\x8a\x86\x6d\x7b\xb5\x92\x23\xd7\x34\x98\x58\x54\xfa\xc1\x42\x47\xf7\xa1\x1f\x3b\x78\x10\x5b\xf1\x11\x30\xb1\x9c\xd9\x89\xc7\xa0\x18\x3e\x9e\x1e\x05\x76\xee\x40\xfd\x64\x00\xaf\xed\x30\xdc\xde\x76\x61\xd8\xa2\xd8\x83\x07\x70\xd4\x69\xb2\xee\xd2\x81\x81\x5f\x7f\x1d\xea\xb4\x78\xc2\xf1\x1f\x4e\xee\x6b\xdc\xf4\x37\xd2\x53\xd4\x9d\xdb\x1e\xca\x5d\x6c\x1c\xf6\x6c\xa7\x9a\x8c\x3a\x95\xec\xd2\x88\xf5\x76\xbc\x45\xed\x3c\x47\xce\xca\x89\xfb\x28\x22\xec\xa5\x8c\x36\xfe\xf1\xd8\x94\xd0\x83\x8f\xf8\xac\x4e\x9d\x73\x97\x82\xf6\xea\x9e\xbb\xf4\x93\x7e\xce\x22\x0e\xc7\xea\x43\xa6\x73\x27\xb7\x60\x4b\x95\xd0\x59\xd6\x3d\x16\x29\x6d\xf0\x6f\x59\xc5\x99\xe8\x3d\x16\xf1\xb6\xfc\xae\x6b\xb4\x12\x8f\x01\x19\xfc\xb8\xcc\xb4\x8c\x6d\xcb\xc1\x9d\xdb\x70\xc4\x37\xb9\x02\xbb\x27\x78\xc3\x43\xea\xca\x39\x92\x10\xc5\x5c\x6d\x49\x9f\xf5\x35\xcf\x49\xb0\x1d\x00\x1b\x2e\x51\xca\x9c\xb2\x15\xba\xd8\xbe\x94\xc8\x98\x53\xc2\x21\xd5\xa6\xa3\x0e\x61\x0c\x13\x02\xbf\x25\x51\xd6\x29\x66\x99\xcb\x07\x62\xae\x29\xbf\x99\x5e\xbd\xf8\xfa\xc9\x37\xdf\x74\xc6\xf9\x4e\x0d\x6b\xa6\x04\x05\x1b\x6c\x4e\x29\xbd\xfb\x64\x90\x90\xc8\x72\x61\xb7\x92\x49\x99\xeb\x76\x18\x27\x15\x24\xdc\x7d\x9a\x98\x1c\xd9\xb1\x01\xa1\x64\x3f\x74\x05\x10\xda\xcf\x08\x09\x84\xdc\x9a\xeb\xe0\xd1\xa9\x4e\x83\xe3\xc1\x9a\x7f\x5b\x23\x2d\x69\x5d\x0a\x58\xd7\x15\x6c\x85\x70\x42\xcb\xf5\x8d\xdc\x96\xdd\x9e\x3f\xf9\xd7\x27\x03\x63\xab\x1d\x37\x26\x95\x9b\x2f\x53\xa7\x88\x11\x33\x5c\x8e\xe8\x32\x39\xc7\xef\x1e\xb8\x53\x08\x06\x90\xaa\x0a\x35\x30\x10\xcf\xba\xbd\xb2\xc2\xa4\x9d\x2f\x57\x1c\x5a\x61\x3d\x4f\xe0\x2b\xd8\x55\xc7\xec\xf0\x7d\x20\x56\x70\x70\xeb\x98\x29\xc8\xb8\x36\x61\xae\xe4\x8a\xc7\xa8\x74\x00\x41\x26\x17\x5c\xb8\xff\xcb\xc2\x78\x1d\x73\xd3\x92\x8c\x2d\x68\x8e\x2b\x66\x06\xc7\xb5\xb9\xa6\x98\xa0\x99\xec\x75\x10\x29\x2b\x1b\x85\x1a\x28\x8c\x0e\x54\x1c\xb6\x54\xb0\x28\xa7\xb0\x38\xd8\xbc\xf3\x63\x6e\xec\x6e\x70\x5b\x29\xed\xde\xb5\xb8\x01\x0a\x6f\xcb\xd6\x6d\x65\xae\x62\xf4\xcc\x92\xf9\x33\xb1\xdb\xf3\x0d\x4a\xc6\xd9\xae\x20\x0c\x73\xa6\xb5\xfd\xd4\xd3\x6b\x09\x49\x82\x1b\xcd\x8a\xaf\x98\xc1\xf0\x1a\x37\xcd\x46\x27\x34\x75\x4b\xa1\x51\x91\x66\xfb\x96\x4f\x25\x1f\x43\xe5\xae\xb1\x2f\x28\xea\x22\xcf\xa5\x32\xae\xc0\x57\xd5\x82\x1a\xc6\x72\x83\xfd\x2f\x45\x1d\x57\xbd\x45\x7e\xfe\x48\xc9\xdc\x57\xa0\x3a\x32\xc3\xb5\x99\x55\xba\xfa\x79\x85\xa7\x94\x1d\xe2\xf3\xdf\xb5\x14\x9f\x4c\xfb\xff\x79\xb9\xdb\x33\x08\xb2\x30\x87\x61\xea\x3d\x2f\x3f\x19\x2f\x7d\x14\xf9\xf9\x1d\xb9\xcb\xda\x03\x08\xf0\x03\xd1\x39\x80\xc0\xeb\x2b\x5f\xfa\x7f\x93\xf9\x08\x20\x90\x39\x92\x7f\x57\xb8\x94\x2b\xb4\x7f\xb8\xc4\x32\xd0\x68\x8a\xfc\xde\xe1\x77\x41\xff\x2e\x87\x5f\x1e\x52\xb2\x52\x8e\xa5\x74\xcc\x6c\x19\xba\x23\x23\xb6\xad\xac\x62\xf9\x3a\x7a\xab\xcc\x38\x9d\xc2\xf9\xc7\x0a\x49\xaf\x6d\xad\xaf\xcc\x54\x5d\xb5\x9b\x89\x18\x2e\x5f\xd6\x1f\xe5\x3b\xb9\x6d\x40\xd4\x18\xac\x6c\xb4\x49\xb3\x83\x96\x7b\xcc\x6e\x13\x0e\xba\x59\xb1\xa8\xb3\xe2\x8c\x0b\x9b\x0f\x43\x8b\x58\x36\xed\xa3\x2e\x97\x30\xd8\x34\xee\xd9\x11\x2d\x5b\xed\x96\xe4\x1b\xc2\xd0\x6d\xfa\xeb\x46\x75\xdb\x91\xb4\x06\x73\xd3\x82\xdc\x38\x3e\xb3\x37\x2d\x2d\xcd\xfa\x50\x06\xe4\xa1\x45\xa7\xc6\xc8\xae\xc1\x98\x39\xfd\xbd\xb7\xff\xad\xdf\xe1\xed\xff\x36\xb8\xc3\x2a\xfd\x1b\xed\x48\x4f\x18\x9c\x0d\x3f\x5c\x84\xc7\x45\x94\x15\x31\x86\x46\x5e\xe3\xa7\x0b\xf5\xfe\x64\x4c\x72\x8e\xf5\x70\x4c\xf2\x1e\xff\x8b\xe7\xce\x6f\xa5\x2f\xd9\xf3\x43\x53\x17\xe3\xfb\x8c\xe7\x0f\x64\x31\xc5\xa2\xff\xbf\x5d\xde\x9f\xcc\xa6\xb9\xac\xe0\x80\x5a\x97\x65\xf6\xff\x85\xa8\xce\xb9\xdf\xeb\xdd\x36\xc8\x87\x13\x12\x02\x77\xaf\xb7\x5f\x10\x4b\x6c\xee\x7e\x18\x8e\xd8\x9e\x20\x0c\x23\x16\x46\xa8\x8c\xae\xeb\xc1\x5c\x68\x8c\x0a\x85\x55\x43\xa3\x38\x4c\xff\x92\xa1\xfd\xd6\xd2\x6c\x30\x7c\x89\xb2\x30\xf7\x25\xea\x83\x9b\x96\xbb\x0a\xa2\x3d\x3a\xf5\xf9\xcb\x5e\x1a\x4d\x00\x81\x4e\xe5\x3a\x80\xa0\x10\xf4\xcf\x3f\x63\x05\xab\xb6\x1e\x96\xce\xf6\x04\xc6\x6f\xb4\x1d\xa3\x3e\xba\x1f\x29\x5a\xd5\x4b\x76\x6e\x1b\xde\xa1\x3e\xf5\xd1\xb2\x11\x81\xdf\x55\x32\x6a\x30\xd5\x9d\x13\x73\x2a\x1d\x49\x85\xa7\xae\x8a\x1e\xe9\x99\xcb\x57\xbb\x3d\x85\xca\x9a\x6d\x4b\xd4\xf6\xbe\x88\x35\x9c\x9d\xbe\x9c\x2d\xb8\x60\xf5\x89\x69\xd7\xaa\x75\x36\x5b\xa1\xe2\xc9\xa6\xd9\xda\xb6\x55\x7e\x60\x3a\x23\x13\xd3\x6d\xcb\x95\xfc\xb0\x99\xf1\xbc\xd9\xae\x90\xcc\x02\x17\x8b\xd6\xfa\x4a\x2e\x73\xe3\xbe\x0e\x96\xed\xfe\x00\x9e\xad\xd2\xba\xa6\xbf\xcb\xf9\x69\x8d\x38\xfd\x4b\xa3\x5a\xf1\x08\x67\x8d\x41\x4b\xa6\x98\x49\xa5\x68\x8c\xcc\x59\x74\xcd\x16\x78\x1a\x49\xbd\x6c\xd2\xe5\x78\x40\x26\x5a\x9c\xaa\x99\xd3\x51\x78\x72\x3c\xf7\x81\xc0\xa1\x54\xb9\xc7\x8c\x54\xae\xef\xb9\xf1\xa5\x70\xc3\x7a\xa3\x7b\x76\x1c\x9c\x1d\xee\x40\xd5\x01\xbe\xc8\xc5\x71\xfd\xd5\xcd\x7f\x6e\xfb\x33\xc6\x26\x07\x3e\x4e\xe3\x0f\xdc\xb1\x38\x3e\x5c\xd9\xa2\xc8\x63\x66\x3e\x5d\xa5\xe2\x8b\xa9\xd3\x79\xda\x1e\xb6\x12\xfb\x49\x8b\xaf\x5f\x1a\x69\x0f\x59\x70\xfb\xe2\x69\xda\x1b\xe1\xb6\xd1\xb9\x0e\xd2\xfc\xed\x9f\x97\x34\x7f\x15\xc0\x6e\x52\xe2\x3b\xb6\xbc\xb0\x30\x78\x09\x0a\xf6\xf9\xb4\xed\x99\xcf\xe3\x5d\xdf\xb5\xfd\x41\x60\xff\x59\xfb\x7f\x0b\x8e\x66\xe0\xb3\xf6\x96\xbd\xb8\x0f\xdd\xf5\x3a\x5b\xb6\xb0\xfd\x92\xc3\x10\xef\x9a\xe4\xf8\x9d\x5e\xb9\x2f\xf1\xd3\xf3\xcf\xe0\x92\x0b\x93\x06\x55\x4a\x45\x7f\xd9\x30\xa3\x3e\x2c\xe3\x76\xb8\xcb\x4d\x93\x45\xf2\xef\xab\x04\xad\x5b\x45\xf5\xc1\xef\xd6\x7d\xa4\x0a\x87\xf2\xc2\x54\xcc\x55\x7d\x21\x69\x7f\x79\x6d\x9d\xb1\xbf\x19\x3c\x7e\xdf\xe1\xf1\xd0\x69\x06\x2f\x53\xd5\x7d\xc8\xfd\xcf\x84\xb4\x1c\x7a\xb5\x46\xf3\xc4\x77\x77\x8a\x3f\xb0\xdf\xbf\x24\xda\x47\xee\x4e\x07\xbc\xf7\x3d\xdc\xfd\x09\x0f\x76\xf7\x0f\x75\x57\x07\xba\x5b\x46\x60\x5f\xc5\x6f\x31\x73\x1f\xed\xaf\x18\x36\x6c\x00\xda\xc2\xd1\x59\xe4\xee\x62\x11\xc0\x16\x28\x5b\xee\xb4\x0c\x9e\xde\x69\x4b\xfc\x5d\x76\xea\xe7\x85\x34\x6f\xcb\x86\xdb\x9b\xf8\xa9\x42\xbf\x7b\x47\x82\xa3\x3f\xab\xd3\xc6\x66\xf0\x64\xd3\xd6\x0b\x1c\x3b\x01\x94\xb6\x66\x0c\x42\x36\xef\x25\x97\x17\xb0\x7d\x42\x03\xc8\xed\xb5\x7f\x6b\x4d\x40\xaa\xe6\xcd\xf0\x4f\xe3\x85\x87\x6b\xd0\xee\x96\xfc\x40\x25\xba\x41\x2c\xc5\x17\xa9\x01\x21\xd7\x03\xf3\xad\x46\xd8\xab\xbb\x19\xb2\x15\xda\xd7\x1d\xec\x0b\x1d\xd2\xa0\x30\x9c\xec\xa3\x54\x10\xa3\xc1\xc8\xd8\x0b\x22\x76\x7f\x56\xb9\x0c\xbb\x46\x77\xbd\x49\xc3\xbc\x30\xf6\xf6\x6d\x7d\xf3\x36\xe3\xd7\x7d\xe7\x39\x86\x30\xb4\xd8\xb9\x6b\x8b\x8d\x9b\xaf\xae\x7d\x6a\xdb\x07\xa6\xad\xf1\xa1\x42\x7b\xbb\x78\x2d\x95\xda\xd4\xd7\x56\xca\xaa\x7b\xa7\xe0\x0e\x26\xb5\x57\x5d\xb5\x04\x6e\x1e\x6a\xd0\x2c\x41\x30\x12\xf8\x42\x48\xff\xf6\x4e\x6f\x95\xfd\x6a\xf2\xe4\x24\xfa\x8c\x38\x7c\x3d\x7f\x80\x68\xee\xa2\x5b\xfb\xc9\x00\xa2\x88\xd5\x44\x22\x5e\x2e\xb5\xe6\xf3\x0c\x7b\xc2\xda\x86\xc3\x05\xa9\x7f\x06\x85\x66\x0b\x3c\xa9\x9f\x1c\xf2\xaf\xb0\x68\x69\xdf\x2f\x2a\x72\xff\xc8\x4f\xf3\xc5\x17\xbf\xa8\x91\xcd\xe7\x0f\x4e\x2c\x23\x75\xa1\x70\xf0\xdb\xc8\x18\x52\xb9\x86\x35\xc2\x9a\x09\x43\x53\x1d\x69\x86\x99\x76\xf0\x1c\xd5\xf5\x2d\x59\xa3\x02\xd1\xb9\x27\xff\x6d\x50\x5a\x90\x2d\x57\xb4\xfe\xe5\x1b\xdf\xef\x1b\xa1\x10\x85\xc6\xc6\x93\x4e\xde\xa7\x9d\xd8\x97\xc8\x80\xeb\x72\x40\xf5\x30\x90\x0f\x42\x0a\xe5\x46\xd8\x97\x8b\xdc\x33\x5f\xad\xb7\x04\xfc\x32\xc4\x93\x56\xbb\x65\x8e\x92\xd2\xd0\xf4\x84\x7f\x70\x30\x9b\x8f\x10\x04\x76\x4b\x7e\x23\xd5\x63\x21\x55\x98\x33\xee\x3c\x7e\xd1\x7e\x26\x6a\xce\x74\xda\xb0\xfb\xe0\xcb\xd4\xfe\xd2\xfe\x25\xcc\x31\xe3\xb8\x42\x58\x16\xda\x78\x70\x73\x67\x1c\x58\x96\x61\x5c\x19\x95\x6c\xe3\x62\x06\xfb\xac\xa2\x25\xf4\xf0\x23\x74\xa1\x80\x60\x7a\x11\x0c\xd2\x63\x34\xc0\xa1\x2b\xc3\x6c\xa1\xbe\xf5\xbc\x8c\x80\x87\x64\x89\x1f\xfa\x30\xc5\xbf\x06\xf5\xa8\x72\x92\xbb\xae\xcb\xfb\x11\x34\x80\x64\xa4\xf2\x11\xa1\xb4\xb8\xfb\x68\x97\xfe\xd9\xf8\x53\x48\xf7\xf0\x4c\xf8\xba\xf5\xe4\x95\x05\xf2\x7f\x01\x00\x00\xff\xff\x4d\xfa\x9d\x2b\x50\x52\x00\x00")
 
 func completionShBytes() ([]byte, error) {
 	return bindataRead(
@@ -8,7 +8,10 @@ import (
 	"os"
 	"os/exec"
 	"path/filepath"
+	"runtime"
+	"runtime/trace"
 	"strings"
+	"syscall"
 	"text/template"
 
 	"github.com/antihax/optional"
@@ -19,6 +22,7 @@ import (
 	"github.com/spf13/pflag"
 
 	"github.com/dcos/dcos-cli/api"
+	"github.com/dcos/dcos-cli/pkg/cli"
 	"github.com/dcos/dcos-cli/pkg/cli/version"
 	"github.com/dcos/dcos-cli/pkg/cmd/auth"
 	clustercmd "github.com/dcos/dcos-cli/pkg/cmd/cluster"
@@ -37,12 +41,47 @@ const annotationUsageOptions string = `    --version
     -h, --help
         Show usage help`
 
+// builtinCommands are the constructors of the top-level commands which are built into the CLI.
+var builtinCommands = map[string]func(ctx api.Context) *cobra.Command{
+	"auth":       auth.NewCommand,
+	"config":     configcmd.NewCommand,
+	"cluster":    clustercmd.NewCommand,
+	"plugin":     plugincmd.NewCommand,
+	"completion": completion.NewCommand,
+}
+
 // NewDCOSCommand creates the `dcos` command with its `auth`, `config`, and `cluster` subcommands.
+//
+// When the first argument refers to a built-in command or a plugin command, only this command gets
+// registered. The whole command tree is built for the help and completion commands, or when the
+// first argument doesn't match any command, as Cobra then needs all commands to print suggestions.
 func NewDCOSCommand(ctx api.Context) *cobra.Command {
 	cmd := &cobra.Command{
 		Use:  "dcos",
 		Args: cobra.ArbitraryArgs,
 	}
+	cmd.SetUsageFunc(helpMenuFunc)
+	cmd.SilenceUsage = true
+
+	var name string
+	if args := ctx.Args(); len(args) > 1 {
+		name = args[1]
+	}
+
+	if newBuiltinCmd, ok := builtinCommands[name]; ok && name != "completion" {
+		cmd.AddCommand(newBuiltinCmd(ctx))
+		return cmd
+	}
+
+	pluginCmds := pluginCommands(ctx)
+	if name != "help" {
+		for _, pluginCmd := range pluginCmds {
+			if pluginCmd.Name == name {
+				cmd.AddCommand(newPluginCommand(ctx, pluginCmd))
+				return cmd
+			}
+		}
+	}
 
 	cmd.AddCommand(
 		auth.NewCommand(ctx),
@@ -51,23 +90,25 @@ func NewDCOSCommand(ctx api.Context) *cobra.Command {
 		plugincmd.NewCommand(ctx),
 		completion.NewCommand(ctx),
 	)
-
-	// If a cluster is attached, we get its plugins.
-	if cluster, err := ctx.Cluster(); err == nil {
-		pluginManager := ctx.PluginManager(cluster)
-		for _, plugin := range pluginManager.Plugins() {
-			for _, pluginCmd := range plugin.Commands {
-				cmd.AddCommand(newPluginCommand(ctx, pluginCmd))
-			}
-		}
+	for _, pluginCmd := range pluginCmds {
+		cmd.AddCommand(newPluginCommand(ctx, pluginCmd))
 	}
-
-	cmd.SetUsageFunc(helpMenuFunc)
-	cmd.SilenceUsage = true
-
 	return cmd
 }
 
+// pluginCommands returns the plugin commands for the attached cluster, if any.
+func pluginCommands(ctx api.Context) (commands []plugin.Command) {
+	cluster, err := ctx.Cluster()
+	if err != nil {
+		return nil
+	}
+	defer trace.StartRegion(context.Background(), "plugin-discovery").End()
+	for _, p := range ctx.PluginManager(cluster).Plugins() {
+		commands = append(commands, p.Commands...)
+	}
+	return commands
+}
+
 func newPluginCommand(ctx api.Context, cmd plugin.Command) *cobra.Command {
 	pluginCmd := &cobra.Command{
 		Use:                cmd.Name,
@@ -103,7 +144,12 @@ func newPluginCommand(ctx api.Context, cmd plugin.Command) *cobra.Command {
 		args := []string{cmd.Name}
 		args = append(args, cmdArgs...)
 		args = append(args, "--help")
-		invokePlugin(ctx, cmd, args)
+		err := invokePlugin(ctx, cmd, args)
+
+		// Help functions can't return errors, mirror the plugin exit code right away.
+		if exitErr, ok := err.(*exec.ExitError); ok && exitErr.ExitCode() > 0 {
+			os.Exit(exitErr.ExitCode())
+		}
 	})
 	return pluginCmd
 }
@@ -155,12 +201,9 @@ func updateCorePlugin(ctx api.Context) error {
 }
 
 // invokePlugin calls the binary of a plugin, passing in the arguments it's been given.
+//
+// When DCOS_CLI_PLUGIN_EXEC=1, the CLI process is replaced by the plugin process on Linux and macOS.
 func invokePlugin(ctx api.Context, cmd plugin.Command, args []string) error {
-	execCmd := exec.Command(cmd.Path, args...) // nolint: gosec
-	execCmd.Stdout = ctx.Out()
-	execCmd.Stderr = ctx.ErrOut()
-	execCmd.Stdin = ctx.Input()
-
 	executablePath, err := os.Executable()
 	if err != nil {
 		return err
@@ -175,26 +218,54 @@ func invokePlugin(ctx api.Context, cmd plugin.Command, args []string) error {
 			return config.NewSSLError(err)
 		}
 	}
-	execCmdEnv := pluginEnv(executablePath, cmd.Name, ctx.Logger().Level, cluster)
-	execCmd.Env = append(os.Environ(), execCmdEnv...)
+	execCmdEnv := append(os.Environ(), pluginEnv(executablePath, cmd.Name, ctx.Logger().Level, cluster)...)
+
+	if canExecPlugin(ctx) {
+		// syscall.Exec only returns on failure, the plugin is then run as a child process.
+		err := syscall.Exec(cmd.Path, append([]string{cmd.Path}, args...), execCmdEnv) // nolint: gosec
+		ctx.Logger().Debugf("Couldn't replace the CLI process with %s: %s", cmd.Path, err)
+	}
+
+	execCmd := exec.Command(cmd.Path, args...) // nolint: gosec
+	execCmd.Stdout = ctx.Out()
+	execCmd.Stderr = ctx.ErrOut()
+	execCmd.Stdin = ctx.Input()
+	execCmd.Env = execCmdEnv
 
+	region := trace.StartRegion(context.Background(), "plugin-exec")
 	err = execCmd.Run()
+	region.End()
 	if err != nil {
 		// Because we're silencing errors through Cobra, we need to print this separately.
+		// When the plugin command exits with a non-zero code, the main CLI process exits
+		// with the same code once the returned *exec.ExitError reaches it.
 		ctx.Logger().Debug(err)
-		// When the plugin command exits with a non-zero code, the main CLI process
-		// exit code should be the same. ExitCode() returns -1 if the process
-		// hasn't exited or was terminated by a signal thus we have to check.
-		//
-		// See https://jira.mesosphere.com/browse/DCOS_OSS-4399
-		if exitCode := execCmd.ProcessState.ExitCode(); exitCode > 0 {
-			os.Exit(exitCode)
-		}
-
 	}
 	return err
 }
 
+// canExecPlugin indicates whether the CLI process can be replaced by a plugin process.
+//
+// This is opt-in through DCOS_CLI_PLUGIN_EXEC. It also requires the CLI to use the standard streams
+// of the process, and it is disabled when profiling as profiles are only written when the CLI exits.
+func canExecPlugin(ctx api.Context) bool {
+	if runtime.GOOS != "linux" && runtime.GOOS != "darwin" {
+		return false
+	}
+	if val, _ := ctx.EnvLookup(cli.EnvPluginExec); val != "1" {
+		return false
+	}
+	if ctx.Input() != os.Stdin || ctx.Out() != os.Stdout || ctx.ErrOut() != os.Stderr {
+		return false
+	}
+	for _, key := range []string{cli.EnvCPUProfile, cli.EnvMemProfile, cli.EnvTrace} {
+		if val, ok := ctx.EnvLookup(key); ok && val != "" {
+			return false
+		}
+	}
+	return true
+}
+
 // pluginEnv returns the environment variables to pass to a given plugin.
 func pluginEnv(executablePath string, cmdName string, logLevel logrus.Level, cluster *config.Cluster) (env []string) {
 	env = append(env, "DCOS_CLI_EXECUTABLE_PATH="+executablePath)
@@ -213,7 +284,7 @@ func pluginEnv(executablePath string, cmdName string, logLevel logrus.Level, clu
 		env = append(env, "DCOS_ACS_TOKEN="+cluster.ACSToken())
 
 		// Create env entries based on the subcommand config.
-		if cmdConfig, ok := cluster.Config().ToMap()[cmdName].(map[string]interface{}); ok {
+		if cmdConfig := cluster.Config().Section(cmdName); cmdConfig != nil {
 			for key, val := range cmdConfig {
 				env = append(env, fmt.Sprintf(
 					"%s=%v",
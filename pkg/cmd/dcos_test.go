@@ -2,12 +2,18 @@ package cmd
 
 import (
 	"bytes"
+	"fmt"
+	"os"
+	"runtime"
+	"strings"
 	"testing"
 
+	"github.com/dcos/dcos-cli/pkg/cli"
 	"github.com/dcos/dcos-cli/pkg/cli/version"
 	"github.com/dcos/dcos-cli/pkg/config"
 	"github.com/dcos/dcos-cli/pkg/mock"
 	"github.com/sirupsen/logrus"
+	"github.com/spf13/afero"
 	"github.com/stretchr/testify/require"
 )
 
@@ -53,6 +59,57 @@ Use "dcos [command] --help" for more information about a command.
 	require.Equal(t, expectedHelp, out.String())
 }
 
+func TestDCOSCommandTree(t *testing.T) {
+	env := mock.NewEnvironment()
+	env.EnvLookup = func(key string) (string, bool) {
+		if key == cli.EnvDCOSDir {
+			return "/.dcos", true
+		}
+		return "", false
+	}
+
+	conf := config.New(config.Opts{Fs: env.Fs})
+	conf.SetPath("/.dcos/clusters/1234/dcos.toml")
+	require.NoError(t, conf.Persist())
+
+	pluginTOML := `name = "hello"
+
+[[commands]]
+name = "hello"
+path = "/hello"
+description = "Say hello"
+
+[[commands]]
+name = "goodbye"
+path = "/goodbye"
+description = "Say goodbye"
+`
+	pluginTOMLPath := "/.dcos/clusters/1234/subcommands/hello/env/plugin.toml"
+	require.NoError(t, afero.WriteFile(env.Fs, pluginTOMLPath, []byte(pluginTOML), 0644))
+
+	testCases := []struct {
+		args     []string
+		commands []string
+	}{
+		{[]string{"dcos", "cluster", "list"}, []string{"cluster"}},
+		{[]string{"dcos", "goodbye", "--all"}, []string{"goodbye"}},
+		{[]string{"dcos", "help"}, []string{"auth", "cluster", "completion", "config", "goodbye", "hello", "plugin"}},
+		{[]string{"dcos", "unknown"}, []string{"auth", "cluster", "completion", "config", "goodbye", "hello", "plugin"}},
+		{[]string{"dcos"}, []string{"auth", "cluster", "completion", "config", "goodbye", "hello", "plugin"}},
+	}
+
+	for _, tc := range testCases {
+		env.Args = tc.args
+		cmd := NewDCOSCommand(mock.NewContext(env))
+
+		var commands []string
+		for _, subcmd := range cmd.Commands() {
+			commands = append(commands, subcmd.Name())
+		}
+		require.Equal(t, tc.commands, commands)
+	}
+}
+
 func TestPluginEnv(t *testing.T) {
 	cluster := config.NewCluster(nil)
 	cluster.SetURL("https://dcos.example.com")
@@ -74,8 +131,76 @@ func TestPluginEnv(t *testing.T) {
 	})
 }
 
+func TestCanExecPlugin(t *testing.T) {
+	testCases := []struct {
+		vars       map[string]string
+		stdStreams bool
+		expected   bool
+	}{
+		{map[string]string{}, true, false},
+		{map[string]string{cli.EnvPluginExec: "0"}, true, false},
+		{map[string]string{cli.EnvPluginExec: "1"}, true, runtime.GOOS == "linux" || runtime.GOOS == "darwin"},
+		{map[string]string{cli.EnvPluginExec: "1"}, false, false},
+		{map[string]string{cli.EnvPluginExec: "1", cli.EnvCPUProfile: "cpu.out"}, true, false},
+		{map[string]string{cli.EnvPluginExec: "1", cli.EnvTrace: "trace.out"}, true, false},
+	}
+
+	for _, tc := range testCases {
+		env := mock.NewEnvironment()
+		env.EnvLookup = func(key string) (string, bool) {
+			val, ok := tc.vars[key]
+			return val, ok
+		}
+		if tc.stdStreams {
+			env.Input, env.Out, env.ErrOut = os.Stdin, os.Stdout, os.Stderr
+		}
+		require.Equal(t, tc.expected, canExecPlugin(mock.NewContext(env)), tc.vars)
+	}
+}
+
 func TestCmdConfigEnvKey(t *testing.T) {
 	require.Equal(t, "DCOS_HELLO_WORLD", cmdConfigEnvKey("hello", "world"))
 	require.Equal(t, "DCOS_HELLO_WORLD_FOO", cmdConfigEnvKey("hello-world", "foo"))
 	require.Equal(t, "DCOS_HELLO_AROUND_THE_WORLD", cmdConfigEnvKey("hello", "around_the_world"))
 }
+
+func BenchmarkNewDCOSCommand(b *testing.B) {
+	env := mock.NewEnvironment()
+	env.EnvLookup = func(key string) (string, bool) {
+		if key == cli.EnvDCOSDir {
+			return "/.dcos", true
+		}
+		return "", false
+	}
+
+	conf := config.New(config.Opts{Fs: env.Fs})
+	conf.SetPath("/.dcos/clusters/1234/dcos.toml")
+	require.NoError(b, conf.Persist())
+
+	// 20 plugins with 5 commands each, this is in the range of a cluster running several services.
+	for i := 0; i < 20; i++ {
+		pluginTOML := fmt.Sprintf("name = \"plugin-%d\"\n", i)
+		for j := 0; j < 5; j++ {
+			pluginTOML += fmt.Sprintf(
+				"\n[[commands]]\nname = \"command-%d-%d\"\npath = \"/command-%d-%d\"\ndescription = \"Command %d-%d\"\n",
+				i, j, i, j, i, j,
+			)
+		}
+		pluginTOMLPath := fmt.Sprintf("/.dcos/clusters/1234/subcommands/plugin-%d/env/plugin.toml", i)
+		require.NoError(b, afero.WriteFile(env.Fs, pluginTOMLPath, []byte(pluginTOML), 0644))
+	}
+
+	for _, args := range [][]string{
+		{"dcos", "cluster", "list"},
+		{"dcos", "command-19-4", "--help"},
+		{"dcos", "help"},
+	} {
+		b.Run(strings.Join(args[1:], "_"), func(b *testing.B) {
+			env.Args = args
+			b.ReportAllocs()
+			for i := 0; i < b.N; i++ {
+				NewDCOSCommand(mock.NewContext(env))
+			}
+		})
+	}
+}
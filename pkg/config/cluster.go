@@ -6,9 +6,11 @@ import (
 	"path/filepath"
 	"strconv"
 	"strings"
+	"sync"
 	"time"
 
 	"github.com/dcos/dcos-cli/constants"
+	"github.com/dcos/dcos-cli/pkg/httpclient"
 
 	"github.com/spf13/afero"
 	"github.com/spf13/cast"
@@ -26,6 +28,23 @@ func NewSSLError(e error) *SSLError {
 	return &SSLError{msg: e}
 }
 
+// caPools holds the CA pools parsed by Cluster.TLS(), by CA bundle file.
+// Clusters with the same CA bundle thus share a pool, and in turn HTTP transports.
+var caPools sync.Map
+
+// caPoolKey identifies a CA bundle file.
+type caPoolKey struct {
+	fs   afero.Fs
+	path string
+}
+
+// caPool is a CA pool along with the modification time and size of the bundle file it has been parsed from.
+type caPool struct {
+	modTime time.Time
+	size    int64
+	pool    *x509.CertPool
+}
+
 // Cluster is a subset representation of a DC/OS CLI configuration.
 //
 // It is a proxy struct on top of a config which provides user-friendly getters and setters for common
@@ -86,6 +105,20 @@ func (c *Cluster) TLS() (TLS, error) {
 	}
 
 	// The value is not a string representing a bool thus it is a path to a root CA bundle.
+	// Parsed bundles are memoized as long as the file isn't modified.
+	poolKey := caPoolKey{fs: c.config.Fs(), path: tlsVal}
+	info, statErr := c.config.Fs().Stat(tlsVal)
+	if statErr == nil {
+		if val, ok := caPools.Load(poolKey); ok {
+			if cached := val.(*caPool); cached.modTime.Equal(info.ModTime()) && cached.size == info.Size() {
+				return TLS{
+					RootCAs:     cached.pool,
+					RootCAsPath: tlsVal,
+				}, nil
+			}
+		}
+	}
+
 	rootCAsPEM, err := afero.ReadFile(c.config.Fs(), tlsVal)
 	if err != nil {
 		return TLS{
@@ -104,6 +137,14 @@ func (c *Cluster) TLS() (TLS, error) {
 	}
 
 	// The cert pool has been successfully created, store it in the TLS config.
+	// The pool parsed from a previous version of the bundle is superseded, HTTP transports using it are released.
+	if statErr == nil {
+		previous, ok := caPools.Load(poolKey)
+		caPools.Store(poolKey, &caPool{modTime: info.ModTime(), size: info.Size(), pool: certPool})
+		if ok {
+			httpclient.ReleaseRootCAs(previous.(*caPool).pool)
+		}
+	}
 	return TLS{
 		RootCAs:     certPool,
 		RootCAsPath: tlsVal,
@@ -124,7 +124,48 @@ func TestGetTLSWithValidCA(t *testing.T) {
 		Fs: afero.NewMemMapFs(),
 	})
 
-	ca := []byte(`
+	ca := []byte(testCA)
+	f, _ := afero.TempFile(conf.Fs(), "/", "ca")
+	f.Write(ca)
+
+	conf.Set("core.ssl_verify", f.Name())
+	cluster := NewCluster(conf)
+
+	tlsConfig, err := cluster.TLS()
+	require.NoError(t, err)
+	require.Equal(t, false, tlsConfig.Insecure)
+	require.Equal(t, f.Name(), tlsConfig.RootCAsPath)
+
+	certPool := x509.NewCertPool()
+	require.True(t, certPool.AppendCertsFromPEM(ca))
+	require.Equal(t, certPool, tlsConfig.RootCAs)
+}
+
+func TestGetTLSMemoizesCAPool(t *testing.T) {
+	conf := New(Opts{
+		Fs: afero.NewMemMapFs(),
+	})
+	f, _ := afero.TempFile(conf.Fs(), "/", "ca")
+	f.Write([]byte(testCA))
+
+	conf.Set("core.ssl_verify", f.Name())
+	cluster := NewCluster(conf)
+
+	tlsConfig, err := cluster.TLS()
+	require.NoError(t, err)
+
+	otherTLSConfig, err := NewCluster(conf).TLS()
+	require.NoError(t, err)
+	require.True(t, tlsConfig.RootCAs == otherTLSConfig.RootCAs)
+
+	// The CA bundle is parsed again once it is modified.
+	f.Write([]byte("\n"))
+	otherTLSConfig, err = cluster.TLS()
+	require.NoError(t, err)
+	require.False(t, tlsConfig.RootCAs == otherTLSConfig.RootCAs)
+}
+
+const testCA = `
 -----BEGIN CERTIFICATE-----
 MIIDszCCApugAwIBAgIQcaz0cEq1THqqPyMRUq6YADANBgkqhkiG9w0BAQsFADCB
 ijELMAkGA1UEBhMCVVMxCzAJBgNVBAgMAkNBMRYwFAYDVQQHDA1TYW4gRnJhbmNp
@@ -147,19 +188,4 @@ ItsQvDefqA5fNDB5LepftYbCNuk65ONGyCjpIoAw+reyzYMJorkG5Sb7AJIyFh2/
 XG3O73Yy5lml6cOyz0iaX46ZaMdm+YEvisSdYGG75uX/ilEOvQObi0vUfM5f6asL
 NT4Sf75bbjkawxsKnddRgK2dILw//sQdOXmSJboaStNrHS5joczy
 -----END CERTIFICATE-----
-`)
-	f, _ := afero.TempFile(conf.Fs(), "/", "ca")
-	f.Write(ca)
-
-	conf.Set("core.ssl_verify", f.Name())
-	cluster := NewCluster(conf)
-
-	tlsConfig, err := cluster.TLS()
-	require.NoError(t, err)
-	require.Equal(t, false, tlsConfig.Insecure)
-	require.Equal(t, f.Name(), tlsConfig.RootCAsPath)
-
-	certPool := x509.NewCertPool()
-	require.True(t, certPool.AppendCertsFromPEM(ca))
-	require.Equal(t, certPool, tlsConfig.RootCAs)
-}
+`
@@ -0,0 +1,72 @@
+package config
+
+import (
+	"bytes"
+	"fmt"
+	"path/filepath"
+	"sort"
+	"strings"
+
+	"github.com/spf13/afero"
+)
+
+// CompletionIndexFile is the name of the shell completion index files. There is one in the DC/OS directory,
+// written by the Manager, and one in each cluster directory, written by the plugin manager.
+//
+// These are line-based files, each line is a tab-separated record starting with its type. This allows the
+// completion script to read them with shell built-ins, rather than spawning the CLI on each key press.
+const CompletionIndexFile = "completion.index"
+
+// completionFieldReplacer replaces the separators of completion index records within their fields.
+var completionFieldReplacer = strings.NewReplacer("\t", " ", "\n", " ")
+
+// UpdateCompletionIndex writes the completion index of the DC/OS directory.
+//
+// The index is also updated whenever the cluster registry changes (eg. when a cluster gets
+// set up, attached or removed), this method makes sure it exists.
+func (m *Manager) UpdateCompletionIndex() error {
+	return m.persistCompletionIndex(m.registry(false))
+}
+
+// persistCompletionIndex atomically writes the completion index of the DC/OS directory.
+//
+// It holds the attached cluster ID, the ID and name of each cluster and the config keys:
+//
+//	attached	<id>
+//	cluster	<id>	<name>
+//	key	<config key>
+func (m *Manager) persistCompletionIndex(reg *registry) error {
+	var buf bytes.Buffer
+	ids := reg.clusterIDs()
+	for _, id := range ids {
+		if reg.Clusters[id].Attached {
+			fmt.Fprintf(&buf, "attached\t%s\n", id)
+		}
+	}
+	for _, id := range ids {
+		fmt.Fprintf(&buf, "cluster\t%s\t%s\n", id, completionFieldReplacer.Replace(reg.Clusters[id].Name))
+	}
+
+	var keys []string
+	for key := range Keys() {
+		keys = append(keys, key)
+	}
+	sort.Strings(keys)
+	for _, key := range keys {
+		fmt.Fprintf(&buf, "key\t%s\n", key)
+	}
+
+	f, err := afero.TempFile(m.fs, m.dir, CompletionIndexFile)
+	if err != nil {
+		return err
+	}
+
+	defer m.fs.Remove(f.Name())
+
+	_, err = f.Write(buf.Bytes())
+	f.Close()
+	if err != nil {
+		return err
+	}
+	return m.fs.Rename(f.Name(), filepath.Join(m.dir, CompletionIndexFile))
+}
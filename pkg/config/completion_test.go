@@ -0,0 +1,48 @@
+package config
+
+import (
+	"fmt"
+	"path/filepath"
+	"strings"
+	"testing"
+
+	"github.com/spf13/afero"
+	"github.com/stretchr/testify/require"
+)
+
+func TestCompletionIndex(t *testing.T) {
+	fs := afero.NewMemMapFs()
+	manager := NewManager(ManagerOpts{
+		Dir: ".dcos",
+		Fs:  fs,
+	})
+
+	newConfig := func(id, name string) *Config {
+		conf := manager.newConfig()
+		conf.Set("cluster.name", name)
+		require.NoError(t, manager.Save(conf, id, nil))
+		return conf
+	}
+	newConfig("79893270-f9f1-4293-9225-e6e3900043a9", "foo")
+	bar := newConfig("97193161-f7f1-2295-2514-a6b3918043b6", "bar\tbaz")
+	require.NoError(t, manager.Attach(bar))
+
+	data, err := afero.ReadFile(fs, filepath.Join(".dcos", CompletionIndexFile))
+	require.NoError(t, err)
+
+	lines := strings.Split(string(data), "\n")
+	require.Equal(t, []string{
+		"attached\t97193161-f7f1-2295-2514-a6b3918043b6",
+		"cluster\t79893270-f9f1-4293-9225-e6e3900043a9\tfoo",
+		"cluster\t97193161-f7f1-2295-2514-a6b3918043b6\tbar baz",
+	}, lines[:3])
+	for key := range Keys() {
+		require.Contains(t, lines, fmt.Sprintf("key\t%s", key))
+	}
+
+	// The index is updated when a cluster is removed.
+	require.NoError(t, manager.Remove(bar))
+	data, err = afero.ReadFile(fs, filepath.Join(".dcos", CompletionIndexFile))
+	require.NoError(t, err)
+	require.True(t, strings.HasPrefix(string(data), "cluster\t79893270-f9f1-4293-9225-e6e3900043a9\tfoo\nkey\t"))
+}
@@ -57,8 +57,11 @@ type Opts struct {
 // Config is the backend for Config data. It aggregates multiple sources (env vars, TOML document)
 // and is able to get/set/unset key(s) in the TOML document.
 type Config struct {
-	path         string
-	tree         *toml.Tree
+	path string
+	tree *toml.Tree
+	// snapshot is a flat view of the TOML tree, used for lookups when the config is loaded from
+	// its snapshot file. The tree is then only created on demand, for updates.
+	snapshot     *snapshot
 	envWhitelist map[string]string
 	envLookup    func(key string) (string, bool)
 	fs           afero.Fs
@@ -122,8 +125,23 @@ func Keys() map[string]string {
 
 // LoadPath populates the store based on a path to a TOML file.
 // If the file doesn't exist, an empty one is created.
+//
+// The TOML file is only parsed when its snapshot is missing or stale, the snapshot then gets refreshed.
 func (c *Config) LoadPath(path string) error {
-	f, err := c.fs.OpenFile(path, os.O_RDONLY|os.O_CREATE, 0600)
+	flag := os.O_RDONLY
+	info, err := c.fs.Stat(path)
+	if err == nil {
+		if snapshot, err := readSnapshot(c.fs, path, info); err == nil {
+			c.tree = nil
+			c.snapshot = snapshot
+			c.path = path
+			return nil
+		}
+	} else {
+		flag |= os.O_CREATE
+	}
+
+	f, err := c.fs.OpenFile(path, flag, 0600)
 	if err != nil {
 		return err
 	}
@@ -133,6 +151,9 @@ func (c *Config) LoadPath(path string) error {
 		return err
 	}
 	c.path = path
+	if info != nil {
+		c.persistSnapshot(info)
+	}
 	return nil
 }
 
@@ -149,6 +170,27 @@ func (c *Config) LoadReader(reader io.Reader) error {
 // LoadTree populates the store with a TOML tree.
 func (c *Config) LoadTree(tree *toml.Tree) {
 	c.tree = tree
+	c.snapshot = nil
+}
+
+// loadedTree returns the TOML tree of the config, it creates it from the snapshot if needed.
+func (c *Config) loadedTree() *toml.Tree {
+	if c.tree == nil {
+		c.tree = c.snapshot.toTree()
+	}
+	return c.tree
+}
+
+// persistSnapshot writes the snapshot of the config next to its TOML file, info describes the TOML file.
+// Configs which can't be snapshotted have their stale snapshot removed, if any.
+func (c *Config) persistSnapshot(info os.FileInfo) {
+	snapshot, err := newSnapshot(c.loadedTree())
+	if err == nil {
+		err = writeSnapshot(c.fs, c.path, info, snapshot)
+	}
+	if err != nil {
+		c.fs.Remove(snapshotPath(c.path))
+	}
 }
 
 // Path returns the path to the Config.
@@ -176,6 +218,10 @@ func (c *Config) Get(key string) interface{} {
 		}
 	}
 
+	if c.snapshot != nil {
+		return c.snapshot.get(key)
+	}
+
 	// Fallback to the TOML tree if present.
 	switch node := c.tree.Get(key).(type) {
 	case *toml.Tree, []*toml.Tree:
@@ -187,9 +233,24 @@ func (c *Config) Get(key string) interface{} {
 
 // ToMap recursively generates a representation of the config using Go built-in structures.
 func (c *Config) ToMap() map[string]interface{} {
+	if c.snapshot != nil {
+		return c.snapshot.toMap()
+	}
 	return c.tree.ToMap()
 }
 
+// Section returns the values under a given section (eg. `marathon`), with the same representation as ToMap.
+// It returns nil when there is no such section.
+func (c *Config) Section(name string) map[string]interface{} {
+	if c.snapshot != nil {
+		return c.snapshot.section(name)
+	}
+	if section, ok := c.tree.Get(name).(*toml.Tree); ok {
+		return section.ToMap()
+	}
+	return nil
+}
+
 // Set sets a key in the store.
 func (c *Config) Set(key string, val interface{}) (err error) {
 	switch key {
@@ -209,7 +270,8 @@ func (c *Config) Set(key string, val interface{}) (err error) {
 		val, err = cast.ToStringE(val)
 	}
 	if err == nil {
-		c.tree.Set(key, val)
+		c.loadedTree().Set(key, val)
+		c.snapshot = nil
 	}
 	return err
 }
@@ -222,7 +284,7 @@ func (c *Config) Unset(key string) {
 	}
 	keys := strings.Split(key, ".")
 
-	treeMap := c.tree.ToMap()
+	treeMap := c.loadedTree().ToMap()
 	subMap := treeMap
 
 	// Extract a sub-map for each dotted key section.
@@ -237,6 +299,7 @@ func (c *Config) Unset(key string) {
 					// Remove the key from the parent map and swap trees.
 					delete(subMap, key)
 					c.tree, _ = toml.TreeFromMap(treeMap)
+					c.snapshot = nil
 				} else {
 					return
 				}
@@ -246,15 +309,22 @@ func (c *Config) Unset(key string) {
 }
 
 // Persist flushes the in-memory TOML tree representation to the path associated to the Config.
+// A snapshot of the config is written next to it, in order to speed up subsequent loads.
 func (c *Config) Persist() error {
 	if c.path == "" {
 		return ErrNoConfigPath
 	}
 	var buf bytes.Buffer
-	if _, err := c.tree.WriteTo(&buf); err != nil {
+	if _, err := c.loadedTree().WriteTo(&buf); err != nil {
+		return err
+	}
+	if err := afero.WriteFile(c.fs, c.path, buf.Bytes(), 0600); err != nil {
 		return err
 	}
-	return afero.WriteFile(c.fs, c.path, buf.Bytes(), 0600)
+	if info, err := c.fs.Stat(c.path); err == nil {
+		c.persistSnapshot(info)
+	}
+	return nil
 }
 
 // Keys returns all the keys in the Config.
@@ -266,7 +336,11 @@ func (c *Config) Keys() []string {
 		}
 	}
 
-	searchKeys(c.tree, &keys, []string{})
+	if c.snapshot != nil {
+		keys = append(keys, c.snapshot.keys...)
+	} else {
+		searchKeys(c.tree, &keys, []string{})
+	}
 	keysLen := len(keys)
 	if keysLen < 2 {
 		// Less than 2 keys, no need to sort or remove duplicates.
@@ -56,60 +56,98 @@ func NewManager(opts ManagerOpts) *Manager {
 	}
 }
 
+// Dir returns the root directory of the manager.
+func (m *Manager) Dir() string {
+	return m.dir
+}
+
+// Fs returns the filesystem of the manager.
+func (m *Manager) Fs() afero.Fs {
+	return m.fs
+}
+
 // Current retrieves the current config.
 //
 // The lookup order is :
 // - DCOS_CLUSTER is defined and is the name/ID of a configured cluster.
 // - An attached file exists alongside a configured cluster, OR there is a single configured cluster.
+//
+// The config is looked up in the cluster registry, which gets rebuilt when it is stale.
 func (m *Manager) Current() (*Config, error) {
 	if configName, ok := m.envLookup("DCOS_CLUSTER"); ok {
 		return m.Find(configName, true)
 	}
 
-	configs := m.All()
-	if len(configs) == 1 {
-		return configs[0], nil
+	config, err := m.current(m.registry(false))
+	if err == errStaleRegistry {
+		config, err = m.current(m.registry(true))
 	}
+	return config, err
+}
 
-	var currentConfig *Config
-	for _, config := range configs {
-		attachedFile := m.attachedFilePath(config)
-		if m.fileExists(attachedFile) {
-			if currentConfig != nil {
+// current retrieves the current config from a given registry.
+func (m *Manager) current(reg *registry) (*Config, error) {
+	clusterIDs := reg.clusterIDs()
+	if len(clusterIDs) == 1 {
+		return m.load(reg, clusterIDs[0])
+	}
+
+	var currentClusterID string
+	for _, id := range clusterIDs {
+		if reg.Clusters[id].Attached {
+			if currentClusterID != "" {
+				if !reg.fresh {
+					return nil, errStaleRegistry
+				}
 				return nil, errors.New("multiple clusters are attached")
 			}
-			currentConfig = config
+			currentClusterID = id
 		}
 	}
-	if currentConfig == nil {
+	if currentClusterID == "" {
+		if !reg.fresh {
+			return nil, errStaleRegistry
+		}
 		return nil, ErrNotAttached
 	}
-	return currentConfig, nil
+	return m.load(reg, currentClusterID)
 }
 
 // Find finds a config by cluster name or ID, `strict` indicates
 // whether or not the search string can also be a cluster ID prefix.
 func (m *Manager) Find(name string, strict bool) (*Config, error) {
-	var matches []*Config
-	for _, config := range m.All() {
-		configName, _ := config.Get(keyClusterName).(string)
-		if name == configName {
-			matches = append(matches, config)
+	config, err := m.find(m.registry(false), name, strict)
+	if err == errStaleRegistry {
+		config, err = m.find(m.registry(true), name, strict)
+	}
+	return config, err
+}
+
+// find finds a config by cluster name or ID in a given registry.
+func (m *Manager) find(reg *registry, name string, strict bool) (*Config, error) {
+	var matches []string
+	for _, clusterID := range reg.clusterIDs() {
+		if name == reg.Clusters[clusterID].Name {
+			matches = append(matches, clusterID)
 		}
-		clusterID := filepath.Base(filepath.Dir(config.Path()))
 		if clusterID == name {
-			return config, nil
+			return m.load(reg, clusterID)
 		}
 		if !strict && strings.HasPrefix(clusterID, name) {
-			matches = append(matches, config)
+			matches = append(matches, clusterID)
 		}
 	}
 
+	// Make sure the registry is up-to-date before returning an error.
+	if len(matches) != 1 && !reg.fresh {
+		return nil, errStaleRegistry
+	}
+
 	switch len(matches) {
 	case 0:
 		return nil, ErrConfigNotFound
 	case 1:
-		return matches[0], nil
+		return m.load(reg, matches[0])
 	default:
 		return nil, ErrTooManyConfigs
 	}
@@ -117,7 +155,7 @@ func (m *Manager) Find(name string, strict bool) (*Config, error) {
 
 // All retrieves all configs.
 func (m *Manager) All() (configs []*Config) {
-	configsDir, err := m.fs.Open(filepath.Join(m.dir, "clusters"))
+	configsDir, err := m.fs.Open(m.clustersDir())
 	if err != nil {
 		return
 	}
@@ -143,7 +181,7 @@ func (m *Manager) All() (configs []*Config) {
 
 // Save saves a config to the disk under the given cluster ID folder.
 func (m *Manager) Save(config *Config, id string, caBundle []byte) error {
-	configDir := filepath.Join(m.dir, "clusters", id)
+	configDir := filepath.Join(m.clustersDir(), id)
 	if err := m.fs.MkdirAll(configDir, 0755); err != nil {
 		return err
 	}
@@ -155,22 +193,21 @@ func (m *Manager) Save(config *Config, id string, caBundle []byte) error {
 		}
 		config.Set(keyTLS, caBundlePath)
 	}
-	config.SetPath(filepath.Join(configDir, "dcos.toml"))
-	return config.Persist()
+	config.SetPath(m.configPath(id))
+	if err := config.Persist(); err != nil {
+		return err
+	}
+	m.registry(false, id)
+	return nil
 }
 
 // Attach sets a given config as the current one. This is done by adding an `attached`
 // file next to it. If another config is already attached, the file gets moved.
 func (m *Manager) Attach(config *Config) error {
-	var currentAttachedFile string
-
-	// Iterate over all configs to find the one with an attached file, if any.
-	for _, c := range m.All() {
-		attachedFile := m.attachedFilePath(c)
-		if m.fileExists(attachedFile) {
-			currentAttachedFile = attachedFile
-			break
-		}
+	currentAttachedFile := m.attachedFile(m.registry(false))
+	if currentAttachedFile == "" {
+		// Make sure no cluster is attached, in case the registry is stale.
+		currentAttachedFile = m.attachedFile(m.registry(true))
 	}
 
 	configAttachedPath := m.attachedFilePath(config)
@@ -181,9 +218,57 @@ func (m *Manager) Attach(config *Config) error {
 		if err != nil {
 			return err
 		}
-		return f.Close()
+		if err := f.Close(); err != nil {
+			return err
+		}
+	} else if err := m.fs.Rename(currentAttachedFile, configAttachedPath); err != nil {
+		return err
 	}
-	return m.fs.Rename(currentAttachedFile, configAttachedPath)
+
+	refresh := []string{m.clusterID(configAttachedPath)}
+	if currentAttachedFile != "" {
+		refresh = append(refresh, m.clusterID(currentAttachedFile))
+	}
+	m.registry(false, refresh...)
+	return nil
+}
+
+// Remove removes a config and its cluster directory from the disk.
+func (m *Manager) Remove(config *Config) error {
+	if err := m.fs.RemoveAll(filepath.Dir(config.Path())); err != nil {
+		return err
+	}
+	m.registry(false)
+	return nil
+}
+
+// attachedFile returns the path to the `attached` file of a given registry, if any.
+func (m *Manager) attachedFile(reg *registry) string {
+	for _, id := range reg.clusterIDs() {
+		if !reg.Clusters[id].Attached {
+			continue
+		}
+		attachedFile := filepath.Join(m.clustersDir(), id, "attached")
+		if m.fileExists(attachedFile) {
+			return attachedFile
+		}
+	}
+	return ""
+}
+
+// clusterID returns the ID of the cluster holding a given file.
+func (m *Manager) clusterID(path string) string {
+	return filepath.Base(filepath.Dir(path))
+}
+
+// clustersDir returns the path to the directory holding cluster configs.
+func (m *Manager) clustersDir() string {
+	return filepath.Join(m.dir, "clusters")
+}
+
+// configPath returns the path to the config of a given cluster.
+func (m *Manager) configPath(id string) string {
+	return filepath.Join(m.clustersDir(), id, "dcos.toml")
 }
 
 // attachedFilePath returns the `attached` file path for a given config.
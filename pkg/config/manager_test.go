@@ -1,9 +1,12 @@
 package config
 
 import (
+	"fmt"
+	"io/ioutil"
 	"os"
 	"path/filepath"
 	"testing"
+	"time"
 
 	"github.com/spf13/afero"
 	"github.com/stretchr/testify/require"
@@ -50,6 +53,7 @@ func TestCurrent(t *testing.T) {
 	for _, tc := range testCases {
 		dcosDir := filepath.Join(fixturesDir, tc.name, ".dcos")
 		manager := NewManager(ManagerOpts{
+			Fs:        testFs(),
 			Dir:       dcosDir,
 			EnvLookup: tc.envLookup,
 		})
@@ -86,6 +90,7 @@ func TestFind(t *testing.T) {
 	for _, tc := range testCases {
 		dcosDir := filepath.Join(fixturesDir, tc.name, ".dcos")
 		manager := NewManager(ManagerOpts{
+			Fs:  testFs(),
 			Dir: dcosDir,
 		})
 
@@ -121,3 +126,149 @@ func TestAttach(t *testing.T) {
 	require.NoError(t, manager.Attach(conf))
 	require.True(t, manager.fileExists(attachedFilePath))
 }
+
+func TestRegistry(t *testing.T) {
+	// The OS filesystem is used as the in-memory one updates modification times when reading files.
+	dir, err := ioutil.TempDir("", "dcos-cli")
+	require.NoError(t, err)
+	defer os.RemoveAll(dir)
+
+	fs := afero.NewOsFs()
+	manager := NewManager(ManagerOpts{
+		Dir: dir,
+		Fs:  fs,
+	})
+
+	newConfig := func(id, name string) *Config {
+		conf := manager.newConfig()
+		conf.Set("cluster.name", name)
+		conf.Set("core.dcos_url", "https://"+name+".example.com")
+		require.NoError(t, manager.Save(conf, id, nil))
+		return conf
+	}
+	newConfig("79893270-f9f1-4293-9225-e6e3900043a9", "foo")
+	bar := newConfig("97193161-f7f1-2295-2514-a6b3918043b6", "bar")
+	require.NoError(t, manager.Attach(bar))
+
+	reg := manager.registry(false)
+	require.False(t, reg.fresh)
+	require.Equal(t, registryEntry{
+		Name:     "bar",
+		URL:      "https://bar.example.com",
+		Attached: true,
+		ModTime:  manager.modTime(bar.Path()),
+	}, reg.Clusters["97193161-f7f1-2295-2514-a6b3918043b6"])
+
+	conf, err := manager.Current()
+	require.NoError(t, err)
+	require.Equal(t, bar.Path(), conf.Path())
+
+	// Configs updated without the manager are detected through their modification time.
+	bar.Set("cluster.name", "baz")
+	require.NoError(t, bar.Persist())
+	future := time.Now().Add(time.Hour)
+	require.NoError(t, fs.Chtimes(bar.Path(), future, future))
+
+	conf, err = manager.Find("baz", true)
+	require.NoError(t, err)
+	require.Equal(t, bar.Path(), conf.Path())
+
+	_, err = manager.Find("bar", true)
+	require.Equal(t, ErrConfigNotFound, err)
+
+	// Removed configs are dropped from the registry.
+	require.NoError(t, manager.Remove(bar))
+	_, err = manager.Find("baz", true)
+	require.Equal(t, ErrConfigNotFound, err)
+
+	conf, err = manager.Current()
+	require.NoError(t, err)
+	require.Equal(t, "foo", conf.Get("cluster.name"))
+}
+
+// testFs returns a filesystem which reads from the OS but only writes in memory.
+func testFs() afero.Fs {
+	return afero.NewCopyOnWriteFs(afero.NewReadOnlyFs(afero.NewOsFs()), afero.NewMemMapFs())
+}
+
+// benchmarkSizes are the numbers of configured clusters used in benchmarks.
+var benchmarkSizes = []int{1, 10, 100, 1000}
+
+func BenchmarkManagerAll(b *testing.B) {
+	for _, n := range benchmarkSizes {
+		b.Run(fmt.Sprintf("clusters=%d", n), func(b *testing.B) {
+			manager, cleanup := benchmarkManager(b, n)
+			defer cleanup()
+
+			b.ReportAllocs()
+			b.ResetTimer()
+			for i := 0; i < b.N; i++ {
+				if configs := manager.All(); len(configs) != n {
+					b.Fatalf("expected %d configs, got %d", n, len(configs))
+				}
+			}
+		})
+	}
+}
+
+func BenchmarkManagerCurrent(b *testing.B) {
+	for _, n := range benchmarkSizes {
+		b.Run(fmt.Sprintf("clusters=%d", n), func(b *testing.B) {
+			manager, cleanup := benchmarkManager(b, n)
+			defer cleanup()
+
+			b.ReportAllocs()
+			b.ResetTimer()
+			for i := 0; i < b.N; i++ {
+				if _, err := manager.Current(); err != nil {
+					b.Fatal(err)
+				}
+			}
+		})
+	}
+}
+
+func BenchmarkManagerFind(b *testing.B) {
+	for _, n := range benchmarkSizes {
+		b.Run(fmt.Sprintf("clusters=%d", n), func(b *testing.B) {
+			manager, cleanup := benchmarkManager(b, n)
+			defer cleanup()
+
+			// Look up the last cluster by name, the registry is iterated in full.
+			name := fmt.Sprintf("cluster-%d", n-1)
+
+			b.ReportAllocs()
+			b.ResetTimer()
+			for i := 0; i < b.N; i++ {
+				if _, err := manager.Find(name, false); err != nil {
+					b.Fatal(err)
+				}
+			}
+		})
+	}
+}
+
+// benchmarkManager returns a manager with n configured clusters, the first one being attached.
+//
+// The OS filesystem is used as the in-memory one updates modification times when reading files,
+// which would invalidate the cluster registry on each lookup.
+func benchmarkManager(b *testing.B, n int) (*Manager, func()) {
+	dir, err := ioutil.TempDir("", "dcos-cli")
+	require.NoError(b, err)
+
+	manager := NewManager(ManagerOpts{
+		Dir: dir,
+		Fs:  afero.NewOsFs(),
+	})
+	for i := 0; i < n; i++ {
+		conf := manager.newConfig()
+		conf.Set("cluster.name", fmt.Sprintf("cluster-%d", i))
+		conf.Set("core.dcos_url", fmt.Sprintf("https://cluster-%d.example.com", i))
+		conf.Set("core.dcos_acs_token", "token")
+		require.NoError(b, manager.Save(conf, fmt.Sprintf("%08d-f7f1-2295-2514-a6b3918043b6", i), nil))
+		if i == 0 {
+			require.NoError(b, manager.Attach(conf))
+		}
+	}
+	return manager, func() { os.RemoveAll(dir) }
+}
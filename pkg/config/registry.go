@@ -0,0 +1,192 @@
+package config
+
+import (
+	"encoding/json"
+	"errors"
+	"path/filepath"
+	"sort"
+
+	"github.com/spf13/afero"
+	"github.com/spf13/cast"
+)
+
+// registryVersion is the version of the registry format. Registries with a different version are discarded.
+const registryVersion = 1
+
+// errStaleRegistry indicates that a registry entry doesn't reflect the filesystem anymore.
+var errStaleRegistry = errors.New("stale cluster registry")
+
+// registry is an index of the configured clusters, stored in the DC/OS directory.
+//
+// It maps each entry of the clusters directory to the name, URL and attached state of the
+// cluster it holds. This allows to find a config without loading all the other ones.
+type registry struct {
+	Version  int                      `json:"version"`
+	Clusters map[string]registryEntry `json:"clusters"`
+
+	// fresh indicates that all entries have just been read from the filesystem.
+	fresh bool
+}
+
+// registryEntry is the registry representation of an entry in the clusters directory.
+type registryEntry struct {
+	// Invalid indicates that the entry is not a directory, or that its config can't be loaded.
+	Invalid bool `json:"invalid,omitempty"`
+
+	Name     string `json:"name"`
+	URL      string `json:"url"`
+	Attached bool   `json:"attached"`
+
+	// ModTime is the modification time of the cluster's dcos.toml file, in nanoseconds.
+	ModTime int64 `json:"mtime"`
+}
+
+// clusterIDs returns the sorted IDs of valid clusters in the registry.
+func (r *registry) clusterIDs() (ids []string) {
+	for id, entry := range r.Clusters {
+		if !entry.Invalid {
+			ids = append(ids, id)
+		}
+	}
+	sort.Strings(ids)
+	return ids
+}
+
+// registry returns the cluster registry.
+//
+// Entries are added or removed according to the content of the clusters directory. When `rescan` is true,
+// all entries are read from the filesystem. Otherwise, only the ones in `refresh` are. The registry is
+// persisted whenever it changes.
+func (m *Manager) registry(rescan bool, refresh ...string) *registry {
+	reg := &registry{
+		Version:  registryVersion,
+		Clusters: make(map[string]registryEntry),
+		fresh:    true,
+	}
+
+	configsDir, err := m.fs.Open(m.clustersDir())
+	if err != nil {
+		return reg
+	}
+	names, err := configsDir.Readdirnames(-1)
+	configsDir.Close()
+	if err != nil {
+		return reg
+	}
+
+	if !rescan {
+		if data, err := afero.ReadFile(m.fs, m.registryPath()); err == nil {
+			var persistedReg registry
+			if err := json.Unmarshal(data, &persistedReg); err == nil && persistedReg.Version == registryVersion {
+				reg.Clusters = persistedReg.Clusters
+				reg.fresh = false
+			}
+		}
+	}
+	changed := reg.fresh
+
+	refreshIDs := make(map[string]bool)
+	for _, id := range refresh {
+		refreshIDs[id] = true
+	}
+
+	dirEntries := make(map[string]bool)
+	for _, name := range names {
+		dirEntries[name] = true
+		if _, ok := reg.Clusters[name]; !ok || reg.fresh || refreshIDs[name] {
+			reg.Clusters[name] = m.registryEntry(name)
+			changed = true
+		}
+	}
+	for id := range reg.Clusters {
+		if !dirEntries[id] {
+			delete(reg.Clusters, id)
+			changed = true
+		}
+	}
+
+	// The registry is only a cache, failing to persist it is not an error.
+	// The completion index is derived from the registry and updated along with it.
+	if changed {
+		m.persistRegistry(reg)
+		m.persistCompletionIndex(reg)
+	}
+	return reg
+}
+
+// registryEntry reads the registry entry of a cluster from the filesystem.
+func (m *Manager) registryEntry(id string) registryEntry {
+	fileInfo, err := m.fs.Stat(filepath.Join(m.clustersDir(), id))
+	if err != nil || !fileInfo.IsDir() {
+		return registryEntry{Invalid: true}
+	}
+
+	configPath := m.configPath(id)
+	modTime := m.modTime(configPath)
+
+	config := m.newConfig()
+	if err := config.LoadPath(configPath); err != nil {
+		return registryEntry{Invalid: true}
+	}
+	if modTime == 0 {
+		// The config file has been created while loading it.
+		modTime = m.modTime(configPath)
+	}
+	return registryEntry{
+		Name:     cast.ToString(config.Get(keyClusterName)),
+		URL:      cast.ToString(config.Get(keyURL)),
+		Attached: m.fileExists(m.attachedFilePath(config)),
+		ModTime:  modTime,
+	}
+}
+
+// load loads the config of a cluster in the registry. When the registry is not fresh,
+// it returns errStaleRegistry if the cluster has been modified since it got registered.
+func (m *Manager) load(reg *registry, id string) (*Config, error) {
+	entry := reg.Clusters[id]
+	configPath := m.configPath(id)
+
+	if !reg.fresh {
+		attached := m.fileExists(filepath.Join(filepath.Dir(configPath), "attached"))
+		if entry.ModTime != m.modTime(configPath) || entry.Attached != attached {
+			return nil, errStaleRegistry
+		}
+	}
+
+	config := m.newConfig()
+	if err := config.LoadPath(configPath); err != nil {
+		return nil, err
+	}
+	return config, nil
+}
+
+// persistRegistry atomically writes the registry to the DC/OS directory.
+func (m *Manager) persistRegistry(reg *registry) error {
+	f, err := afero.TempFile(m.fs, m.dir, "clusters.index")
+	if err != nil {
+		return err
+	}
+
+	defer m.fs.Remove(f.Name())
+
+	err = json.NewEncoder(f).Encode(reg)
+	f.Close()
+	if err != nil {
+		return err
+	}
+	return m.fs.Rename(f.Name(), m.registryPath())
+}
+
+// modTime returns the modification time of a file in nanoseconds, or 0 if it can't be determined.
+func (m *Manager) modTime(path string) int64 {
+	fileInfo, err := m.fs.Stat(path)
+	if err != nil {
+		return 0
+	}
+	return fileInfo.ModTime().UnixNano()
+}
+
+// registryPath returns the path to the cluster registry.
+func (m *Manager) registryPath() string {
+	return filepath.Join(m.dir, "clusters.index")
+}
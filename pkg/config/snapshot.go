@@ -0,0 +1,387 @@
+package config
+
+import (
+	"bytes"
+	"encoding/binary"
+	"errors"
+	"fmt"
+	"math"
+	"os"
+	"path/filepath"
+	"sort"
+	"strings"
+	"time"
+
+	"github.com/pelletier/go-toml"
+	"github.com/spf13/afero"
+)
+
+// snapshotMagic is the header of a snapshot file, its last byte is the format version.
+var snapshotMagic = []byte("DCOSCFG\x01")
+
+// snapshotExt is the extension appended to the path of a config to get its snapshot path.
+const snapshotExt = ".snapshot"
+
+// Tags for the values of a snapshot.
+const (
+	tagString byte = 's'
+	tagInt    byte = 'i'
+	tagFloat  byte = 'f'
+	tagBool   byte = 'b'
+	tagTime   byte = 't'
+	tagArray  byte = 'a'
+)
+
+// Errors related to snapshots.
+var (
+	errSnapshotStale       = errors.New("snapshot is stale")
+	errSnapshotCorrupted   = errors.New("snapshot is corrupted")
+	errSnapshotUnsupported = errors.New("config can't be snapshotted")
+)
+
+// snapshot is a flat representation of a TOML config, it maps the full key to each leaf to its value.
+//
+// It is persisted next to the TOML file it has been created from, as a compact binary file
+// which is much cheaper to decode than TOML. It is tied to the modification time and size
+// of the TOML file and is ignored when they don't match anymore, eg. after a manual edit.
+type snapshot struct {
+	keys   []string
+	values []interface{}
+}
+
+// snapshotPath returns the path to the snapshot of a config file.
+func snapshotPath(configPath string) string {
+	return configPath + snapshotExt
+}
+
+// newSnapshot creates a snapshot from a TOML tree. Arrays of tables, empty tables, keys containing dots
+// and date/time values without a timezone are not supported, such configs are always loaded from TOML.
+func newSnapshot(tree *toml.Tree) (*snapshot, error) {
+	s := &snapshot{}
+	if err := s.add(tree, ""); err != nil {
+		return nil, err
+	}
+	sort.Sort(s)
+	return s, nil
+}
+
+// add recursively adds the leaves of a tree to the snapshot.
+func (s *snapshot) add(tree *toml.Tree, prefix string) error {
+	keys := tree.Keys()
+	if len(keys) == 0 && prefix != "" {
+		return errSnapshotUnsupported
+	}
+	for _, key := range keys {
+		if key == "" || strings.Contains(key, ".") {
+			return errSnapshotUnsupported
+		}
+		switch node := tree.GetPath([]string{key}).(type) {
+		case *toml.Tree:
+			if err := s.add(node, prefix+key+"."); err != nil {
+				return err
+			}
+		default:
+			if !snapshotSupports(node) {
+				return errSnapshotUnsupported
+			}
+			s.keys = append(s.keys, prefix+key)
+			s.values = append(s.values, node)
+		}
+	}
+	return nil
+}
+
+// snapshotSupports indicates whether a TOML value can be part of a snapshot.
+func snapshotSupports(val interface{}) bool {
+	switch val := val.(type) {
+	case string, int64, float64, bool, time.Time:
+		return true
+	case []interface{}:
+		for _, item := range val {
+			if !snapshotSupports(item) {
+				return false
+			}
+		}
+		return true
+	default:
+		return false
+	}
+}
+
+// Len is part of sort.Interface.
+func (s *snapshot) Len() int {
+	return len(s.keys)
+}
+
+// Less is part of sort.Interface.
+func (s *snapshot) Less(i, j int) bool {
+	return s.keys[i] < s.keys[j]
+}
+
+// Swap is part of sort.Interface.
+func (s *snapshot) Swap(i, j int) {
+	s.keys[i], s.keys[j] = s.keys[j], s.keys[i]
+	s.values[i], s.values[j] = s.values[j], s.values[i]
+}
+
+// get returns the value of a leaf, or nil if there is no such key.
+func (s *snapshot) get(key string) interface{} {
+	i := sort.SearchStrings(s.keys, key)
+	if i < len(s.keys) && s.keys[i] == key {
+		return s.values[i]
+	}
+	return nil
+}
+
+// section returns the values under a given section, as nested maps. It returns nil if there is no such section.
+func (s *snapshot) section(name string) map[string]interface{} {
+	prefix := name + "."
+	var section map[string]interface{}
+	for i := sort.SearchStrings(s.keys, prefix); i < len(s.keys) && strings.HasPrefix(s.keys[i], prefix); i++ {
+		if section == nil {
+			section = make(map[string]interface{})
+		}
+		setPath(section, strings.Split(s.keys[i][len(prefix):], "."), s.values[i])
+	}
+	return section
+}
+
+// toMap returns the snapshot as nested maps, like toml.Tree.ToMap.
+func (s *snapshot) toMap() map[string]interface{} {
+	result := make(map[string]interface{})
+	for i, key := range s.keys {
+		setPath(result, strings.Split(key, "."), s.values[i])
+	}
+	return result
+}
+
+// toTree returns the snapshot as a TOML tree.
+func (s *snapshot) toTree() *toml.Tree {
+	tree, _ := toml.TreeFromMap(make(map[string]interface{}))
+	for i, key := range s.keys {
+		tree.SetPath(strings.Split(key, "."), s.values[i])
+	}
+	return tree
+}
+
+// setPath sets a value in nested maps, creating intermediate maps as needed.
+func setPath(m map[string]interface{}, path []string, val interface{}) {
+	for _, key := range path[:len(path)-1] {
+		sub, ok := m[key].(map[string]interface{})
+		if !ok {
+			sub = make(map[string]interface{})
+			m[key] = sub
+		}
+		m = sub
+	}
+	m[path[len(path)-1]] = val
+}
+
+// readSnapshot reads the snapshot of a config file, info describes the config file it should match.
+func readSnapshot(fs afero.Fs, configPath string, info os.FileInfo) (*snapshot, error) {
+	data, err := afero.ReadFile(fs, snapshotPath(configPath))
+	if err != nil {
+		return nil, err
+	}
+	if !bytes.HasPrefix(data, snapshotMagic) {
+		return nil, errSnapshotCorrupted
+	}
+	d := &snapshotDecoder{data: data[len(snapshotMagic):]}
+	if d.varint() != info.ModTime().UnixNano() || d.varint() != info.Size() {
+		return nil, errSnapshotStale
+	}
+
+	n := d.length()
+	s := &snapshot{
+		keys:   make([]string, 0, n),
+		values: make([]interface{}, 0, n),
+	}
+	for i := 0; i < n && d.err == nil; i++ {
+		s.keys = append(s.keys, d.string())
+		s.values = append(s.values, d.value())
+	}
+	if d.err != nil {
+		return nil, d.err
+	}
+	if !sort.IsSorted(s) {
+		return nil, errSnapshotCorrupted
+	}
+	return s, nil
+}
+
+// writeSnapshot atomically writes a snapshot next to a config file, info describes the config file.
+func writeSnapshot(fs afero.Fs, configPath string, info os.FileInfo, s *snapshot) error {
+	buf := bytes.NewBuffer(append([]byte(nil), snapshotMagic...))
+	e := &snapshotEncoder{buf: buf}
+	e.varint(info.ModTime().UnixNano())
+	e.varint(info.Size())
+	e.uvarint(uint64(len(s.keys)))
+	for i, key := range s.keys {
+		e.string(key)
+		if err := e.value(s.values[i]); err != nil {
+			return err
+		}
+	}
+
+	f, err := afero.TempFile(fs, filepath.Dir(configPath), filepath.Base(snapshotPath(configPath)))
+	if err != nil {
+		return err
+	}
+	defer fs.Remove(f.Name())
+
+	_, err = f.Write(buf.Bytes())
+	if closeErr := f.Close(); err == nil {
+		err = closeErr
+	}
+	if err != nil {
+		return err
+	}
+	return fs.Rename(f.Name(), snapshotPath(configPath))
+}
+
+// snapshotEncoder encodes snapshot entries.
+type snapshotEncoder struct {
+	buf *bytes.Buffer
+	tmp [binary.MaxVarintLen64]byte
+}
+
+func (e *snapshotEncoder) uvarint(v uint64) {
+	e.buf.Write(e.tmp[:binary.PutUvarint(e.tmp[:], v)])
+}
+
+func (e *snapshotEncoder) varint(v int64) {
+	e.buf.Write(e.tmp[:binary.PutVarint(e.tmp[:], v)])
+}
+
+func (e *snapshotEncoder) string(s string) {
+	e.uvarint(uint64(len(s)))
+	e.buf.WriteString(s)
+}
+
+func (e *snapshotEncoder) value(val interface{}) error {
+	switch val := val.(type) {
+	case string:
+		e.buf.WriteByte(tagString)
+		e.string(val)
+	case int64:
+		e.buf.WriteByte(tagInt)
+		e.varint(val)
+	case float64:
+		e.buf.WriteByte(tagFloat)
+		e.uvarint(math.Float64bits(val))
+	case bool:
+		e.buf.WriteByte(tagBool)
+		if val {
+			e.buf.WriteByte(1)
+		} else {
+			e.buf.WriteByte(0)
+		}
+	case time.Time:
+		data, err := val.MarshalBinary()
+		if err != nil {
+			return err
+		}
+		e.buf.WriteByte(tagTime)
+		e.string(string(data))
+	case []interface{}:
+		e.buf.WriteByte(tagArray)
+		e.uvarint(uint64(len(val)))
+		for _, item := range val {
+			if err := e.value(item); err != nil {
+				return err
+			}
+		}
+	default:
+		return fmt.Errorf("unsupported snapshot value type %T", val)
+	}
+	return nil
+}
+
+// snapshotDecoder decodes snapshot entries, it stops at the first error.
+type snapshotDecoder struct {
+	data []byte
+	err  error
+}
+
+func (d *snapshotDecoder) fail() {
+	if d.err == nil {
+		d.err = errSnapshotCorrupted
+	}
+	d.data = nil
+}
+
+func (d *snapshotDecoder) uvarint() uint64 {
+	v, n := binary.Uvarint(d.data)
+	if n <= 0 {
+		d.fail()
+		return 0
+	}
+	d.data = d.data[n:]
+	return v
+}
+
+func (d *snapshotDecoder) varint() int64 {
+	v, n := binary.Varint(d.data)
+	if n <= 0 {
+		d.fail()
+		return 0
+	}
+	d.data = d.data[n:]
+	return v
+}
+
+// length decodes a length, which can't exceed the remaining data as each element takes at least a byte.
+func (d *snapshotDecoder) length() int {
+	n := d.uvarint()
+	if n > uint64(len(d.data)) {
+		d.fail()
+		return 0
+	}
+	return int(n)
+}
+
+func (d *snapshotDecoder) byte() byte {
+	if len(d.data) == 0 {
+		d.fail()
+		return 0
+	}
+	b := d.data[0]
+	d.data = d.data[1:]
+	return b
+}
+
+func (d *snapshotDecoder) string() string {
+	n := d.length()
+	s := string(d.data[:n])
+	d.data = d.data[n:]
+	return s
+}
+
+func (d *snapshotDecoder) value() interface{} {
+	switch d.byte() {
+	case tagString:
+		return d.string()
+	case tagInt:
+		return d.varint()
+	case tagFloat:
+		return math.Float64frombits(d.uvarint())
+	case tagBool:
+		return d.byte() == 1
+	case tagTime:
+		var t time.Time
+		if err := t.UnmarshalBinary([]byte(d.string())); err != nil {
+			d.fail()
+		}
+		return t
+	case tagArray:
+		n := d.length()
+		array := make([]interface{}, 0, n)
+		for i := 0; i < n && d.err == nil; i++ {
+			array = append(array, d.value())
+		}
+		return array
+	default:
+		d.fail()
+		return nil
+	}
+}
@@ -0,0 +1,130 @@
+package config
+
+import (
+	"testing"
+	"time"
+
+	"github.com/spf13/afero"
+	"github.com/stretchr/testify/require"
+)
+
+func TestSnapshot(t *testing.T) {
+	fs := afero.NewMemMapFs()
+
+	store := New(Opts{Fs: fs})
+	store.SetPath("/dcos.toml")
+	require.NoError(t, store.Set(keyURL, "https://dcos.example.com"))
+	require.NoError(t, store.Set(keyTimeout, 15))
+	require.NoError(t, store.Set(keyPagination, false))
+	require.NoError(t, store.Set("marathon.url", "https://marathon.example.com"))
+	require.NoError(t, store.Set("marathon.extra.key", "value"))
+	require.NoError(t, store.Persist())
+
+	exists, err := afero.Exists(fs, "/dcos.toml.snapshot")
+	require.NoError(t, err)
+	require.True(t, exists)
+
+	// Replace the TOML file with invalid contents of the same size and modification time,
+	// so that it can only be loaded from its snapshot.
+	// FileInfos of a MemMapFs reflect subsequent changes, the values are thus copied.
+	info, err := fs.Stat("/dcos.toml")
+	require.NoError(t, err)
+	modTime, size := info.ModTime(), info.Size()
+	require.NoError(t, afero.WriteFile(fs, "/dcos.toml", make([]byte, size), 0600))
+	require.NoError(t, fs.Chtimes("/dcos.toml", modTime, modTime))
+
+	loaded := New(Opts{Fs: fs})
+	require.NoError(t, loaded.LoadPath("/dcos.toml"))
+	require.Nil(t, loaded.tree)
+	require.Equal(t, "https://dcos.example.com", loaded.Get(keyURL))
+	require.Equal(t, int64(15), loaded.Get(keyTimeout))
+	require.Equal(t, false, loaded.Get(keyPagination))
+	require.Nil(t, loaded.Get("marathon"))
+	require.Equal(t, store.Keys(), loaded.Keys())
+	require.Equal(t, store.ToMap(), loaded.ToMap())
+	require.Equal(t, store.Section("marathon"), loaded.Section("marathon"))
+	require.Equal(t, map[string]interface{}{
+		"url":   "https://marathon.example.com",
+		"extra": map[string]interface{}{"key": "value"},
+	}, loaded.Section("marathon"))
+	require.Nil(t, loaded.Section("job"))
+
+	// Updates are done on a tree created from the snapshot.
+	require.NoError(t, loaded.Set(keyClusterName, "mr-cluster"))
+	loaded.Unset("marathon.extra.key")
+	require.Equal(t, "mr-cluster", loaded.Get(keyClusterName))
+	require.Equal(t, "https://dcos.example.com", loaded.Get(keyURL))
+	require.Nil(t, loaded.Get("marathon.extra.key"))
+}
+
+func TestSnapshotStale(t *testing.T) {
+	fs := afero.NewMemMapFs()
+
+	store := New(Opts{Fs: fs})
+	store.SetPath("/dcos.toml")
+	require.NoError(t, store.Set(keyURL, "https://dcos.example.com"))
+	require.NoError(t, store.Persist())
+
+	// Simulate a manual edit of the TOML file.
+	require.NoError(t, afero.WriteFile(fs, "/dcos.toml", []byte(`
+[core]
+  dcos_url = "https://dcos.example.org"
+`), 0600))
+	later := time.Now().Add(time.Minute)
+	require.NoError(t, fs.Chtimes("/dcos.toml", later, later))
+
+	loaded := New(Opts{Fs: fs})
+	require.NoError(t, loaded.LoadPath("/dcos.toml"))
+	require.NotNil(t, loaded.tree)
+	require.Equal(t, "https://dcos.example.org", loaded.Get(keyURL))
+
+	// The snapshot has been refreshed.
+	info, err := fs.Stat("/dcos.toml")
+	require.NoError(t, err)
+	snapshot, err := readSnapshot(fs, "/dcos.toml", info)
+	require.NoError(t, err)
+	require.Equal(t, "https://dcos.example.org", snapshot.get(keyURL))
+}
+
+func TestSnapshotUnsupported(t *testing.T) {
+	fs := afero.NewMemMapFs()
+
+	require.NoError(t, afero.WriteFile(fs, "/dcos.toml", []byte(`
+[core]
+  dcos_url = "https://dcos.example.com"
+
+[[plugins]]
+  name = "dcos-core-cli"
+`), 0600))
+	require.NoError(t, afero.WriteFile(fs, "/dcos.toml.snapshot", []byte("stale"), 0600))
+
+	store := New(Opts{Fs: fs})
+	require.NoError(t, store.LoadPath("/dcos.toml"))
+	require.Equal(t, "https://dcos.example.com", store.Get(keyURL))
+
+	exists, err := afero.Exists(fs, "/dcos.toml.snapshot")
+	require.NoError(t, err)
+	require.False(t, exists)
+}
+
+func TestSnapshotCorrupted(t *testing.T) {
+	fs := afero.NewMemMapFs()
+
+	store := New(Opts{Fs: fs})
+	store.SetPath("/dcos.toml")
+	require.NoError(t, store.Set(keyURL, "https://dcos.example.com"))
+	require.NoError(t, store.Persist())
+
+	data, err := afero.ReadFile(fs, "/dcos.toml.snapshot")
+	require.NoError(t, err)
+	require.NoError(t, afero.WriteFile(fs, "/dcos.toml.snapshot", data[:len(data)-4], 0600))
+
+	info, err := fs.Stat("/dcos.toml")
+	require.NoError(t, err)
+	_, err = readSnapshot(fs, "/dcos.toml", info)
+	require.Equal(t, errSnapshotCorrupted, err)
+
+	loaded := New(Opts{Fs: fs})
+	require.NoError(t, loaded.LoadPath("/dcos.toml"))
+	require.Equal(t, "https://dcos.example.com", loaded.Get(keyURL))
+}
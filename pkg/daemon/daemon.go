@@ -0,0 +1,159 @@
+// Package daemon implements an optional resident DC/OS CLI process.
+//
+// The daemon serves CLI invocations over a Unix socket in the DC/OS directory. The front-end process
+// sends its arguments, environment and working directory along with its standard streams, as file
+// descriptors. The daemon runs the invocation on these streams and replies with its exit code.
+//
+// This saves the process startup and keeps process-level caches warm across invocations, most notably
+// keep-alive connections and TLS sessions to the clusters.
+package daemon
+
+import (
+	"errors"
+	"fmt"
+	"io/ioutil"
+	"os"
+	"path/filepath"
+	"sort"
+	"strings"
+	"time"
+
+	"github.com/sirupsen/logrus"
+)
+
+// EnvServe is set to 1 in the environment of daemon processes started through Start.
+const EnvServe = "DCOS_CLI_DAEMON_SERVE"
+
+// DefaultIdleTimeout is the default duration after which a daemon without requests exits.
+const DefaultIdleTimeout = 10 * time.Minute
+
+// Files of the daemon in the DC/OS directory.
+const (
+	socketFile = "daemon.sock"
+	lockFile   = "daemon.lock"
+)
+
+// maxSocketPath is the maximum length of a Unix socket path, the lowest limit is on macOS.
+const maxSocketPath = 103
+
+// maxRequestSize is the maximum size of an encoded request.
+const maxRequestSize = 1 << 20
+
+// Statuses sent by the daemon once it has received a request.
+const (
+	statusAccepted byte = 'A'
+	statusRejected byte = 'R'
+)
+
+// Errors related to the daemon.
+var (
+	// ErrUnsupported indicates that the daemon is not supported on this platform or for this DC/OS directory.
+	ErrUnsupported = errors.New("the daemon is not supported")
+
+	// ErrNotRunning indicates that there is no daemon listening for the DC/OS directory.
+	ErrNotRunning = errors.New("the daemon is not running")
+
+	// ErrRejected indicates that the daemon didn't run the invocation, eg. because it is busy.
+	// The invocation can then be run by the front-end process.
+	ErrRejected = errors.New("the daemon rejected the invocation")
+
+	// ErrConnectionLost indicates that the connection to the daemon has been lost while it was running
+	// the invocation. The invocation shouldn't be run again as it might have had side effects.
+	ErrConnectionLost = errors.New("lost connection to the daemon")
+)
+
+// Request is a CLI invocation sent to the daemon.
+type Request struct {
+	// Version is the version of the front-end CLI, the daemon rejects requests from other versions.
+	Version string `json:"version"`
+
+	// Args are the command-line arguments, starting with the program name.
+	Args []string `json:"args"`
+
+	// Env is the environment of the front-end process, as returned by os.Environ.
+	Env []string `json:"env"`
+
+	// Dir is the working directory of the front-end process.
+	Dir string `json:"dir"`
+}
+
+// ServeOpts are options for a daemon.
+type ServeOpts struct {
+	// Dir is the DC/OS directory the daemon serves.
+	Dir string
+
+	// Version is the version of the CLI.
+	Version string
+
+	// IdleTimeout is the duration after which the daemon exits when it doesn't get any request.
+	// It defaults to DefaultIdleTimeout.
+	IdleTimeout time.Duration
+
+	// Logger is the logger of the daemon.
+	Logger *logrus.Logger
+
+	// Run runs a CLI invocation and returns its exit code. The environment, the working directory
+	// and the standard streams of the process are those of the front-end process while it runs.
+	Run func(args []string, stdin, stdout, stderr *os.File) int
+}
+
+// SocketPath returns the path to the daemon socket of a DC/OS directory.
+func SocketPath(dcosDir string) string {
+	return filepath.Join(dcosDir, socketFile)
+}
+
+// sharedEnvKeys are the environment variables which must be the same for the front-end and the daemon.
+// They are read once per process, either by the standard library (proxies) or by go-homedir (HOME).
+var sharedEnvKeys = []string{
+	"HOME",
+	"HTTP_PROXY", "http_proxy",
+	"HTTPS_PROXY", "https_proxy",
+	"NO_PROXY", "no_proxy",
+	"REQUEST_METHOD",
+}
+
+// incompatibleEnv returns the first shared environment variable with a different value in a request, if any.
+func incompatibleEnv(daemonEnv, requestEnv []string) string {
+	lookup := func(env []string, key string) (string, bool) {
+		for _, kv := range env {
+			if strings.HasPrefix(kv, key+"=") {
+				return kv[len(key)+1:], true
+			}
+		}
+		return "", false
+	}
+	for _, key := range sharedEnvKeys {
+		daemonVal, daemonOk := lookup(daemonEnv, key)
+		requestVal, requestOk := lookup(requestEnv, key)
+		if daemonVal != requestVal || daemonOk != requestOk {
+			return key
+		}
+	}
+	return ""
+}
+
+// fingerprint summarizes the state of a DC/OS directory. It is based on the modification time and size of
+// the cluster registry and, for each cluster, of its config, `attached` file and plugins directory.
+//
+// Cluster directories themselves are left out, as CLI runs update files within them.
+func fingerprint(dir string) string {
+	var b strings.Builder
+	add := func(path string) {
+		if info, err := os.Stat(path); err == nil {
+			fmt.Fprintf(&b, "%s %d %d\n", path, info.ModTime().UnixNano(), info.Size())
+		}
+	}
+	add(filepath.Join(dir, "clusters.index"))
+
+	clustersDir := filepath.Join(dir, "clusters")
+	add(clustersDir)
+	clusters, _ := ioutil.ReadDir(clustersDir)
+	sort.Slice(clusters, func(i, j int) bool { return clusters[i].Name() < clusters[j].Name() })
+	for _, cluster := range clusters {
+		clusterDir := filepath.Join(clustersDir, cluster.Name())
+		add(filepath.Join(clusterDir, "dcos.toml"))
+		add(filepath.Join(clusterDir, "attached"))
+		add(filepath.Join(clusterDir, "subcommands"))
+	}
+	return b.String()
+}
@@ -0,0 +1,21 @@
+//go:build !linux && !darwin
+// +build !linux,!darwin
+
+package daemon
+
+import "os"
+
+// Forward runs an invocation through the daemon of a DC/OS directory, it isn't supported on this platform.
+func Forward(dcosDir string, req *Request, stdin, stdout, stderr *os.File) (int, error) {
+	return 0, ErrUnsupported
+}
+
+// Start starts a daemon for a DC/OS directory, it isn't supported on this platform.
+func Start(executable string, dcosDir string) error {
+	return ErrUnsupported
+}
+
+// Serve runs a daemon for a DC/OS directory, it isn't supported on this platform.
+func Serve(opts ServeOpts) error {
+	return ErrUnsupported
+}
@@ -0,0 +1,199 @@
+//go:build linux || darwin
+// +build linux darwin
+
+package daemon
+
+import (
+	"fmt"
+	"io/ioutil"
+	"os"
+	"path/filepath"
+	"strings"
+	"testing"
+	"time"
+
+	"github.com/stretchr/testify/require"
+)
+
+// restoreProcessState restores the environment and working directory of the test process,
+// which are changed by the daemon while it runs an invocation.
+func restoreProcessState(t *testing.T) func() {
+	env := os.Environ()
+	dir, err := os.Getwd()
+	require.NoError(t, err)
+	return func() {
+		os.Clearenv()
+		for _, kv := range env {
+			if i := strings.IndexByte(kv, '='); i > 0 {
+				os.Setenv(kv[:i], kv[i+1:])
+			}
+		}
+		os.Chdir(dir)
+	}
+}
+
+func TestForward(t *testing.T) {
+	defer restoreProcessState(t)()
+
+	dir, err := ioutil.TempDir("", "dcos-daemon")
+	require.NoError(t, err)
+	defer os.RemoveAll(dir)
+
+	started := make(chan struct{})
+	release := make(chan struct{})
+	served := make(chan error, 1)
+	go func() {
+		served <- Serve(ServeOpts{
+			Dir:         dir,
+			Version:     "1.0.0",
+			IdleTimeout: 500 * time.Millisecond,
+			Run: func(args []string, stdin, stdout, stderr *os.File) int {
+				if args[1] == "block" {
+					close(started)
+					<-release
+				}
+				workDir, _ := os.Getwd()
+				input, _ := ioutil.ReadAll(stdin)
+				fmt.Fprintf(stdout, "%s %s %s %s", strings.Join(args, " "), os.Getenv("DCOS_TEST"), workDir, input)
+				fmt.Fprint(stderr, "done")
+				return 3
+			},
+		})
+	}()
+
+	require.Eventually(t, func() bool {
+		_, err := os.Stat(SocketPath(dir))
+		return err == nil
+	}, 5*time.Second, 10*time.Millisecond)
+
+	stdin, err := ioutil.TempFile(dir, "stdin")
+	require.NoError(t, err)
+	defer stdin.Close()
+	_, err = stdin.WriteString("input")
+	require.NoError(t, err)
+	_, err = stdin.Seek(0, 0)
+	require.NoError(t, err)
+
+	stdout, err := ioutil.TempFile(dir, "stdout")
+	require.NoError(t, err)
+	defer stdout.Close()
+	stderr, err := ioutil.TempFile(dir, "stderr")
+	require.NoError(t, err)
+	defer stderr.Close()
+
+	env := append(os.Environ(), "DCOS_TEST=value")
+	code, err := Forward(dir, &Request{
+		Version: "1.0.0",
+		Args:    []string{"dcos", "cluster", "list"},
+		Env:     env,
+		Dir:     os.TempDir(),
+	}, stdin, stdout, stderr)
+	require.NoError(t, err)
+	require.Equal(t, 3, code)
+
+	out, err := ioutil.ReadFile(stdout.Name())
+	require.NoError(t, err)
+	workDir, err := filepath.EvalSymlinks(os.TempDir())
+	require.NoError(t, err)
+	require.Contains(t, []string{
+		"dcos cluster list value " + os.TempDir() + " input",
+		"dcos cluster list value " + workDir + " input",
+	}, string(out))
+	errOut, err := ioutil.ReadFile(stderr.Name())
+	require.NoError(t, err)
+	require.Equal(t, "done", string(errOut))
+
+	// Invocations are rejected while another one is running.
+	blocked := make(chan error, 1)
+	go func() {
+		_, err := Forward(dir, &Request{Version: "1.0.0", Args: []string{"dcos", "block"}, Env: env, Dir: dir}, stdin, stdout, stderr)
+		blocked <- err
+	}()
+	<-started
+	_, err = Forward(dir, &Request{Version: "1.0.0", Args: []string{"dcos"}, Env: env, Dir: dir}, stdin, stdout, stderr)
+	require.Equal(t, ErrRejected, err)
+	close(release)
+	require.NoError(t, <-blocked)
+
+	// Invocations with a different environment for shared variables are rejected.
+	_, err = Forward(dir, &Request{
+		Version: "1.0.0",
+		Args:    []string{"dcos"},
+		Env:     append(env, "HTTPS_PROXY=http://proxy.example.com"),
+		Dir:     dir,
+	}, stdin, stdout, stderr)
+	require.Equal(t, ErrRejected, err)
+
+	// The daemon exits when it is idle.
+	select {
+	case err := <-served:
+		require.NoError(t, err)
+	case <-time.After(5 * time.Second):
+		t.Fatal("the daemon didn't exit when idle")
+	}
+	_, err = Forward(dir, &Request{Version: "1.0.0", Args: []string{"dcos"}, Env: env, Dir: dir}, stdin, stdout, stderr)
+	require.Equal(t, ErrNotRunning, err)
+}
+
+func TestServeVersionMismatch(t *testing.T) {
+	defer restoreProcessState(t)()
+
+	dir, err := ioutil.TempDir("", "dcos-daemon")
+	require.NoError(t, err)
+	defer os.RemoveAll(dir)
+
+	served := make(chan error, 1)
+	go func() {
+		served <- Serve(ServeOpts{
+			Dir:     dir,
+			Version: "1.0.0",
+			Run: func(args []string, stdin, stdout, stderr *os.File) int {
+				return 0
+			},
+		})
+	}()
+	require.Eventually(t, func() bool {
+		_, err := os.Stat(SocketPath(dir))
+		return err == nil
+	}, 5*time.Second, 10*time.Millisecond)
+
+	// A second daemon for the same directory returns immediately.
+	require.NoError(t, Serve(ServeOpts{Dir: dir, Version: "1.0.0"}))
+
+	_, err = Forward(dir, &Request{Version: "2.0.0", Args: []string{"dcos"}, Env: os.Environ(), Dir: dir}, os.Stdin, os.Stdout, os.Stderr)
+	require.Equal(t, ErrRejected, err)
+
+	// The daemon exits, so that the front-end can start one with its own version.
+	select {
+	case err := <-served:
+		require.NoError(t, err)
+	case <-time.After(5 * time.Second):
+		t.Fatal("the daemon didn't exit after a version mismatch")
+	}
+}
+
+func TestIncompatibleEnv(t *testing.T) {
+	daemonEnv := []string{"HOME=/home/user", "HTTPS_PROXY=http://proxy", "PATH=/bin"}
+	require.Equal(t, "", incompatibleEnv(daemonEnv, []string{"HOME=/home/user", "HTTPS_PROXY=http://proxy", "PATH=/usr/bin"}))
+	require.Equal(t, "HTTPS_PROXY", incompatibleEnv(daemonEnv, []string{"HOME=/home/user", "PATH=/bin"}))
+	require.Equal(t, "HOME", incompatibleEnv(daemonEnv, []string{"HOME=/root", "HTTPS_PROXY=http://proxy"}))
+	require.Equal(t, "NO_PROXY", incompatibleEnv(daemonEnv, append(daemonEnv, "NO_PROXY=")))
+}
+
+func TestFingerprint(t *testing.T) {
+	dir, err := ioutil.TempDir("", "dcos-daemon")
+	require.NoError(t, err)
+	defer os.RemoveAll(dir)
+
+	clusterDir := filepath.Join(dir, "clusters", "79893ba2-a3d2-4a4c-8c8e-05c6ea0c7f5c")
+	require.NoError(t, os.MkdirAll(clusterDir, 0700))
+	configPath := filepath.Join(clusterDir, "dcos.toml")
+	require.NoError(t, ioutil.WriteFile(configPath, []byte("[core]\n"), 0600))
+
+	initial := fingerprint(dir)
+	require.Equal(t, initial, fingerprint(dir))
+
+	later := time.Now().Add(time.Minute)
+	require.NoError(t, os.Chtimes(configPath, later, later))
+	require.NotEqual(t, initial, fingerprint(dir))
+}
@@ -0,0 +1,428 @@
+//go:build linux || darwin
+// +build linux darwin
+
+package daemon
+
+import (
+	"encoding/binary"
+	"encoding/json"
+	"errors"
+	"fmt"
+	"io"
+	"io/ioutil"
+	"net"
+	"os"
+	"os/exec"
+	"os/signal"
+	"path/filepath"
+	"strings"
+	"sync"
+	"syscall"
+	"time"
+
+	"github.com/dcos/dcos-cli/pkg/httpclient"
+	"github.com/sirupsen/logrus"
+)
+
+// forwardedSignals are the signals relayed by the front-end to the daemon while an invocation runs.
+var forwardedSignals = []os.Signal{syscall.SIGINT, syscall.SIGTERM, syscall.SIGHUP}
+
+// Forward runs an invocation through the daemon of a DC/OS directory, on the given standard streams.
+// It returns the exit code of the invocation.
+//
+// ErrNotRunning and ErrRejected indicate that the invocation hasn't been run and can be run locally.
+// The first signal received by the front-end is relayed to the invocation, a second one makes
+// Forward return without waiting for the invocation, with the exit code of the signal.
+func Forward(dcosDir string, req *Request, stdin, stdout, stderr *os.File) (int, error) {
+	path := SocketPath(dcosDir)
+	if len(path) > maxSocketPath {
+		return 0, ErrUnsupported
+	}
+	conn, err := net.DialUnix("unix", nil, &net.UnixAddr{Name: path, Net: "unix"})
+	if err != nil {
+		return 0, ErrNotRunning
+	}
+	defer conn.Close()
+
+	data, err := json.Marshal(req)
+	if err != nil {
+		return 0, err
+	}
+	msg := make([]byte, 4+len(data))
+	binary.BigEndian.PutUint32(msg, uint32(len(data)))
+	copy(msg[4:], data)
+
+	// The standard streams are sent along with the first bytes of the request.
+	rights := syscall.UnixRights(int(stdin.Fd()), int(stdout.Fd()), int(stderr.Fd()))
+	n, _, err := conn.WriteMsgUnix(msg, rights, nil)
+	if err == nil && n < len(msg) {
+		_, err = conn.Write(msg[n:])
+	}
+	if err != nil {
+		return 0, ErrRejected
+	}
+
+	status := make([]byte, 1)
+	if _, err := io.ReadFull(conn, status); err != nil || status[0] != statusAccepted {
+		return 0, ErrRejected
+	}
+
+	signals := make(chan os.Signal, 1)
+	signal.Notify(signals, forwardedSignals...)
+	defer signal.Stop(signals)
+
+	result := make(chan error, 1)
+	var code int32
+	go func() {
+		result <- binary.Read(conn, binary.BigEndian, &code)
+	}()
+
+	interrupted := false
+	for {
+		select {
+		case err := <-result:
+			if err != nil {
+				return 0, ErrConnectionLost
+			}
+			return int(code), nil
+		case sig := <-signals:
+			sigNum := sig.(syscall.Signal)
+			if interrupted {
+				return 128 + int(sigNum), nil
+			}
+			interrupted = true
+			conn.Write([]byte{byte(sigNum)})
+		}
+	}
+}
+
+// Start starts a daemon for a DC/OS directory, as a detached process running the given executable.
+// The process is started with EnvServe set to 1 and should then call Serve.
+func Start(executable string, dcosDir string) error {
+	if len(SocketPath(dcosDir)) > maxSocketPath {
+		return ErrUnsupported
+	}
+	cmd := exec.Command(executable) // nolint: gosec
+	cmd.Env = append(os.Environ(), EnvServe+"=1", "DCOS_DIR="+dcosDir)
+	cmd.Dir = dcosDir
+	cmd.SysProcAttr = &syscall.SysProcAttr{Setsid: true}
+	if err := cmd.Start(); err != nil {
+		return err
+	}
+	return cmd.Process.Release()
+}
+
+// server is a daemon serving CLI invocations.
+type server struct {
+	opts     ServeOpts
+	logger   *logrus.Logger
+	listener *net.UnixListener
+
+	// env is the environment of the daemon when it started.
+	env []string
+
+	// executable is the path to the daemon executable and exeModTime its modification time,
+	// the daemon exits when the executable gets replaced.
+	executable string
+	exeModTime time.Time
+
+	// busy holds a token while an invocation is running, invocations are run one at a time.
+	busy chan struct{}
+
+	// fingerprint is the fingerprint of the DC/OS directory when the last invocation started.
+	fingerprint string
+
+	mu      sync.Mutex
+	closing bool
+
+	// pending counts the relayed signals which the daemon is about to receive itself.
+	pending map[os.Signal]int
+}
+
+// Serve runs a daemon for a DC/OS directory. It returns when the daemon has been idle for the
+// configured duration, when the daemon receives a termination signal, or when a request from
+// a different CLI version is received. It returns immediately if a daemon is already running.
+func Serve(opts ServeOpts) error {
+	if opts.IdleTimeout <= 0 {
+		opts.IdleTimeout = DefaultIdleTimeout
+	}
+	if opts.Logger == nil {
+		opts.Logger = &logrus.Logger{Out: ioutil.Discard, Formatter: new(logrus.TextFormatter), Level: logrus.WarnLevel}
+	}
+	path := SocketPath(opts.Dir)
+	if len(path) > maxSocketPath {
+		return ErrUnsupported
+	}
+
+	// The lock is held for the lifetime of the daemon, it prevents concurrently started daemons
+	// from replacing each other's socket.
+	lock, err := os.OpenFile(filepath.Join(opts.Dir, lockFile), os.O_RDWR|os.O_CREATE, 0600)
+	if err != nil {
+		return err
+	}
+	defer lock.Close()
+	if err := syscall.Flock(int(lock.Fd()), syscall.LOCK_EX|syscall.LOCK_NB); err != nil {
+		opts.Logger.Debugf("Another daemon is running for %s.", opts.Dir)
+		return nil
+	}
+
+	// A socket left behind by a daemon which didn't exit cleanly is removed.
+	os.Remove(path)
+	listener, err := net.ListenUnix("unix", &net.UnixAddr{Name: path, Net: "unix"})
+	if err != nil {
+		return err
+	}
+	defer listener.Close()
+	if err := os.Chmod(path, 0600); err != nil {
+		return err
+	}
+
+	s := &server{
+		opts:        opts,
+		logger:      opts.Logger,
+		listener:    listener,
+		env:         os.Environ(),
+		busy:        make(chan struct{}, 1),
+		fingerprint: fingerprint(opts.Dir),
+		pending:     make(map[os.Signal]int),
+	}
+	if s.executable, err = os.Executable(); err == nil {
+		if info, err := os.Stat(s.executable); err == nil {
+			s.exeModTime = info.ModTime()
+		}
+	}
+
+	signals := make(chan os.Signal, 1)
+	signal.Notify(signals, forwardedSignals...)
+	defer signal.Stop(signals)
+	go s.handleSignals(signals)
+
+	s.logger.Infof("Serving CLI invocations on %s.", path)
+	for {
+		listener.SetDeadline(time.Now().Add(opts.IdleTimeout))
+		conn, err := listener.AcceptUnix()
+		if err == nil {
+			go s.handle(conn)
+			continue
+		}
+		if netErr, ok := err.(net.Error); ok && netErr.Timeout() && len(s.busy) > 0 {
+			continue
+		}
+		if s.isClosing() {
+			err = nil
+		} else if netErr, ok := err.(net.Error); ok && netErr.Timeout() {
+			s.logger.Infof("Exiting after %s without invocations.", opts.IdleTimeout)
+			err = nil
+		}
+		// Wait for the current invocation, if any.
+		s.busy <- struct{}{}
+		return err
+	}
+}
+
+// handle serves a connection from a front-end process.
+func (s *server) handle(conn *net.UnixConn) {
+	defer conn.Close()
+
+	req, files, err := readRequest(conn)
+	if err != nil {
+		s.logger.Warnf("Couldn't read request: %s", err)
+		return
+	}
+	defer func() {
+		for _, f := range files {
+			f.Close()
+		}
+	}()
+
+	if reason := s.reject(req); reason != "" {
+		s.logger.Infof("Rejecting invocation: %s.", reason)
+		conn.Write([]byte{statusRejected})
+		return
+	}
+	select {
+	case s.busy <- struct{}{}:
+		defer func() { <-s.busy }()
+	default:
+		conn.Write([]byte{statusRejected})
+		return
+	}
+	if _, err := conn.Write([]byte{statusAccepted}); err != nil {
+		return
+	}
+
+	if newFingerprint := fingerprint(s.opts.Dir); newFingerprint != s.fingerprint {
+		s.logger.Infof("%s has changed, closing idle connections.", s.opts.Dir)
+		httpclient.CloseIdleConnections()
+		s.fingerprint = newFingerprint
+	}
+
+	done := make(chan struct{})
+	go s.watch(conn, done)
+
+	code := s.run(req, files)
+	close(done)
+	binary.Write(conn, binary.BigEndian, int32(code))
+}
+
+// reject returns the reason why a request can't be served by the daemon, if any.
+func (s *server) reject(req *Request) string {
+	if req.Version != s.opts.Version {
+		s.close()
+		return fmt.Sprintf("the front-end version %s doesn't match the daemon version %s", req.Version, s.opts.Version)
+	}
+	if !s.exeModTime.IsZero() {
+		if info, err := os.Stat(s.executable); err != nil || !info.ModTime().Equal(s.exeModTime) {
+			s.close()
+			return "the executable has been replaced"
+		}
+	}
+	if key := incompatibleEnv(s.env, req.Env); key != "" {
+		return fmt.Sprintf("%s doesn't match the environment of the daemon", key)
+	}
+	return ""
+}
+
+// run runs an invocation with the environment, working directory and standard streams of the front-end process.
+//
+// The standard streams of the daemon are also replaced, for code writing to os.Stderr directly (eg. cobra errors).
+func (s *server) run(req *Request, files []*os.File) int {
+	stdin, stdout, stderr := os.Stdin, os.Stdout, os.Stderr
+	os.Stdin, os.Stdout, os.Stderr = files[0], files[1], files[2]
+	defer func() {
+		os.Stdin, os.Stdout, os.Stderr = stdin, stdout, stderr
+	}()
+
+	os.Clearenv()
+	for _, kv := range req.Env {
+		if i := strings.IndexByte(kv, '='); i > 0 {
+			os.Setenv(kv[:i], kv[i+1:])
+		}
+	}
+	if err := os.Chdir(req.Dir); err != nil {
+		fmt.Fprintf(files[2], "Error: %s\n", err)
+		return 1
+	}
+	return s.opts.Run(req.Args, files[0], files[1], files[2])
+}
+
+// watch relays the signals sent by the front-end process until the invocation is done.
+//
+// When the front-end process goes away before the invocation is done, its output can't be
+// delivered anymore. The daemon then kills its process group, which includes plugin processes.
+func (s *server) watch(conn *net.UnixConn, done <-chan struct{}) {
+	buf := make([]byte, 1)
+	for {
+		_, err := conn.Read(buf)
+		select {
+		case <-done:
+			return
+		default:
+		}
+		if err != nil {
+			s.logger.Warn("The front-end process went away, exiting.")
+			s.listener.Close()
+			if syscall.Getpgrp() == os.Getpid() {
+				syscall.Kill(0, syscall.SIGKILL)
+			}
+			os.Exit(1)
+		}
+		s.relay(syscall.Signal(buf[0]))
+	}
+}
+
+// relay sends a signal to the process group of the daemon, which includes plugin processes.
+// The daemon is only the leader of its process group when it has been started through Start.
+func (s *server) relay(sig syscall.Signal) {
+	if syscall.Getpgrp() != os.Getpid() {
+		return
+	}
+	s.mu.Lock()
+	s.pending[sig]++
+	s.mu.Unlock()
+	syscall.Kill(0, sig)
+}
+
+// handleSignals closes the daemon when it gets a termination signal which hasn't been relayed by itself.
+func (s *server) handleSignals(signals <-chan os.Signal) {
+	for sig := range signals {
+		s.mu.Lock()
+		relayed := s.pending[sig] > 0
+		if relayed {
+			s.pending[sig]--
+		}
+		s.mu.Unlock()
+
+		if !relayed {
+			s.logger.Infof("Received %s, exiting.", sig)
+			s.close()
+		}
+	}
+}
+
+// close stops accepting invocations, Serve returns once the current invocation is done.
+func (s *server) close() {
+	s.mu.Lock()
+	s.closing = true
+	s.mu.Unlock()
+	s.listener.Close()
+}
+
+// isClosing indicates whether the daemon has been closed.
+func (s *server) isClosing() bool {
+	s.mu.Lock()
+	defer s.mu.Unlock()
+	return s.closing
+}
+
+// readRequest reads a request and the standard streams of the front-end process from a connection.
+func readRequest(conn *net.UnixConn) (*Request, []*os.File, error) {
+	header := make([]byte, 4)
+	oob := make([]byte, syscall.CmsgSpace(3*4))
+	n, oobn, _, _, err := conn.ReadMsgUnix(header, oob)
+	if err != nil {
+		return nil, nil, err
+	}
+
+	var files []*os.File
+	msgs, err := syscall.ParseSocketControlMessage(oob[:oobn])
+	if err != nil {
+		return nil, nil, err
+	}
+	for _, msg := range msgs {
+		fds, err := syscall.ParseUnixRights(&msg)
+		if err != nil {
+			continue
+		}
+		for _, fd := range fds {
+			syscall.CloseOnExec(fd)
+			files = append(files, os.NewFile(uintptr(fd), fmt.Sprintf("fd%d", len(files))))
+		}
+	}
+	fail := func(err error) (*Request, []*os.File, error) {
+		for _, f := range files {
+			f.Close()
+		}
+		return nil, nil, err
+	}
+	if len(files) != 3 {
+		return fail(errors.New("expected the standard streams along with the request"))
+	}
+
+	if _, err := io.ReadFull(conn, header[n:]); err != nil {
+		return fail(err)
+	}
+	size := binary.BigEndian.Uint32(header)
+	if size > maxRequestSize {
+		return fail(fmt.Errorf("request too large (%d bytes)", size))
+	}
+	data := make([]byte, size)
+	if _, err := io.ReadFull(conn, data); err != nil {
+		return fail(err)
+	}
+	var req Request
+	if err := json.Unmarshal(data, &req); err != nil {
+		return fail(err)
+	}
+	return &req, files, nil
+}
@@ -2,6 +2,7 @@ package fsutil
 
 import (
 	"archive/zip"
+	"bytes"
 	"fmt"
 	"io"
 	"io/ioutil"
@@ -9,7 +10,9 @@ import (
 	"os"
 	"path/filepath"
 	"runtime"
+	"sort"
 	"strings"
+	"sync"
 
 	"github.com/spf13/afero"
 )
@@ -112,7 +115,13 @@ func DetectMediaType(fs afero.Fs, path string) (string, error) {
 	return http.DetectContentType(sniffBuf), nil
 }
 
+// unzipWorkers is the maximum number of archive entries extracted concurrently.
+var unzipWorkers = runtime.NumCPU()
+
 // Unzip extracts a ZIP archive into a given destination.
+//
+// Directories are created upfront, then files are extracted concurrently. Extraction stops
+// at the first entry which can't be extracted, in which case its error is returned.
 func Unzip(fs afero.Fs, src, dest string) error {
 	f, err := fs.Open(src)
 	if err != nil {
@@ -120,42 +129,107 @@ func Unzip(fs afero.Fs, src, dest string) error {
 	}
 	defer f.Close()
 
-	fi, err := f.Stat()
+	r, err := zipReader(f)
 	if err != nil {
 		return err
 	}
 
-	r, err := zip.NewReader(f, fi.Size())
-	if err != nil {
-		return err
+	// Sanitize all paths and gather the directories to create, parents being sorted before their children.
+	paths := make([]string, len(r.File))
+	dirModes := make(map[string]os.FileMode)
+	for i, zf := range r.File {
+		fpath, err := sanitizeExtractPath(dest, zf.Name)
+		if err != nil {
+			return err
+		}
+		paths[i] = fpath
+
+		if zf.FileInfo().IsDir() {
+			dirModes[fpath] = zf.FileInfo().Mode()
+		} else if _, ok := dirModes[filepath.Dir(fpath)]; !ok {
+			dirModes[filepath.Dir(fpath)] = 0755
+		}
+	}
+	dirs := make([]string, 0, len(dirModes))
+	for dir := range dirModes {
+		dirs = append(dirs, dir)
+	}
+	sort.Strings(dirs)
+	for _, dir := range dirs {
+		if err := fs.MkdirAll(dir, dirModes[dir]); err != nil {
+			return err
+		}
 	}
 
-	for _, f := range r.File {
-		unzipFile(fs, f, dest)
+	entries := make(chan int)
+	var wg sync.WaitGroup
+	var errOnce sync.Once
+	var unzipErr error
+	failed := make(chan struct{})
+
+	workers := unzipWorkers
+	if workers > len(r.File) {
+		workers = len(r.File)
+	}
+	for w := 0; w < workers; w++ {
+		wg.Add(1)
+		go func() {
+			defer wg.Done()
+			for i := range entries {
+				if err := unzipFile(fs, r.File[i], paths[i]); err != nil {
+					errOnce.Do(func() {
+						unzipErr = fmt.Errorf("couldn't extract %s: %s", r.File[i].Name, err)
+						close(failed)
+					})
+				}
+			}
+		}()
 	}
-	return nil
-}
 
-// unzipFile extracts a zip.File to a given destination.
-func unzipFile(fs afero.Fs, f *zip.File, dest string) error {
-	rc, err := f.Open()
-	if err != nil {
-		return err
+feed:
+	for i, zf := range r.File {
+		if zf.FileInfo().IsDir() {
+			continue
+		}
+		select {
+		case entries <- i:
+		case <-failed:
+			break feed
+		}
 	}
-	defer rc.Close()
+	close(entries)
+	wg.Wait()
+	return unzipErr
+}
 
-	fpath, err := sanitizeExtractPath(dest, f.Name)
-	if err != nil {
-		return err
+// zipReader returns a ZIP reader for an archive file.
+//
+// Entries are read concurrently, this requires a ReaderAt which is safe for concurrent use.
+// This is the case for OS files, other files are read into memory.
+func zipReader(f afero.File) (*zip.Reader, error) {
+	if osFile, ok := f.(*os.File); ok {
+		fi, err := osFile.Stat()
+		if err != nil {
+			return nil, err
+		}
+		return zip.NewReader(osFile, fi.Size())
 	}
 
-	if f.FileInfo().IsDir() {
-		return fs.MkdirAll(fpath, f.FileInfo().Mode())
+	data, err := ioutil.ReadAll(f)
+	if err != nil {
+		return nil, err
 	}
+	return zip.NewReader(bytes.NewReader(data), int64(len(data)))
+}
 
-	if err := fs.MkdirAll(filepath.Dir(fpath), 0755); err != nil {
+// unzipFile extracts a zip.File to a given path.
+func unzipFile(fs afero.Fs, f *zip.File, fpath string) error {
+	rc, err := f.Open()
+	if err != nil {
 		return err
 	}
+	defer rc.Close()
+
 	return CopyReader(fs, rc, fpath, f.Mode())
 }
 
@@ -0,0 +1,89 @@
+package fsutil
+
+import (
+	"archive/zip"
+	"bytes"
+	"fmt"
+	"strings"
+	"testing"
+
+	"github.com/spf13/afero"
+	"github.com/stretchr/testify/require"
+)
+
+func TestUnzip(t *testing.T) {
+	fs := afero.NewMemMapFs()
+
+	files := map[string]string{"plugin.toml": "name = \"test\"\n"}
+	for i := 0; i < 20; i++ {
+		files[fmt.Sprintf("bin/dcos-test-%d", i)] = fmt.Sprintf("binary %d", i)
+	}
+	require.NoError(t, afero.WriteFile(fs, "plugin.zip", zipArchive(t, files), 0644))
+
+	require.NoError(t, Unzip(fs, "plugin.zip", "/env"))
+	for name, content := range files {
+		data, err := afero.ReadFile(fs, "/env/"+name)
+		require.NoError(t, err)
+		require.Equal(t, content, string(data))
+	}
+}
+
+func TestUnzipCorruptArchive(t *testing.T) {
+	fs := afero.NewMemMapFs()
+
+	archive := zipArchive(t, map[string]string{"bin/dcos-test": "binary"})
+
+	// Alter the content of the single entry, its checksum won't match anymore.
+	archive = bytes.Replace(archive, []byte("binary"), []byte("BINARY"), 1)
+	require.NoError(t, afero.WriteFile(fs, "plugin.zip", archive, 0644))
+
+	err := Unzip(fs, "plugin.zip", "/env")
+	require.EqualError(t, err, "couldn't extract bin/dcos-test: zip: checksum error")
+}
+
+func TestUnzipIllegalPath(t *testing.T) {
+	fs := afero.NewMemMapFs()
+
+	archive := zipArchive(t, map[string]string{"../dcos-test": "binary"})
+	require.NoError(t, afero.WriteFile(fs, "plugin.zip", archive, 0644))
+
+	require.EqualError(t, Unzip(fs, "plugin.zip", "/env"), "../dcos-test: illegal file path")
+}
+
+// zipArchive creates an uncompressed ZIP archive from a map of file names to contents.
+func zipArchive(t testing.TB, files map[string]string) []byte {
+	var buf bytes.Buffer
+	w := zip.NewWriter(&buf)
+	for name, content := range files {
+		f, err := w.CreateHeader(&zip.FileHeader{Name: name, Method: zip.Store})
+		require.NoError(t, err)
+		_, err = f.Write([]byte(content))
+		require.NoError(t, err)
+	}
+	require.NoError(t, w.Close())
+	return buf.Bytes()
+}
+
+func BenchmarkUnzip(b *testing.B) {
+	// 16 files of 4MiB, which is in the range of the core and enterprise plugin binaries.
+	files := make(map[string]string)
+	content := strings.Repeat("dcos", 1<<20)
+	for i := 0; i < 16; i++ {
+		files[fmt.Sprintf("bin/dcos-test-%d", i)] = content
+	}
+	fs := afero.NewMemMapFs()
+	require.NoError(b, afero.WriteFile(fs, "plugin.zip", zipArchive(b, files), 0644))
+
+	b.SetBytes(int64(len(files) * len(content)))
+	b.ReportAllocs()
+	b.ResetTimer()
+	for i := 0; i < b.N; i++ {
+		dest := fmt.Sprintf("/env-%d", i)
+		if err := Unzip(fs, "plugin.zip", dest); err != nil {
+			b.Fatal(err)
+		}
+		b.StopTimer()
+		fs.RemoveAll(dest)
+		b.StartTimer()
+	}
+}
@@ -8,7 +8,6 @@ import (
 	"fmt"
 	"io"
 	"mime"
-	"net"
 	"net/http"
 	"net/http/httputil"
 	"net/url"
@@ -134,26 +133,9 @@ func New(baseURL string, opts ...Option) *Client {
 	return &Client{
 		baseURL: baseURL,
 		baseClient: &http.Client{
-			Transport: &http.Transport{
-				// Allow http_proxy, https_proxy, and no_proxy.
-				Proxy: http.ProxyFromEnvironment,
-
-				// Set a 10 seconds timeout for the connection to be established.
-				DialContext: (&net.Dialer{
-					Timeout: dialTimeout,
-				}).DialContext,
-
-				// Set it to 10 seconds as well for the TLS handshake when using HTTPS.
-				TLSHandshakeTimeout: dialTimeout,
-
-				// The client will be dealing with a single host (the one in baseURL),
-				// set max idle connections to 30 regardless of the host.
-				MaxIdleConns:        30,
-				MaxIdleConnsPerHost: 30,
-
-				// Set the TLS configuration as specified in the context.
-				TLSClientConfig: options.TLS,
-			},
+			// Transports are shared between clients with the same TLS and timeout settings,
+			// this allows to reuse connections across clients.
+			Transport: transports.get(options.TLS, dialTimeout),
 
 			// Specify the redirect policy for the client.
 			CheckRedirect: options.CheckRedirect,
@@ -246,32 +228,47 @@ func (c *Client) NewRequest(method, path string, body io.Reader, opts ...Option)
 func (c *Client) Do(req *http.Request) (*http.Response, error) {
 	logger := c.opts.Logger
 
+	// At the debug level, headers are dumped right away while bodies are logged as they are streamed.
 	if logger != nil && logger.Level >= logrus.DebugLevel {
-		dumpBody := c.isText(req.Header.Get("Content-Type"))
-		reqDump, err := httputil.DumpRequestOut(req, dumpBody)
+		reqDump, err := httputil.DumpRequestOut(req, false)
 		if err != nil {
 			logger.Debugf("Couldn't dump request: %s", err)
 		} else {
 			logger.Debug(string(reqDump))
 		}
+		if req.Body != nil && req.Body != http.NoBody && c.isText(req.Header.Get("Content-Type")) {
+			req = req.WithContext(req.Context())
+			req.Body = newDebugBody(req.Body, logger, "Request")
+		}
+	}
+
+	tracer := newRequestTracer(req, logger)
+	if tracer != nil {
+		req = tracer.attach(req)
 	}
 
 	resp, err := c.baseClient.Do(req)
 
 	if logger != nil && logger.Level >= logrus.DebugLevel {
 		if err == nil {
-			dumpBody := c.isText(resp.Header.Get("Content-Type"))
-			respDump, err := httputil.DumpResponse(resp, dumpBody)
+			respDump, err := httputil.DumpResponse(resp, false)
 			if err != nil {
 				logger.Debugf("Couldn't dump response: %s", err)
 			} else {
 				logger.Debug(string(respDump))
 			}
+			if c.isText(resp.Header.Get("Content-Type")) {
+				resp.Body = newDebugBody(resp.Body, logger, "Response")
+			}
 		} else {
 			logger.Debug(err)
 		}
 	}
 
+	if tracer != nil {
+		resp = tracer.finish(resp, err)
+	}
+
 	if err == nil {
 		_, failOnErrStatus := req.Context().Value(ctxKeyFailOnErrStatus).(struct{})
 
@@ -1,17 +1,21 @@
 package httpclient
 
 import (
+	"bytes"
 	"context"
 	"crypto/tls"
 	"crypto/x509"
+	"encoding/json"
 	"io/ioutil"
 	"net/http"
 	"net/http/httptest"
 	"strings"
+	"sync/atomic"
 	"testing"
 	"time"
 
 	"github.com/sirupsen/logrus"
+	logrustest "github.com/sirupsen/logrus/hooks/test"
 	"github.com/stretchr/testify/assert"
 	"github.com/stretchr/testify/require"
 )
@@ -243,3 +247,191 @@ func TestIsText(t *testing.T) {
 		require.Equal(t, tc.isText, client.isText(tc.contentType))
 	}
 }
+
+func TestSharedTransport(t *testing.T) {
+	ts := httptest.NewServer(http.HandlerFunc(func(w http.ResponseWriter, r *http.Request) {
+		w.Write([]byte("ok"))
+	}))
+	defer ts.Close()
+
+	certPool := x509.NewCertPool()
+	tlsConfig := &tls.Config{RootCAs: certPool, MinVersion: tls.VersionTLS12}
+
+	client := New(ts.URL, TLS(tlsConfig))
+	otherClient := New(ts.URL, TLS(&tls.Config{RootCAs: certPool, MinVersion: tls.VersionTLS12}))
+	require.Equal(t, client.BaseClient().Transport, otherClient.BaseClient().Transport)
+
+	insecureClient := New(ts.URL, TLS(&tls.Config{InsecureSkipVerify: true}))
+	require.NotEqual(t, client.BaseClient().Transport, insecureClient.BaseClient().Transport)
+
+	noTimeoutClient := New(ts.URL, TLS(tlsConfig), Timeout(0))
+	require.NotEqual(t, client.BaseClient().Transport, noTimeoutClient.BaseClient().Transport)
+
+	certClient := New(ts.URL, TLS(&tls.Config{RootCAs: certPool, Certificates: []tls.Certificate{{}}}))
+	require.NotEqual(t, client.BaseClient().Transport, certClient.BaseClient().Transport)
+
+	// The second client reuses the connection established by the first one.
+	stats := Stats()
+	for _, c := range []*Client{client, otherClient} {
+		resp, err := c.Get("/")
+		require.NoError(t, err)
+		require.Equal(t, stats.Active+1, Stats().Active)
+
+		_, err = ioutil.ReadAll(resp.Body)
+		require.NoError(t, err)
+		require.NoError(t, resp.Body.Close())
+	}
+	require.Equal(t, stats.Dials+1, Stats().Dials)
+	require.Equal(t, stats.Active, Stats().Active)
+	require.True(t, Stats().Idle > stats.Idle)
+}
+
+func TestReleaseRootCAs(t *testing.T) {
+	ts := httptest.NewServer(http.HandlerFunc(func(w http.ResponseWriter, r *http.Request) {
+		w.Write([]byte("ok"))
+	}))
+	defer ts.Close()
+
+	certPool := x509.NewCertPool()
+	client := New(ts.URL, TLS(&tls.Config{RootCAs: certPool}))
+	resp, err := client.Get("/")
+	require.NoError(t, err)
+	_, err = ioutil.ReadAll(resp.Body)
+	require.NoError(t, err)
+	require.NoError(t, resp.Body.Close())
+
+	stats := Stats()
+	ReleaseRootCAs(certPool)
+	require.Equal(t, stats.Transports-1, Stats().Transports)
+
+	// The transport is gone from the pool, its idle connection has been closed.
+	require.Eventually(t, func() bool {
+		return atomic.LoadInt64(&client.BaseClient().Transport.(*transport).open) == 0
+	}, 5*time.Second, 10*time.Millisecond)
+
+	otherClient := New(ts.URL, TLS(&tls.Config{RootCAs: certPool}))
+	require.NotEqual(t, client.BaseClient().Transport, otherClient.BaseClient().Transport)
+}
+
+func TestSessionCache(t *testing.T) {
+	ts := httptest.NewTLSServer(http.HandlerFunc(func(w http.ResponseWriter, r *http.Request) {
+		w.Write([]byte("ok"))
+	}))
+	defer ts.Close()
+
+	certPool := x509.NewCertPool()
+	certPool.AddCert(ts.Certificate())
+
+	require.Nil(t, SessionCache(""))
+	require.Equal(t, SessionCache("/cluster"), SessionCache("/cluster"))
+
+	resumed := func() bool {
+		client := New(ts.URL, TLS(&tls.Config{
+			RootCAs:            certPool,
+			ClientSessionCache: SessionCache("/cluster"),
+		}))
+		resp, err := client.Get("/")
+		require.NoError(t, err)
+		defer resp.Body.Close()
+
+		_, err = ioutil.ReadAll(resp.Body)
+		require.NoError(t, err)
+		return resp.TLS.DidResume
+	}
+	require.False(t, resumed())
+
+	// Drop idle connections so that the next request goes through a new handshake.
+	ts.CloseClientConnections()
+	require.True(t, resumed())
+}
+
+func TestTrace(t *testing.T) {
+	ts := httptest.NewServer(http.HandlerFunc(func(w http.ResponseWriter, r *http.Request) {
+		ioutil.ReadAll(r.Body)
+		w.Write([]byte("ok"))
+	}))
+	defer ts.Close()
+
+	var out bytes.Buffer
+	SetTraceOutput(&out)
+	defer SetTraceOutput(nil)
+
+	client := New(ts.URL, Timeout(5*time.Second))
+	for i := 0; i < 2; i++ {
+		resp, err := client.Post("/path", "application/json", strings.NewReader(`{"cluster":"DC/OS"}`))
+		require.NoError(t, err)
+		_, err = ioutil.ReadAll(resp.Body)
+		require.NoError(t, err)
+		require.NoError(t, resp.Body.Close())
+	}
+
+	dec := json.NewDecoder(&out)
+	var traces []RequestTrace
+	for dec.More() {
+		var trace RequestTrace
+		require.NoError(t, dec.Decode(&trace))
+		traces = append(traces, trace)
+	}
+	require.Len(t, traces, 2)
+	for _, trace := range traces {
+		require.Equal(t, "POST", trace.Method)
+		require.Equal(t, ts.URL+"/path", trace.URL)
+		require.Equal(t, 200, trace.Status)
+		require.Equal(t, int64(19), trace.BytesSent)
+		require.Equal(t, int64(2), trace.BytesReceived)
+		require.True(t, trace.Total >= trace.FirstByte)
+	}
+	require.False(t, traces[0].Reused)
+	require.True(t, traces[1].Reused)
+}
+
+func TestDebugBody(t *testing.T) {
+	ts := httptest.NewServer(http.HandlerFunc(func(w http.ResponseWriter, r *http.Request) {
+		ioutil.ReadAll(r.Body)
+		w.Header().Set("Content-Type", "application/json")
+		w.Write(bytes.Repeat([]byte("a"), 10000))
+	}))
+	defer ts.Close()
+
+	logger, hook := logrustest.NewNullLogger()
+	logger.SetLevel(logrus.DebugLevel)
+
+	client := New(ts.URL, Logger(logger))
+	resp, err := client.Post("/path", "application/json", strings.NewReader(`{"cluster":"DC/OS"}`))
+	require.NoError(t, err)
+	body, err := ioutil.ReadAll(resp.Body)
+	require.NoError(t, err)
+	require.Len(t, body, 10000)
+	require.NoError(t, resp.Body.Close())
+
+	var bodyLogs []string
+	for _, entry := range hook.AllEntries() {
+		if strings.Contains(entry.Message, " body (") {
+			bodyLogs = append(bodyLogs, entry.Message)
+		}
+	}
+	require.Equal(t, []string{
+		"Request body (19 bytes):\n" + `{"cluster":"DC/OS"}`,
+		"Response body (10000 bytes, 5904 not shown):\n" + strings.Repeat("a", DefaultDebugBodyLimit) + "...",
+	}, bodyLogs)
+}
+
+func TestDebugBodyConcurrentClose(t *testing.T) {
+	logger, _ := logrustest.NewNullLogger()
+	logger.SetLevel(logrus.DebugLevel)
+
+	// The transport may close a request body while it is being read by its write goroutine.
+	body := newDebugBody(ioutil.NopCloser(strings.NewReader(strings.Repeat("a", 100000))), logger, "Request")
+	done := make(chan struct{})
+	go func() {
+		defer close(done)
+		buf := make([]byte, 10)
+		for {
+			if _, err := body.Read(buf); err != nil {
+				return
+			}
+		}
+	}()
+	require.NoError(t, body.Close())
+	<-done
+}
@@ -0,0 +1,86 @@
+package httpclient
+
+import (
+	"bytes"
+	"io"
+	"sync"
+	"sync/atomic"
+
+	"github.com/sirupsen/logrus"
+)
+
+// DefaultDebugBodyLimit is the default number of body bytes logged per request and response at the debug level.
+const DefaultDebugBodyLimit = 4096
+
+// debugBodyLimit is the number of body bytes logged per request and response at the debug level.
+var debugBodyLimit int64 = DefaultDebugBodyLimit
+
+// SetDebugBodyLimit sets the number of bytes of textual request and response bodies logged at the debug level.
+// Bodies are never logged when it is 0, they are logged in full when it is negative.
+func SetDebugBodyLimit(limit int64) {
+	atomic.StoreInt64(&debugBodyLimit, limit)
+}
+
+// debugBody is a body which logs its first bytes and its total size once it is consumed or closed.
+//
+// The body is streamed to its reader, only the logged bytes are kept in memory. For request bodies, the
+// transport may close the body from another goroutine than the one reading it, hence the mutex.
+type debugBody struct {
+	io.ReadCloser
+	logger  *logrus.Logger
+	name    string
+	limit   int64
+	mu      sync.Mutex
+	size    int64
+	head    bytes.Buffer
+	logOnce sync.Once
+}
+
+// newDebugBody wraps a body to log it at the debug level. It returns the body as is when logging is disabled.
+func newDebugBody(body io.ReadCloser, logger *logrus.Logger, name string) io.ReadCloser {
+	limit := atomic.LoadInt64(&debugBodyLimit)
+	if body == nil || limit == 0 {
+		return body
+	}
+	return &debugBody{ReadCloser: body, logger: logger, name: name, limit: limit}
+}
+
+// Read reads from the body, keeping a copy of the bytes to log.
+func (b *debugBody) Read(p []byte) (int, error) {
+	n, err := b.ReadCloser.Read(p)
+	if n > 0 {
+		b.mu.Lock()
+		b.size += int64(n)
+		if keep := b.limit - int64(b.head.Len()); b.limit < 0 || keep > 0 {
+			if b.limit < 0 || keep > int64(n) {
+				keep = int64(n)
+			}
+			b.head.Write(p[:keep])
+		}
+		b.mu.Unlock()
+	}
+	if err == io.EOF {
+		b.log()
+	}
+	return n, err
+}
+
+// Close closes the body.
+func (b *debugBody) Close() error {
+	b.log()
+	return b.ReadCloser.Close()
+}
+
+// log logs the captured bytes of the body and its size.
+func (b *debugBody) log() {
+	b.logOnce.Do(func() {
+		b.mu.Lock()
+		defer b.mu.Unlock()
+
+		if truncated := b.size - int64(b.head.Len()); truncated > 0 {
+			b.logger.Debugf("%s body (%d bytes, %d not shown):\n%s...", b.name, b.size, truncated, b.head.String())
+		} else {
+			b.logger.Debugf("%s body (%d bytes):\n%s", b.name, b.size, b.head.String())
+		}
+	})
+}
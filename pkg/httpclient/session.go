@@ -0,0 +1,35 @@
+package httpclient
+
+import (
+	"crypto/tls"
+	"sync"
+)
+
+// sessionCacheCapacity is the number of TLS sessions kept per session cache.
+const sessionCacheCapacity = 32
+
+// sessionCaches holds the session caches of the process, a single cache is used per cluster directory.
+var sessionCaches = struct {
+	mu     sync.Mutex
+	caches map[string]tls.ClientSessionCache
+}{caches: make(map[string]tls.ClientSessionCache)}
+
+// SessionCache returns the in-memory TLS client session cache for a cluster directory.
+// It returns nil for an empty directory.
+//
+// Caches are shared within the process by directory, they don't prevent clients from sharing a transport.
+func SessionCache(dir string) tls.ClientSessionCache {
+	if dir == "" {
+		return nil
+	}
+
+	sessionCaches.mu.Lock()
+	defer sessionCaches.mu.Unlock()
+
+	if cache, ok := sessionCaches.caches[dir]; ok {
+		return cache
+	}
+	cache := tls.NewLRUClientSessionCache(sessionCacheCapacity)
+	sessionCaches.caches[dir] = cache
+	return cache
+}
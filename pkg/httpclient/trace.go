@@ -0,0 +1,263 @@
+package httpclient
+
+import (
+	"crypto/tls"
+	"encoding/json"
+	"io"
+	"net/http"
+	"net/http/httptrace"
+	"sync"
+	"sync/atomic"
+	"time"
+
+	"github.com/sirupsen/logrus"
+)
+
+// traceOutput receives the traces of the HTTP requests sent by the process, when set.
+var traceOutput = &traceWriter{}
+
+// SetTraceOutput enables HTTP request tracing. Each request sent by a client is written
+// to w as a RequestTrace JSON object followed by a newline. A nil writer disables tracing.
+func SetTraceOutput(w io.Writer) {
+	traceOutput.mu.Lock()
+	defer traceOutput.mu.Unlock()
+
+	if w == nil {
+		traceOutput.enc = nil
+		return
+	}
+	traceOutput.enc = json.NewEncoder(w)
+}
+
+// RequestTrace is the latency breakdown of an HTTP request. Durations are in milliseconds.
+//
+// When a request is redirected, phase durations are summed across the redirects
+// while the connection details are the ones of the last response.
+type RequestTrace struct {
+	Start  time.Time `json:"start"`
+	Method string    `json:"method"`
+	URL    string    `json:"url"`
+	Status int       `json:"status,omitempty"`
+	Error  string    `json:"error,omitempty"`
+	Proto  string    `json:"proto,omitempty"`
+
+	RemoteAddr string `json:"remote_addr,omitempty"`
+	Reused     bool   `json:"reused"`
+	WasIdle    bool   `json:"was_idle"`
+	TLSResumed bool   `json:"tls_resumed"`
+
+	DNS          float64 `json:"dns_ms"`
+	Connect      float64 `json:"connect_ms"`
+	ProxyConnect float64 `json:"proxy_connect_ms"`
+	TLSHandshake float64 `json:"tls_handshake_ms"`
+	FirstByte    float64 `json:"first_byte_ms"`
+	Total        float64 `json:"total_ms"`
+
+	BytesSent     int64 `json:"bytes_sent"`
+	BytesReceived int64 `json:"bytes_received"`
+}
+
+// traceWriter writes request traces as newline-delimited JSON.
+type traceWriter struct {
+	mu  sync.Mutex
+	enc *json.Encoder
+}
+
+// enabled indicates whether request traces are written.
+func (w *traceWriter) enabled() bool {
+	w.mu.Lock()
+	defer w.mu.Unlock()
+	return w.enc != nil
+}
+
+// write writes a request trace.
+func (w *traceWriter) write(trace *RequestTrace) {
+	w.mu.Lock()
+	defer w.mu.Unlock()
+	if w.enc != nil {
+		w.enc.Encode(trace)
+	}
+}
+
+// requestTracer records the phases of an HTTP request through an httptrace.ClientTrace.
+type requestTracer struct {
+	// Byte counters are kept first for 64-bit alignment of atomic operations on 32-bit platforms.
+	bytesSent     int64
+	bytesReceived int64
+
+	mu           sync.Mutex
+	trace        RequestTrace
+	proxied      bool
+	dnsStart     time.Time
+	connectStart time.Time
+	connectDone  time.Time
+	tlsStart     time.Time
+	done         sync.Once
+	logger       *logrus.Logger
+}
+
+// newRequestTracer returns a tracer for a request, or nil when tracing is disabled.
+func newRequestTracer(req *http.Request, logger *logrus.Logger) *requestTracer {
+	debug := logger != nil && logger.Level >= logrus.DebugLevel
+	if !debug && !traceOutput.enabled() {
+		return nil
+	}
+	t := &requestTracer{logger: logger}
+	t.trace.Start = time.Now()
+	t.trace.Method = req.Method
+	t.trace.URL = req.URL.String()
+
+	// With a proxy, the time between the connection to the proxy and the TLS handshake is spent on CONNECT.
+	if req.URL.Scheme == "https" {
+		if proxyURL, err := http.ProxyFromEnvironment(req); err == nil && proxyURL != nil {
+			t.proxied = true
+		}
+	}
+	return t
+}
+
+// attach returns a copy of the request with the tracer hooks and a byte counter on its body.
+func (t *requestTracer) attach(req *http.Request) *http.Request {
+	clientTrace := &httptrace.ClientTrace{
+		DNSStart: func(httptrace.DNSStartInfo) {
+			t.mu.Lock()
+			t.dnsStart = time.Now()
+			t.mu.Unlock()
+		},
+		DNSDone: func(httptrace.DNSDoneInfo) {
+			t.mu.Lock()
+			t.trace.DNS += msSince(t.dnsStart)
+			t.mu.Unlock()
+		},
+		ConnectStart: func(network, addr string) {
+			t.mu.Lock()
+			t.connectStart = time.Now()
+			t.mu.Unlock()
+		},
+		ConnectDone: func(network, addr string, err error) {
+			t.mu.Lock()
+			t.connectDone = time.Now()
+			t.trace.Connect += msSince(t.connectStart)
+			t.mu.Unlock()
+		},
+		TLSHandshakeStart: func() {
+			t.mu.Lock()
+			t.tlsStart = time.Now()
+			if t.proxied && !t.connectDone.IsZero() {
+				t.trace.ProxyConnect += float64(t.tlsStart.Sub(t.connectDone)) / float64(time.Millisecond)
+			}
+			t.mu.Unlock()
+		},
+		TLSHandshakeDone: func(tls.ConnectionState, error) {
+			t.mu.Lock()
+			t.trace.TLSHandshake += msSince(t.tlsStart)
+			t.mu.Unlock()
+		},
+		GotConn: func(info httptrace.GotConnInfo) {
+			t.mu.Lock()
+			t.trace.Reused = info.Reused
+			t.trace.WasIdle = info.WasIdle
+			if info.Conn != nil {
+				t.trace.RemoteAddr = info.Conn.RemoteAddr().String()
+			}
+			t.mu.Unlock()
+		},
+		GotFirstResponseByte: func() {
+			t.mu.Lock()
+			t.trace.FirstByte = msSince(t.trace.Start)
+			t.mu.Unlock()
+		},
+	}
+	req = req.WithContext(httptrace.WithClientTrace(req.Context(), clientTrace))
+	if req.Body != nil && req.Body != http.NoBody {
+		req.Body = &countingBody{ReadCloser: req.Body, count: &t.bytesSent}
+	}
+	return req
+}
+
+// finish records the outcome of a request. The trace is written once the response body is
+// consumed or closed, so that the total duration and the received bytes are accurate.
+func (t *requestTracer) finish(resp *http.Response, err error) *http.Response {
+	if err != nil {
+		t.mu.Lock()
+		t.trace.Error = err.Error()
+		t.mu.Unlock()
+		t.write()
+		return resp
+	}
+	t.mu.Lock()
+	t.trace.Status = resp.StatusCode
+	t.trace.Proto = resp.Proto
+	if resp.TLS != nil {
+		t.trace.TLSResumed = resp.TLS.DidResume
+	}
+	t.mu.Unlock()
+
+	resp.Body = &tracedBody{
+		countingBody: countingBody{ReadCloser: resp.Body, count: &t.bytesReceived},
+		tracer:       t,
+	}
+	return resp
+}
+
+// write writes the request trace to the trace output and logs it at the debug level.
+func (t *requestTracer) write() {
+	t.done.Do(func() {
+		t.mu.Lock()
+		trace := t.trace
+		t.mu.Unlock()
+
+		trace.Total = msSince(trace.Start)
+		trace.BytesSent = atomic.LoadInt64(&t.bytesSent)
+		trace.BytesReceived = atomic.LoadInt64(&t.bytesReceived)
+		traceOutput.write(&trace)
+
+		if t.logger != nil && t.logger.Level >= logrus.DebugLevel {
+			t.logger.Debugf(
+				"%s %s: dns %.1fms, connect %.1fms, proxy %.1fms, tls %.1fms, first byte %.1fms, total %.1fms "+
+					"(reused: %t, sent: %dB, received: %dB)",
+				trace.Method, trace.URL, trace.DNS, trace.Connect, trace.ProxyConnect, trace.TLSHandshake,
+				trace.FirstByte, trace.Total, trace.Reused, trace.BytesSent, trace.BytesReceived,
+			)
+		}
+	})
+}
+
+// countingBody is a body which counts the bytes read from it.
+type countingBody struct {
+	io.ReadCloser
+	count *int64
+}
+
+// Read reads from the body.
+func (b *countingBody) Read(p []byte) (int, error) {
+	n, err := b.ReadCloser.Read(p)
+	atomic.AddInt64(b.count, int64(n))
+	return n, err
+}
+
+// tracedBody is a response body which writes the request trace when it is consumed or closed.
+type tracedBody struct {
+	countingBody
+	tracer *requestTracer
+}
+
+// Read reads from the response body.
+func (b *tracedBody) Read(p []byte) (int, error) {
+	n, err := b.countingBody.Read(p)
+	if err == io.EOF {
+		b.tracer.write()
+	}
+	return n, err
+}
+
+// Close closes the response body.
+func (b *tracedBody) Close() error {
+	b.tracer.write()
+	return b.countingBody.Close()
+}
+
+// msSince returns the number of milliseconds elapsed since a given time.
+func msSince(start time.Time) float64 {
+	return float64(time.Since(start)) / float64(time.Millisecond)
+}
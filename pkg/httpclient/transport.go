@@ -0,0 +1,252 @@
+package httpclient
+
+import (
+	"context"
+	"crypto/tls"
+	"crypto/x509"
+	"io"
+	"net"
+	"net/http"
+	"reflect"
+	"sync"
+	"sync/atomic"
+	"time"
+)
+
+// transports is the pool of HTTP transports shared by the clients of the process.
+var transports = &transportPool{transports: make(map[transportKey]*transport)}
+
+// TransportStats are connection statistics of the shared HTTP transports.
+type TransportStats struct {
+	// Transports is the number of transports in the pool.
+	Transports int
+
+	// Dials is the total number of connections which have been established.
+	Dials int64
+
+	// Open is the number of connections which are currently open.
+	Open int64
+
+	// Active is the number of requests in-flight, a request is in-flight until its response body is closed.
+	Active int64
+
+	// Idle is the number of open connections which aren't used by an in-flight request.
+	// With HTTP/2 a connection can serve several requests, the number is then a lower bound.
+	Idle int64
+}
+
+// Stats returns connection statistics for the shared HTTP transports.
+func Stats() TransportStats {
+	return transports.stats()
+}
+
+// CloseIdleConnections closes the idle connections of the shared HTTP transports.
+// Connections which are in use are not interrupted.
+func CloseIdleConnections() {
+	transports.closeIdleConnections()
+}
+
+// ReleaseRootCAs removes the shared HTTP transports using a CA pool and closes their idle connections.
+// It is meant for CA pools which have been superseded, eg. after a CA bundle file changed, so that
+// long-running processes don't keep transports which won't be used anymore. Clients which already
+// use these transports keep working.
+func ReleaseRootCAs(rootCAs *x509.CertPool) {
+	transports.release(rootCAs)
+}
+
+// transportKey identifies the settings of a transport. Clients with the same key share a transport.
+//
+// The proxy isn't part of the key as all transports read it from the environment.
+type transportKey struct {
+	dialTimeout  time.Duration
+	insecure     bool
+	minVersion   uint16
+	serverName   string
+	rootCAs      *x509.CertPool
+	sessionCache tls.ClientSessionCache
+
+	// tls is only set for TLS configs with settings not covered by the fields above,
+	// such configs get a dedicated transport.
+	tls *tls.Config
+}
+
+// newTransportKey returns the transport key for a TLS config and a dial timeout.
+func newTransportKey(tlsConfig *tls.Config, dialTimeout time.Duration) transportKey {
+	key := transportKey{dialTimeout: dialTimeout}
+	if tlsConfig == nil {
+		return key
+	}
+	key.insecure = tlsConfig.InsecureSkipVerify
+	key.minVersion = tlsConfig.MinVersion
+	key.serverName = tlsConfig.ServerName
+	key.rootCAs = tlsConfig.RootCAs
+	key.sessionCache = tlsConfig.ClientSessionCache
+
+	otherSettings := tlsConfig.Clone()
+	otherSettings.InsecureSkipVerify = false
+	otherSettings.MinVersion = 0
+	otherSettings.ServerName = ""
+	otherSettings.RootCAs = nil
+	otherSettings.ClientSessionCache = nil
+	if !reflect.DeepEqual(otherSettings, &tls.Config{}) {
+		key.tls = tlsConfig
+	}
+	return key
+}
+
+// transportPool holds HTTP transports, indexed by their settings.
+type transportPool struct {
+	mu         sync.Mutex
+	transports map[transportKey]*transport
+}
+
+// get returns the transport for a TLS config and a dial timeout, creating it if needed.
+func (p *transportPool) get(tlsConfig *tls.Config, dialTimeout time.Duration) *transport {
+	key := newTransportKey(tlsConfig, dialTimeout)
+
+	p.mu.Lock()
+	defer p.mu.Unlock()
+
+	if t, ok := p.transports[key]; ok {
+		return t
+	}
+	t := newTransport(tlsConfig, dialTimeout)
+	p.transports[key] = t
+	return t
+}
+
+// closeIdleConnections closes the idle connections of all transports in the pool.
+func (p *transportPool) closeIdleConnections() {
+	p.mu.Lock()
+	defer p.mu.Unlock()
+
+	for _, t := range p.transports {
+		t.base.CloseIdleConnections()
+	}
+}
+
+// release removes the transports using a CA pool and closes their idle connections.
+func (p *transportPool) release(rootCAs *x509.CertPool) {
+	if rootCAs == nil {
+		return
+	}
+	p.mu.Lock()
+	defer p.mu.Unlock()
+
+	for key, t := range p.transports {
+		if key.rootCAs == rootCAs || (key.tls != nil && key.tls.RootCAs == rootCAs) {
+			t.base.CloseIdleConnections()
+			delete(p.transports, key)
+		}
+	}
+}
+
+// stats returns the connection statistics of all transports in the pool.
+func (p *transportPool) stats() TransportStats {
+	p.mu.Lock()
+	defer p.mu.Unlock()
+
+	stats := TransportStats{Transports: len(p.transports)}
+	for _, t := range p.transports {
+		open := atomic.LoadInt64(&t.open)
+		active := atomic.LoadInt64(&t.active)
+		stats.Dials += atomic.LoadInt64(&t.dials)
+		stats.Open += open
+		stats.Active += active
+		if open > active {
+			stats.Idle += open - active
+		}
+	}
+	return stats
+}
+
+// transport is an HTTP transport keeping track of its connections and in-flight requests.
+type transport struct {
+	// Counters are kept first for 64-bit alignment of atomic operations on 32-bit platforms.
+	dials  int64
+	open   int64
+	active int64
+	base   *http.Transport
+}
+
+// newTransport creates a transport for a TLS config and a dial timeout.
+func newTransport(tlsConfig *tls.Config, dialTimeout time.Duration) *transport {
+	t := &transport{}
+	dialer := &net.Dialer{
+		Timeout:   dialTimeout,
+		KeepAlive: 30 * time.Second,
+	}
+	t.base = &http.Transport{
+		// Allow http_proxy, https_proxy, and no_proxy.
+		Proxy: http.ProxyFromEnvironment,
+
+		// Set a 10 seconds timeout for the connection to be established.
+		DialContext: func(ctx context.Context, network, addr string) (net.Conn, error) {
+			conn, err := dialer.DialContext(ctx, network, addr)
+			if err != nil {
+				return nil, err
+			}
+			atomic.AddInt64(&t.dials, 1)
+			atomic.AddInt64(&t.open, 1)
+			return &trackedConn{Conn: conn, open: &t.open}, nil
+		},
+
+		// Set it to 10 seconds as well for the TLS handshake when using HTTPS.
+		TLSHandshakeTimeout: dialTimeout,
+
+		// The transport is shared by all clients with the same settings, which
+		// usually deal with a handful of hosts. Keep up to 30 idle connections per host.
+		MaxIdleConns:        100,
+		MaxIdleConnsPerHost: 30,
+		IdleConnTimeout:     90 * time.Second,
+
+		// A custom dialer and TLS config disable HTTP/2 unless it is explicitly enabled.
+		ForceAttemptHTTP2: true,
+
+		// Set the TLS configuration as specified in the context.
+		TLSClientConfig: tlsConfig,
+	}
+	return t
+}
+
+// RoundTrip executes a single HTTP transaction.
+func (t *transport) RoundTrip(req *http.Request) (*http.Response, error) {
+	atomic.AddInt64(&t.active, 1)
+	resp, err := t.base.RoundTrip(req)
+	if err != nil {
+		atomic.AddInt64(&t.active, -1)
+		return nil, err
+	}
+	resp.Body = &trackedBody{ReadCloser: resp.Body, active: &t.active}
+	return resp, nil
+}
+
+// trackedConn is a connection which decrements a counter when it gets closed.
+type trackedConn struct {
+	net.Conn
+	open      *int64
+	closeOnce sync.Once
+}
+
+// Close closes the connection.
+func (c *trackedConn) Close() error {
+	c.closeOnce.Do(func() {
+		atomic.AddInt64(c.open, -1)
+	})
+	return c.Conn.Close()
+}
+
+// trackedBody is a response body which decrements a counter when it gets closed.
+type trackedBody struct {
+	io.ReadCloser
+	active    *int64
+	closeOnce sync.Once
+}
+
+// Close closes the response body.
+func (b *trackedBody) Close() error {
+	b.closeOnce.Do(func() {
+		atomic.AddInt64(b.active, -1)
+	})
+	return b.ReadCloser.Close()
+}
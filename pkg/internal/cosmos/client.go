@@ -6,6 +6,7 @@ import (
 	"runtime"
 
 	"github.com/dcos/client-go/dcos"
+	"github.com/spf13/afero"
 )
 
 // NewClient creates a new Cosmos client.
@@ -17,6 +18,20 @@ func NewClient() (*dcos.CosmosApiService, error) {
 	return dcosClient.Cosmos, nil
 }
 
+// NewClientForConfig creates a new Cosmos client for the cluster of a given config file.
+// Unlike NewClient, it doesn't depend on the attached cluster.
+func NewClientForConfig(fs afero.Fs, configPath string) (*dcos.CosmosApiService, error) {
+	store := dcos.NewConfigStore(&dcos.ConfigStoreOpts{Fs: fs})
+	if err := store.LoadPath(configPath); err != nil {
+		return nil, err
+	}
+	dcosClient, err := dcos.NewClientWithConfig(dcos.NewConfig(store))
+	if err != nil {
+		return nil, err
+	}
+	return dcosClient.Cosmos, nil
+}
+
 // CLIPluginInfo extracts plugin resource data from the Cosmos package and for the current platform.
 func CLIPluginInfo(pkg dcos.CosmosPackageDescribeV3Response, baseURL *url.URL) (cliArtifact dcos.CosmosPackageResourceCliArtifact, err error) {
 	switch runtime.GOOS {
@@ -0,0 +1,62 @@
+package plugin
+
+import (
+	"bytes"
+	"fmt"
+	"os"
+	"path/filepath"
+	"strings"
+
+	"github.com/dcos/dcos-cli/pkg/config"
+	"github.com/spf13/afero"
+)
+
+// UpdateCompletionIndex writes the completion index of the current cluster.
+//
+// The index is also updated whenever the plugin index gets rebuilt (eg. when a plugin
+// gets installed or removed), this method makes sure it exists.
+func (m *Manager) UpdateCompletionIndex() error {
+	return m.persistCompletionIndex(m.Plugins())
+}
+
+// persistCompletionIndex atomically writes the completion index of the current cluster,
+// see config.CompletionIndexFile.
+//
+// It holds the plugin names, their commands and the bash completion scripts they ship:
+//
+//	plugin	<name>
+//	command	<name>
+//	script	<path>
+func (m *Manager) persistCompletionIndex(plugins []*Plugin) error {
+	var buf bytes.Buffer
+	for _, plugin := range plugins {
+		fmt.Fprintf(&buf, "plugin\t%s\n", plugin.Name)
+	}
+	for _, plugin := range plugins {
+		for _, command := range plugin.Commands {
+			fmt.Fprintf(&buf, "command\t%s\n", command.Name)
+		}
+	}
+	for _, plugin := range plugins {
+		for _, script := range m.completionScripts(plugin) {
+			fmt.Fprintf(&buf, "script\t%s\n", script)
+		}
+	}
+	return m.persistFile(buf.Bytes(), filepath.Join(m.cluster.Dir(), config.CompletionIndexFile))
+}
+
+// completionScripts returns the bash completion scripts of a plugin, these are the `.sh`
+// files in the `bash` sub-directory of its completion directory.
+func (m *Manager) completionScripts(plugin *Plugin) (scripts []string) {
+	dir := filepath.Join(plugin.CompletionDir(), "bash")
+	afero.Walk(m.fs, dir, func(path string, info os.FileInfo, err error) error {
+		if err != nil {
+			return nil
+		}
+		if info.Mode().IsRegular() && strings.HasSuffix(strings.ToLower(info.Name()), ".sh") {
+			scripts = append(scripts, path)
+		}
+		return nil
+	})
+	return scripts
+}
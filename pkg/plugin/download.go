@@ -0,0 +1,619 @@
+package plugin
+
+import (
+	"crypto/sha256"
+	"encoding/hex"
+	"encoding/json"
+	"fmt"
+	"io"
+	"net/http"
+	"os"
+	"path/filepath"
+	"strings"
+	"sync"
+
+	"github.com/dcos/dcos-cli/pkg/fsutil"
+	"github.com/dcos/dcos-cli/pkg/httpclient"
+	"github.com/spf13/afero"
+	"github.com/vbauerster/mpb"
+	"github.com/vbauerster/mpb/decor"
+)
+
+const (
+	// downloadSegments is the number of segments fetched concurrently for ranged downloads.
+	downloadSegments = 4
+
+	// minSegmentSize is the minimum size of a segment, smaller resources are downloaded with a single request.
+	minSegmentSize = 1 << 20
+
+	// segmentAttempts is the number of attempts to fetch a segment, each attempt resumes the previous one.
+	segmentAttempts = 3
+)
+
+// partialDownload describes a ranged download in progress. It is stored along with the downloaded
+// segments, a later download of the same resource resumes them as long as the description matches.
+type partialDownload struct {
+	URL       string `json:"url"`
+	Size      int64  `json:"size"`
+	Validator string `json:"validator"`
+	Segments  int    `json:"segments"`
+}
+
+// pluginSourceFile is the file in a plugin directory describing the resource the plugin has been downloaded from.
+const pluginSourceFile = "source.json"
+
+// pluginSource describes the remote resource an installed plugin has been downloaded from.
+type pluginSource struct {
+	URL          string `json:"url"`
+	ETag         string `json:"etag,omitempty"`
+	LastModified string `json:"last_modified,omitempty"`
+	SHA256       string `json:"sha256"`
+}
+
+// sharedDownloads are the downloads into a plugin store in progress in this process.
+var sharedDownloads = struct {
+	sync.Mutex
+	calls map[sharedDownloadKey]*sharedDownload
+}{calls: make(map[sharedDownloadKey]*sharedDownload)}
+
+// sharedDownloadKey identifies a download into a plugin store.
+type sharedDownloadKey struct {
+	fs       afero.Fs
+	storeDir string
+	url      string
+}
+
+// sharedDownload is a download into a plugin store, other installations of the resource wait for it.
+type sharedDownload struct {
+	done   chan struct{}
+	source *pluginSource
+}
+
+// fetchPlugin returns the path to a remote plugin resource, either found in the store or downloaded.
+//
+// Within a process, concurrent installations of the same URL into a store share a single download
+// (eg. the default plugins of clusters set up in bulk). They wait for it, then use the stored resource
+// when it matches their expected checksum.
+func (m *Manager) fetchPlugin(url string, installOpts *InstallOpts) (string, error) {
+	if storedPath, ok := m.storedResource(installOpts); ok {
+		m.logger.Infof("Using %s from the plugin store", storedPath)
+		installOpts.source = &pluginSource{URL: url, SHA256: installOpts.digest}
+		return storedPath, nil
+	}
+	if m.storeDir == "" {
+		return m.fetchRemotePlugin(url, installOpts)
+	}
+
+	key := sharedDownloadKey{fs: m.fs, storeDir: m.storeDir, url: url}
+	sharedDownloads.Lock()
+	dl, inProgress := sharedDownloads.calls[key]
+	if !inProgress {
+		dl = &sharedDownload{done: make(chan struct{})}
+		sharedDownloads.calls[key] = dl
+	}
+	sharedDownloads.Unlock()
+
+	if inProgress {
+		m.logger.Debugf("Waiting for the download of %s by a concurrent installation...", url)
+		<-dl.done
+		if dl.source != nil && m.matchesChecksum(dl.source.SHA256, installOpts) {
+			if storedPath, ok := m.storedBlob(dl.source.SHA256); ok {
+				m.logger.Infof("Using %s from the plugin store", storedPath)
+				source := *dl.source
+				installOpts.source = &source
+				installOpts.digest = source.SHA256
+				return storedPath, nil
+			}
+		}
+		return m.fetchRemotePlugin(url, installOpts)
+	}
+
+	defer func() {
+		sharedDownloads.Lock()
+		delete(sharedDownloads.calls, key)
+		sharedDownloads.Unlock()
+		close(dl.done)
+	}()
+	path, err := m.fetchRemotePlugin(url, installOpts)
+	if err == nil && installOpts.digest != "" {
+		source := *installOpts.source
+		dl.source = &source
+	}
+	return path, err
+}
+
+// fetchRemotePlugin sends a HEAD request for a remote plugin resource, it then either finds it in the
+// store through its source or downloads it. Downloaded resources are moved into the store, if enabled.
+func (m *Manager) fetchRemotePlugin(url string, installOpts *InstallOpts) (string, error) {
+	client, err := m.httpClient(url)
+	if err != nil {
+		return "", err
+	}
+
+	// The HEAD response tells whether the resource can be downloaded with range requests,
+	// and whether it is the same as a resource previously downloaded into the store.
+	head := m.headResource(client, url)
+	if storedPath, ok := m.storedSource(url, head, installOpts); ok {
+		m.logger.Infof("Using %s from the plugin store", storedPath)
+		return storedPath, nil
+	}
+
+	path, err := m.downloadPlugin(client, url, head, installOpts)
+	if err != nil || installOpts.digest == "" {
+		return path, err
+	}
+	path, err = m.storeResource(path, installOpts.digest)
+	if err != nil {
+		return "", err
+	}
+	if err := m.recordStoreSource(installOpts.source); err != nil {
+		m.logger.Debugf("Couldn't record plugin store source: %s", err)
+	}
+	return path, nil
+}
+
+// matchesChecksum indicates whether a resource with a given SHA256 digest matches the expected checksum of a plugin.
+// The checksum is verified by the download when it doesn't use SHA256.
+func (m *Manager) matchesChecksum(digest string, installOpts *InstallOpts) bool {
+	if installOpts.Checksum.Hasher == nil {
+		return true
+	}
+	return isSHA256(installOpts.Checksum.Hasher) && strings.ToLower(installOpts.Checksum.Value) == digest
+}
+
+// downloadPlugin downloads a plugin and returns the path to the temporary file it stored it to.
+// The resource ETag, Last-Modified date and SHA256 digest are recorded as the plugin source.
+//
+// When the server supports range requests, the resource is fetched as concurrent segments which
+// are kept across failed attempts. Otherwise it is fetched with a single request.
+//
+// When the plugin store is enabled, the resource is downloaded into the store temp dir
+// and its SHA256 digest is computed, so that it can be moved into the store afterwards.
+//
+// The head argument is the response to a HEAD request for the resource, it can be nil.
+func (m *Manager) downloadPlugin(client *httpclient.Client, url string, head *http.Response, installOpts *InstallOpts) (string, error) {
+	var tmpDir string
+	var err error
+	if m.storeDir != "" {
+		tmpDir, err = m.storeTempDir()
+	} else {
+		tmpDir, err = afero.TempDir(m.fs, os.TempDir(), "dcos-cli")
+	}
+	if err != nil {
+		return "", err
+	}
+
+	var hashers []io.Writer
+	if installOpts.Checksum.Hasher != nil {
+		hashers = append(hashers, installOpts.Checksum.Hasher)
+	}
+	digestHasher := sha256.New()
+	hashers = append(hashers, digestHasher)
+	hashWriter := io.MultiWriter(hashers...)
+
+	var downloadedFilePath string
+	var header http.Header
+	if rangeable(head) {
+		downloadedFilePath = filepath.Join(tmpDir, m.downloadFilename(head))
+		header = head.Header
+		err = m.downloadSegments(client, url, head, downloadedFilePath, hashWriter, installOpts)
+	} else {
+		downloadedFilePath, header, err = m.downloadStream(client, url, tmpDir, hashWriter, installOpts)
+	}
+	if err != nil {
+		return "", err
+	}
+
+	if installOpts.Checksum.Hasher != nil {
+		m.logger.Debugf("Verifying checksum for %s...", url)
+		computedChecksum := hex.EncodeToString(installOpts.Checksum.Hasher.Sum(nil))
+		if computedChecksum != installOpts.Checksum.Value {
+			return "", fmt.Errorf("computed checksum %s for %s, expected %s", computedChecksum, url, installOpts.Checksum.Value)
+		}
+	}
+	installOpts.source = &pluginSource{
+		URL:          url,
+		ETag:         header.Get("ETag"),
+		LastModified: header.Get("Last-Modified"),
+		SHA256:       hex.EncodeToString(digestHasher.Sum(nil)),
+	}
+	if m.storeDir != "" {
+		installOpts.digest = installOpts.source.SHA256
+	}
+	return downloadedFilePath, nil
+}
+
+// headResource issues a HEAD request for a resource, it returns nil when the request fails.
+func (m *Manager) headResource(client *httpclient.Client, url string) *http.Response {
+	req, err := client.NewRequest("HEAD", url, nil)
+	if err != nil {
+		return nil
+	}
+	resp, err := client.Do(req)
+	if err != nil {
+		m.logger.Debugf("Couldn't send HEAD request to %s: %s", url, err)
+		return nil
+	}
+	resp.Body.Close()
+	return resp
+}
+
+// rangeable indicates whether a resource can be downloaded with range requests, based on its HEAD response.
+func rangeable(head *http.Response) bool {
+	return head != nil && head.Header.Get("Accept-Ranges") == "bytes" && head.ContentLength >= 2*minSegmentSize
+}
+
+// downloadStream downloads a resource with a single request into a directory.
+// The response header is returned along with the path to the downloaded file.
+func (m *Manager) downloadStream(client *httpclient.Client, url, dir string,
+	hashWriter io.Writer, installOpts *InstallOpts) (string, http.Header, error) {
+
+	resp, err := client.Get(url)
+	if err != nil {
+		return "", nil, err
+	}
+	defer resp.Body.Close()
+
+	downloadedFilePath := filepath.Join(dir, m.downloadFilename(resp))
+
+	respReader := io.TeeReader(resp.Body, hashWriter)
+	if bar := m.progressBar(installOpts, resp.ContentLength); bar != nil {
+		if resp.ContentLength > 0 {
+			respReader = bar.ProxyReader(respReader)
+		} else {
+			respReader = newStreamReader(respReader, bar)
+		}
+	}
+	return downloadedFilePath, resp.Header, fsutil.CopyReader(m.fs, respReader, downloadedFilePath, 0644)
+}
+
+// downloadSegments downloads a resource as concurrent segments, then reassembles them into the destination file.
+//
+// Segments are kept in a partial download directory until the download succeeds,
+// this way a subsequent download of the same resource resumes where it stopped.
+func (m *Manager) downloadSegments(client *httpclient.Client, url string, head *http.Response,
+	dest string, hashWriter io.Writer, installOpts *InstallOpts) (err error) {
+
+	dl := partialDownload{
+		URL:       url,
+		Size:      head.ContentLength,
+		Validator: head.Header.Get("ETag"),
+		Segments:  downloadSegments,
+	}
+	// Weak ETags can't be used as If-Range validators.
+	if dl.Validator == "" || strings.HasPrefix(dl.Validator, "W/") {
+		dl.Validator = head.Header.Get("Last-Modified")
+	}
+
+	partialDir, release, err := m.partialDownloadDir(dl)
+	if err != nil {
+		return err
+	}
+	defer func() { release(err == nil) }()
+
+	bar := m.progressBar(installOpts, dl.Size)
+	segmentSize := (dl.Size + int64(dl.Segments) - 1) / int64(dl.Segments)
+
+	var wg sync.WaitGroup
+	errs := make([]error, dl.Segments)
+	for i := 0; i < dl.Segments; i++ {
+		start := int64(i) * segmentSize
+		end := start + segmentSize
+		if end > dl.Size {
+			end = dl.Size
+		}
+		wg.Add(1)
+		go func(i int, start, end int64) {
+			defer wg.Done()
+			segmentPath := filepath.Join(partialDir, fmt.Sprintf("segment-%d", i))
+			errs[i] = m.downloadSegment(client, url, dl.Validator, segmentPath, start, end, bar)
+		}(i, start, end)
+	}
+	wg.Wait()
+
+	for _, err := range errs {
+		if err != nil {
+			return err
+		}
+	}
+
+	// Reassemble the segments, computing the resource hashes along the way.
+	destFile, err := m.fs.OpenFile(dest, os.O_WRONLY|os.O_CREATE|os.O_TRUNC, 0644)
+	if err != nil {
+		return err
+	}
+	defer destFile.Close()
+
+	w := io.MultiWriter(destFile, hashWriter)
+	for i := 0; i < dl.Segments; i++ {
+		segment, err := m.fs.Open(filepath.Join(partialDir, fmt.Sprintf("segment-%d", i)))
+		if err != nil {
+			return err
+		}
+		_, err = io.Copy(w, segment)
+		segment.Close()
+		if err != nil {
+			return err
+		}
+	}
+	return nil
+}
+
+// downloadSegment downloads the [start, end) range of a resource into a segment file.
+// An existing segment file is resumed, failed requests are retried from where they stopped.
+func (m *Manager) downloadSegment(client *httpclient.Client, url, validator, path string, start, end int64, bar *mpb.Bar) error {
+	var downloaded int64
+	if fileInfo, err := m.fs.Stat(path); err == nil && fileInfo.Size() <= end-start {
+		downloaded = fileInfo.Size()
+	}
+
+	f, err := m.fs.OpenFile(path, os.O_WRONLY|os.O_CREATE, 0644)
+	if err != nil {
+		return err
+	}
+	defer f.Close()
+
+	if err := f.Truncate(downloaded); err != nil {
+		return err
+	}
+	if _, err := f.Seek(downloaded, io.SeekStart); err != nil {
+		return err
+	}
+	if bar != nil {
+		bar.IncrBy(int(downloaded))
+	}
+
+	for attempt := 0; downloaded < end-start; attempt++ {
+		if attempt == segmentAttempts {
+			return fmt.Errorf("couldn't download %s: %s", url, err)
+		}
+
+		var n int64
+		n, err = m.fetchRange(client, url, validator, f, start+downloaded, end, bar)
+		downloaded += n
+		if err == nil && downloaded < end-start {
+			err = io.ErrUnexpectedEOF
+		}
+		if err != nil {
+			m.logger.Debugf("Couldn't download bytes %d-%d of %s: %s", start+downloaded, end-1, url, err)
+		}
+	}
+	return nil
+}
+
+// fetchRange fetches the [start, end) range of a resource into a writer, it returns the number of bytes written.
+func (m *Manager) fetchRange(client *httpclient.Client, url, validator string, w io.Writer, start, end int64, bar *mpb.Bar) (int64, error) {
+	req, err := client.NewRequest("GET", url, nil)
+	if err != nil {
+		return 0, err
+	}
+	req.Header.Set("Range", fmt.Sprintf("bytes=%d-%d", start, end-1))
+	if validator != "" {
+		// The server sends the whole resource instead of the range when it has changed.
+		req.Header.Set("If-Range", validator)
+	}
+
+	resp, err := client.Do(req)
+	if err != nil {
+		return 0, err
+	}
+	defer resp.Body.Close()
+
+	if resp.StatusCode != http.StatusPartialContent {
+		return 0, fmt.Errorf("unexpected HTTP %d response to a range request", resp.StatusCode)
+	}
+
+	var r io.Reader = io.LimitReader(resp.Body, end-start)
+	if bar != nil {
+		r = &progressReader{Reader: r, bar: bar}
+	}
+	return io.Copy(w, r)
+}
+
+// unchangedPlugin indicates whether an installed plugin has been downloaded from a resource which is still unchanged.
+//
+// When the expected SHA256 checksum of the resource is known, it is compared to the recorded one. Otherwise a
+// conditional HEAD request is sent with the ETag and Last-Modified date recorded at installation, the resource
+// is unchanged when the server replies with 304 or with the same ETag and Last-Modified date.
+func (m *Manager) unchangedPlugin(url string, installOpts *InstallOpts) bool {
+	data, err := afero.ReadFile(m.fs, filepath.Join(m.pluginsDir(), installOpts.Name, pluginSourceFile))
+	if err != nil {
+		return false
+	}
+	var source pluginSource
+	if err := json.Unmarshal(data, &source); err != nil || source.URL != url {
+		return false
+	}
+	if isSHA256(installOpts.Checksum.Hasher) {
+		return source.SHA256 == strings.ToLower(installOpts.Checksum.Value)
+	}
+	if source.ETag == "" && source.LastModified == "" {
+		return false
+	}
+
+	client, err := m.httpClient(url)
+	if err != nil {
+		return false
+	}
+	req, err := client.NewRequest("HEAD", url, nil, httpclient.FailOnErrStatus(false))
+	if err != nil {
+		return false
+	}
+	if source.ETag != "" {
+		req.Header.Set("If-None-Match", source.ETag)
+	}
+	if source.LastModified != "" {
+		req.Header.Set("If-Modified-Since", source.LastModified)
+	}
+	resp, err := client.Do(req)
+	if err != nil {
+		m.logger.Debugf("Couldn't check whether %s changed: %s", url, err)
+		return false
+	}
+	resp.Body.Close()
+
+	switch resp.StatusCode {
+	case http.StatusNotModified:
+		return true
+	case http.StatusOK:
+		return resp.Header.Get("ETag") == source.ETag && resp.Header.Get("Last-Modified") == source.LastModified
+	default:
+		return false
+	}
+}
+
+// recordSource writes the plugin source into the staging directory, if the plugin comes from a remote resource.
+func (m *Manager) recordSource(installOpts *InstallOpts) error {
+	if installOpts.source == nil {
+		return nil
+	}
+	data, err := json.Marshal(installOpts.source)
+	if err != nil {
+		return err
+	}
+	return afero.WriteFile(m.fs, filepath.Join(installOpts.stagingDir, pluginSourceFile), data, 0644)
+}
+
+// partialLocks are the partial download locks held by this process, for filesystems other than the OS one.
+var partialLocks sync.Map
+
+// partialLockKey identifies a partial download lock.
+type partialLockKey struct {
+	fs   afero.Fs
+	path string
+}
+
+// partialDownloadDir returns the directory holding the segments of a partial download, along with
+// a function to call once the download is over, telling whether it succeeded.
+//
+// The directory is keyed by URL and guarded by a lock file, only the download holding the lock writes
+// to it. Concurrent downloads of the same resource get their own temp directory and don't resume.
+// Segments are discarded when they belong to a different version of the resource.
+func (m *Manager) partialDownloadDir(dl partialDownload) (string, func(succeeded bool), error) {
+	key := sha256.Sum256([]byte(dl.URL))
+	partialDir := filepath.Join(m.tempDir(), "partial", hex.EncodeToString(key[:8]))
+	if m.storeDir != "" {
+		partialDir = filepath.Join(m.storeDir, "partial", hex.EncodeToString(key[:8]))
+	}
+	if err := m.fs.MkdirAll(filepath.Dir(partialDir), 0755); err != nil {
+		return "", nil, err
+	}
+
+	lockPath := partialDir + ".lock"
+	unlock := m.lockPartialDownload(lockPath)
+	if unlock == nil {
+		m.logger.Debugf("%s is being downloaded concurrently, not resuming it", dl.URL)
+		var tmpDir string
+		var err error
+		if m.storeDir != "" {
+			tmpDir, err = m.storeTempDir()
+		} else {
+			tmpDir, err = afero.TempDir(m.fs, m.tempDir(), "dcos-cli")
+		}
+		if err != nil {
+			return "", nil, err
+		}
+		return tmpDir, func(bool) { m.fs.RemoveAll(tmpDir) }, nil
+	}
+	release := func(succeeded bool) {
+		// The lock file is removed before being unlocked, see lockPartialDownload.
+		if succeeded {
+			m.fs.RemoveAll(partialDir)
+			m.fs.Remove(lockPath)
+		}
+		unlock()
+	}
+
+	// Without a validator, there is no way to tell whether existing segments are still valid.
+	descPath := filepath.Join(partialDir, "download.json")
+	var prevDl partialDownload
+	data, err := afero.ReadFile(m.fs, descPath)
+	if err != nil || json.Unmarshal(data, &prevDl) != nil || prevDl != dl || dl.Validator == "" {
+		if err := m.fs.RemoveAll(partialDir); err != nil {
+			unlock()
+			return "", nil, err
+		}
+	} else {
+		m.logger.Debugf("Resuming download of %s", dl.URL)
+	}
+
+	if err := m.fs.MkdirAll(partialDir, 0755); err != nil {
+		unlock()
+		return "", nil, err
+	}
+	data, err = json.Marshal(dl)
+	if err == nil {
+		err = afero.WriteFile(m.fs, descPath, data, 0644)
+	}
+	if err != nil {
+		unlock()
+		return "", nil, err
+	}
+	return partialDir, release, nil
+}
+
+// lockPartialDownload takes the lock of a partial download without waiting.
+// It returns a function releasing the lock, or nil when another download holds it.
+func (m *Manager) lockPartialDownload(lockPath string) func() {
+	if _, ok := m.fs.(*afero.OsFs); !ok {
+		key := partialLockKey{fs: m.fs, path: lockPath}
+		if _, held := partialLocks.LoadOrStore(key, true); held {
+			return nil
+		}
+		return func() { partialLocks.Delete(key) }
+	}
+
+	f, err := os.OpenFile(lockPath, os.O_RDWR|os.O_CREATE, 0644)
+	if err != nil {
+		m.logger.Debug(err)
+		return nil
+	}
+	if !tryLockFile(f) {
+		f.Close()
+		return nil
+	}
+
+	// The lock file might have been removed by the previous holder once its download succeeded,
+	// in which case the lock doesn't guard the partial download directory anymore.
+	lockInfo, err := f.Stat()
+	if err == nil {
+		var pathInfo os.FileInfo
+		pathInfo, err = os.Stat(lockPath)
+		if err == nil && !os.SameFile(lockInfo, pathInfo) {
+			err = os.ErrNotExist
+		}
+	}
+	if err != nil {
+		f.Close()
+		return nil
+	}
+	return func() { f.Close() }
+}
+
+// progressBar adds a download progress bar for a plugin, it returns nil when there is no progress container.
+func (m *Manager) progressBar(installOpts *InstallOpts, total int64) *mpb.Bar {
+	if installOpts.ProgressBar == nil {
+		return nil
+	}
+	return installOpts.ProgressBar.AddBar(
+		total,
+		mpb.PrependDecorators(decor.Name(installOpts.Name)),
+		mpb.AppendDecorators(
+			decor.OnComplete(decor.CountersKibiByte("% 6.1f / % 6.1f"), " plugin is now installed"),
+		),
+		mpb.BarClearOnComplete(),
+	)
+}
+
+// progressReader increments a progress bar as it reads from an io.Reader.
+// Unlike a bar proxy reader, several progress readers can feed the same bar concurrently.
+type progressReader struct {
+	io.Reader
+	bar *mpb.Bar
+}
+
+func (pr *progressReader) Read(p []byte) (n int, err error) {
+	n, err = pr.Reader.Read(p)
+	pr.bar.IncrBy(n)
+	return
+}
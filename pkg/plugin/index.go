@@ -0,0 +1,216 @@
+package plugin
+
+import (
+	"encoding/json"
+	"path/filepath"
+	"sync"
+	"time"
+
+	"github.com/spf13/afero"
+)
+
+// indexVersion is the version of the plugin index format. Indexes with a different version are discarded.
+const indexVersion = 1
+
+// index is a compiled representation of the plugins installed for a cluster.
+//
+// It allows to retrieve plugins without parsing their plugin.toml files. An index is only
+// valid as long as the plugins directory and the plugin.toml files it references are unchanged.
+type index struct {
+	Version    int              `json:"version"`
+	DirModTime int64            `json:"dir_mtime"`
+	Files      map[string]int64 `json:"files"`
+	Plugins    []indexedPlugin  `json:"plugins"`
+}
+
+// indexedPlugin is a plugin as stored in the index.
+type indexedPlugin struct {
+	Name     string    `json:"name"`
+	Commands []Command `json:"commands"`
+	Dir      string    `json:"dir"`
+}
+
+// indexes holds the plugin indexes decoded within the process, by index file. An entry is only used
+// as long as the file isn't modified, this avoids decoding indexes over and over in long-running processes.
+var indexes sync.Map
+
+// indexFileKey identifies an index file.
+type indexFileKey struct {
+	fs   afero.Fs
+	path string
+}
+
+// decodedIndex is an index along with the modification time and size of the file it has been decoded from.
+type decodedIndex struct {
+	modTime time.Time
+	size    int64
+	idx     *index
+}
+
+// cachedPlugins returns the plugins from the index, the boolean is false when the index is missing or stale.
+func (m *Manager) cachedPlugins() ([]*Plugin, bool) {
+	idx, err := m.readIndex()
+	if err != nil {
+		return nil, false
+	}
+	if idx.Version != indexVersion || idx.DirModTime != m.modTime(m.pluginsDir()) {
+		return nil, false
+	}
+	for path, modTime := range idx.Files {
+		if modTime == 0 || modTime != m.modTime(path) {
+			return nil, false
+		}
+	}
+
+	plugins := make([]*Plugin, 0, len(idx.Plugins))
+	for _, p := range idx.Plugins {
+		plugins = append(plugins, &Plugin{
+			Name:     p.Name,
+			Commands: append([]Command(nil), p.Commands...),
+			dir:      p.Dir,
+		})
+	}
+	return plugins, true
+}
+
+// readIndex reads and decodes the plugin index, unless it has already been decoded by the process.
+func (m *Manager) readIndex() (*index, error) {
+	key := indexFileKey{fs: m.fs, path: m.indexPath()}
+	info, err := m.fs.Stat(key.path)
+	if err != nil {
+		return nil, err
+	}
+	if val, ok := indexes.Load(key); ok {
+		decoded := val.(*decodedIndex)
+		if decoded.modTime.Equal(info.ModTime()) && decoded.size == info.Size() {
+			return decoded.idx, nil
+		}
+	}
+
+	data, err := afero.ReadFile(m.fs, key.path)
+	if err != nil {
+		return nil, err
+	}
+	var idx index
+	if err := json.Unmarshal(data, &idx); err != nil {
+		m.logger.Debugf("Couldn't decode plugin index: %s", err)
+		return nil, err
+	}
+	indexes.Store(key, &decodedIndex{modTime: info.ModTime(), size: info.Size(), idx: &idx})
+	return &idx, nil
+}
+
+// indexPlugins loads the plugins from the plugins directory and stores them in the index.
+func (m *Manager) indexPlugins() (plugins []*Plugin) {
+	// The directory modification time is read before loading the plugins,
+	// this way we can detect changes which happened while building the index.
+	idx := index{
+		Version:    indexVersion,
+		DirModTime: m.modTime(m.pluginsDir()),
+		Files:      make(map[string]int64),
+	}
+
+	pluginDirs, err := afero.ReadDir(m.fs, m.pluginsDir())
+	if err != nil {
+		m.logger.Debugf("Couldn't open plugin dir: %s", err)
+		return plugins
+	}
+
+	// Plugins are loaded concurrently, so that their `--info` probes can run in parallel.
+	loadedPlugins := make([]*Plugin, len(pluginDirs))
+	var wg sync.WaitGroup
+	for i, pluginDir := range pluginDirs {
+		if !pluginDir.IsDir() {
+			continue
+		}
+		wg.Add(1)
+		go func(i int, name string) {
+			defer wg.Done()
+			plugin, err := m.loadPlugin(name)
+			if err != nil {
+				// We don't want to see the CLI failing if a single plugin is malformed.
+				// We thus log the error but continue if there is an issue at that step.
+				m.logger.Debugf("Couldn't load plugin: %s", err)
+				return
+			}
+			loadedPlugins[i] = plugin
+		}(i, pluginDir.Name())
+	}
+	wg.Wait()
+
+	for i, pluginDir := range pluginDirs {
+		if !pluginDir.IsDir() {
+			continue
+		}
+
+		// Malformed plugins are also tracked, a fix to their plugin.toml must invalidate the index.
+		pluginFilePath := filepath.Join(m.pluginsDir(), pluginDir.Name(), "env", "plugin.toml")
+		idx.Files[pluginFilePath] = m.modTime(pluginFilePath)
+
+		if plugin := loadedPlugins[i]; plugin != nil {
+			plugins = append(plugins, plugin)
+			idx.Plugins = append(idx.Plugins, indexedPlugin{
+				Name:     plugin.Name,
+				Commands: plugin.Commands,
+				Dir:      plugin.dir,
+			})
+		}
+	}
+
+	if idx.DirModTime != m.modTime(m.pluginsDir()) {
+		m.logger.Debug("Plugins directory changed while indexing, skipping plugin index update")
+		return plugins
+	}
+	if err := m.persistJSON(&idx, m.indexPath()); err != nil {
+		m.logger.Debugf("Couldn't write plugin index: %s", err)
+	}
+	if err := m.persistCompletionIndex(plugins); err != nil {
+		m.logger.Debugf("Couldn't write completion index: %s", err)
+	}
+	return plugins
+}
+
+// persistJSON atomically writes the JSON encoding of a value to a given path.
+func (m *Manager) persistJSON(v interface{}, path string) error {
+	data, err := json.Marshal(v)
+	if err != nil {
+		return err
+	}
+	return m.persistFile(append(data, '\n'), path)
+}
+
+// persistFile atomically writes data to a given path.
+func (m *Manager) persistFile(data []byte, path string) error {
+	if err := m.fs.MkdirAll(m.tempDir(), 0755); err != nil {
+		return err
+	}
+
+	f, err := afero.TempFile(m.fs, m.tempDir(), filepath.Base(path))
+	if err != nil {
+		return err
+	}
+
+	defer m.fs.Remove(f.Name())
+
+	_, err = f.Write(data)
+	f.Close()
+	if err != nil {
+		return err
+	}
+	return m.fs.Rename(f.Name(), path)
+}
+
+// modTime returns the modification time of a file in nanoseconds, or 0 if it can't be determined.
+func (m *Manager) modTime(path string) int64 {
+	fileInfo, err := m.fs.Stat(path)
+	if err != nil {
+		return 0
+	}
+	return fileInfo.ModTime().UnixNano()
+}
+
+// indexPath returns the path to the plugin index. It lives next to the plugins directory
+// rather than inside, otherwise writing it would change the directory modification time.
+func (m *Manager) indexPath() string {
+	return filepath.Join(m.cluster.Dir(), "subcommands.index")
+}
@@ -0,0 +1,145 @@
+package plugin
+
+import (
+	"context"
+	"encoding/json"
+	"os/exec"
+	"path/filepath"
+	"strings"
+	"sync"
+	"time"
+
+	"github.com/spf13/afero"
+)
+
+const (
+	// infoProbeTimeout is the maximum duration of a `--info` probe.
+	infoProbeTimeout = 5 * time.Second
+
+	// infoProbeWorkers is the maximum number of `--info` probes running concurrently.
+	infoProbeWorkers = 4
+)
+
+// infoCacheEntry is the `--info` summary of a command binary.
+//
+// The binary size and modification time are stored alongside the summary,
+// an entry is only used when they match the binary on the filesystem.
+type infoCacheEntry struct {
+	Size        int64  `json:"size"`
+	ModTime     int64  `json:"mtime"`
+	Description string `json:"description"`
+}
+
+// infoCache holds the `--info` summaries of command binaries, indexed by binary path.
+type infoCache struct {
+	mu      sync.Mutex
+	entries map[string]infoCacheEntry
+}
+
+// describeCommands sets the description of commands which don't have one.
+//
+// Descriptions are read from the info cache, or retrieved by invoking command binaries with the `--info` flag.
+// Binaries are invoked concurrently, with a bounded number of workers and a timeout for each invocation.
+func (m *Manager) describeCommands(commands []Command) {
+	cache := m.loadInfoCache()
+
+	var wg sync.WaitGroup
+	var updated bool
+	for i := range commands {
+		if commands[i].Description != "" {
+			continue
+		}
+
+		var entry infoCacheEntry
+		if fileInfo, err := m.fs.Stat(commands[i].Path); err == nil {
+			entry.Size = fileInfo.Size()
+			entry.ModTime = fileInfo.ModTime().UnixNano()
+		}
+
+		cache.mu.Lock()
+		cachedEntry, ok := cache.entries[commands[i].Path]
+		cache.mu.Unlock()
+		if ok && cachedEntry.Size == entry.Size && cachedEntry.ModTime == entry.ModTime {
+			commands[i].Description = cachedEntry.Description
+			continue
+		}
+
+		wg.Add(1)
+		go func(cmd *Command, entry infoCacheEntry) {
+			defer wg.Done()
+
+			m.infoProbes <- struct{}{}
+			cmd.Description = m.commandDescription(*cmd)
+			<-m.infoProbes
+
+			// Failed probes are cached as well, a broken binary is only invoked again once it gets updated.
+			if entry.ModTime != 0 {
+				entry.Description = cmd.Description
+				cache.mu.Lock()
+				cache.entries[cmd.Path] = entry
+				updated = true
+				cache.mu.Unlock()
+			}
+		}(&commands[i], entry)
+	}
+	wg.Wait()
+
+	if updated {
+		if err := m.persistInfoCache(cache); err != nil {
+			m.logger.Debugf("Couldn't write info cache: %s", err)
+		}
+	}
+}
+
+// commandDescription gets the command info summary by invoking the binary with the `--info` flag.
+func (m *Manager) commandDescription(cmd Command) (desc string) {
+	ctx, cancel := context.WithTimeout(context.Background(), infoProbeTimeout)
+	defer cancel()
+
+	infoCmd, err := exec.CommandContext(ctx, cmd.Path, cmd.Name, "--info").Output() // nolint: gosec
+	if err != nil {
+		m.logger.Debugf("Couldn't get info summary for the '%s' command: %s", cmd.Name, err)
+	} else {
+		desc = strings.TrimSpace(string(infoCmd))
+	}
+	return desc
+}
+
+// loadInfoCache returns the info cache for the current cluster, reading it from the filesystem on first use.
+func (m *Manager) loadInfoCache() *infoCache {
+	m.infoCacheMu.Lock()
+	defer m.infoCacheMu.Unlock()
+
+	if m.infoCache != nil {
+		return m.infoCache
+	}
+	m.infoCache = &infoCache{entries: make(map[string]infoCacheEntry)}
+
+	data, err := afero.ReadFile(m.fs, m.infoCachePath())
+	if err != nil {
+		return m.infoCache
+	}
+	if err := json.Unmarshal(data, &m.infoCache.entries); err != nil {
+		m.logger.Debugf("Couldn't decode info cache: %s", err)
+		m.infoCache.entries = make(map[string]infoCacheEntry)
+	}
+	return m.infoCache
+}
+
+// persistInfoCache writes the info cache to the filesystem. Entries for binaries which don't exist anymore are pruned.
+func (m *Manager) persistInfoCache(cache *infoCache) error {
+	cache.mu.Lock()
+	defer cache.mu.Unlock()
+
+	for path := range cache.entries {
+		if exists, _ := afero.Exists(m.fs, path); !exists {
+			delete(cache.entries, path)
+		}
+	}
+	return m.persistJSON(cache.entries, m.infoCachePath())
+}
+
+// infoCachePath returns the path to the info cache.
+func (m *Manager) infoCachePath() string {
+	return filepath.Join(m.cluster.Dir(), "subcommands.info")
+}
@@ -0,0 +1,11 @@
+//go:build !linux && !darwin && !windows
+// +build !linux,!darwin,!windows
+
+package plugin
+
+import "os"
+
+// tryLockFile always fails as file locks aren't supported on this platform.
+func tryLockFile(f *os.File) bool {
+	return false
+}
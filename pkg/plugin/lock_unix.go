@@ -0,0 +1,14 @@
+//go:build linux || darwin
+// +build linux darwin
+
+package plugin
+
+import (
+	"os"
+	"syscall"
+)
+
+// tryLockFile takes an exclusive lock on a file without waiting, it is released when the file is closed.
+func tryLockFile(f *os.File) bool {
+	return syscall.Flock(int(f.Fd()), syscall.LOCK_EX|syscall.LOCK_NB) == nil
+}
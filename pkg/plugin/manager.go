@@ -4,19 +4,18 @@ package plugin
 
 import (
 	"crypto/tls"
-	"encoding/hex"
 	"fmt"
 	"hash"
 	"io"
 	"mime"
 	"net/http"
 	"os"
-	"os/exec"
 	"path"
 	"path/filepath"
 	"reflect"
 	"runtime"
 	"strings"
+	"sync"
 
 	"github.com/dcos/dcos-cli/pkg/config"
 	"github.com/dcos/dcos-cli/pkg/fsutil"
@@ -25,7 +24,6 @@ import (
 	"github.com/sirupsen/logrus"
 	"github.com/spf13/afero"
 	"github.com/vbauerster/mpb"
-	"github.com/vbauerster/mpb/decor"
 )
 
 // ExistError indicates that a plugin installation failed because it's already installed.
@@ -36,16 +34,21 @@ type ExistError struct {
 // Manager retrieves the plugins available for the current cluster
 // by navigating into the filesystem.
 type Manager struct {
-	fs      afero.Fs
-	logger  *logrus.Logger
-	cluster *config.Cluster
+	fs          afero.Fs
+	logger      *logrus.Logger
+	cluster     *config.Cluster
+	infoProbes  chan struct{}
+	infoCache   *infoCache
+	infoCacheMu sync.Mutex
+	storeDir    string
 }
 
 // NewManager returns a new plugin manager.
 func NewManager(fs afero.Fs, logger *logrus.Logger) *Manager {
 	return &Manager{
-		fs:     fs,
-		logger: logger,
+		fs:         fs,
+		logger:     logger,
+		infoProbes: make(chan struct{}, infoProbeWorkers),
 	}
 }
 
@@ -57,6 +60,10 @@ type InstallOpts struct {
 	// Update allows to potentially overwrite an already existing plugin of the same name.
 	Update bool
 
+	// SkipUnchanged skips the installation when the plugin is already installed from the same remote
+	// resource and the resource didn't change since then. The installed plugin is then returned.
+	SkipUnchanged bool
+
 	// Checksum represents a CLI plugin resource content hash.
 	Checksum Checksum
 
@@ -68,6 +75,12 @@ type InstallOpts struct {
 
 	path       string
 	stagingDir string
+
+	// digest is the SHA256 digest of the resource, it is only set for resources in the plugin store.
+	digest string
+
+	// source describes the remote resource the plugin is installed from.
+	source *pluginSource
 }
 
 // Checksum contains the hash function and the checksum we expect from a plugin.
@@ -81,12 +94,23 @@ func (m *Manager) Install(resource string, installOpts *InstallOpts) (plugin *Pl
 	// If it's a remote resource, download it first.
 	m.logger.Infof("Installing plugin from %s...", resource)
 	if strings.HasPrefix(resource, "https://") || strings.HasPrefix(resource, "http://") {
-		installOpts.path, err = m.downloadPlugin(resource, installOpts)
+		if installOpts.SkipUnchanged && installOpts.Name != "" && m.unchangedPlugin(resource, installOpts) {
+			plugin, err := m.loadPlugin(installOpts.Name)
+			if err == nil {
+				m.logger.Infof("%s is already up-to-date", installOpts.Name)
+				return plugin, nil
+			}
+			m.logger.Debug(err)
+		}
+
+		installOpts.path, err = m.fetchPlugin(resource, installOpts)
 		if err != nil {
 			return nil, err
 		}
-		// Remove the downloaded resource from the temp dir at the end of installation.
-		defer m.fs.RemoveAll(filepath.Dir(installOpts.path))
+		if installOpts.digest == "" {
+			// Remove the downloaded resource from the temp dir at the end of installation.
+			defer m.fs.RemoveAll(filepath.Dir(installOpts.path))
+		}
 	} else {
 		installOpts.path = resource
 	}
@@ -118,16 +142,36 @@ func (m *Manager) Install(resource string, installOpts *InstallOpts) (plugin *Pl
 	if err != nil {
 		return nil, err
 	}
+	if err := m.recordSource(installOpts); err != nil {
+		return nil, err
+	}
 	err = m.installPlugin(installOpts)
 	if err != nil {
 		return nil, err
 	}
-	return m.loadPlugin(installOpts.Name)
+	if installOpts.digest != "" {
+		pluginDir := filepath.Join(m.pluginsDir(), installOpts.Name)
+		if err := m.addStoreRef(installOpts.digest, pluginDir); err != nil {
+			m.logger.Debugf("Couldn't add plugin store reference: %s", err)
+		}
+	}
+	m.gcStore()
+
+	plugin, err = m.loadPlugin(installOpts.Name)
+	if err != nil {
+		return nil, err
+	}
+	m.indexPlugins()
+	return plugin, nil
 }
 
 // SetCluster sets the plugin manager's target cluster.
 func (m *Manager) SetCluster(cluster *config.Cluster) {
+	m.infoCacheMu.Lock()
+	defer m.infoCacheMu.Unlock()
+
 	m.cluster = cluster
+	m.infoCache = nil
 }
 
 // Remove removes a plugin from the filesystem.
@@ -144,32 +188,21 @@ func (m *Manager) Remove(name string) error {
 	if err != nil {
 		return err
 	}
+	m.gcStore()
+	m.indexPlugins()
 	m.logger.Infof("Removed %s as a plugin from the CLI", name)
 	return nil
 }
 
 // Plugins returns the plugins associated with the current cluster.
-func (m *Manager) Plugins() (plugins []*Plugin) {
-	pluginDirs, err := afero.ReadDir(m.fs, m.pluginsDir())
-	if err != nil {
-		m.logger.Debugf("Couldn't open plugin dir: %s", err)
+//
+// Plugins are read from the plugin index when it is up-to-date, otherwise
+// they are loaded from their plugin.toml files and the index is rebuilt.
+func (m *Manager) Plugins() []*Plugin {
+	if plugins, ok := m.cachedPlugins(); ok {
 		return plugins
 	}
-
-	for _, pluginDir := range pluginDirs {
-		if !pluginDir.IsDir() {
-			continue
-		}
-		plugin, err := m.loadPlugin(pluginDir.Name())
-		if err != nil {
-			// We don't want to see the CLI failing if a single plugin is malformed.
-			// We thus log the error but continue if there is an issue at that step.
-			m.logger.Debugf("Couldn't load plugin: %s", err)
-			continue
-		}
-		plugins = append(plugins, plugin)
-	}
-	return plugins
+	return m.indexPlugins()
 }
 
 // Plugin finds a plugin identified by a given name.
@@ -210,13 +243,10 @@ func (m *Manager) loadPlugin(name string) (*Plugin, error) {
 	// Normalize plugin commands by putting binary full paths and description summaries.
 	for i, cmd := range plugin.Commands {
 		if !filepath.IsAbs(cmd.Path) {
-			cmd.Path = filepath.Join(pluginPath, cmd.Path)
-		}
-		if cmd.Description == "" {
-			cmd.Description = m.commandDescription(cmd)
+			plugin.Commands[i].Path = filepath.Join(pluginPath, cmd.Path)
 		}
-		plugin.Commands[i] = cmd
 	}
+	m.describeCommands(plugin.Commands)
 
 	// Compare the normalized plugin with the saved copy to know whether or not the file should be updated.
 	if !reflect.DeepEqual(persistedPlugin, plugin) {
@@ -265,17 +295,6 @@ func (m *Manager) findCommands(pluginDir string) (commands []Command) {
 	return commands
 }
 
-// commandDescription gets the command info summary by invoking the binary with the `--info` flag.
-func (m *Manager) commandDescription(cmd Command) (desc string) {
-	infoCmd, err := exec.Command(cmd.Path, cmd.Name, "--info").Output() // nolint: gosec
-	if err != nil {
-		m.logger.Debugf("Couldn't get info summary for the '%s' command: %s", cmd.Name, err)
-	} else {
-		desc = strings.TrimSpace(string(infoCmd))
-	}
-	return desc
-}
-
 // unmarshalPlugin unmarshals a `plugin.toml` file into a Plugin structure.
 func (m *Manager) unmarshalPlugin(plugin *Plugin, path string) error {
 	data, err := afero.ReadFile(m.fs, path)
@@ -316,62 +335,6 @@ func (m *Manager) tempDir() string {
 	return filepath.Join(m.cluster.Dir(), "tmp")
 }
 
-// downloadPlugin downloads a plugin and returns the path to the temporary file it stored it to.
-func (m *Manager) downloadPlugin(url string, installOpts *InstallOpts) (string, error) {
-	tmpDir, err := afero.TempDir(m.fs, os.TempDir(), "dcos-cli")
-	if err != nil {
-		return "", err
-	}
-
-	client, err := m.httpClient(url)
-	if err != nil {
-		return "", err
-	}
-	resp, err := client.Get(url)
-	if err != nil {
-		return "", err
-	}
-	defer resp.Body.Close()
-
-	downloadedFilePath := filepath.Join(tmpDir, m.downloadFilename(resp))
-
-	var respReader io.Reader
-	if installOpts.Checksum.Hasher != nil {
-		respReader = io.TeeReader(resp.Body, installOpts.Checksum.Hasher)
-	} else {
-		respReader = resp.Body
-	}
-
-	if installOpts.ProgressBar != nil {
-		bar := installOpts.ProgressBar.AddBar(
-			resp.ContentLength,
-			mpb.PrependDecorators(decor.Name(installOpts.Name)),
-			mpb.AppendDecorators(
-				decor.OnComplete(decor.CountersKibiByte("% 6.1f / % 6.1f"), " plugin is now installed"),
-			),
-			mpb.BarClearOnComplete(),
-		)
-		if resp.ContentLength > 0 {
-			respReader = bar.ProxyReader(respReader)
-		} else {
-			respReader = newStreamReader(respReader, bar)
-		}
-	}
-
-	if err := fsutil.CopyReader(m.fs, respReader, downloadedFilePath, 0644); err != nil {
-		return "", err
-	}
-
-	if installOpts.Checksum.Hasher != nil {
-		m.logger.Debugf("Verifying checksum for %s...", url)
-		computedChecksum := hex.EncodeToString(installOpts.Checksum.Hasher.Sum(nil))
-		if computedChecksum != installOpts.Checksum.Value {
-			return "", fmt.Errorf("computed checksum %s for %s, expected %s", computedChecksum, url, installOpts.Checksum.Value)
-		}
-	}
-	return downloadedFilePath, nil
-}
-
 // downloadFilename picks a filename for the resource to download. It first reads the
 // `Content-Disposition` header, when not set it defaults to the URL path basename.
 func (m *Manager) downloadFilename(resp *http.Response) string {
@@ -400,7 +363,20 @@ func (m *Manager) buildPlugin(installOpts *InstallOpts) error {
 	switch contentType {
 	case "application/zip":
 		// Unzip the plugin into the staging dir and validate its plugin.toml, if any.
-		if err := fsutil.Unzip(m.fs, installOpts.path, envDir); err != nil {
+		// Plugins from the store are extracted once, then linked into the staging dir.
+		if installOpts.digest != "" {
+			treeDir, err := m.storedTree(installOpts.path, installOpts.digest)
+			if err != nil {
+				return err
+			}
+			if err := m.linkTree(treeDir, envDir); err != nil {
+				return err
+			}
+			digestPath := filepath.Join(installOpts.stagingDir, storeDigestFile)
+			if err := afero.WriteFile(m.fs, digestPath, []byte(installOpts.digest), 0644); err != nil {
+				return err
+			}
+		} else if err := fsutil.Unzip(m.fs, installOpts.path, envDir); err != nil {
 			return err
 		}
 		pluginFilePath := filepath.Join(envDir, "plugin.toml")
@@ -500,6 +476,7 @@ func (m *Manager) httpClient(url string) (*httpclient.Client, error) {
 			httpclient.TLS(&tls.Config{
 				InsecureSkipVerify: clusterTLS.Insecure, // nolint: gosec
 				RootCAs:            clusterTLS.RootCAs,
+				ClientSessionCache: httpclient.SessionCache(m.cluster.Dir()),
 			}),
 		)
 	}
@@ -1,9 +1,25 @@
 package plugin
 
 import (
+	"archive/zip"
+	"bytes"
+	"crypto/rand"
+	"crypto/sha256"
+	"encoding/hex"
+	"encoding/json"
+	"fmt"
+	"io/ioutil"
+	"net/http"
+	"net/http/httptest"
 	"os"
 	"path/filepath"
+	"runtime"
+	"strconv"
+	"strings"
+	"sync"
+	"sync/atomic"
 	"testing"
+	"time"
 
 	"github.com/dcos/dcos-cli/pkg/config"
 	"github.com/sirupsen/logrus/hooks/test"
@@ -68,6 +84,103 @@ func TestLoadPluginWithMultipleCommands(t *testing.T) {
 	require.Equal(t, []string{"no-test", "test"}, plugins[0].CommandNames())
 }
 
+func TestLoadPluginsFromIndex(t *testing.T) {
+	pm := pluginManager(t, "multiple_commands")
+	require.Equal(t, 1, len(pm.Plugins()))
+
+	// The first load normalizes the plugin.toml file, which touches the plugins directory
+	// in the copy-on-write filesystem. The index should be written on the next load.
+	plugins := pm.Plugins()
+	require.Equal(t, 1, len(plugins))
+	data, err := afero.ReadFile(pm.fs, pm.indexPath())
+	require.NoError(t, err)
+
+	var idx index
+	require.NoError(t, json.Unmarshal(data, &idx))
+	require.Equal(t, 1, len(idx.Plugins))
+
+	// Tweak the index, this makes sure plugins are read from it when it's up-to-date.
+	idx.Plugins[0].Commands[0].Description = "This is an indexed test"
+	require.NoError(t, pm.persistJSON(&idx, pm.indexPath()))
+
+	plugins = pm.Plugins()
+	require.Equal(t, 1, len(plugins))
+	require.Equal(t, "This is an indexed test", plugins[0].Commands[0].Description)
+	require.Equal(t, filepath.Join(pm.pluginsDir(), "toml", "env"), plugins[0].Dir())
+
+	// The decoded index is kept by the process, plugins don't share their commands with it.
+	plugins[0].Commands[0].Description = "This is a modified test"
+	plugins = pm.Plugins()
+	require.Equal(t, "This is an indexed test", plugins[0].Commands[0].Description)
+	_, ok := indexes.Load(indexFileKey{fs: pm.fs, path: pm.indexPath()})
+	require.True(t, ok)
+
+	// Updating a plugin.toml file invalidates the index.
+	pluginFilePath := filepath.Join(pm.pluginsDir(), "toml", "env", "plugin.toml")
+	future := time.Now().Add(time.Hour)
+	require.NoError(t, pm.fs.Chtimes(pluginFilePath, future, future))
+
+	plugins = pm.Plugins()
+	require.Equal(t, 1, len(plugins))
+	require.Equal(t, "This is a test", plugins[0].Commands[0].Description)
+}
+
+func TestCompletionIndex(t *testing.T) {
+	pm := pluginManager(t, "multiple_commands")
+
+	completionDir := filepath.Join(pm.pluginsDir(), "toml", "env", "completion", "bash")
+	require.NoError(t, pm.fs.MkdirAll(completionDir, 0755))
+	require.NoError(t, afero.WriteFile(pm.fs, filepath.Join(completionDir, "toml.sh"), nil, 0644))
+	require.NoError(t, afero.WriteFile(pm.fs, filepath.Join(completionDir, "README"), nil, 0644))
+	require.NoError(t, pm.UpdateCompletionIndex())
+
+	data, err := afero.ReadFile(pm.fs, filepath.Join(pm.cluster.Dir(), config.CompletionIndexFile))
+	require.NoError(t, err)
+
+	var expected []string
+	expected = append(expected, "plugin\ttoml")
+	for _, command := range pm.Plugins()[0].Commands {
+		expected = append(expected, "command\t"+command.Name)
+	}
+	expected = append(expected, "script\t"+filepath.Join(completionDir, "toml.sh"), "")
+	require.Equal(t, strings.Join(expected, "\n"), string(data))
+}
+
+func TestDescribeCommandsFromInfoCache(t *testing.T) {
+	if runtime.GOOS == "windows" {
+		t.Skip("the command binary is a shell script")
+	}
+
+	dir, err := ioutil.TempDir("", "dcos-cli")
+	require.NoError(t, err)
+	defer os.RemoveAll(dir)
+
+	// The binary appends a line to a file each time it's invoked.
+	callsPath := filepath.Join(dir, "calls")
+	binPath := filepath.Join(dir, "dcos-hello")
+	script := "#!/bin/sh\necho called >> " + callsPath + "\necho Say hello\n"
+	require.NoError(t, ioutil.WriteFile(binPath, []byte(script), 0755))
+
+	fs := afero.NewOsFs()
+	logger, _ := test.NewNullLogger()
+	conf := config.New(config.Opts{Fs: fs})
+	conf.SetPath(filepath.Join(dir, "dcos.toml"))
+
+	for i := 0; i < 2; i++ {
+		// A new manager is used each time, this makes sure the cache is persisted.
+		pm := NewManager(fs, logger)
+		pm.SetCluster(config.NewCluster(conf))
+
+		commands := []Command{{Name: "hello", Path: binPath}}
+		pm.describeCommands(commands)
+		require.Equal(t, "Say hello", commands[0].Description)
+
+		calls, err := ioutil.ReadFile(callsPath)
+		require.NoError(t, err)
+		require.Equal(t, "called\n", string(calls))
+	}
+}
+
 func pluginManager(t *testing.T, name string) *Manager {
 	baseFs := afero.NewOsFs()
 	baseRoFs := afero.NewReadOnlyFs(baseFs)
@@ -89,3 +202,376 @@ func pluginManager(t *testing.T, name string) *Manager {
 	pluginManager.SetCluster(config.NewCluster(conf))
 	return pluginManager
 }
+
+func TestInstallFromStore(t *testing.T) {
+	if runtime.GOOS == "windows" {
+		t.Skip("the command binary is a shell script")
+	}
+
+	archive := helloArchive(t)
+	digest := sha256.Sum256(archive)
+
+	var downloads int
+	ts := httptest.NewServer(http.HandlerFunc(func(w http.ResponseWriter, r *http.Request) {
+		if r.Method == "GET" {
+			downloads++
+		}
+		w.Write(archive)
+	}))
+	defer ts.Close()
+
+	dir, err := ioutil.TempDir("", "dcos-cli")
+	require.NoError(t, err)
+	defer os.RemoveAll(dir)
+
+	fs := afero.NewOsFs()
+	logger, _ := test.NewNullLogger()
+
+	var managers []*Manager
+	for _, id := range []string{"cluster-a", "cluster-b"} {
+		conf := config.New(config.Opts{Fs: fs})
+		conf.SetPath(filepath.Join(dir, "clusters", id, "dcos.toml"))
+
+		pm := NewManager(fs, logger)
+		pm.SetCluster(config.NewCluster(conf))
+		pm.SetStoreDir(filepath.Join(dir, "store"))
+		managers = append(managers, pm)
+
+		plugin, err := pm.Install(ts.URL+"/hello.zip", &InstallOpts{
+			Name: "hello",
+			Checksum: Checksum{
+				Hasher: sha256.New(),
+				Value:  hex.EncodeToString(digest[:]),
+			},
+		})
+		require.NoError(t, err)
+		require.Equal(t, "Say hello", plugin.Commands[0].Description)
+	}
+
+	// The archive is only downloaded once, and binaries are linked to the store.
+	require.Equal(t, 1, downloads)
+	treeBinary, err := os.Stat(filepath.Join(dir, "store", "trees", hex.EncodeToString(digest[:]), "bin", "dcos-hello"))
+	require.NoError(t, err)
+	for _, pm := range managers {
+		binary, err := os.Stat(filepath.Join(pm.pluginsDir(), "hello", "env", "bin", "dcos-hello"))
+		require.NoError(t, err)
+		require.True(t, os.SameFile(treeBinary, binary))
+	}
+
+	defer func(gracePeriod time.Duration) {
+		storeGracePeriod = gracePeriod
+	}(storeGracePeriod)
+	storeGracePeriod = 0
+
+	// The store entry is kept as long as a plugin references it.
+	require.NoError(t, managers[0].Remove("hello"))
+	require.DirExists(t, filepath.Join(dir, "store", "trees", hex.EncodeToString(digest[:])))
+
+	require.NoError(t, managers[1].Remove("hello"))
+	require.NoDirExists(t, filepath.Join(dir, "store", "trees", hex.EncodeToString(digest[:])))
+	require.NoDirExists(t, filepath.Join(dir, "store", "blobs", hex.EncodeToString(digest[:])))
+}
+
+func TestInstallFromStoreBySource(t *testing.T) {
+	if runtime.GOOS == "windows" {
+		t.Skip("the command binary is a shell script")
+	}
+
+	archive := helloArchive(t)
+	etag := `"v1"`
+
+	var downloads int
+	ts := httptest.NewServer(http.HandlerFunc(func(w http.ResponseWriter, r *http.Request) {
+		if r.Method == "GET" {
+			downloads++
+		}
+		w.Header().Set("ETag", etag)
+		w.Write(archive)
+	}))
+	defer ts.Close()
+
+	dir, err := ioutil.TempDir("", "dcos-cli")
+	require.NoError(t, err)
+	defer os.RemoveAll(dir)
+
+	fs := afero.NewOsFs()
+	logger, _ := test.NewNullLogger()
+
+	install := func(clusterID string) {
+		conf := config.New(config.Opts{Fs: fs})
+		conf.SetPath(filepath.Join(dir, "clusters", clusterID, "dcos.toml"))
+
+		pm := NewManager(fs, logger)
+		pm.SetCluster(config.NewCluster(conf))
+		pm.SetStoreDir(filepath.Join(dir, "store"))
+
+		plugin, err := pm.Install(ts.URL+"/hello.zip", &InstallOpts{Name: "hello"})
+		require.NoError(t, err)
+		require.Equal(t, "Say hello", plugin.Commands[0].Description)
+	}
+
+	// Without a checksum, the archive is found in the store through its URL and ETag.
+	install("cluster-a")
+	install("cluster-b")
+	require.Equal(t, 1, downloads)
+
+	// It is downloaded again once the ETag changes.
+	etag = `"v2"`
+	install("cluster-c")
+	require.Equal(t, 2, downloads)
+}
+
+// helloArchive returns a plugin ZIP archive with a dcos-hello binary.
+func helloArchive(t *testing.T) []byte {
+	var archive bytes.Buffer
+	zw := zip.NewWriter(&archive)
+	header := &zip.FileHeader{Name: "bin/dcos-hello", Method: zip.Store}
+	header.SetMode(0755)
+	f, err := zw.CreateHeader(header)
+	require.NoError(t, err)
+	_, err = f.Write([]byte("#!/bin/sh\necho Say hello\n"))
+	require.NoError(t, err)
+	require.NoError(t, zw.Close())
+	return archive.Bytes()
+}
+
+func TestDownloadPluginResumesSegments(t *testing.T) {
+	content := make([]byte, 4*minSegmentSize+123)
+	_, err := rand.Read(content)
+	require.NoError(t, err)
+	digest := sha256.Sum256(content)
+
+	// The last segment is interrupted halfway as long as the server is failing.
+	failing := true
+	var servedBytes int64
+	var mu sync.Mutex
+	lastSegmentStart := 3 * ((int64(len(content)) + downloadSegments - 1) / downloadSegments)
+	ts := httptest.NewServer(http.HandlerFunc(func(w http.ResponseWriter, r *http.Request) {
+		mu.Lock()
+		isFailing := failing
+		mu.Unlock()
+
+		w.Header().Set("ETag", `"v1"`)
+		var start int64
+		fmt.Sscanf(r.Header.Get("Range"), "bytes=%d-", &start)
+		if isFailing && start >= lastSegmentStart {
+			w.Header().Set("Content-Range", fmt.Sprintf("bytes %d-%d/%d", start, len(content)-1, len(content)))
+			w.Header().Set("Content-Length", strconv.FormatInt(int64(len(content))-start, 10))
+			w.WriteHeader(http.StatusPartialContent)
+			w.Write(content[start : start+100])
+			w.(http.Flusher).Flush()
+			panic(http.ErrAbortHandler)
+		}
+		cw := &countingWriter{ResponseWriter: w, n: &servedBytes}
+		http.ServeContent(cw, r, "plugin.zip", time.Time{}, bytes.NewReader(content))
+	}))
+	defer ts.Close()
+
+	fs := afero.NewMemMapFs()
+	logger, _ := test.NewNullLogger()
+	conf := config.New(config.Opts{Fs: fs})
+	conf.SetPath(filepath.Join("/clusters", "cluster-a", "dcos.toml"))
+
+	pm := NewManager(fs, logger)
+	pm.SetCluster(config.NewCluster(conf))
+
+	download := func(installOpts *InstallOpts) (string, error) {
+		client, err := pm.httpClient(ts.URL + "/plugin.zip")
+		require.NoError(t, err)
+		head := pm.headResource(client, ts.URL+"/plugin.zip")
+		return pm.downloadPlugin(client, ts.URL+"/plugin.zip", head, installOpts)
+	}
+
+	_, err = download(&InstallOpts{})
+	require.Error(t, err)
+
+	mu.Lock()
+	failing = false
+	mu.Unlock()
+	atomic.StoreInt64(&servedBytes, 0)
+
+	path, err := download(&InstallOpts{
+		Checksum: Checksum{
+			Hasher: sha256.New(),
+			Value:  hex.EncodeToString(digest[:]),
+		},
+	})
+	require.NoError(t, err)
+
+	data, err := afero.ReadFile(fs, path)
+	require.NoError(t, err)
+	require.Equal(t, content, data)
+
+	// Only the missing part of the last segment is downloaded again,
+	// each attempt of the failed download fetched 100 bytes.
+	require.Equal(t, int64(len(content))-lastSegmentStart-segmentAttempts*100, atomic.LoadInt64(&servedBytes))
+}
+
+func TestDownloadPluginConcurrently(t *testing.T) {
+	content := make([]byte, 4*minSegmentSize+123)
+	_, err := rand.Read(content)
+	require.NoError(t, err)
+	digest := sha256.Sum256(content)
+
+	// Range requests are served once all downloads have started.
+	const downloads = 4
+	var heads int32
+	started := make(chan struct{})
+	ts := httptest.NewServer(http.HandlerFunc(func(w http.ResponseWriter, r *http.Request) {
+		if r.Method == "HEAD" {
+			if atomic.AddInt32(&heads, 1) == downloads {
+				close(started)
+			}
+		} else {
+			<-started
+		}
+		w.Header().Set("ETag", `"v1"`)
+		http.ServeContent(w, r, "plugin.zip", time.Time{}, bytes.NewReader(content))
+	}))
+	defer ts.Close()
+
+	dir, err := ioutil.TempDir("", "dcos-cli")
+	require.NoError(t, err)
+	defer os.RemoveAll(dir)
+
+	fs := afero.NewOsFs()
+	logger, _ := test.NewNullLogger()
+
+	var wg sync.WaitGroup
+	paths := make([]string, downloads)
+	errs := make([]error, downloads)
+	for i := 0; i < downloads; i++ {
+		conf := config.New(config.Opts{Fs: fs})
+		conf.SetPath(filepath.Join(dir, "clusters", fmt.Sprintf("cluster-%d", i), "dcos.toml"))
+
+		pm := NewManager(fs, logger)
+		pm.SetCluster(config.NewCluster(conf))
+		pm.SetStoreDir(filepath.Join(dir, "store"))
+
+		wg.Add(1)
+		go func(i int) {
+			defer wg.Done()
+			client, err := pm.httpClient(ts.URL + "/plugin.zip")
+			if err != nil {
+				errs[i] = err
+				return
+			}
+			head := pm.headResource(client, ts.URL+"/plugin.zip")
+			paths[i], errs[i] = pm.downloadPlugin(client, ts.URL+"/plugin.zip", head, &InstallOpts{
+				Checksum: Checksum{
+					Hasher: sha256.New(),
+					Value:  hex.EncodeToString(digest[:]),
+				},
+			})
+		}(i)
+	}
+	wg.Wait()
+
+	for i := 0; i < downloads; i++ {
+		require.NoError(t, errs[i])
+		data, err := ioutil.ReadFile(paths[i])
+		require.NoError(t, err)
+		require.Equal(t, content, data)
+	}
+
+	// Nothing is left in the partial downloads directory.
+	partials, err := ioutil.ReadDir(filepath.Join(dir, "store", "partial"))
+	require.NoError(t, err)
+	require.Empty(t, partials)
+}
+
+// countingWriter is an HTTP response writer counting the body bytes it writes.
+type countingWriter struct {
+	http.ResponseWriter
+	n *int64
+}
+
+func (cw *countingWriter) Write(p []byte) (int, error) {
+	n, err := cw.ResponseWriter.Write(p)
+	atomic.AddInt64(cw.n, int64(n))
+	return n, err
+}
+
+func TestInstallSkipUnchanged(t *testing.T) {
+	if runtime.GOOS == "windows" {
+		t.Skip("the command binary is a shell script")
+	}
+
+	content := []byte("#!/bin/sh\necho Say hello\n")
+	etag := `"v1"`
+	var downloads int
+	ts := httptest.NewServer(http.HandlerFunc(func(w http.ResponseWriter, r *http.Request) {
+		if r.Method == "GET" {
+			downloads++
+		}
+		w.Header().Set("ETag", etag)
+		http.ServeContent(w, r, "dcos-hello", time.Time{}, bytes.NewReader(content))
+	}))
+	defer ts.Close()
+
+	dir, err := ioutil.TempDir("", "dcos-cli")
+	require.NoError(t, err)
+	defer os.RemoveAll(dir)
+
+	fs := afero.NewOsFs()
+	logger, _ := test.NewNullLogger()
+	conf := config.New(config.Opts{Fs: fs})
+	conf.SetPath(filepath.Join(dir, "clusters", "cluster-a", "dcos.toml"))
+
+	pm := NewManager(fs, logger)
+	pm.SetCluster(config.NewCluster(conf))
+
+	install := func() {
+		plugin, err := pm.Install(ts.URL+"/dcos-hello", &InstallOpts{
+			Name:          "hello",
+			Update:        true,
+			SkipUnchanged: true,
+		})
+		require.NoError(t, err)
+		require.Equal(t, "hello", plugin.Commands[0].Name)
+	}
+
+	install()
+	require.Equal(t, 1, downloads)
+
+	// The resource ETag didn't change, the plugin isn't downloaded again.
+	install()
+	require.Equal(t, 1, downloads)
+
+	etag = `"v2"`
+	install()
+	require.Equal(t, 2, downloads)
+}
+
+func BenchmarkPlugins(b *testing.B) {
+	for _, n := range []int{1, 10, 100} {
+		b.Run(fmt.Sprintf("plugins=%d", n), func(b *testing.B) {
+			fs := afero.NewMemMapFs()
+			logger, _ := test.NewNullLogger()
+
+			conf := config.New(config.Opts{Fs: fs})
+			conf.SetPath("/clusters/1234/dcos.toml")
+			require.NoError(b, conf.Persist())
+
+			pm := NewManager(fs, logger)
+			pm.SetCluster(config.NewCluster(conf))
+			for i := 0; i < n; i++ {
+				pluginTOML := fmt.Sprintf(
+					"name = \"plugin-%d\"\n\n[[commands]]\nname = \"command-%d\"\npath = \"/bin/dcos-command-%d\"\ndescription = \"Command %d\"\n",
+					i, i, i, i,
+				)
+				pluginFilePath := filepath.Join(pm.pluginsDir(), fmt.Sprintf("plugin-%d", i), "env", "plugin.toml")
+				require.NoError(b, afero.WriteFile(fs, pluginFilePath, []byte(pluginTOML), 0644))
+			}
+			require.Len(b, pm.Plugins(), n)
+
+			b.ReportAllocs()
+			b.ResetTimer()
+			for i := 0; i < b.N; i++ {
+				if plugins := pm.Plugins(); len(plugins) != n {
+					b.Fatalf("expected %d plugins, got %d", n, len(plugins))
+				}
+			}
+		})
+	}
+}
@@ -0,0 +1,359 @@
+package plugin
+
+import (
+	"crypto/sha256"
+	"encoding/hex"
+	"encoding/json"
+	"hash"
+	"net/http"
+	"os"
+	"path/filepath"
+	"reflect"
+	"strings"
+	"time"
+
+	"github.com/dcos/dcos-cli/pkg/fsutil"
+	"github.com/spf13/afero"
+)
+
+// storeGracePeriod is the duration during which new store entries and references are
+// never garbage collected, this protects installations happening concurrently.
+var storeGracePeriod = time.Hour
+
+// storeDigestFile is the file in a plugin directory holding the digest of the store entry it comes from.
+const storeDigestFile = "store.digest"
+
+// The plugin store is a content-addressable store for plugin resources, shared by all clusters.
+//
+// Downloaded resources are stored under `blobs/<sha256>`, extracted archives under `trees/<sha256>`.
+// The source of downloaded resources (URL, ETag and Last-Modified date) is recorded under `sources/`,
+// so that resources without a checksum are found in the store after a HEAD request.
+// Plugin directories are populated with hardlinks to the extracted files, when the filesystem supports it.
+// Each plugin directory using an entry adds a reference file under `refs/<sha256>`; entries without
+// any valid reference are removed when plugins get installed or removed.
+
+// SetStoreDir sets the plugin store directory. The store is disabled when it isn't set.
+func (m *Manager) SetStoreDir(dir string) {
+	m.storeDir = dir
+}
+
+// storedResource returns the path to a resource in the store, based on its expected checksum.
+func (m *Manager) storedResource(installOpts *InstallOpts) (string, bool) {
+	if m.storeDir == "" || !isSHA256(installOpts.Checksum.Hasher) {
+		return "", false
+	}
+	digest := strings.ToLower(installOpts.Checksum.Value)
+	path, ok := m.storedBlob(digest)
+	if ok {
+		installOpts.digest = digest
+	}
+	return path, ok
+}
+
+// storedSource returns the path to a resource in the store, based on the source it has been downloaded from.
+//
+// This is for resources without a checksum (eg. the default plugins of a cluster): the resource is
+// the one in the store when its HEAD response has the same ETag and Last-Modified date as recorded.
+func (m *Manager) storedSource(url string, head *http.Response, installOpts *InstallOpts) (string, bool) {
+	if m.storeDir == "" || head == nil || installOpts.Checksum.Hasher != nil {
+		return "", false
+	}
+	etag := head.Header.Get("ETag")
+	lastModified := head.Header.Get("Last-Modified")
+
+	// Weak ETags don't guarantee byte-for-byte equality.
+	if strings.HasPrefix(etag, "W/") {
+		etag = ""
+	}
+	if etag == "" && lastModified == "" {
+		return "", false
+	}
+
+	data, err := afero.ReadFile(m.fs, m.storeSourcePath(url))
+	if err != nil {
+		return "", false
+	}
+	var source pluginSource
+	if err := json.Unmarshal(data, &source); err != nil || source.URL != url {
+		return "", false
+	}
+	if source.ETag != head.Header.Get("ETag") || source.LastModified != lastModified {
+		return "", false
+	}
+
+	path, ok := m.storedBlob(source.SHA256)
+	if ok {
+		installOpts.digest = source.SHA256
+		installOpts.source = &source
+	}
+	return path, ok
+}
+
+// storedBlob returns the path to the resource stored under a digest, if any.
+func (m *Manager) storedBlob(digest string) (string, bool) {
+	blobDir := filepath.Join(m.storeDir, "blobs", digest)
+	blobs, err := afero.ReadDir(m.fs, blobDir)
+	if err != nil || len(blobs) != 1 {
+		return "", false
+	}
+	m.touchStoreEntry(blobDir)
+	return filepath.Join(blobDir, blobs[0].Name()), true
+}
+
+// storeResource moves a downloaded resource into the store and returns its new path.
+// The resource must have been downloaded into its own directory, within the store temp dir.
+func (m *Manager) storeResource(path, digest string) (string, error) {
+	blobDir := filepath.Join(m.storeDir, "blobs", digest)
+	if err := m.fs.MkdirAll(filepath.Dir(blobDir), 0755); err != nil {
+		return "", err
+	}
+
+	err := m.fs.Rename(filepath.Dir(path), blobDir)
+	if err != nil {
+		// The resource might have been stored by a concurrent installation.
+		if exists, _ := afero.Exists(m.fs, filepath.Join(blobDir, filepath.Base(path))); !exists {
+			return "", err
+		}
+		m.fs.RemoveAll(filepath.Dir(path))
+	}
+	return filepath.Join(blobDir, filepath.Base(path)), nil
+}
+
+// recordStoreSource records the source of a resource moved into the store, for storedSource.
+// Sources without an ETag nor Last-Modified date aren't recorded as they can't be checked.
+func (m *Manager) recordStoreSource(source *pluginSource) error {
+	if source == nil || (source.ETag == "" && source.LastModified == "") {
+		return nil
+	}
+	data, err := json.Marshal(source)
+	if err != nil {
+		return err
+	}
+	sourcePath := m.storeSourcePath(source.URL)
+	if err := m.fs.MkdirAll(filepath.Dir(sourcePath), 0755); err != nil {
+		return err
+	}
+
+	// The source is written to a temp file first, concurrent installations never read a partial file.
+	tmpDir, err := m.storeTempDir()
+	if err != nil {
+		return err
+	}
+	defer m.fs.RemoveAll(tmpDir)
+
+	tmpPath := filepath.Join(tmpDir, filepath.Base(sourcePath))
+	if err := afero.WriteFile(m.fs, tmpPath, data, 0644); err != nil {
+		return err
+	}
+	return m.fs.Rename(tmpPath, sourcePath)
+}
+
+// storeSourcePath returns the path to the source file of a URL in the store.
+func (m *Manager) storeSourcePath(url string) string {
+	key := sha256.Sum256([]byte(url))
+	return filepath.Join(m.storeDir, "sources", hex.EncodeToString(key[:8])+".json")
+}
+
+// storedTree returns the directory holding the extracted content of an archive in the store.
+// The archive is extracted on first use.
+func (m *Manager) storedTree(archivePath, digest string) (string, error) {
+	treeDir := filepath.Join(m.storeDir, "trees", digest)
+	if exists, _ := afero.DirExists(m.fs, treeDir); exists {
+		m.touchStoreEntry(treeDir)
+		return treeDir, nil
+	}
+
+	if err := m.fs.MkdirAll(filepath.Dir(treeDir), 0755); err != nil {
+		return "", err
+	}
+	tmpDir, err := m.storeTempDir()
+	if err != nil {
+		return "", err
+	}
+	if err := fsutil.Unzip(m.fs, archivePath, tmpDir); err != nil {
+		m.fs.RemoveAll(tmpDir)
+		return "", err
+	}
+	if err := m.fs.Rename(tmpDir, treeDir); err != nil {
+		m.fs.RemoveAll(tmpDir)
+
+		// The archive might have been extracted by a concurrent installation.
+		if exists, _ := afero.DirExists(m.fs, treeDir); !exists {
+			return "", err
+		}
+	}
+	return treeDir, nil
+}
+
+// linkTree populates a directory with the files of a tree from the store.
+//
+// Files at the root of the tree are copied as the CLI might modify them (eg. plugin.toml or package.json).
+// Files in subdirectories are hardlinked, they are typically the plugin binaries.
+func (m *Manager) linkTree(treeDir, dest string) error {
+	return afero.Walk(m.fs, treeDir, func(path string, info os.FileInfo, err error) error {
+		if err != nil {
+			return err
+		}
+		relPath, err := filepath.Rel(treeDir, path)
+		if err != nil {
+			return err
+		}
+		destPath := filepath.Join(dest, relPath)
+
+		switch {
+		case info.IsDir():
+			return m.fs.MkdirAll(destPath, info.Mode().Perm()|0700)
+		case filepath.Dir(relPath) == ".":
+			return fsutil.CopyFile(m.fs, path, destPath, info.Mode())
+		default:
+			return m.linkFile(path, destPath, info.Mode())
+		}
+	})
+}
+
+// linkFile creates a hardlink to a file, or copies it when hardlinks aren't supported.
+func (m *Manager) linkFile(src, dest string, perm os.FileMode) error {
+	if _, ok := m.fs.(*afero.OsFs); ok {
+		err := os.Link(src, dest)
+		if err == nil {
+			return nil
+		}
+		m.logger.Debugf("Couldn't link %s, copying it instead: %s", src, err)
+	}
+	return fsutil.CopyFile(m.fs, src, dest, perm)
+}
+
+// addStoreRef records that a plugin directory uses a store entry.
+func (m *Manager) addStoreRef(digest, pluginDir string) error {
+	refsDir := filepath.Join(m.storeDir, "refs", digest)
+	if err := m.fs.MkdirAll(refsDir, 0755); err != nil {
+		return err
+	}
+	refID := sha256.Sum256([]byte(pluginDir))
+	refPath := filepath.Join(refsDir, hex.EncodeToString(refID[:8]))
+	return afero.WriteFile(m.fs, refPath, []byte(pluginDir), 0644)
+}
+
+// gcStore removes the store entries which aren't used by any plugin directory.
+//
+// A reference is valid when the plugin directory it points to still holds the entry digest.
+// This way entries get collected even when a cluster directory is removed altogether.
+func (m *Manager) gcStore() {
+	if m.storeDir == "" {
+		return
+	}
+
+	digests := make(map[string]bool)
+	for _, kind := range []string{"blobs", "trees", "refs"} {
+		entries, err := afero.ReadDir(m.fs, filepath.Join(m.storeDir, kind))
+		if err != nil {
+			continue
+		}
+		for _, entry := range entries {
+			digests[entry.Name()] = true
+		}
+	}
+
+	// Leftovers of interrupted installations are removed from the temp dir.
+	if tmpEntries, err := afero.ReadDir(m.fs, filepath.Join(m.storeDir, "tmp")); err == nil {
+		for _, entry := range tmpEntries {
+			if time.Since(entry.ModTime()) > storeGracePeriod {
+				m.fs.RemoveAll(filepath.Join(m.storeDir, "tmp", entry.Name()))
+			}
+		}
+	}
+
+	defer m.gcStoreSources()
+
+	for digest := range digests {
+		if m.storeRefs(digest) > 0 {
+			continue
+		}
+		entryDirs := []string{
+			filepath.Join(m.storeDir, "blobs", digest),
+			filepath.Join(m.storeDir, "trees", digest),
+		}
+		recent := false
+		for _, dir := range entryDirs {
+			if info, err := m.fs.Stat(dir); err == nil && time.Since(info.ModTime()) < storeGracePeriod {
+				recent = true
+			}
+		}
+		if recent {
+			continue
+		}
+		m.logger.Debugf("Removing unused plugin store entry %s", digest)
+		for _, dir := range append(entryDirs, filepath.Join(m.storeDir, "refs", digest)) {
+			if err := m.fs.RemoveAll(dir); err != nil {
+				m.logger.Debug(err)
+			}
+		}
+	}
+}
+
+// gcStoreSources removes the source files pointing to resources which aren't in the store anymore.
+func (m *Manager) gcStoreSources() {
+	sourcesDir := filepath.Join(m.storeDir, "sources")
+	sources, err := afero.ReadDir(m.fs, sourcesDir)
+	if err != nil {
+		return
+	}
+	for _, entry := range sources {
+		sourcePath := filepath.Join(sourcesDir, entry.Name())
+		var source pluginSource
+		if data, err := afero.ReadFile(m.fs, sourcePath); err == nil && json.Unmarshal(data, &source) == nil {
+			if exists, _ := afero.DirExists(m.fs, filepath.Join(m.storeDir, "blobs", source.SHA256)); exists && source.SHA256 != "" {
+				continue
+			}
+		}
+		m.fs.Remove(sourcePath)
+	}
+}
+
+// storeRefs returns the number of valid references to a store entry. Invalid references are removed.
+func (m *Manager) storeRefs(digest string) (count int) {
+	refsDir := filepath.Join(m.storeDir, "refs", digest)
+	refs, err := afero.ReadDir(m.fs, refsDir)
+	if err != nil {
+		return 0
+	}
+	for _, ref := range refs {
+		refPath := filepath.Join(refsDir, ref.Name())
+		if time.Since(ref.ModTime()) < storeGracePeriod {
+			count++
+			continue
+		}
+		pluginDir, err := afero.ReadFile(m.fs, refPath)
+		if err == nil {
+			refDigest, err := afero.ReadFile(m.fs, filepath.Join(string(pluginDir), storeDigestFile))
+			if err == nil && string(refDigest) == digest {
+				count++
+				continue
+			}
+		}
+		m.fs.Remove(refPath)
+	}
+	return count
+}
+
+// touchStoreEntry updates the modification time of a store entry, it then benefits from the GC grace period.
+func (m *Manager) touchStoreEntry(path string) {
+	now := time.Now()
+	if err := m.fs.Chtimes(path, now, now); err != nil {
+		m.logger.Debug(err)
+	}
+}
+
+// storeTempDir creates a temp directory in the store, on the same device as its entries.
+func (m *Manager) storeTempDir() (string, error) {
+	tmpDir := filepath.Join(m.storeDir, "tmp")
+	if err := m.fs.MkdirAll(tmpDir, 0755); err != nil {
+		return "", err
+	}
+	return afero.TempDir(m.fs, tmpDir, "dcos-cli")
+}
+
+// isSHA256 indicates whether a hash is a SHA256 hash.
+func isSHA256(h hash.Hash) bool {
+	return h != nil && reflect.TypeOf(h) == reflect.TypeOf(sha256.New()) && h.Size() == sha256.Size
+}
@@ -0,0 +1,175 @@
+package setup
+
+import (
+	"fmt"
+	"io/ioutil"
+	"strings"
+	"sync"
+	"time"
+
+	"github.com/dcos/dcos-cli/pkg/config"
+	"github.com/pelletier/go-toml"
+	"github.com/spf13/afero"
+	"github.com/spf13/pflag"
+)
+
+// DefaultBulkWorkers is the default number of clusters set up concurrently by a bulk setup.
+const DefaultBulkWorkers = 4
+
+// Manifest lists clusters to set up in bulk. For example :
+//
+//	[[cluster]]
+//	url = "https://dcos-1.example.com"
+//	name = "dcos-1"
+//	username = "bootstrapuser"
+//	password_env = "DCOS_1_PASSWORD"
+//
+//	[[cluster]]
+//	url = "https://dcos-2.example.com"
+//	ca_certs = "/etc/ssl/dcos-2.pem"
+//	private_key = "/etc/dcos/dcos-2.key"
+type Manifest struct {
+	Clusters []ManifestCluster `toml:"cluster"`
+}
+
+// ManifestCluster is a cluster entry in a manifest, its fields mirror the `dcos cluster setup` flags.
+// Credentials are read from files or environment variables, they can't be written in the manifest.
+type ManifestCluster struct {
+	URL          string `toml:"url"`
+	Name         string `toml:"name"`
+	CACerts      string `toml:"ca_certs"`
+	Insecure     bool   `toml:"insecure"`
+	NoCheck      bool   `toml:"no_check"`
+	NoTimeout    bool   `toml:"no_timeout"`
+	Provider     string `toml:"provider"`
+	Username     string `toml:"username"`
+	PasswordFile string `toml:"password_file"`
+	PasswordEnv  string `toml:"password_env"`
+	PrivateKey   string `toml:"private_key"`
+}
+
+// BulkResult is the outcome of the setup of a manifest cluster.
+type BulkResult struct {
+	URL      string
+	Cluster  *config.Cluster
+	Duration time.Duration
+	Err      error
+}
+
+// ReadManifest reads a manifest file.
+func ReadManifest(fs afero.Fs, path string) (*Manifest, error) {
+	data, err := afero.ReadFile(fs, path)
+	if err != nil {
+		return nil, err
+	}
+	var manifest Manifest
+	if err := toml.Unmarshal(data, &manifest); err != nil {
+		return nil, fmt.Errorf("couldn't parse manifest %s: %s", path, err)
+	}
+	if len(manifest.Clusters) == 0 {
+		return nil, fmt.Errorf("manifest %s doesn't list any cluster", path)
+	}
+	for i, cluster := range manifest.Clusters {
+		if cluster.URL == "" {
+			return nil, fmt.Errorf("cluster #%d in manifest %s is missing an URL", i+1, path)
+		}
+	}
+	return &manifest, nil
+}
+
+// ConfigureAll sets up the clusters of a manifest, using up to `workers` concurrent setups.
+//
+// A new setup is created for each cluster through newSetup, as a setup isn't safe for concurrent use.
+// The clusters share the HTTP transports of the process and the plugin store. The plugin manager
+// shares concurrent downloads of a URL, a plugin used by several clusters is thus only downloaded
+// once. Results are returned in the manifest order.
+func (m *Manifest) ConfigureAll(newSetup func() *Setup, workers int) []BulkResult {
+	if workers < 1 {
+		workers = DefaultBulkWorkers
+	}
+	results := make([]BulkResult, len(m.Clusters))
+
+	jobs := make(chan int)
+	var wg sync.WaitGroup
+	for w := 0; w < workers && w < len(m.Clusters); w++ {
+		wg.Add(1)
+		go func() {
+			defer wg.Done()
+			for i := range jobs {
+				results[i] = m.Clusters[i].configure(newSetup())
+			}
+		}()
+	}
+	for i := range m.Clusters {
+		jobs <- i
+	}
+	close(jobs)
+	wg.Wait()
+	return results
+}
+
+// configure sets up a manifest cluster. The cluster is never attached.
+func (c ManifestCluster) configure(s *Setup) BulkResult {
+	start := time.Now()
+
+	clusterURL := c.URL
+	if !strings.HasPrefix(clusterURL, "https://") && !strings.HasPrefix(clusterURL, "http://") {
+		clusterURL = "https://" + clusterURL
+	}
+	result := BulkResult{URL: clusterURL}
+
+	flags, err := c.flags(s)
+	if err == nil {
+		result.Cluster, err = s.Configure(flags, clusterURL, false)
+	}
+	result.Err = err
+	result.Duration = time.Since(start)
+	if err != nil {
+		s.logger.Infof("Setup of %s failed after %s: %s", clusterURL, result.Duration.Round(time.Millisecond), err)
+	}
+	return result
+}
+
+// flags returns the setup flags of a manifest cluster.
+//
+// They are parsed from command-line arguments so that they go through the same code path as `dcos cluster setup`.
+func (c ManifestCluster) flags(s *Setup) (*Flags, error) {
+	envLookup := func(key string) (string, bool) {
+		if key == "DCOS_PASSWORD" && c.PasswordEnv != "" {
+			return s.envLookup(c.PasswordEnv)
+		}
+		return s.envLookup(key)
+	}
+	flags := NewFlags(s.fs, envLookup, s.logger)
+
+	var args []string
+	for flag, value := range map[string]string{
+		"name":          c.Name,
+		"ca-certs":      c.CACerts,
+		"provider":      c.Provider,
+		"username":      c.Username,
+		"password-file": c.PasswordFile,
+		"private-key":   c.PrivateKey,
+	} {
+		if value != "" {
+			args = append(args, "--"+flag+"="+value)
+		}
+	}
+	for flag, value := range map[string]bool{
+		"insecure":   c.Insecure,
+		"no-check":   c.NoCheck,
+		"no-timeout": c.NoTimeout,
+	} {
+		if value {
+			args = append(args, "--"+flag)
+		}
+	}
+
+	flagSet := pflag.NewFlagSet(c.URL, pflag.ContinueOnError)
+	flagSet.SetOutput(ioutil.Discard)
+	flags.Register(flagSet)
+	if err := flagSet.Parse(args); err != nil {
+		return nil, err
+	}
+	return flags, nil
+}
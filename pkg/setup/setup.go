@@ -138,60 +138,142 @@ func (s *Setup) Configure(flags *Flags, clusterURL string, attach bool) (*config
 		return nil, err
 	}
 
-	// Login to get the ACS token, unless it is already present as an env var.
+	// The rest of the flow runs as a task graph, stages which don't depend on each other run concurrently.
+	// The DC/OS version and metadata are usually readable without authentication, they are fetched
+	// while logging in and only fetched again with the ACS token if this fails.
+	g := &taskGraph{logger: s.logger}
+	state := &setupState{
+		flags:                     flags,
+		cluster:                   cluster,
+		httpOpts:                  httpOpts,
+		unauthenticatedHTTPClient: httpclient.New(cluster.URL(), httpOpts...),
+	}
+	state.loginTask = g.run("login", func() error { return s.login(state) })
+	versionTask := g.run("version", func() error { return s.fetchVersion(state) })
+	metadataTask := g.run("metadata", func() error { return s.fetchMetadata(state) })
+
+	// The default plugins URLs only depend on the DC/OS version, they are resolved while logging in.
+	pluginURLsTask := g.run("plugin-urls", func() error {
+		state.pluginURLs = s.canonicalPluginURLs(state.version)
+		return nil
+	}, versionTask)
+
+	saveTask := g.run("save", func() error { return s.save(state, attach) }, state.loginTask, metadataTask)
+
+	// Install default plugins (dcos-core-cli and dcos-enterprise-cli).
+	pluginsTask := g.run("plugins", func() error {
+		s.pluginManager.SetCluster(cluster)
+		return s.installDefaultPlugins(cluster, state.httpClient, state.version, state.pluginURLs)
+	}, saveTask, versionTask, pluginURLsTask)
+
+	if err := pluginsTask.wait(); err != nil {
+		return nil, err
+	}
+
+	s.logger.Infof("%s is now setup", clusterURL)
+	return cluster, nil
+}
+
+// setupState is the state shared by the stages of a setup flow.
+type setupState struct {
+	flags                     *Flags
+	cluster                   *config.Cluster
+	httpOpts                  []httpclient.Option
+	unauthenticatedHTTPClient *httpclient.Client
+
+	// Set by the login stage.
+	loginTask  *task
+	httpClient *httpclient.Client
+
+	// Set by the version, metadata and plugin-urls stages.
+	version    *dcos.Version
+	metadata   *dcos.Metadata
+	pluginURLs map[string]string
+}
+
+// login gets an ACS token for the cluster, unless it is already present as an env var.
+func (s *Setup) login(state *setupState) error {
 	acsToken, _ := s.envLookup("DCOS_CLUSTER_SETUP_ACS_TOKEN")
 	if acsToken == "" {
-		httpClient := httpclient.New(cluster.URL(), httpOpts...)
 		var err error
-		acsToken, err = s.loginFlow.Start(flags.loginFlags, httpClient)
+		acsToken, err = s.loginFlow.Start(state.flags.loginFlags, state.unauthenticatedHTTPClient)
 		if err == login.ErrAuthDisabled {
 			s.logger.Warn("This cluster does not require authenticated requests. Skipping login.")
 		} else if err != nil {
-			return nil, err
+			return err
 		}
 	}
-	cluster.SetACSToken(acsToken)
-	httpClient := httpclient.New(cluster.URL(), append(httpOpts, httpclient.ACSToken(cluster.ACSToken()))...)
+	state.cluster.SetACSToken(acsToken)
+	state.httpClient = httpclient.New(state.cluster.URL(), append(state.httpOpts, httpclient.ACSToken(acsToken))...)
+	return nil
+}
 
-	// Read cluster ID from cluster metadata.
-	metadata, err := dcos.NewClient(httpClient).Metadata()
+// fetchVersion gets the DC/OS version, with the ACS token when it isn't readable without authentication.
+func (s *Setup) fetchVersion(state *setupState) error {
+	var err error
+	state.version, err = dcos.NewClient(state.unauthenticatedHTTPClient).Version()
+	if err == nil {
+		return nil
+	}
+	s.logger.Debugf("Couldn't get DC/OS version without authentication: %s", err)
+	if err := state.loginTask.wait(); err != nil {
+		return err
+	}
+	state.version, err = dcos.NewClient(state.httpClient).Version()
 	if err != nil {
-		return nil, err
+		return fmt.Errorf("unable to get DC/OS version, installation of the plugins aborted: %s", err)
 	}
+	return nil
+}
 
-	if flags.name != "" {
+// fetchMetadata reads the cluster ID from the cluster metadata,
+// with the ACS token when it isn't readable without authentication.
+func (s *Setup) fetchMetadata(state *setupState) error {
+	metadata, err := dcos.NewClient(state.unauthenticatedHTTPClient).Metadata()
+	switch {
+	case err != nil:
+		s.logger.Debugf("Couldn't get cluster metadata without authentication: %s", err)
+	case metadata.ClusterID == "":
+		s.logger.Debug("Cluster metadata read without authentication has no cluster ID.")
+	default:
+		state.metadata = metadata
+		return nil
+	}
+	if err := state.loginTask.wait(); err != nil {
+		return err
+	}
+	state.metadata, err = dcos.NewClient(state.httpClient).Metadata()
+	return err
+}
+
+// save names the cluster and creates its config, then attaches it if requested.
+func (s *Setup) save(state *setupState, attach bool) error {
+	cluster := state.cluster
+	if state.flags.name != "" {
 		// A custom cluster name has been passed as a flag.
-		cluster.SetName(flags.name)
-	} else if stateSummary, err := mesos.NewClient(httpClient).StateSummary(); err == nil {
+		cluster.SetName(state.flags.name)
+	} else if stateSummary, err := mesos.NewClient(state.httpClient).StateSummary(); err == nil {
 		// Read cluster name from Mesos state summary.
 		cluster.SetName(stateSummary.Cluster)
 	} else {
 		// Fallback to cluster ID as cluster name.
-		cluster.SetName(metadata.ClusterID)
+		cluster.SetName(state.metadata.ClusterID)
 	}
 
 	// Create the config for the given cluster.
-	err = s.configManager.Save(cluster.Config(), metadata.ClusterID, flags.caBundle)
+	err := s.configManager.Save(cluster.Config(), state.metadata.ClusterID, state.flags.caBundle)
 	if err != nil {
-		return nil, err
+		return err
 	}
 
 	if attach {
 		err = s.configManager.Attach(cluster.Config())
 		if err != nil {
-			return nil, err
+			return err
 		}
 		s.logger.Infof("You are now attached to cluster %s", cluster.ID())
 	}
-
-	// Install default plugins (dcos-core-cli and dcos-enterprise-cli).
-	s.pluginManager.SetCluster(cluster)
-	if err = s.installDefaultPlugins(httpClient); err != nil {
-		return nil, err
-	}
-
-	s.logger.Infof("%s is now setup", clusterURL)
-	return cluster, nil
+	return nil
 }
 
 // detectCanonicalClusterURL returns the URL with the response of the HEAD request.
@@ -300,13 +382,12 @@ func (s *Setup) decodePEMCerts(caPEM []byte, prompt bool) (*x509.CertPool, error
 // installDefaultPlugins installs the dcos-core-cli and (if applicable) the dcos-enterprise-cli plugin.
 // The installation of the core plugin only works with DC/OS >= 1.10 and the installation of the EE plugin only works
 // with DC/OS >= 1.12 due to the lack of a "Variant" key in the "/dcos-metadata/dcos-version.json" endpoint before.
-func (s *Setup) installDefaultPlugins(httpClient *httpclient.Client) error {
-	version, err := dcos.NewClient(httpClient).Version()
-	if err != nil {
-		return fmt.Errorf("unable to get DC/OS version, installation of the plugins aborted: %s", err)
-	}
+//
+// Plugins are installed from their canonical URL when it is known, otherwise through Cosmos.
+func (s *Setup) installDefaultPlugins(cluster *config.Cluster, httpClient *httpclient.Client,
+	version *dcos.Version, pluginURLs map[string]string) error {
 
-	if err = s.checkDefaultPluginsRequirements(version.Version); err != nil {
+	if err := s.checkDefaultPluginsRequirements(version.Version); err != nil {
 		return err
 	}
 
@@ -316,7 +397,7 @@ func (s *Setup) installDefaultPlugins(httpClient *httpclient.Client) error {
 
 	// Install plugins for currently installed packages.
 	go func() {
-		s.installPackageServicesPlugins(&wg, httpClient, pbar)
+		s.installPackageServicesPlugins(&wg, cluster, httpClient, pbar)
 		wg.Done()
 	}()
 
@@ -324,7 +405,7 @@ func (s *Setup) installDefaultPlugins(httpClient *httpclient.Client) error {
 	go func() {
 		// Install dcos-enterprise-cli if the DC/OS variant metadata is "enterprise".
 		if version.DCOSVariant == "enterprise" {
-			if err := s.installPlugin("dcos-enterprise-cli", httpClient, version, pbar); err != nil {
+			if err := s.installPlugin(cluster, "dcos-enterprise-cli", pluginURLs["dcos-enterprise-cli"], httpClient, pbar); err != nil {
 				s.logger.Debug(err)
 			}
 		} else if version.DCOSVariant == "" {
@@ -336,7 +417,7 @@ func (s *Setup) installDefaultPlugins(httpClient *httpclient.Client) error {
 	}()
 
 	// Install dcos-core-cli.
-	errCore := s.installPlugin("dcos-core-cli", httpClient, version, pbar)
+	errCore := s.installPlugin(cluster, "dcos-core-cli", pluginURLs["dcos-core-cli"], httpClient, pbar)
 	pbar.Wait()
 	if errCore != nil {
 		return errCore
@@ -354,14 +435,14 @@ func (s *Setup) installDefaultPlugins(httpClient *httpclient.Client) error {
 
 // installPackageServicesPlugins installs CLI plugins for the services currently installed on the cluster.
 // When different versions of the same package are installed, it installs the plugin for the highest version.
-func (s *Setup) installPackageServicesPlugins(wg *sync.WaitGroup, httpClient *httpclient.Client, pbar *mpb.Progress) {
+func (s *Setup) installPackageServicesPlugins(wg *sync.WaitGroup, cluster *config.Cluster, httpClient *httpclient.Client, pbar *mpb.Progress) {
 	// Install all package CLIs when the env var is present.
 	installPackageCLIs, _ := s.envLookup("DCOS_CLI_EXPERIMENTAL_AUTOINSTALL_PACKAGE_CLIS")
 	if installPackageCLIs == "" {
 		return
 	}
 
-	cosmosClient, err := cosmos.NewClient()
+	cosmosClient, err := cosmos.NewClientForConfig(s.fs, cluster.Config().Path())
 	if err != nil {
 		s.logger.Debug(err)
 		return
@@ -389,7 +470,7 @@ func (s *Setup) installPackageServicesPlugins(wg *sync.WaitGroup, httpClient *ht
 	for _, pkg := range pkgMap {
 		wg.Add(1)
 		go func(name, version string) {
-			err := s.installPluginFromCosmos(name, version, httpClient, pbar)
+			err := s.installPluginFromCosmos(cluster, name, version, httpClient, pbar)
 			if err != nil {
 				s.logger.Debug(err)
 			}
@@ -398,25 +479,58 @@ func (s *Setup) installPackageServicesPlugins(wg *sync.WaitGroup, httpClient *ht
 	}
 }
 
-// installPlugin installs a plugin by its name.
-func (s *Setup) installPlugin(name string, httpClient *httpclient.Client, version *dcos.Version, pbar *mpb.Progress) error {
+// installPlugin installs a plugin by its name, from its canonical URL if it's not empty or through Cosmos.
+func (s *Setup) installPlugin(cluster *config.Cluster, name, canonicalURL string, httpClient *httpclient.Client, pbar *mpb.Progress) error {
 	s.logger.Infof("Installing %s...", name)
 
-	if skip, _ := s.envLookup("DCOS_CLUSTER_SETUP_SKIP_CANONICAL_URL_INSTALL"); skip != "1" {
-		err := s.installPluginFromCanonicalURL(name, version, pbar)
+	if canonicalURL != "" {
+		err := s.installPluginFromCanonicalURL(name, canonicalURL, pbar)
 		if err == nil {
 			return nil
 		}
 		s.logger.Debug(err)
 	}
 	if skip, _ := s.envLookup("DCOS_CLUSTER_SETUP_SKIP_COSMOS_INSTALL"); skip != "1" {
-		return s.installPluginFromCosmos(name, "", httpClient, pbar)
+		return s.installPluginFromCosmos(cluster, name, "", httpClient, pbar)
 	}
 	return errors.New("skipping plugin installation from Cosmos (DCOS_CLUSTER_SETUP_SKIP_COSMOS_INSTALL=1)")
 }
 
-// installPluginFromCanonicalURL installs a plugin using its canonical URL.
-func (s *Setup) installPluginFromCanonicalURL(name string, version *dcos.Version, pbar *mpb.Progress) error {
+// canonicalPluginURLs returns the canonical URLs of the default plugins for a given DC/OS version.
+// Plugins whose canonical URL can't be determined are not part of the returned map.
+func (s *Setup) canonicalPluginURLs(version *dcos.Version) map[string]string {
+	pluginURLs := make(map[string]string)
+	if skip, _ := s.envLookup("DCOS_CLUSTER_SETUP_SKIP_CANONICAL_URL_INSTALL"); skip == "1" {
+		return pluginURLs
+	}
+
+	names := []string{"dcos-core-cli"}
+	if version.DCOSVariant == "enterprise" {
+		names = append(names, "dcos-enterprise-cli")
+	}
+
+	var mu sync.Mutex
+	var wg sync.WaitGroup
+	for _, name := range names {
+		wg.Add(1)
+		go func(name string) {
+			defer wg.Done()
+			url, err := s.canonicalPluginURL(name, version)
+			if err != nil {
+				s.logger.Debug(err)
+				return
+			}
+			mu.Lock()
+			pluginURLs[name] = url
+			mu.Unlock()
+		}(name)
+	}
+	wg.Wait()
+	return pluginURLs
+}
+
+// canonicalPluginURL returns the canonical URL of a plugin for a given DC/OS version.
+func (s *Setup) canonicalPluginURL(name string, version *dcos.Version) (string, error) {
 	domain := "downloads.dcos.io"
 	if name == "dcos-enterprise-cli" {
 		domain = "downloads.mesosphere.io"
@@ -425,7 +539,7 @@ func (s *Setup) installPluginFromCanonicalURL(name string, version *dcos.Version
 
 	matches := regexp.MustCompile(`^(\d+)\.(\d+)\D*`).FindStringSubmatch(version.Version)
 	if matches == nil {
-		return fmt.Errorf("unable to parse DC/OS version %s", version.Version)
+		return "", fmt.Errorf("unable to parse DC/OS version %s", version.Version)
 	}
 	dcosVersion := matches[1] + "." + matches[2]
 
@@ -436,30 +550,39 @@ func (s *Setup) installPluginFromCanonicalURL(name string, version *dcos.Version
 	httpClient := httpclient.New("")
 	req, err := httpClient.NewRequest("HEAD", url, nil, httpclient.FailOnErrStatus(false))
 	if err != nil {
-		return err
+		return "", err
 	}
 	resp, err := httpClient.Do(req)
 	if err != nil {
-		return err
+		return "", err
 	}
+	resp.Body.Close()
 	if resp.StatusCode >= 400 && resp.StatusCode < 500 {
 		url = fmt.Sprintf(
 			"https://%s/cli/testing/plugins/%s/%s/x86-64/%s-%s-patch.x.zip",
 			domain, name, platform, name, dcosVersion,
 		)
 	}
-	_, err = s.pluginManager.Install(url, &plugin.InstallOpts{
-		Name:        name,
-		Update:      true,
-		ProgressBar: pbar,
+	return url, nil
+}
+
+// installPluginFromCanonicalURL installs a plugin using its canonical URL.
+func (s *Setup) installPluginFromCanonicalURL(name, url string, pbar *mpb.Progress) error {
+	_, err := s.pluginManager.Install(url, &plugin.InstallOpts{
+		Name:          name,
+		Update:        true,
+		SkipUnchanged: true,
+		ProgressBar:   pbar,
 	})
 	return err
 }
 
 // installPluginFromCosmos installs a plugin through Cosmos.
-func (s *Setup) installPluginFromCosmos(name string, version string, httpClient *httpclient.Client, pbar *mpb.Progress) error {
+func (s *Setup) installPluginFromCosmos(cluster *config.Cluster, name string, version string,
+	httpClient *httpclient.Client, pbar *mpb.Progress) error {
+
 	// Get package information from Cosmos.
-	cosmosClient, err := cosmos.NewClient()
+	cosmosClient, err := cosmos.NewClientForConfig(s.fs, cluster.Config().Path())
 	if err != nil {
 		return err
 	}
@@ -487,10 +610,11 @@ func (s *Setup) installPluginFromCosmos(name string, version string, httpClient
 		}
 	}
 	_, err = s.pluginManager.Install(pluginInfo.Url, &plugin.InstallOpts{
-		Name:        pkg.Package.Name,
-		Update:      true,
-		Checksum:    checksum,
-		ProgressBar: pbar,
+		Name:          pkg.Package.Name,
+		Update:        true,
+		SkipUnchanged: true,
+		Checksum:      checksum,
+		ProgressBar:   pbar,
 		PostInstall: func(fs afero.Fs, pluginDir string) error {
 			pkgInfoFilepath := filepath.Join(pluginDir, "package.json")
 			pkgInfoFile, err := fs.OpenFile(pkgInfoFilepath, os.O_WRONLY|os.O_CREATE|os.O_TRUNC, 0644)
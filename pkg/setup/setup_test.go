@@ -1,12 +1,28 @@
 package setup
 
 import (
+	"archive/zip"
+	"bytes"
+	"crypto/sha256"
+	"encoding/hex"
+	"errors"
+	"fmt"
+	"io/ioutil"
 	"net/http"
 	"net/http/httptest"
+	"os"
+	"path/filepath"
+	"runtime"
+	"strings"
+	"sync/atomic"
 	"testing"
+	"time"
 
+	"github.com/dcos/dcos-cli/pkg/config"
+	"github.com/dcos/dcos-cli/pkg/plugin"
 	"github.com/sirupsen/logrus"
 	logrustest "github.com/sirupsen/logrus/hooks/test"
+	"github.com/spf13/afero"
 	"github.com/stretchr/testify/assert"
 	"github.com/stretchr/testify/require"
 )
@@ -47,3 +63,187 @@ func TestDefaultPluginsRequirements(t *testing.T) {
 	require.Equal(t, logrus.WarnLevel, entry.Level)
 	require.Equal(t, `Couldn't parse DC/OS version "V3".`, entry.Message)
 }
+
+func TestTaskGraph(t *testing.T) {
+	logger, _ := logrustest.NewNullLogger()
+	g := &taskGraph{logger: logger}
+
+	// Independent tasks run concurrently, each one waits for the other to start.
+	aStarted := make(chan struct{})
+	bStarted := make(chan struct{})
+	a := g.run("a", func() error {
+		close(aStarted)
+		<-bStarted
+		return nil
+	})
+	b := g.run("b", func() error {
+		close(bStarted)
+		<-aStarted
+		return errors.New("b failed")
+	})
+
+	var cRan bool
+	c := g.run("c", func() error {
+		cRan = true
+		return nil
+	}, a)
+	d := g.run("d", func() error {
+		t.Error("d shouldn't run as b failed")
+		return nil
+	}, c, b)
+
+	require.NoError(t, c.wait())
+	require.True(t, cRan)
+	require.EqualError(t, d.wait(), "b failed")
+}
+
+func TestConfigureAll(t *testing.T) {
+	fs := afero.NewMemMapFs()
+	manifest := `
+[[cluster]]
+url = "dcos-1.example.com"
+ca_certs = "/missing-1.pem"
+
+[[cluster]]
+url = "https://dcos-2.example.com"
+ca_certs = "/missing-2.pem"
+password_env = "DCOS_2_PASSWORD"
+`
+	require.NoError(t, afero.WriteFile(fs, "/manifest.toml", []byte(manifest), 0644))
+
+	m, err := ReadManifest(fs, "/manifest.toml")
+	require.NoError(t, err)
+	require.Len(t, m.Clusters, 2)
+	require.Equal(t, "DCOS_2_PASSWORD", m.Clusters[1].PasswordEnv)
+
+	var setups int32
+	results := m.ConfigureAll(func() *Setup {
+		atomic.AddInt32(&setups, 1)
+		logger := logrus.New()
+		logger.Out = ioutil.Discard
+		return New(Opts{Fs: fs, Logger: logger, EnvLookup: func(string) (string, bool) { return "", false }})
+	}, 2)
+
+	// Setups fail when resolving flags, as the CA bundles don't exist.
+	require.Equal(t, int32(2), setups)
+	require.Len(t, results, 2)
+	require.Equal(t, "https://dcos-1.example.com", results[0].URL)
+	require.Error(t, results[0].Err)
+	require.Equal(t, "https://dcos-2.example.com", results[1].URL)
+	require.Error(t, results[1].Err)
+}
+
+func TestConfigureAllSharesPluginDownloads(t *testing.T) {
+	if runtime.GOOS == "windows" {
+		t.Skip("the plugin binary is a shell script")
+	}
+
+	var archive bytes.Buffer
+	zw := zip.NewWriter(&archive)
+	header := &zip.FileHeader{Name: "bin/dcos-core", Method: zip.Store}
+	header.SetMode(0755)
+	f, err := zw.CreateHeader(header)
+	require.NoError(t, err)
+	_, err = f.Write([]byte("#!/bin/sh\necho Core commands\n"))
+	require.NoError(t, err)
+	require.NoError(t, zw.Close())
+	digest := sha256.Sum256(archive.Bytes())
+
+	logger, hook := logrustest.NewNullLogger()
+	logger.SetLevel(logrus.DebugLevel)
+
+	// The plugin is served once the setup of the other cluster waits for its download.
+	var downloads int32
+	pluginServer := httptest.NewServer(http.HandlerFunc(func(w http.ResponseWriter, r *http.Request) {
+		if r.Method == "GET" {
+			atomic.AddInt32(&downloads, 1)
+			waitForLog(t, hook, "Waiting for the download of")
+		}
+		w.Write(archive.Bytes())
+	}))
+	defer pluginServer.Close()
+
+	// Both clusters advertise the same plugin URL through Cosmos.
+	newCluster := func(id string) *httptest.Server {
+		return httptest.NewServer(http.HandlerFunc(func(w http.ResponseWriter, r *http.Request) {
+			switch r.URL.Path {
+			case "/":
+			case "/dcos-metadata/dcos-version.json":
+				w.Write([]byte(`{"version": "2.1.0", "dcos-variant": "open"}`))
+			case "/metadata":
+				fmt.Fprintf(w, `{"CLUSTER_ID": "%s"}`, id)
+			case "/package/describe":
+				w.Header().Set("Content-Type", "application/vnd.dcos.package.describe-response+json;charset=utf-8;version=v3")
+				fmt.Fprintf(w, `{"package": {"name": "dcos-core-cli", "version": "2.1.0", "resource": {"cli": {"binaries": {"%s": {"x86-64": {"kind": "zip", "url": "%s/dcos-core-cli.zip", "contentHash": [{"algo": "sha256", "value": "%s"}]}}}}}}}`,
+					runtime.GOOS, pluginServer.URL, hex.EncodeToString(digest[:]))
+			default:
+				http.NotFound(w, r)
+			}
+		}))
+	}
+	cluster1 := newCluster("cluster-1")
+	defer cluster1.Close()
+	cluster2 := newCluster("cluster-2")
+	defer cluster2.Close()
+
+	dir, err := ioutil.TempDir("", "dcos-cli")
+	require.NoError(t, err)
+	defer os.RemoveAll(dir)
+
+	fs := afero.NewOsFs()
+	manifest := fmt.Sprintf("[[cluster]]\nurl = %q\nname = \"cluster-1\"\n\n[[cluster]]\nurl = %q\nname = \"cluster-2\"\n", cluster1.URL, cluster2.URL)
+	manifestPath := filepath.Join(dir, "manifest.toml")
+	require.NoError(t, afero.WriteFile(fs, manifestPath, []byte(manifest), 0644))
+	m, err := ReadManifest(fs, manifestPath)
+	require.NoError(t, err)
+
+	env := map[string]string{
+		"DCOS_CLUSTER_SETUP_ACS_TOKEN":                  "token",
+		"DCOS_CLUSTER_SETUP_SKIP_CANONICAL_URL_INSTALL": "1",
+	}
+	envLookup := func(key string) (string, bool) {
+		val, ok := env[key]
+		return val, ok
+	}
+	results := m.ConfigureAll(func() *Setup {
+		pluginManager := plugin.NewManager(fs, logger)
+		pluginManager.SetStoreDir(filepath.Join(dir, "store"))
+		return New(Opts{
+			Fs:            fs,
+			Errout:        ioutil.Discard,
+			Logger:        logger,
+			ConfigManager: config.NewManager(config.ManagerOpts{Fs: fs, Dir: dir, EnvLookup: envLookup}),
+			PluginManager: pluginManager,
+			EnvLookup:     envLookup,
+		})
+	}, 2)
+
+	require.Len(t, results, 2)
+	for _, result := range results {
+		require.NoError(t, result.Err)
+		require.FileExists(t, filepath.Join(result.Cluster.Dir(), "subcommands", "dcos-core-cli", "env", "bin", "dcos-core"))
+	}
+	require.Equal(t, int32(1), atomic.LoadInt32(&downloads))
+}
+
+// waitForLog waits for a log entry starting with a given message.
+func waitForLog(t *testing.T, hook *logrustest.Hook, msg string) {
+	deadline := time.Now().Add(5 * time.Second)
+	for time.Now().Before(deadline) {
+		for _, entry := range hook.AllEntries() {
+			if strings.HasPrefix(entry.Message, msg) {
+				return
+			}
+		}
+		time.Sleep(10 * time.Millisecond)
+	}
+	t.Errorf("no log entry starting with %q", msg)
+}
+
+func TestReadManifestMissingURL(t *testing.T) {
+	fs := afero.NewMemMapFs()
+	require.NoError(t, afero.WriteFile(fs, "/manifest.toml", []byte("[[cluster]]\nname = \"dcos\"\n"), 0644))
+
+	_, err := ReadManifest(fs, "/manifest.toml")
+	require.EqualError(t, err, "cluster #1 in manifest /manifest.toml is missing an URL")
+}
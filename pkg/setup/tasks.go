@@ -0,0 +1,49 @@
+package setup
+
+import (
+	"time"
+
+	"github.com/sirupsen/logrus"
+)
+
+// taskGraph runs the stages of the setup flow. Each stage runs concurrently
+// with the others, as soon as the stages it depends on are completed.
+type taskGraph struct {
+	logger *logrus.Logger
+}
+
+// task is a stage of the setup flow.
+type task struct {
+	name string
+	done chan struct{}
+	err  error
+}
+
+// run starts a stage once its dependencies are completed. When a dependency
+// fails, the stage isn't run and fails with the dependency error.
+func (g *taskGraph) run(name string, fn func() error, deps ...*task) *task {
+	t := &task{name: name, done: make(chan struct{})}
+	go func() {
+		defer close(t.done)
+		for _, dep := range deps {
+			if err := dep.wait(); err != nil {
+				t.err = err
+				return
+			}
+		}
+		start := time.Now()
+		t.err = fn()
+		if t.err != nil {
+			g.logger.Infof("Setup stage '%s' failed after %s", name, time.Since(start).Round(time.Millisecond))
+		} else {
+			g.logger.Infof("Setup stage '%s' completed in %s", name, time.Since(start).Round(time.Millisecond))
+		}
+	}()
+	return t
+}
+
+// wait waits for a stage to complete and returns its error.
+func (t *task) wait() error {
+	<-t.done
+	return t.err
+}
@@ -1,16 +1,24 @@
 import json
 import os
+import shutil
 import subprocess
+import time
 import uuid
 
 from contextlib import contextmanager
 
 import pytest
 
+from . import perf
+from .mock_cluster import MockCluster
+
 
 def exec_cmd(cmd, env=None, stdin=None, timeout=None):
     """Execute CLI command
 
+    The wall time, CPU time and peak RSS of the command are recorded for the
+    session performance report, see the `perf` module.
+
     :param cmd: Program and arguments
     :type cmd: [str]
     :param env: Environment variables
@@ -27,44 +35,46 @@ def exec_cmd(cmd, env=None, stdin=None, timeout=None):
 
     print('CMD: {!r}'.format(cmd))
 
-    process = subprocess.Popen(
-        cmd,
-        stdin=stdin,
-        stdout=subprocess.PIPE,
-        stderr=subprocess.PIPE,
-        env=env)
-
+    start = time.monotonic()
     try:
-        streams = process.communicate(timeout=timeout)
-    except subprocess.TimeoutExpired:
-        # The child process is not killed if the timeout expires, so in order
-        # to cleanup properly a well-behaved application should kill the child
-        # process and finish communication.
-        # https://docs.python.org/3.5/library/subprocess.html#subprocess.Popen.communicate
-        process.kill()
-        stdout, stderr = process.communicate()
-        print('STDOUT: {}'.format(stdout.decode('utf-8')))
-        print('STDERR: {}'.format(stderr.decode('utf-8')))
+        returncode, stdout, stderr, rusage = perf.run(cmd, stdin=stdin, env=env, timeout=timeout)
+    except subprocess.TimeoutExpired as e:
+        # The child process is killed once the timeout expires.
+        print('STDOUT: {}'.format(e.output.decode('utf-8')))
+        print('STDERR: {}'.format(e.stderr.decode('utf-8')))
         raise
 
+    perf.record(cmd, time.monotonic() - start, rusage)
+
     # This is needed to get rid of '\r' from Windows's lines endings.
-    stdout, stderr = [stream.replace(b'\r', b'').decode('utf-8') for stream in streams]
+    stdout, stderr = [stream.replace(b'\r', b'').decode('utf-8') for stream in (stdout, stderr)]
 
     # We should always print the stdout and stderr
     print('STDOUT: {}'.format(stdout))
     print('STDERR: {}'.format(stderr))
 
-    return (process.returncode, stdout, stderr)
+    return (returncode, stdout, stderr)
 
 
 @pytest.fixture()
-def default_cluster():
-    cluster = _setup_cluster()
+def default_cluster(dcos_dir, _default_cluster_snapshot):
+    """The default cluster, attached in the DCOS_DIR of the test.
 
-    yield cluster
+    It is set up once per session, then restored from a snapshot for each test.
+    """
 
-    code, _, _ = exec_cmd(['dcos', 'cluster', 'remove', cluster['cluster_id']])
-    assert code == 0
+    cluster, snapshot = _default_cluster_snapshot
+    os.rmdir(dcos_dir)
+    shutil.copytree(snapshot, dcos_dir, symlinks=True)
+    return dict(cluster)
+
+
+@pytest.fixture()
+def mock_cluster():
+    """A local mock cluster, see the `mock_cluster` module."""
+
+    with MockCluster() as cluster:
+        yield cluster
 
 
 @contextmanager
@@ -102,7 +112,7 @@ def _setup_cluster(name='DEFAULT', scheme='https', insecure=True, env={}):
     code, _, _ = exec_cmd(cmd.split(' '), env=env)
     assert code == 0
 
-    code, out, _ = exec_cmd(['dcos', 'cluster', 'list', '--json', '--attached'])
+    code, out, _ = exec_cmd(['dcos', 'cluster', 'list', '--json', '--attached'], env=env)
     clusters = json.loads(out)
     assert len(clusters) == 1
     assert clusters[0]['name'] == cluster['name']
@@ -111,7 +121,7 @@ def _setup_cluster(name='DEFAULT', scheme='https', insecure=True, env={}):
     cluster['version'] = clusters[0]['version']
     cluster['cluster_id'] = clusters[0]['cluster_id']
 
-    code, out, _ = exec_cmd(['dcos', 'config', 'show', 'core.dcos_acs_token'])
+    code, out, _ = exec_cmd(['dcos', 'config', 'show', 'core.dcos_acs_token'], env=env)
     assert code == 0
     cluster['acs_token'] = out.rstrip()
 
@@ -0,0 +1,75 @@
+import os
+import shutil
+
+import pytest
+
+from . import perf
+from .common import _setup_cluster
+
+
+def pytest_addoption(parser):
+    parser.addoption(
+        '--perf-report',
+        metavar='PATH',
+        help='write the wall time, CPU time and peak RSS of the CLI commands to a JSON report')
+
+
+def pytest_sessionfinish(session):
+    config = session.config
+    path = config.getoption('--perf-report')
+    if not path:
+        return
+
+    # pytest-xdist workers send their records to the controller, which writes the report.
+    if hasattr(config, 'workerinput'):
+        config.workeroutput['perf_records'] = perf.records()
+        return
+    perf.write_report(path)
+
+
+@pytest.hookimpl(optionalhook=True)
+def pytest_testnodedown(node, error):
+    """Merge the records of a pytest-xdist worker once it is done."""
+
+    perf.merge(getattr(node, 'workeroutput', {}).get('perf_records', []))
+
+
+@pytest.fixture(scope='session')
+def _worker_dcos_dir(tmp_path_factory):
+    """The DCOS_DIR of the session.
+
+    The base temporary directory is distinct for each pytest-xdist worker, which
+    allows workers to run tests concurrently without sharing any CLI state.
+    """
+
+    return str(tmp_path_factory.mktemp('dcos'))
+
+
+@pytest.fixture(autouse=True)
+def dcos_dir(_worker_dcos_dir, monkeypatch):
+    """Start each test with an empty DCOS_DIR."""
+
+    _reset_dir(_worker_dcos_dir)
+    monkeypatch.setenv('DCOS_DIR', _worker_dcos_dir)
+    return _worker_dcos_dir
+
+
+@pytest.fixture(scope='session')
+def _default_cluster_snapshot(_worker_dcos_dir, tmp_path_factory):
+    """Set up the default cluster once per session and snapshot the resulting DCOS_DIR.
+
+    The CLI stores absolute paths in its plugin indexes, the snapshot is thus
+    taken from the session DCOS_DIR and restored at the same location.
+    """
+
+    _reset_dir(_worker_dcos_dir)
+    cluster = _setup_cluster(env={'DCOS_DIR': _worker_dcos_dir})
+
+    snapshot = os.path.join(str(tmp_path_factory.mktemp('snapshots')), 'default')
+    shutil.copytree(_worker_dcos_dir, snapshot, symlinks=True)
+    return cluster, snapshot
+
+
+def _reset_dir(path):
+    shutil.rmtree(path, ignore_errors=True)
+    os.makedirs(path)
@@ -0,0 +1,362 @@
+"""A local stand-in for a DC/OS cluster, serving the endpoints called by the CLI.
+
+It allows to run `dcos cluster setup`, `dcos auth login`, `dcos cluster list`
+and default plugin installations offline. Latency, bandwidth and failure rate
+are configurable in order to load-test the CLI on a single machine:
+
+    python -m integration.mock_cluster --port 8080 --latency 0.1 --bandwidth 1000000 --failure-rate 0.05
+
+Plugins are served through Cosmos only, the CLI should thus be run with
+DCOS_CLUSTER_SETUP_SKIP_CANONICAL_URL_INSTALL=1 to skip their canonical URLs.
+"""
+
+import argparse
+import hashlib
+import io
+import json
+import os
+import random
+import ssl
+import sys
+import threading
+import time
+import uuid
+import zipfile
+
+from http.server import BaseHTTPRequestHandler, HTTPServer
+from socketserver import ThreadingMixIn
+
+
+# Directory of the test plugin binaries, per platform.
+FIXTURES_DIR = os.path.join(os.path.dirname(__file__), 'fixtures', 'plugins', 'dcos-test')
+
+# Size of the chunks written when the bandwidth is limited.
+CHUNK_SIZE = 16 * 1024
+
+
+class MockCluster:
+    """A mock DC/OS cluster served over HTTP(S) from a background thread.
+
+    :param name: Cluster name
+    :type name: str
+    :param version: DC/OS version
+    :type version: str
+    :param variant: DC/OS variant, "open" or "enterprise"
+    :type variant: str
+    :param username: Username accepted by the login endpoint
+    :type username: str
+    :param password: Password accepted by the login endpoint
+    :type password: str
+    :param latency: Delay in seconds before each response
+    :type latency: float
+    :param bandwidth: Maximum response throughput in bytes per second, 0 for unlimited
+    :type bandwidth: int
+    :param failure_rate: Probability for a request to fail with a 503 error
+    :type failure_rate: float
+    :param links: Linked clusters, as returned by /cluster/v1/links
+    :type links: [dict]
+    :param tls_cert: Path to a PEM certificate, the cluster is served over HTTPS when set
+    :type tls_cert: str | None
+    :param tls_key: Path to the PEM private key of the certificate
+    :type tls_key: str | None
+    """
+
+    def __init__(self, name='mock-cluster', version='2.1.0', variant='open',
+                 username='bootstrapuser', password='deleteme',
+                 latency=0, bandwidth=0, failure_rate=0, links=None,
+                 tls_cert=None, tls_key=None):
+        self.name = name
+        self.version = version
+        self.variant = variant
+        self.username = username
+        self.password = password
+        self.latency = latency
+        self.bandwidth = bandwidth
+        self.failure_rate = failure_rate
+        self.links = links or []
+        self.tls_cert = tls_cert
+        self.tls_key = tls_key
+
+        self.cluster_id = str(uuid.uuid4())
+        self.token = uuid.uuid4().hex
+        self.plugins = {name: _plugin_zip(name) for name in ('dcos-core-cli', 'dcos-enterprise-cli')}
+
+        self._server = None
+        self._thread = None
+
+    @property
+    def url(self):
+        """The URL of the cluster, available once it is started."""
+
+        scheme = 'https' if self.tls_cert else 'http'
+        host, port = self._server.server_address[:2]
+        return '{}://{}:{}'.format(scheme, host, port)
+
+    def start(self, host='127.0.0.1', port=0):
+        """Start serving the cluster. A random port is picked by default."""
+
+        handler = type('Handler', (_Handler,), {'cluster': self})
+        self._server = _Server((host, port), handler)
+        if self.tls_cert:
+            context = ssl.SSLContext(ssl.PROTOCOL_TLS_SERVER)
+            context.load_cert_chain(self.tls_cert, self.tls_key)
+            self._server.socket = context.wrap_socket(self._server.socket, server_side=True)
+
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        """Stop serving the cluster."""
+
+        self._server.shutdown()
+        self._server.server_close()
+        self._thread.join()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.stop()
+
+
+class _Server(ThreadingMixIn, HTTPServer):
+    daemon_threads = True
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+
+    # Set by MockCluster.start.
+    cluster = None
+
+    def do_HEAD(self):
+        self._handle(head=True)
+
+    def do_GET(self):
+        self._handle()
+
+    def do_POST(self):
+        self._handle()
+
+    def log_message(self, format, *args):
+        pass
+
+    def _handle(self, head=False):
+        length = int(self.headers.get('Content-Length') or 0)
+        body = self.rfile.read(length) if length else b''
+
+        if self.cluster.latency:
+            time.sleep(self.cluster.latency)
+
+        if random.random() < self.cluster.failure_rate:
+            self._reply(503, b'Service Unavailable', 'text/plain', head)
+            return
+
+        route = self.path.split('?')[0]
+        if route.startswith('/cli-plugins/'):
+            self._plugin(route[len('/cli-plugins/'):], head)
+            return
+
+        handler = {
+            '/': self._root,
+            '/dcos-metadata/dcos-version.json': self._version,
+            '/metadata': self._metadata,
+            '/mesos/state-summary': self._state_summary,
+            '/ca/dcos-ca.crt': self._ca,
+            '/pkgpanda/active.buildinfo.full.json': self._buildinfo,
+            '/acs/api/v1/auth/providers': self._providers,
+            '/acs/api/v1/auth/login': self._login,
+            '/cluster/v1/links': self._links,
+            '/package/describe': self._package_describe,
+            '/package/list': self._package_list,
+        }.get(route)
+        if handler is None:
+            self._reply(404, b'Not Found', 'text/plain', head)
+            return
+        handler(body, head)
+
+    def _authenticated(self):
+        return self.headers.get('Authorization') == 'token=' + self.cluster.token
+
+    def _json(self, obj, head, status=200, content_type='application/json'):
+        self._reply(status, json.dumps(obj).encode('utf-8'), content_type, head)
+
+    def _reply(self, status, data, content_type, head, headers=None):
+        self.send_response(status)
+        self.send_header('Content-Type', content_type)
+        self.send_header('Content-Length', str(len(data)))
+        for key, value in (headers or {}).items():
+            self.send_header(key, value)
+        self.end_headers()
+        if head:
+            return
+
+        if not self.cluster.bandwidth:
+            self.wfile.write(data)
+            return
+        for i in range(0, len(data), CHUNK_SIZE):
+            chunk = data[i:i + CHUNK_SIZE]
+            self.wfile.write(chunk)
+            time.sleep(len(chunk) / self.cluster.bandwidth)
+
+    def _root(self, body, head):
+        self._reply(200, b'<html></html>', 'text/html', head)
+
+    def _version(self, body, head):
+        self._json({
+            'version': self.cluster.version,
+            'dcos-variant': self.cluster.variant,
+            'dcos-image-commit': 'mock',
+            'bootstrap-id': 'mock',
+        }, head)
+
+    def _metadata(self, body, head):
+        self._json({'PUBLIC_IPV4': '127.0.0.1', 'CLUSTER_ID': self.cluster.cluster_id}, head)
+
+    def _state_summary(self, body, head):
+        if not self._authenticated():
+            self._reply(401, b'Unauthorized', 'text/plain', head)
+            return
+        self._json({'cluster': self.cluster.name}, head)
+
+    def _ca(self, body, head):
+        if not self.cluster.tls_cert:
+            self._reply(404, b'Not Found', 'text/plain', head)
+            return
+        with open(self.cluster.tls_cert, 'rb') as f:
+            self._reply(200, f.read(), 'application/x-x509-ca-cert', head)
+
+    def _buildinfo(self, body, head):
+        if not self._authenticated():
+            self._reply(401, b'Unauthorized', 'text/plain', head, {'WWW-Authenticate': 'acsjwt'})
+            return
+        self._json({}, head)
+
+    def _providers(self, body, head):
+        self._json({
+            'dcos-users': {
+                'authentication-type': 'dcos-uid-password',
+                'client-method': 'dcos-usercredential-post-receive-authtoken',
+                'config': {'start_flow_url': '/acs/api/v1/auth/login'},
+                'description': 'Default DC/OS login provider',
+            },
+        }, head)
+
+    def _login(self, body, head):
+        credentials = json.loads(body.decode('utf-8') or '{}')
+        if credentials.get('uid') != self.cluster.username or credentials.get('password') != self.cluster.password:
+            self._json({
+                'title': 'Unauthorized',
+                'description': 'Invalid credentials.',
+                'code': 'ERR_INVALID_CREDENTIALS',
+            }, head, status=401)
+            return
+        self._json({'token': self.cluster.token}, head)
+
+    def _links(self, body, head):
+        self._json({'links': self.cluster.links}, head)
+
+    def _package_describe(self, body, head):
+        request = json.loads(body.decode('utf-8') or '{}')
+        name = request.get('packageName')
+        if name not in self.cluster.plugins:
+            self._json({
+                'type': 'PackageNotFound',
+                'message': "Package [{}] not found".format(name),
+            }, head, status=400, content_type='application/vnd.dcos.package.error+json;charset=utf-8;version=v1')
+            return
+        self._json(
+            {'package': self._package(name)}, head,
+            content_type='application/vnd.dcos.package.describe-response+json;charset=utf-8;version=v3')
+
+    def _package_list(self, body, head):
+        self._json(
+            {'packages': []}, head,
+            content_type='application/vnd.dcos.package.list-response+json;charset=utf-8;version=v1')
+
+    def _package(self, name):
+        plugin = self.cluster.plugins[name]
+        artifact = {
+            'kind': 'zip',
+            'url': '{}/cli-plugins/{}.zip'.format(self.cluster.url, name),
+            'contentHash': [{'algo': 'sha256', 'value': plugin['sha256']}],
+        }
+        return {
+            'name': name,
+            'version': self.cluster.version,
+            'releaseVersion': 0,
+            'packagingVersion': '4.0',
+            'maintainer': 'support@mesosphere.io',
+            'description': 'Mock {} plugin'.format(name),
+            'resource': {
+                'cli': {
+                    'binaries': {
+                        platform: {'x86-64': artifact} for platform in ('linux', 'darwin', 'windows')
+                    },
+                },
+            },
+        }
+
+    def _plugin(self, filename, head):
+        name, _ = os.path.splitext(filename)
+        plugin = self.cluster.plugins.get(name)
+        if plugin is None:
+            self._reply(404, b'Not Found', 'text/plain', head)
+            return
+        self._reply(200, plugin['data'], 'application/zip', head)
+
+
+def _plugin_zip(name):
+    """Build a plugin archive with the test binary, named after the plugin (eg. dcos-core)."""
+
+    platform = 'win32' if sys.platform == 'win32' else ('darwin' if sys.platform == 'darwin' else 'linux')
+    ext = '.exe' if platform == 'win32' else ''
+    with open(os.path.join(FIXTURES_DIR, platform, 'dcos-test' + ext), 'rb') as f:
+        binary = f.read()
+
+    command = name[:-len('-cli')] if name.endswith('-cli') else name
+    buf = io.BytesIO()
+    with zipfile.ZipFile(buf, 'w') as archive:
+        info = zipfile.ZipInfo('bin/' + command + ext)
+        info.external_attr = 0o755 << 16
+        archive.writestr(info, binary)
+    data = buf.getvalue()
+    return {'data': data, 'sha256': hashlib.sha256(data).hexdigest()}
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Serve a mock DC/OS cluster.')
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8080)
+    parser.add_argument('--name', default='mock-cluster', help='cluster name')
+    parser.add_argument('--version', default='2.1.0', help='DC/OS version')
+    parser.add_argument('--variant', default='open', choices=('open', 'enterprise'), help='DC/OS variant')
+    parser.add_argument('--username', default='bootstrapuser')
+    parser.add_argument('--password', default='deleteme')
+    parser.add_argument('--latency', type=float, default=0, help='delay in seconds before each response')
+    parser.add_argument('--bandwidth', type=int, default=0,
+                        help='maximum response throughput in bytes per second, unlimited by default')
+    parser.add_argument('--failure-rate', type=float, default=0,
+                        help='probability for a request to fail with a 503 error')
+    parser.add_argument('--tls-cert', help='PEM certificate, the cluster is served over HTTPS when set')
+    parser.add_argument('--tls-key', help='PEM private key of the certificate')
+    args = parser.parse_args(argv)
+
+    cluster = MockCluster(
+        name=args.name, version=args.version, variant=args.variant,
+        username=args.username, password=args.password,
+        latency=args.latency, bandwidth=args.bandwidth, failure_rate=args.failure_rate,
+        tls_cert=args.tls_cert, tls_key=args.tls_key,
+    ).start(args.host, args.port)
+    print('Serving {} ({}) at {}'.format(cluster.name, cluster.cluster_id, cluster.url))
+    try:
+        while True:
+            time.sleep(3600)
+    except KeyboardInterrupt:
+        cluster.stop()
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
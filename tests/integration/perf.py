@@ -0,0 +1,265 @@
+"""Resource usage of the CLI invocations made by the integration tests.
+
+Each invocation through `exec_cmd` runs through `run`, which collects its
+resource usage. It is recorded with its wall time, user and system CPU time
+and peak RSS. Records are aggregated per command (eg. `dcos cluster list`)
+into a JSON report at the end of the pytest session.
+
+Reports can be compared against a baseline to flag regressions:
+
+    python -m integration.perf baseline.json report.json
+"""
+
+import argparse
+import json
+import os
+import re
+import signal
+import statistics
+import subprocess
+import sys
+import tempfile
+import threading
+
+
+# Records of the CLI invocations made during the session.
+_records = []
+
+# Arguments which are part of a command name, as opposed to option values, URLs or IDs.
+_COMMAND_WORD = re.compile(r'^[a-z][a-z0-9-]*$')
+
+# Maximum number of words in a command name (eg. `dcos cluster list`).
+_COMMAND_WORDS = 3
+
+
+def run(cmd, stdin=None, env=None, timeout=None):
+    """Run a command to completion and collect its resource usage.
+
+    The child is reaped with an explicit os.wait4, its output is written to
+    temporary files so that no pipe needs to be drained meanwhile. On platforms
+    without os.wait4 (Windows), the command runs through Popen.communicate and
+    the resource usage is None.
+
+    :param cmd: Program and arguments
+    :type cmd: [str]
+    :param stdin: File to use for stdin
+    :type stdin: file | None
+    :param env: Environment variables
+    :type env: dict | None
+    :param timeout: The timeout for the process to terminate, it is then killed.
+    :type timeout: int | None
+    :raises: subprocess.TimeoutExpired when the timeout is reached
+    :returns: The return code, stdout, stderr and resource usage
+    :rtype: (int, bytes, bytes, resource.struct_rusage | None)
+    """
+
+    if not hasattr(os, 'wait4'):
+        process = subprocess.Popen(
+            cmd, stdin=stdin, stdout=subprocess.PIPE, stderr=subprocess.PIPE, env=env)
+        try:
+            stdout, stderr = process.communicate(timeout=timeout)
+        except subprocess.TimeoutExpired:
+            process.kill()
+            stdout, stderr = process.communicate()
+            raise subprocess.TimeoutExpired(cmd, timeout, output=stdout, stderr=stderr)
+        return process.returncode, stdout, stderr, None
+
+    with tempfile.TemporaryFile() as stdout, tempfile.TemporaryFile() as stderr:
+        process = subprocess.Popen(cmd, stdin=stdin, stdout=stdout, stderr=stderr, env=env)
+
+        # The process is killed through os.kill, Popen.kill could reap it before os.wait4 does.
+        lock = threading.Lock()
+        state = {'reaped': False, 'killed': False}
+
+        def kill():
+            with lock:
+                if not state['reaped']:
+                    state['killed'] = True
+                    os.kill(process.pid, signal.SIGKILL)
+
+        timer = threading.Timer(timeout, kill) if timeout is not None else None
+        if timer:
+            timer.start()
+        try:
+            _, status, rusage = os.wait4(process.pid, 0)
+        finally:
+            with lock:
+                state['reaped'] = True
+            if timer:
+                timer.cancel()
+
+        # The return code is set as Popen would, it then doesn't wait for the process again.
+        if os.WIFSIGNALED(status):
+            process.returncode = -os.WTERMSIG(status)
+        else:
+            process.returncode = os.WEXITSTATUS(status)
+
+        stdout.seek(0)
+        stderr.seek(0)
+        output = (stdout.read(), stderr.read())
+
+    if state['killed']:
+        raise subprocess.TimeoutExpired(cmd, timeout, output=output[0], stderr=output[1])
+    return (process.returncode,) + output + (rusage,)
+
+
+def record(cmd, wall_time, rusage):
+    """Record the resource usage of a CLI invocation.
+
+    :param cmd: Program and arguments
+    :type cmd: [str]
+    :param wall_time: Wall time in seconds
+    :type wall_time: float
+    :param rusage: Resource usage as returned by os.wait4
+    :type rusage: resource.struct_rusage | None
+    """
+
+    entry = {'command': command_name(cmd), 'wall_time': wall_time}
+    if rusage is not None:
+        entry['user_time'] = rusage.ru_utime
+        entry['sys_time'] = rusage.ru_stime
+        entry['max_rss'] = max_rss_bytes(rusage.ru_maxrss)
+    _records.append(entry)
+
+
+def records():
+    """Return the records of the session.
+
+    :rtype: [dict]
+    """
+
+    return list(_records)
+
+
+def merge(entries):
+    """Merge records of another process into those of the session, eg. from a pytest-xdist worker.
+
+    :param entries: Records as returned by `records`
+    :type entries: [dict]
+    """
+
+    _records.extend(entries)
+
+
+def command_name(cmd):
+    """Return the name of a command, without its options and arguments.
+
+    :param cmd: Program and arguments
+    :type cmd: [str]
+    :rtype: str
+    """
+
+    words = [os.path.basename(cmd[0])]
+    for arg in cmd[1:_COMMAND_WORDS]:
+        if not _COMMAND_WORD.match(arg):
+            break
+        words.append(arg)
+    return ' '.join(words)
+
+
+def max_rss_bytes(max_rss):
+    """Convert a ru_maxrss value to bytes, it is in kilobytes except on macOS."""
+
+    if sys.platform == 'darwin':
+        return max_rss
+    return max_rss * 1024
+
+
+def report():
+    """Aggregate the records of the session per command.
+
+    :rtype: dict
+    """
+
+    commands = {}
+    for entry in _records:
+        commands.setdefault(entry['command'], []).append(entry)
+
+    result = {}
+    for name, entries in sorted(commands.items()):
+        stats = {'count': len(entries)}
+        for metric in ('wall_time', 'user_time', 'sys_time'):
+            values = [e[metric] for e in entries if metric in e]
+            if values:
+                stats[metric] = {
+                    'min': min(values),
+                    'median': statistics.median(values),
+                    'mean': statistics.mean(values),
+                    'max': max(values),
+                }
+        rss = [e['max_rss'] for e in entries if 'max_rss' in e]
+        if rss:
+            stats['max_rss'] = max(rss)
+        result[name] = stats
+    return result
+
+
+def write_report(path):
+    """Write the session report to a JSON file.
+
+    :param path: Path to the report
+    :type path: str
+    """
+
+    with open(path, 'w') as f:
+        json.dump(report(), f, indent=4, sort_keys=True)
+
+
+def compare(baseline, current, threshold):
+    """Compare a report against a baseline.
+
+    Median wall and CPU times as well as peak RSS are considered, a regression is
+    a relative increase above the threshold. Commands missing from either report
+    are ignored.
+
+    :param baseline: Baseline report
+    :type baseline: dict
+    :param current: Report to compare
+    :type current: dict
+    :param threshold: Tolerated relative increase (eg. 0.2 for 20%)
+    :type threshold: float
+    :returns: Regressions as (command, metric, baseline value, current value)
+    :rtype: [(str, str, float, float)]
+    """
+
+    regressions = []
+    for name, stats in sorted(current.items()):
+        base = baseline.get(name)
+        if base is None:
+            continue
+        for metric in ('wall_time', 'user_time', 'sys_time'):
+            if metric in stats and metric in base:
+                old, new = base[metric]['median'], stats[metric]['median']
+                if old > 0 and new > old * (1 + threshold):
+                    regressions.append((name, metric, old, new))
+        if 'max_rss' in stats and 'max_rss' in base:
+            old, new = base['max_rss'], stats['max_rss']
+            if old > 0 and new > old * (1 + threshold):
+                regressions.append((name, 'max_rss', old, new))
+    return regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Flag CLI performance regressions against a baseline report.')
+    parser.add_argument('baseline', help='baseline report')
+    parser.add_argument('report', help='report to compare against the baseline')
+    parser.add_argument('--threshold', type=float, default=0.2,
+                        help='tolerated relative increase, defaults to 0.2 (20%%)')
+    args = parser.parse_args(argv)
+
+    with open(args.baseline) as f:
+        baseline = json.load(f)
+    with open(args.report) as f:
+        current = json.load(f)
+
+    regressions = compare(baseline, current, args.threshold)
+    for name, metric, old, new in regressions:
+        print('{}: {} went from {:.6g} to {:.6g} (+{:.0%})'.format(name, metric, old, new, new / old - 1))
+    if not regressions:
+        print('No regression above {:.0%}.'.format(args.threshold))
+        return 0
+    return 1
+
+
+if __name__ == '__main__':
+    sys.exit(main())
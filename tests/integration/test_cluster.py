@@ -4,7 +4,7 @@ import time
 
 import pytest
 
-from .common import setup_cluster, exec_cmd, default_cluster  # noqa: F401
+from .common import setup_cluster, exec_cmd, default_cluster, mock_cluster  # noqa: F401
 
 
 def test_cluster_help():
@@ -19,6 +19,10 @@ Usage:
 Commands:
     attach
         Attach the CLI to a cluster
+    export
+        Export a configured cluster and its plugins to an archive
+    import
+        Import a cluster exported with `dcos cluster export`
     link
         Link the current cluster to another one
     list
@@ -52,6 +56,10 @@ def test_cluster_invalid_usage():
 Commands:
     attach
         Attach the CLI to a cluster
+    export
+        Export a configured cluster and its plugins to an archive
+    import
+        Import a cluster exported with `dcos cluster export`
     link
         Link the current cluster to another one
     list
@@ -216,3 +224,26 @@ def test_cluster_setup_too_many_args():
     assert code != 0
     assert out == ""
     assert err.startswith('Error: received 2 arguments [https://1.example.com https://2.example.com], expects a single cluster URL\n')
+
+
+def test_cluster_setup_mock(mock_cluster):
+    env = {**os.environ, 'DCOS_CLUSTER_SETUP_SKIP_CANONICAL_URL_INSTALL': '1'}
+
+    code, _, _ = exec_cmd([
+        'dcos', 'cluster', 'setup', mock_cluster.url,
+        '--username={}'.format(mock_cluster.username),
+        '--password={}'.format(mock_cluster.password),
+    ], env=env)
+    assert code == 0
+
+    code, out, _ = exec_cmd(['dcos', 'cluster', 'list', '--json', '--attached'], env=env)
+    assert code == 0
+    clusters = json.loads(out)
+    assert len(clusters) == 1
+    assert clusters[0]['name'] == mock_cluster.name
+    assert clusters[0]['cluster_id'] == mock_cluster.cluster_id
+    assert clusters[0]['status'] == 'AVAILABLE'
+
+    code, out, _ = exec_cmd(['dcos', 'plugin', 'list', '--json'], env=env)
+    assert code == 0
+    assert [plugin['name'] for plugin in json.loads(out)] == ['dcos-core-cli']